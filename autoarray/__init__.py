@@ -2,12 +2,19 @@ from . import exc
 from . import type
 from . import util
 from .numba_util import profile_func
+from .numba_util import get_num_threads
+from .numba_util import set_num_threads
+from .numba_util import num_threads
+from .profiler import Profiler
 from .preloads import Preloads
+from .preload_cache import PreloadCache
+from .shared_buffer import shared_buffers
 from .dataset import preprocess
 from .dataset.imaging import SettingsImaging
 from .dataset.imaging import Imaging
 from .dataset.imaging import SimulatorImaging
 from .dataset.imaging import WTildeImaging
+from .dataset.w_tilde_cache import WTildeCache
 from .dataset.interferometer import Interferometer
 from .dataset.interferometer import SettingsInterferometer
 from .dataset.interferometer import SimulatorInterferometer
@@ -15,6 +22,7 @@ from .fit.fit_data import FitData
 from .fit.fit_data import FitDataComplex
 from .fit.fit_dataset import FitDataset
 from .fit.fit_dataset import FitImaging
+from .fit.fit_dataset import FitImagingBatch
 from .fit.fit_dataset import FitInterferometer
 from .instruments import acs
 from .instruments import euclid
@@ -39,15 +47,14 @@ from .inversion.linear_eqn.imaging import LEqImagingMapping
 from .inversion.linear_eqn.imaging import LEqImagingWTilde
 from .inversion.linear_eqn.interferometer import LEqInterferometerMapping
 from .inversion.linear_eqn.interferometer import LEqInterferometerMappingPyLops
+from .inversion.linear_eqn.interferometer import LEqInterferometerWTilde
 from .inversion.linear_obj import LinearObj
 from .inversion.linear_obj import LinearObjFunc
 from .mask.mask_1d import Mask1D
 from .mask.mask_2d import Mask2D
-from .mock import fixtures
 from .operators.convolver import Convolver
 from .operators.convolver import Convolver
-from .operators.transformer import TransformerDFT
-from .operators.transformer import TransformerNUFFT
+from .operators.convolver import ConvolverFFT
 from .layout.layout import Layout1D
 from .layout.layout import Layout2D
 from .structures.arrays.one_d.array_1d import Array1D
@@ -76,4 +83,41 @@ from autoconf import conf
 
 conf.instance.register(__file__)
 
+"""
+Attributes of the package which are imported the first time they are accessed, as opposed to when `autoarray` is
+imported, because importing them imports heavy dependencies (e.g. `pylops`) that most users never need.
+"""
+_lazy_attribute_dict = {
+    "fixtures": ("autoarray.mock.fixtures", None),
+    "TransformerDFT": ("autoarray.operators.transformer", "TransformerDFT"),
+    "TransformerNUFFT": ("autoarray.operators.transformer", "TransformerNUFFT"),
+    "TransformerKaiserBessel": (
+        "autoarray.operators.transformer",
+        "TransformerKaiserBessel",
+    ),
+}
+
+
+def __getattr__(name):
+
+    if name not in _lazy_attribute_dict:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module_name, attribute_name = _lazy_attribute_dict[name]
+
+    value = importlib.import_module(module_name)
+
+    if attribute_name is not None:
+        value = getattr(value, attribute_name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attribute_dict))
+
 __version__ = "2021.10.14.1"
@@ -0,0 +1,7 @@
+from .benchmark import benchmark_dict
+from .benchmark import default_parameter_dict
+from .benchmark import output_to_json
+from .benchmark import ratio_dict_from
+from .benchmark import regression_dict_from
+from .benchmark import results_from_json
+from .benchmark import run
@@ -0,0 +1,80 @@
+"""
+Runs the likelihood function benchmarks from the command line, for example:
+
+python -m autoarray.benchmark --output benchmark.json
+python -m autoarray.benchmark --name convolve curvature_matrix --baseline benchmark.json
+
+If a baseline is input, the exit status is 1 if any benchmark is slower than the baseline by more than the tolerance.
+"""
+import argparse
+import json
+import sys
+
+from autoarray import benchmark
+
+
+def parameter_dict_from(parameter_list):
+
+    parameter_dict = {}
+
+    for parameter in parameter_list or []:
+        name, values = parameter.split("=")
+        parameter_dict[name] = [json.loads(value) for value in values.split(",")]
+
+    return parameter_dict
+
+
+def main(args=None) -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m autoarray.benchmark",
+        description="Benchmark the hot paths of the likelihood functions.",
+    )
+    parser.add_argument(
+        "--name",
+        nargs="+",
+        help="Only run the benchmarks whose names contain one of these names.",
+    )
+    parser.add_argument(
+        "--param",
+        nargs="+",
+        help="Override the values of a parameter, e.g. mask_radius=1.0,3.0",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--output", help="The .json file the results are output to.")
+    parser.add_argument(
+        "--baseline", help="A .json file of results which the results are compared to."
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+
+    args = parser.parse_args(args=args)
+
+    results = benchmark.run(
+        name_list=args.name,
+        parameter_dict=parameter_dict_from(parameter_list=args.param),
+        repeats=args.repeats,
+        min_time=args.min_time,
+        verbose=True,
+    )
+
+    if args.output is not None:
+        benchmark.output_to_json(results=results, file_path=args.output)
+
+    if args.baseline is None:
+        return 0
+
+    regression_dict = benchmark.regression_dict_from(
+        results=results,
+        baseline=benchmark.results_from_json(file_path=args.baseline),
+        tolerance=args.tolerance,
+    )
+
+    for key, ratio in regression_dict.items():
+        print(f"REGRESSION {key}: {ratio:.2f}x slower than the baseline")
+
+    return 1 if regression_dict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+import datetime
+import inspect
+import itertools
+import json
+import platform
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+"""
+The values of every parameter a benchmark is run for, unless a benchmark or the user overrides them. A benchmark is
+run for every combination of the values of the parameters in its signature:
+
+- `mask_radius`: The radius (in arc-seconds) of the circular mask of the dataset, which has pixel scales of 0.1".
+- `sub_size`: The sub-grid size of the masked grids.
+- `kernel_size`: The size of the (square) PSF kernel.
+- `source_pixels`: The number of pixels of the pixelization, which is the number of pixels of a rectangular
+  pixelization and the number of pixels before masking of the uniform grid a Delaunay or Voronoi pixelization is
+  overlaid from.
+- `total_visibilities`: The number of visibilities of an interferometer dataset.
+"""
+default_parameter_dict = {
+    "mask_radius": [1.0, 2.0],
+    "sub_size": [1, 2],
+    "kernel_size": [5, 11],
+    "source_pixels": [400, 900],
+    "total_visibilities": [1000, 10000],
+}
+
+"""
+Every registered benchmark, which is filled by the `benchmark` decorator.
+"""
+benchmark_dict: Dict[str, "Benchmark"] = {}
+
+
+class Benchmark:
+    def __init__(self, func: Callable, parameter_dict: Dict[str, List]):
+        """
+        A benchmark of one of the hot paths of a likelihood function (e.g. a PSF convolution or the construction of a
+        curvature matrix).
+
+        The benchmark is a function whose inputs are the benchmark's parameters, which sets up the data and returns a
+        function (with no inputs) that runs the code which is timed, such that the setup is not timed.
+
+        Parameters
+        ----------
+        func
+            The function which sets up the benchmark and returns the function which is timed.
+        parameter_dict
+            The values of parameters specific to this benchmark, which take precedence over the values in the
+            `default_parameter_dict`.
+        """
+        self.func = func
+        self.name = func.__name__
+        self.parameter_dict = parameter_dict
+
+    @property
+    def parameter_names(self) -> List[str]:
+        return list(inspect.signature(self.func).parameters)
+
+    def params_list_from(
+        self, parameter_dict: Optional[Dict[str, List]] = None
+    ) -> List[Dict]:
+        """
+        Returns every combination of the benchmark's parameter values it is run for.
+
+        Parameters
+        ----------
+        parameter_dict
+            Values of parameters which override those of the benchmark and the `default_parameter_dict`.
+        """
+        values_dict = {**default_parameter_dict, **self.parameter_dict}
+        values_dict.update(parameter_dict or {})
+
+        value_lists = [values_dict[name] for name in self.parameter_names]
+
+        return [
+            dict(zip(self.parameter_names, values))
+            for values in itertools.product(*value_lists)
+        ]
+
+
+def benchmark(**parameter_dict):
+    """
+    Decorator which registers a benchmark in the `benchmark_dict`.
+
+    Keyword arguments are the values of parameters specific to the benchmark, for example the types of pixelization
+    a mapper benchmark is run for.
+    """
+
+    def wrapper(func: Callable) -> Callable:
+        benchmark_dict[func.__name__] = Benchmark(
+            func=func, parameter_dict=parameter_dict
+        )
+        return func
+
+    return wrapper
+
+
+def key_from(name: str, params: Dict) -> str:
+    """
+    Returns the key of the result of a benchmark run for a set of parameters, for example
+    `convolve_image[mask_radius=1.0,kernel_size=5]`.
+    """
+    return f"{name}[{','.join(f'{key}={value}' for key, value in params.items())}]"
+
+
+def timings_from(
+    func: Callable, repeats: int = 5, min_time: float = 0.05, max_number: int = 1000
+) -> Dict:
+    """
+    Returns timings of a function, in seconds per call.
+
+    The function is called once before it is timed, such that the compilation of numba functions and the filling of
+    caches is not timed. The number of calls per repeat is then increased until a repeat takes at least `min_time`,
+    and the time per call of every repeat is recorded.
+
+    The `min` is the most reproducible timing and is the value compared to a baseline, as noise from other processes
+    only ever slows a repeat down.
+
+    Parameters
+    ----------
+    func
+        The function which is timed, which has no inputs.
+    repeats
+        The number of repeats whose time per call is recorded.
+    min_time
+        The minimum time of a repeat, in seconds.
+    max_number
+        The maximum number of calls per repeat.
+    """
+    func()
+
+    number = 1
+
+    while True:
+
+        start = time.perf_counter()
+
+        for _ in range(number):
+            func()
+
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time or number >= max_number:
+            break
+
+        number = min(max_number, number * 10)
+
+    times = [elapsed / number]
+
+    for _ in range(repeats - 1):
+
+        start = time.perf_counter()
+
+        for _ in range(number):
+            func()
+
+        times.append((time.perf_counter() - start) / number)
+
+    return {
+        "min": float(np.min(times)),
+        "median": float(np.median(times)),
+        "mean": float(np.mean(times)),
+        "repeats": repeats,
+        "number": number,
+    }
+
+
+def metadata_dict_from() -> Dict:
+    """
+    Returns a description of the environment benchmarks are run in, which is stored with the results such that
+    results from different machines or library versions are not compared by mistake.
+    """
+    import numba
+    import scipy
+
+    import autoarray
+    from autoarray import numba_util
+
+    return {
+        "date": datetime.datetime.now().isoformat(),
+        "autoarray": autoarray.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "numba": numba.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "num_threads": numba_util.get_num_threads(),
+    }
+
+
+def run(
+    name_list: Optional[List[str]] = None,
+    parameter_dict: Optional[Dict[str, List]] = None,
+    repeats: int = 5,
+    min_time: float = 0.05,
+    verbose: bool = False,
+) -> Dict:
+    """
+    Run benchmarks for every combination of their parameters, returning the results as a dictionary which can be
+    output to a .json file (via `output_to_json`) and compared to a baseline (via `regression_dict_from`).
+
+    A benchmark which requires an optional library which is not installed (e.g. PyNUFFT) is recorded as skipped.
+
+    Every dataset is synthetic, with noise drawn from fixed random seeds, such that the results are reproducible and
+    no data needs to be downloaded.
+
+    Parameters
+    ----------
+    name_list
+        The names of the benchmarks which are run, where all registered benchmarks are run if `None`. A name runs
+        every benchmark whose name contains it.
+    parameter_dict
+        Values of parameters which override the default values, for example `{"mask_radius": [3.0]}`.
+    repeats
+        The number of repeats of every timing (see `timings_from`).
+    min_time
+        The minimum time of a repeat, in seconds (see `timings_from`).
+    verbose
+        If `True`, the result of every benchmark is printed as it is run.
+    """
+    from autoarray.benchmark import cases
+
+    result_dict = {}
+
+    for name, bench in benchmark_dict.items():
+
+        if name_list is not None and not any(
+            substring in name for substring in name_list
+        ):
+            continue
+
+        for params in bench.params_list_from(parameter_dict=parameter_dict):
+
+            key = key_from(name=name, params=params)
+
+            try:
+                func = bench.func(**params)
+            except ModuleNotFoundError as e:
+                result = {"skipped": str(e).strip()}
+            else:
+                result = timings_from(func=func, repeats=repeats, min_time=min_time)
+
+            result_dict[key] = {"name": name, "params": params, **result}
+
+            if verbose:
+                print(summary_line_from(key=key, result=result))
+
+    return {"metadata": metadata_dict_from(), "results": result_dict}
+
+
+def summary_line_from(key: str, result: Dict) -> str:
+
+    if "skipped" in result:
+        return f"{key:<100} skipped"
+
+    return f"{key:<100} {result['min'] * 1.0e3:12.4f} ms"
+
+
+def output_to_json(results: Dict, file_path: str):
+    """
+    Output the results of `run` to a .json file, which can be used as the baseline of later runs.
+    """
+    with open(file_path, "w") as f:
+        json.dump(results, f, indent=4)
+
+
+def results_from_json(file_path: str) -> Dict:
+    """
+    Load the results of `run` from a .json file.
+    """
+    with open(file_path) as f:
+        return json.load(f)
+
+
+def ratio_dict_from(results: Dict, baseline: Dict) -> Dict[str, float]:
+    """
+    Returns the ratio of the `min` timing of every benchmark to its `min` timing in a baseline, for every benchmark
+    which is in both and was not skipped in either.
+
+    A ratio above 1 means the benchmark is slower than the baseline.
+    """
+    ratio_dict = {}
+
+    for key, result in results["results"].items():
+
+        baseline_result = baseline["results"].get(key)
+
+        if baseline_result is None:
+            continue
+
+        if "skipped" in result or "skipped" in baseline_result:
+            continue
+
+        ratio_dict[key] = result["min"] / baseline_result["min"]
+
+    return ratio_dict
+
+
+def regression_dict_from(
+    results: Dict, baseline: Dict, tolerance: float = 0.25
+) -> Dict[str, float]:
+    """
+    Returns the ratio of the timing of every benchmark which is slower than its baseline by more than a tolerance
+    (see `ratio_dict_from`).
+
+    Parameters
+    ----------
+    results
+        The results of a run of the benchmarks.
+    baseline
+        The results of a previous run of the benchmarks (e.g. of the last release), which are compared to.
+    tolerance
+        The fractional slow down above which a benchmark is a regression, where the default of 0.25 allows for the
+        noise in timings on a shared machine.
+    """
+    return {
+        key: ratio
+        for key, ratio in ratio_dict_from(results=results, baseline=baseline).items()
+        if ratio > 1.0 + tolerance
+    }
@@ -0,0 +1,344 @@
+import numpy as np
+
+from autoarray.benchmark.benchmark import benchmark
+from autoarray.inversion import pixelizations as pix
+from autoarray.inversion.inversion import solver
+from autoarray.inversion.linear_eqn import leq_util
+from autoarray.inversion.mappers import mapper_util
+from autoarray.inversion.regularization.constant import Constant
+from autoarray.mock import fixtures
+from autoarray.operators.convolver import Convolver
+from autoarray.structures.arrays.two_d.array_2d import Array2D
+from autoarray.structures.grids.two_d import sparse_kmeans
+from autoarray.structures.grids.two_d.grid_2d import Grid2D
+
+"""
+The benchmarks of the hot paths of the likelihood functions of imaging and interferometer inversions.
+
+Every benchmark sets up a synthetic dataset (see the benchmark fixtures in `autoarray.mock.fixtures`) and returns a
+function which runs the code that is timed.
+"""
+
+
+def pixelization_from(pixelization: str, source_pixels: int):
+
+    shape_total = int(round(np.sqrt(source_pixels)))
+    shape = (shape_total, shape_total)
+
+    if pixelization == "rectangular":
+        return pix.Rectangular(shape=shape)
+    elif pixelization == "delaunay":
+        return pix.DelaunayMagnification(shape=shape)
+    elif pixelization == "voronoi":
+        return pix.VoronoiMagnification(shape=shape)
+    elif pixelization == "voronoi_nn":
+
+        from autoarray.util.nn import nn_py
+
+        if not hasattr(nn_py, "_mod"):
+            raise ModuleNotFoundError(
+                "The natural neighbour interpolation library is not built."
+            )
+
+        return pix.VoronoiNNMagnification(shape=shape)
+
+    raise ValueError(
+        f"The pixelization {pixelization} is not a benchmarked pixelization."
+    )
+
+
+def mapper_from(grid: Grid2D, pixelization: str, source_pixels: int):
+
+    pixelization = pixelization_from(
+        pixelization=pixelization, source_pixels=source_pixels
+    )
+
+    source_pixelization_grid = pixelization.data_pixelization_grid_from(
+        data_grid_slim=grid
+    )
+
+    return pixelization.mapper_from(
+        source_grid_slim=grid, source_pixelization_grid=source_pixelization_grid
+    )
+
+
+@benchmark()
+def convolver_setup(mask_radius, kernel_size):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, kernel_size=kernel_size
+    )
+
+    return lambda: Convolver(mask=imaging.mask, kernel=imaging.psf)
+
+
+@benchmark()
+def convolve_image(mask_radius, kernel_size):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, kernel_size=kernel_size
+    )
+
+    blurring_image = Array2D.manual_mask(
+        array=np.ones(imaging.mask.shape_native),
+        mask=imaging.mask.blurring_mask_from(
+            kernel_shape_native=imaging.psf.shape_native
+        ),
+    )
+
+    convolver = imaging.convolver
+
+    return lambda: convolver.convolve_image(
+        image=imaging.image, blurring_image=blurring_image
+    )
+
+
+@benchmark()
+def convolve_mapping_matrix(mask_radius, sub_size, kernel_size, source_pixels):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, sub_size=sub_size, kernel_size=kernel_size
+    )
+
+    mapper = mapper_from(
+        grid=imaging.grid_inversion,
+        pixelization="rectangular",
+        source_pixels=source_pixels,
+    )
+
+    mapping_matrix = mapper.mapping_matrix
+
+    convolver = imaging.convolver
+
+    return lambda: convolver.convolve_mapping_matrix(mapping_matrix=mapping_matrix)
+
+
+@benchmark()
+def w_tilde_curvature_preload(mask_radius, kernel_size):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, kernel_size=kernel_size
+    )
+
+    return lambda: leq_util.w_tilde_curvature_preload_imaging_from(
+        noise_map_native=imaging.noise_map.native,
+        kernel_native=imaging.psf.native,
+        native_index_for_slim_index=imaging.mask.native_index_for_slim_index,
+    )
+
+
+@benchmark(pixelization=["rectangular", "delaunay", "voronoi", "voronoi_nn"])
+def pix_sub_weights(mask_radius, sub_size, source_pixels, pixelization):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, sub_size=sub_size
+    )
+
+    grid = imaging.grid_inversion
+
+    mapper_from(grid=grid, pixelization=pixelization, source_pixels=source_pixels)
+
+    return lambda: mapper_from(
+        grid=grid, pixelization=pixelization, source_pixels=source_pixels
+    ).pix_sub_weights
+
+
+@benchmark(pixelization=["rectangular", "delaunay", "voronoi"])
+def mapping_matrix(mask_radius, sub_size, source_pixels, pixelization):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, sub_size=sub_size
+    )
+
+    mapper = mapper_from(
+        grid=imaging.grid_inversion,
+        pixelization=pixelization,
+        source_pixels=source_pixels,
+    )
+
+    return lambda: mapper_util.mapping_matrix_from(
+        pix_weights_for_sub_slim_index=mapper.pix_weights_for_sub_slim_index,
+        pixels=mapper.pixels,
+        total_mask_sub_pixels=mapper.source_grid_slim.mask.pixels_in_mask,
+        slim_index_for_sub_slim_index=mapper.slim_index_for_sub_slim_index,
+        pix_indexes_for_sub_slim_index=mapper.pix_indexes_for_sub_slim_index,
+        pix_size_for_sub_slim_index=mapper.pix_sizes_for_sub_slim_index,
+        sub_fraction=mapper.source_grid_slim.mask.sub_fraction,
+    )
+
+
+@benchmark(formalism=["mapping", "w_tilde", "sparse_preload"])
+def curvature_matrix(mask_radius, sub_size, kernel_size, source_pixels, formalism):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, sub_size=sub_size, kernel_size=kernel_size
+    )
+
+    mapper = mapper_from(
+        grid=imaging.grid_inversion,
+        pixelization="rectangular",
+        source_pixels=source_pixels,
+    )
+
+    noise_map = np.asarray(imaging.noise_map)
+
+    if formalism == "w_tilde":
+
+        w_tilde = imaging.w_tilde
+        data_unique_mappings = mapper.data_unique_mappings
+
+        return lambda: leq_util.curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+            curvature_preload=w_tilde.curvature_preload,
+            curvature_indexes=w_tilde.indexes,
+            curvature_lengths=w_tilde.lengths,
+            data_to_pix_unique=data_unique_mappings.data_to_pix_unique,
+            data_weights=data_unique_mappings.data_weights,
+            pix_lengths=data_unique_mappings.pix_lengths,
+            pix_pixels=mapper.pixels,
+        )
+
+    blurred_mapping_matrix = imaging.convolver.convolve_mapping_matrix(
+        mapping_matrix=mapper.mapping_matrix
+    )
+
+    if formalism == "sparse_preload":
+
+        (
+            curvature_matrix_preload,
+            curvature_matrix_counts,
+        ) = leq_util.curvature_matrix_preload_from(
+            mapping_matrix=blurred_mapping_matrix
+        )
+
+        curvature_matrix_preload = curvature_matrix_preload.astype("int")
+        curvature_matrix_counts = curvature_matrix_counts.astype("int")
+
+        return lambda: leq_util.curvature_matrix_via_sparse_preload_from(
+            mapping_matrix=blurred_mapping_matrix,
+            noise_map=noise_map,
+            curvature_matrix_preload=curvature_matrix_preload,
+            curvature_matrix_counts=curvature_matrix_counts,
+        )
+
+    return lambda: leq_util.curvature_matrix_via_mapping_matrix_from(
+        mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+    )
+
+
+@benchmark(solver_class=["dense", "sparse"])
+def log_det(mask_radius, source_pixels, solver_class):
+
+    imaging = fixtures.make_masked_imaging_benchmark(mask_radius=mask_radius)
+
+    mapper = mapper_from(
+        grid=imaging.grid_inversion,
+        pixelization="rectangular",
+        source_pixels=source_pixels,
+    )
+
+    blurred_mapping_matrix = imaging.convolver.convolve_mapping_matrix(
+        mapping_matrix=mapper.mapping_matrix
+    )
+
+    curvature_reg_matrix = leq_util.curvature_matrix_via_mapping_matrix_from(
+        mapping_matrix=blurred_mapping_matrix, noise_map=np.asarray(imaging.noise_map)
+    ) + Constant(coefficient=1.0).regularization_matrix_from(mapper=mapper)
+
+    cls = solver.SolverDense if solver_class == "dense" else solver.SolverSparse
+
+    return lambda: cls(matrix=curvature_reg_matrix).log_det
+
+
+def transformer_from(mask_radius: float, total_visibilities: int, transformer: str):
+
+    from autoarray.operators.transformer import TransformerDFT
+    from autoarray.operators.transformer import TransformerKaiserBessel
+    from autoarray.operators.transformer import TransformerNUFFT
+
+    transformer_class = {
+        "dft": TransformerDFT,
+        "nufft": TransformerNUFFT,
+        "kaiser_bessel": TransformerKaiserBessel,
+    }[transformer]
+
+    return transformer_class(
+        uv_wavelengths=fixtures.make_uv_wavelengths_benchmark(
+            total_visibilities=total_visibilities
+        ),
+        real_space_mask=fixtures.make_mask_2d_benchmark(mask_radius=mask_radius),
+    )
+
+
+@benchmark(transformer=["dft", "nufft", "kaiser_bessel"])
+def transformer_visibilities(mask_radius, total_visibilities, transformer):
+
+    transformer = transformer_from(
+        mask_radius=mask_radius,
+        total_visibilities=total_visibilities,
+        transformer=transformer,
+    )
+
+    image = Array2D.manual_mask(
+        array=np.ones(transformer.real_space_mask.shape_native),
+        mask=transformer.real_space_mask,
+    )
+
+    return lambda: transformer.visibilities_from(image=image)
+
+
+@benchmark(
+    source_pixels=[100, 400],
+    total_visibilities=[100, 1000],
+    transformer=["dft", "nufft", "kaiser_bessel"],
+)
+def transform_mapping_matrix(
+    mask_radius, source_pixels, total_visibilities, transformer
+):
+
+    transformer = transformer_from(
+        mask_radius=mask_radius,
+        total_visibilities=total_visibilities,
+        transformer=transformer,
+    )
+
+    mapper = mapper_from(
+        grid=Grid2D.from_mask(mask=transformer.real_space_mask),
+        pixelization="rectangular",
+        source_pixels=source_pixels,
+    )
+
+    mapping_matrix = mapper.mapping_matrix
+
+    return lambda: transformer.transform_mapping_matrix(mapping_matrix=mapping_matrix)
+
+
+@benchmark()
+def border_relocation(mask_radius, sub_size):
+
+    imaging = fixtures.make_masked_imaging_benchmark(
+        mask_radius=mask_radius, sub_size=sub_size
+    )
+
+    grid = imaging.grid_inversion
+
+    traced_grid = Grid2D(grid=2.0 * np.asarray(grid), mask=grid.mask)
+
+    return lambda: grid.relocated_grid_from(grid=traced_grid)
+
+
+@benchmark(source_pixels=[100, 300], mini_batch_size=[None, 256])
+def kmeans(mask_radius, source_pixels, mini_batch_size):
+
+    imaging = fixtures.make_masked_imaging_benchmark(mask_radius=mask_radius)
+
+    grid = np.asarray(imaging.grid)
+    weight_map = np.abs(np.asarray(imaging.image)) + 0.1
+
+    return lambda: sparse_kmeans.cluster_centers_and_labels_from(
+        grid=grid,
+        weight_map=weight_map,
+        total_pixels=source_pixels,
+        seed=1,
+        use_cache=False,
+        mini_batch_size=mini_batch_size,
+    )
@@ -14,6 +14,7 @@ from autoarray.structures.grids.two_d.grid_2d_iterate import Grid2DIterate
 from autoarray.structures.vectors.uniform import VectorYX2D
 from autoarray.structures.visibilities import Visibilities
 from autoarray.structures.visibilities import VisibilitiesNoiseMap
+from autoarray.dataset.w_tilde_cache import WTildeCache
 from autoarray.mask.mask_1d import Mask1D
 from autoarray.mask.mask_2d import Mask2D
 
@@ -86,6 +87,8 @@ class AbstractSettingsDataset:
         sub_steps: Optional[List[int]] = None,
         signal_to_noise_limit: Optional[float] = None,
         signal_to_noise_limit_radii: Optional[float] = None,
+        use_w_tilde_cache: bool = True,
+        w_tilde_cache_path: Optional[str] = None,
     ):
         """
         A dataset is a collection of data structures (e.g. the data, noise-map, PSF), a mask, grid, convolver
@@ -119,6 +122,12 @@ class AbstractSettingsDataset:
         signal_to_noise_limit
             If input, the dataset's noise-map is rescaled such that no pixel has a signal-to-noise above the
             signa to noise limit.
+        use_w_tilde_cache
+            If `True`, the w_tilde preloads of the dataset are stored in an on-disk cache (see `WTildeCache`), such
+            that they are only computed once and loaded by every other process that uses the same dataset.
+        w_tilde_cache_path
+            The directory the w_tilde cache is stored in, which defaults to a folder in the system's temporary
+            directory.
         """
 
         self.grid_class = grid_class
@@ -134,6 +143,18 @@ class AbstractSettingsDataset:
         self.sub_steps = sub_steps
         self.signal_to_noise_limit = signal_to_noise_limit
         self.signal_to_noise_limit_radii = signal_to_noise_limit_radii
+        self.use_w_tilde_cache = use_w_tilde_cache
+        self.w_tilde_cache_path = w_tilde_cache_path
+
+    @property
+    def w_tilde_cache(self) -> Optional[WTildeCache]:
+        """
+        The on-disk cache of the dataset's w_tilde preloads, which is `None` if the cache is disabled.
+        """
+        if not self.use_w_tilde_cache:
+            return None
+
+        return WTildeCache(cache_path=self.w_tilde_cache_path)
 
     def grid_from(self, mask) -> Union[Grid1D, Grid2D]:
 
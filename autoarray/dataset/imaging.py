@@ -1,15 +1,17 @@
 import copy
 import logging
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from autoconf import cached_property
 
 from autoarray.dataset.abstract_dataset import AbstractWTilde
 from autoarray.dataset.abstract_dataset import AbstractSettingsDataset
 from autoarray.dataset.abstract_dataset import AbstractDataset
+from autoarray.dataset.w_tilde_cache import WTildeCache
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.operators.convolver import Convolver
+from autoarray.operators.convolver import ConvolverFFT
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
 from autoarray.structures.kernel_2d import Kernel2D
 from autoarray.mask.mask_2d import Mask2D
@@ -32,6 +34,74 @@ class WTildeImaging(AbstractWTilde):
         self.lengths = lengths
 
 
+def w_tilde_imaging_from(
+    noise_map: Array2D,
+    psf: Kernel2D,
+    mask: Mask2D,
+    w_tilde_cache: Optional[WTildeCache] = None,
+    dtype: str = "float64",
+) -> WTildeImaging:
+    """
+    Returns the `WTildeImaging` object of an imaging dataset, which stores the precomputed w_tilde values used
+    to efficiently compute the curvature matrix of an inversion (see `leq_util.w_tilde_curvature_preload_imaging_from`).
+
+    If a `WTildeCache` is input, the values are loaded from the on-disk cache if they have previously been computed
+    for the same noise-map, PSF and mask, and are otherwise computed and saved to the cache.
+
+    Parameters
+    ----------
+    noise_map
+        The noise-map of the imaging dataset.
+    psf
+        The PSF of the imaging dataset.
+    mask
+        The mask of the imaging dataset.
+    w_tilde_cache
+        The on-disk cache the w_tilde values are loaded from and saved to.
+    dtype
+        The data type the curvature preload is stored in (e.g. `float32`).
+    """
+
+    def w_tilde_array_dict_from():
+
+        logger.info("IMAGING - Computing W-Tilde... May take a moment.")
+
+        curvature_preload, indexes, lengths = leq_util.w_tilde_curvature_preload_imaging_from(
+            noise_map_native=noise_map.native,
+            kernel_native=psf.native,
+            native_index_for_slim_index=mask.native_index_for_slim_index,
+        )
+
+        return {
+            "curvature_preload": curvature_preload.astype(dtype, copy=False),
+            "indexes": indexes.astype("int"),
+            "lengths": lengths.astype("int"),
+        }
+
+    if w_tilde_cache is None:
+        array_dict = w_tilde_array_dict_from()
+    else:
+        key = w_tilde_cache.key_from(
+            "w_tilde_imaging",
+            np.asarray(noise_map.native),
+            np.asarray(psf.native),
+            np.asarray(mask),
+            mask.pixel_scales,
+            np.dtype(dtype).str,
+        )
+
+        array_dict = w_tilde_cache.cached_arrays_from(
+            key=key, func=w_tilde_array_dict_from
+        )
+
+    return WTildeImaging(
+        curvature_preload=array_dict["curvature_preload"],
+        indexes=array_dict["indexes"],
+        lengths=array_dict["lengths"],
+        noise_map_value=noise_map[0],
+    )
+
+
 class SettingsImaging(AbstractSettingsDataset):
     def __init__(
         self,
@@ -45,6 +115,11 @@ class SettingsImaging(AbstractSettingsDataset):
         signal_to_noise_limit: Optional[float] = None,
         signal_to_noise_limit_radii: Optional[float] = None,
         use_normalized_psf: Optional[bool] = True,
+        use_fft_convolver: Optional[bool] = None,
+        fft_convolver_kernel_size: int = 21,
+        use_w_tilde_cache: bool = True,
+        w_tilde_cache_path: Optional[str] = None,
+        dtype: str = "float64",
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver
@@ -81,6 +156,22 @@ class SettingsImaging(AbstractSettingsDataset):
         psf_shape_2d
             The shape of the PSF used for convolving model image generated using analytic light profiles. A smaller
             shape will trim the PSF relative to the input image PSF, giving a faster analysis run-time.
+        use_fft_convolver
+            If `True` PSF convolution is performed via Fast Fourier Transforms (`ConvolverFFT`), if `False` via the
+            real-space image frames of the `Convolver`. If `None`, the `ConvolverFFT` is used if either dimension of
+            the PSF is greater than or equal to `fft_convolver_kernel_size`.
+        fft_convolver_kernel_size
+            The PSF size above which the `ConvolverFFT` is used if `use_fft_convolver` is `None`.
+        use_w_tilde_cache
+            If `True`, the w_tilde preloads of the dataset are stored in an on-disk cache (see `WTildeCache`), such
+            that they are only computed once and loaded by every other process that uses the same dataset.
+        w_tilde_cache_path
+            The directory the w_tilde cache is stored in, which defaults to a folder in the system's temporary
+            directory.
+        dtype
+            The data type the w_tilde curvature preload is stored in, where `float32` halves its memory and speeds
+            up the memory-bandwidth bound construction of the curvature matrix (which is still summed in double
+            precision).
         """
 
         super().__init__(
@@ -93,9 +184,39 @@ class SettingsImaging(AbstractSettingsDataset):
             sub_steps=sub_steps,
             signal_to_noise_limit=signal_to_noise_limit,
             signal_to_noise_limit_radii=signal_to_noise_limit_radii,
+            use_w_tilde_cache=use_w_tilde_cache,
+            w_tilde_cache_path=w_tilde_cache_path,
         )
 
         self.use_normalized_psf = use_normalized_psf
+        self.use_fft_convolver = use_fft_convolver
+        self.fft_convolver_kernel_size = fft_convolver_kernel_size
+        self.dtype = dtype
+
+    def convolver_class_from(self, kernel_shape_native: Tuple[int, int]):
+        """
+        Returns the class used to perform PSF convolution, which is the `ConvolverFFT` if `use_fft_convolver` is
+        `True` and the `Convolver` if it is `False`.
+
+        If `use_fft_convolver` is `None` the class is chosen via the PSF size, because the run time of the
+        `Convolver` scales with the number of PSF pixels whereas the `ConvolverFFT` is independent of it.
+
+        Parameters
+        ----------
+        kernel_shape_native
+            The 2D shape of the PSF which the data is convolved with.
+        """
+        use_fft_convolver = self.use_fft_convolver
+
+        if use_fft_convolver is None:
+            use_fft_convolver = (
+                max(kernel_shape_native) >= self.fft_convolver_kernel_size
+            )
+
+        if use_fft_convolver:
+            return ConvolverFFT
+
+        return Convolver
 
 
 class Imaging(AbstractDataset):
@@ -193,6 +314,9 @@ class Imaging(AbstractDataset):
         The `Convolver` stores in memory the array indexing between the mask and PSF, enabling efficient 2D PSF
         convolution of images and matrices used for linear algebra calculations (see `operators.convolver`).
 
+        For large PSFs a `ConvolverFFT` is returned instead, which performs the convolution via Fast Fourier
+        Transforms (see `SettingsImaging.convolver_class_from`).
+
         This uses lazy allocation such that the calculation is only performed when the convolver is used, ensuring
         efficient set up of the `Imaging` class.
 
@@ -201,7 +325,11 @@ class Imaging(AbstractDataset):
         Convolver
             The convolver given the masked imaging data's mask and PSF.
         """
-        return Convolver(mask=self.mask, kernel=self.psf)
+        convolver_class = self.settings.convolver_class_from(
+            kernel_shape_native=self.psf.shape_native
+        )
+
+        return convolver_class(mask=self.mask, kernel=self.psf)
 
     @cached_property
     def w_tilde(self):
@@ -215,25 +343,20 @@ class Imaging(AbstractDataset):
         This uses lazy allocation such that the calculation is only performed when the wtilde matrices are used,
         ensuring efficient set up of the `Imaging` class.
 
+        If the settings use the w_tilde cache, the values are loaded from an on-disk cache if they have already been
+        computed for the same noise-map, PSF and mask (e.g. by another process), which are memory mapped on load.
+
         Returns
         -------
         WTildeImaging
             Precomputed values used for the w tilde formalism of linear algebra calculations.
         """
-
-        logger.info("IMAGING - Computing W-Tilde... May take a moment.")
-
-        curvature_preload, indexes, lengths = leq_util.w_tilde_curvature_preload_imaging_from(
-            noise_map_native=self.noise_map.native,
-            kernel_native=self.psf.native,
-            native_index_for_slim_index=self.mask.native_index_for_slim_index,
-        )
-
-        return WTildeImaging(
-            curvature_preload=curvature_preload,
-            indexes=indexes.astype("int"),
-            lengths=lengths.astype("int"),
-            noise_map_value=self.noise_map[0],
+        return w_tilde_imaging_from(
+            noise_map=self.noise_map,
+            psf=self.psf,
+            mask=self.mask,
+            w_tilde_cache=self.settings.w_tilde_cache,
+            dtype=self.settings.dtype,
         )
 
     @classmethod
@@ -9,8 +9,6 @@ from autoarray.dataset.abstract_dataset import AbstractWTilde
 from autoarray.dataset.abstract_dataset import AbstractSettingsDataset
 from autoarray.dataset.abstract_dataset import AbstractDataset
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
-from autoarray.operators.transformer import TransformerDFT
-from autoarray.operators.transformer import TransformerNUFFT
 from autoarray.structures.visibilities import Visibilities
 from autoarray.structures.visibilities import VisibilitiesNoiseMap
 
@@ -23,12 +21,34 @@ logger = logging.getLogger(__name__)
 
 
 class WTildeInterferometer(AbstractWTilde):
-    def __init__(self, curvature_preload, noise_map_value):
+    def __init__(self, curvature_preload, dirty_image, noise_map_value):
+        """
+        Packages together all derived data quantities necessary to fit `Interferometer` data using an `Inversion` via
+        the w_tilde formalism.
+
+        The w_tilde formalism performs the NUFFT of every pair of image pixels once, storing the values for every
+        image pixel offset (see `inversion_interferometer_util.w_tilde_curvature_preload_interferometer_from`). The
+        curvature matrix and data vector of an inversion can then be computed without performing a NUFFT of the
+        mapping matrix, which for datasets with many visibilities is the dominant cost of the calculation.
 
+        Parameters
+        ----------
+        curvature_preload
+            A matrix which uses the translation invariance of the NUFFT of every image pixel pair to compute the
+            curvature matrix efficiently, by storing its value for every image pixel offset in the real-space mask.
+        dirty_image
+            The Fourier transform of the visibilities divided by the noise-map squared to every real-space image
+            pixel, which is used to compute the data vector efficiently.
+        noise_map_value
+            The first value of the noise-map used to construct the curvature preload, which is used as a sanity
+            check when performing the inversion to ensure the preload corresponds to the data being fitted.
+        """
         super().__init__(
             curvature_preload=curvature_preload, noise_map_value=noise_map_value
         )
 
+        self.dirty_image = dirty_image
+
 
 class SettingsInterferometer(AbstractSettingsDataset):
     def __init__(
@@ -40,7 +60,9 @@ class SettingsInterferometer(AbstractSettingsDataset):
         fractional_accuracy: float = 0.9999,
         sub_steps: List[int] = None,
         signal_to_noise_limit: Optional[float] = None,
-        transformer_class=TransformerNUFFT,
+        transformer_class=None,
+        use_w_tilde_cache: bool = True,
+        w_tilde_cache_path: Optional[str] = None,
     ):
         """
           The lens dataset is the collection of data_type (image, noise-map), a mask, grid, convolver \
@@ -69,6 +91,12 @@ class SettingsInterferometer(AbstractSettingsDataset):
         signal_to_noise_limit
             If input, the dataset's noise-map is rescaled such that no pixel has a signal-to-noise above the
             signa to noise limit.
+        use_w_tilde_cache
+            If `True`, the w_tilde preloads of the dataset are stored in an on-disk cache (see `WTildeCache`), such
+            that they are only computed once and loaded by every other process that uses the same dataset.
+        w_tilde_cache_path
+            The directory the w_tilde cache is stored in, which defaults to a folder in the system's temporary
+            directory.
           """
 
         super().__init__(
@@ -79,9 +107,28 @@ class SettingsInterferometer(AbstractSettingsDataset):
             fractional_accuracy=fractional_accuracy,
             sub_steps=sub_steps,
             signal_to_noise_limit=signal_to_noise_limit,
+            use_w_tilde_cache=use_w_tilde_cache,
+            w_tilde_cache_path=w_tilde_cache_path,
         )
 
-        self.transformer_class = transformer_class
+        self._transformer_class = transformer_class
+
+    @property
+    def transformer_class(self):
+        """
+        The class of the transformer used to Fourier transform images to visibilities, which defaults to the
+        `TransformerNUFFT`. It is resolved when first accessed such that `pylops` is not imported with `autoarray`.
+        """
+        if self._transformer_class is None:
+            from autoarray.operators.transformer import TransformerNUFFT
+
+            return TransformerNUFFT
+
+        return self._transformer_class
+
+    @transformer_class.setter
+    def transformer_class(self, transformer_class):
+        self._transformer_class = transformer_class
 
 
 class Interferometer(AbstractDataset):
@@ -164,7 +211,7 @@ class Interferometer(AbstractDataset):
     def w_tilde(self):
         """
         The w_tilde formalism of the linear algebra equations precomputes the Fourier Transform of all the visibilities
-        given the `uv_wavelengths` (see `inversion.inversion_util`).
+        given the `uv_wavelengths` (see `inversion.inversion_interferometer_util`).
 
         The `WTilde` object stores these precomputed values in the interferometer dataset ensuring they are only
         computed once per analysis.
@@ -172,23 +219,73 @@ class Interferometer(AbstractDataset):
         This uses lazy allocation such that the calculation is only performed when the wtilde matrices are used,
         ensuring efficient set up of the `Interferometer` class.
 
+        The curvature preload assumes the real and imaginary noise-map values of every visibility are equal, which
+        makes the NUFFT of every image pixel pair depend only on the offset between them. An exception is raised if
+        this is not the case, in which case the mapping formalism should be used instead.
+
+        If the settings use the w_tilde cache, the values are loaded from an on-disk cache if they have already been
+        computed for the same visibilities, noise-map, uv-wavelengths and mask (e.g. by another process), which are
+        memory mapped on load.
+
         Returns
         -------
         WTildeInterferometer
             Precomputed values used for the w tilde formalism of linear algebra calculations.
         """
 
-        logger.info("IMAGING - Computing W-Tilde... May take a moment.")
+        if not np.allclose(self.noise_map.real, self.noise_map.imag):
+            raise exc.InversionException(
+                "The w_tilde formalism for Interferometer data requires the real and imaginary noise-map values "
+                "of every visibility to be equal, which is not the case for this dataset. "
+                "Use the mapping formalism instead (e.g. `SettingsInversion(use_w_tilde_interferometer=False)`)."
+            )
 
-        curvature_preload = inversion_interferometer_util.w_tilde_curvature_preload_interferometer_from(
-            noise_map_real=self.noise_map.real,
-            uv_wavelengths=self.uv_wavelengths,
-            shape_masked_pixels_2d=self.transformer.grid.mask.shape_native_masked_pixels,
-            grid_radians_2d=self.transformer.grid.mask.unmasked_grid_sub_1.in_radians.native,
-        )
+        mask = self.transformer.real_space_mask
+
+        def w_tilde_array_dict_from():
+
+            logger.info("INTERFEROMETER - Computing W-Tilde... May take a moment.")
+
+            curvature_preload = inversion_interferometer_util.w_tilde_curvature_preload_interferometer_from(
+                noise_map_real=self.noise_map.real,
+                uv_wavelengths=self.uv_wavelengths,
+                shape_masked_pixels_2d=mask.shape_native_masked_pixels,
+                grid_radians_2d=mask.unmasked_grid_sub_1.in_radians.native,
+            )
+
+            dirty_image = inversion_interferometer_util.w_tilde_data_interferometer_from(
+                visibilities_real=self.visibilities.real,
+                visibilities_imag=self.visibilities.imag,
+                noise_map_real=self.noise_map.real,
+                noise_map_imag=self.noise_map.imag,
+                uv_wavelengths=self.uv_wavelengths,
+                grid_radians_slim=mask.masked_grid_sub_1.binned.in_radians,
+            )
+
+            return {"curvature_preload": curvature_preload, "dirty_image": dirty_image}
+
+        w_tilde_cache = self.settings.w_tilde_cache
+
+        if w_tilde_cache is None:
+            array_dict = w_tilde_array_dict_from()
+        else:
+            key = w_tilde_cache.key_from(
+                "w_tilde_interferometer",
+                np.asarray(self.visibilities),
+                np.asarray(self.noise_map),
+                np.asarray(self.uv_wavelengths),
+                np.asarray(mask),
+                mask.pixel_scales,
+            )
+
+            array_dict = w_tilde_cache.cached_arrays_from(
+                key=key, func=w_tilde_array_dict_from
+            )
 
         return WTildeInterferometer(
-            curvature_preload=curvature_preload, noise_map_value=self.noise_map[0]
+            curvature_preload=array_dict["curvature_preload"],
+            dirty_image=array_dict["dirty_image"],
+            noise_map_value=self.noise_map[0],
         )
 
     @property
@@ -294,7 +391,7 @@ class AbstractSimulatorInterferometer:
         self,
         uv_wavelengths,
         exposure_time: float,
-        transformer_class=TransformerDFT,
+        transformer_class=None,
         noise_sigma=0.1,
         noise_if_add_noise_false=0.1,
         noise_seed=-1,
@@ -317,6 +414,12 @@ class AbstractSimulatorInterferometer:
 
         self.uv_wavelengths = uv_wavelengths
         self.exposure_time = exposure_time
+
+        if transformer_class is None:
+            from autoarray.operators.transformer import TransformerDFT
+
+            transformer_class = TransformerDFT
+
         self.transformer_class = transformer_class
         self.noise_sigma = noise_sigma
         self.noise_if_add_noise_false = noise_if_add_noise_false
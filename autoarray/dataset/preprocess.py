@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.stats import norm
 
 from autoarray import exc
 
@@ -234,6 +233,8 @@ def background_noise_map_via_edges_of_image_from(image, no_edges):
         Number of edges used to estimate the background level.
     """
 
+    from scipy.stats import norm
+
     from autoarray.structures.arrays.two_d.array_2d import Array2D
 
     edges = []
@@ -0,0 +1,327 @@
+import hashlib
+import logging
+import numpy as np
+import os
+from os import path
+import shutil
+import tempfile
+import time
+import uuid
+from typing import Dict, Optional
+
+from autoconf import conf
+
+logger = logging.getLogger(__name__)
+
+"""
+The version of the w_tilde calculations stored in the cache, which is included in every key such that a change to
+how the w_tilde preloads are computed does not load outdated values from the cache.
+"""
+w_tilde_cache_version = "1"
+
+
+def default_cache_path() -> str:
+    return path.join(tempfile.gettempdir(), "autoarray", "w_tilde")
+
+
+def default_max_size_gb() -> float:
+    try:
+        return float(conf.instance["general"]["w_tilde"]["cache_max_size_gb"])
+    except Exception:
+        return 10.0
+
+
+class WTildeCache:
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        max_size_gb: Optional[float] = None,
+        lock_timeout: float = 3600.0,
+    ):
+        """
+        A content-addressed on-disk cache of the w_tilde preloads of `Imaging` and `Interferometer` datasets.
+
+        Computing the w_tilde preloads is expensive and, because they are stored in memory on the dataset, they are
+        recomputed by every new Python process which uses the dataset (e.g. every worker of a parallel non-linear
+        search and every restart of a search). This cache stores the preloads on hard-disk as `.npy` files, keyed
+        on a hash of the quantities they are computed from (e.g. the noise-map, PSF and mask), such that they are
+        computed once and loaded by every other process.
+
+        Arrays are loaded via memory mapping, meaning that processes on the same machine share the same physical
+        memory for the preloads and loading them is near instantaneous.
+
+        The total size of the cache is bounded, with the least recently used entries removed when it is exceeded.
+
+        If multiple processes request the same entry simultaneously, the first process computes it whilst the others
+        wait for it to be written to the cache (see `lock`).
+
+        Parameters
+        ----------
+        cache_path
+            The directory the cache is stored in, which defaults to a folder in the system's temporary directory.
+        max_size_gb
+            The maximum total size of the cache in gigabytes, above which the least recently used entries are
+            removed. Defaults to the value in the general.ini config file.
+        lock_timeout
+            The time in seconds a process waits for another process to compute an entry, after which the entry
+            is computed regardless.
+        """
+        self.cache_path = cache_path or default_cache_path()
+        self.max_size_gb = (
+            max_size_gb if max_size_gb is not None else default_max_size_gb()
+        )
+        self.lock_timeout = lock_timeout
+
+    @staticmethod
+    def key_from(name: str, *args) -> str:
+        """
+        Returns the key of a cache entry, which is the hash of every quantity used to compute the cached values.
+
+        Arrays are hashed using their shape, data type and raw bytes, with all other quantities (e.g. the pixel
+        scales of a mask) hashed via their string representation.
+
+        Parameters
+        ----------
+        name
+            The name of the quantities being cached (e.g. `w_tilde_imaging`), which is prefixed to the key.
+        args
+            The arrays and values the cached quantities are computed from.
+        """
+        hasher = hashlib.sha256()
+
+        hasher.update(w_tilde_cache_version.encode())
+
+        for arg in args:
+
+            if isinstance(arg, np.ndarray):
+                array = np.ascontiguousarray(arg)
+                hasher.update(str(array.shape).encode())
+                hasher.update(str(array.dtype).encode())
+                hasher.update(array.tobytes())
+            else:
+                hasher.update(repr(arg).encode())
+
+        return f"{name}_{hasher.hexdigest()}"
+
+    def entry_path_from(self, key: str) -> str:
+        return path.join(self.cache_path, key)
+
+    def load(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Load the arrays of a cache entry as read-only memory mapped arrays, returning `None` if the entry is not in
+        the cache.
+
+        Loading an entry updates its modification time, which is used to determine the least recently used entries
+        when the cache exceeds its maximum size.
+
+        Parameters
+        ----------
+        key
+            The key of the cache entry (see `key_from`).
+        """
+        entry_path = self.entry_path_from(key=key)
+
+        if not path.isdir(entry_path):
+            return None
+
+        try:
+            array_dict = {
+                file[:-4]: np.load(path.join(entry_path, file), mmap_mode="r")
+                for file in os.listdir(entry_path)
+                if file.endswith(".npy")
+            }
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+
+        return array_dict
+
+    def save(self, key: str, array_dict: Dict[str, np.ndarray]):
+        """
+        Save a dictionary of arrays to the cache as `.npy` files.
+
+        The arrays are written to a temporary directory which is renamed to the entry's path once complete, such that
+        other processes never load a partially written entry. The least recently used entries are then removed if
+        the cache exceeds its maximum size.
+
+        Parameters
+        ----------
+        key
+            The key of the cache entry (see `key_from`).
+        array_dict
+            The arrays that are cached, where the keys of the dictionary are used as the file names.
+        """
+        entry_path = self.entry_path_from(key=key)
+
+        if path.isdir(entry_path):
+            return
+
+        tmp_path = path.join(self.cache_path, f".tmp_{key}_{uuid.uuid4().hex}")
+
+        try:
+            os.makedirs(tmp_path)
+
+            for name, array in array_dict.items():
+                np.save(path.join(tmp_path, f"{name}.npy"), np.asarray(array))
+
+            os.rename(tmp_path, entry_path)
+        except OSError as e:
+            logger.info(f"W-TILDE CACHE - Could not write entry {key} to cache ({e}).")
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self.evict(keep_key=key)
+
+    @property
+    def entry_size_dict(self) -> Dict[str, int]:
+        """
+        The size in bytes of every entry in the cache.
+        """
+        entry_size_dict = {}
+
+        if not path.isdir(self.cache_path):
+            return entry_size_dict
+
+        for key in os.listdir(self.cache_path):
+
+            entry_path = self.entry_path_from(key=key)
+
+            if key.startswith(".") or not path.isdir(entry_path):
+                continue
+
+            entry_size_dict[key] = sum(
+                path.getsize(path.join(entry_path, file))
+                for file in os.listdir(entry_path)
+            )
+
+        return entry_size_dict
+
+    def evict(self, keep_key: Optional[str] = None):
+        """
+        Remove the least recently used entries of the cache until its total size is below `max_size_gb`.
+
+        Parameters
+        ----------
+        keep_key
+            The key of an entry which is never removed (e.g. the entry that has just been saved).
+        """
+        try:
+            entry_size_dict = self.entry_size_dict
+        except OSError:
+            return
+
+        max_size = self.max_size_gb * 1.0e9
+        total_size = sum(entry_size_dict.values())
+
+        if total_size <= max_size:
+            return
+
+        def last_used(key):
+            try:
+                return path.getmtime(self.entry_path_from(key=key))
+            except OSError:
+                return 0.0
+
+        for key in sorted(entry_size_dict, key=last_used):
+
+            if total_size <= max_size:
+                break
+
+            if key == keep_key:
+                continue
+
+            shutil.rmtree(self.entry_path_from(key=key), ignore_errors=True)
+            total_size -= entry_size_dict[key]
+
+    def lock(self, key: str) -> bool:
+        """
+        Attempt to acquire a lock for computing a cache entry, so that when many processes request the same entry
+        at once it is only computed by one of them.
+
+        If the lock is already held by another process, this function waits until the entry appears in the cache
+        (or the lock is released) and returns `False`, such that the entry can then be loaded. If the lock is held
+        for longer than `lock_timeout` it is assumed the process holding it has failed and the lock is taken over.
+
+        Parameters
+        ----------
+        key
+            The key of the cache entry (see `key_from`).
+
+        Returns
+        -------
+        True if the lock was acquired and the entry should be computed by this process.
+        """
+        lock_path = path.join(self.cache_path, f".lock_{key}")
+
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+        except OSError:
+            return True
+
+        while True:
+
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                pass
+            except OSError:
+                return True
+
+            try:
+                if time.time() - path.getmtime(lock_path) > self.lock_timeout:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+
+            if path.isdir(self.entry_path_from(key=key)):
+                return False
+
+            time.sleep(0.1)
+
+    def unlock(self, key: str):
+        try:
+            os.remove(path.join(self.cache_path, f".lock_{key}"))
+        except OSError:
+            pass
+
+    def cached_arrays_from(self, key: str, func) -> Dict[str, np.ndarray]:
+        """
+        Returns the arrays of a cache entry if it is in the cache, otherwise computes them via the input function,
+        saves them to the cache and returns them.
+
+        The cache is checked again after the lock of the entry is acquired, because a process waiting for the lock
+        acquires it after the process holding it has saved the entry, which is then loaded as opposed to recomputed.
+
+        Parameters
+        ----------
+        key
+            The key of the cache entry (see `key_from`).
+        func
+            A function with no inputs which computes the dictionary of arrays stored in the cache entry.
+        """
+        array_dict = self.load(key=key)
+
+        if array_dict is not None:
+            logger.info(f"W-TILDE CACHE - Loaded {key} from cache.")
+            return array_dict
+
+        locked = self.lock(key=key)
+
+        try:
+
+            array_dict = self.load(key=key)
+
+            if array_dict is not None:
+                logger.info(f"W-TILDE CACHE - Loaded {key} from cache.")
+                return array_dict
+
+            array_dict = func()
+            self.save(key=key, array_dict=array_dict)
+
+        finally:
+            if locked:
+                self.unlock(key=key)
+
+        return array_dict
@@ -46,6 +46,10 @@ class InversionException(Exception):
     pass
 
 
+class FitException(Exception):
+    pass
+
+
 class PlottingException(Exception):
     pass
 
@@ -1,10 +1,17 @@
 import numpy as np
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
+
+from autoconf import cached_property
 
 from autoarray.structures.arrays.one_d.array_1d import Array1D
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.fit.fit_data import FitData
 from autoarray.fit.fit_data import FitDataComplex
+from autoarray.fit import fit_util
+from autoarray.inversion.inversion import inversion_util
+from autoarray import profiler
+
+from autoarray import exc
 
 
 class FitDataset:
@@ -52,6 +59,13 @@ class FitDataset:
         self.dataset = dataset
         self.fit = fit
 
+        with profiler.span_from(
+            profiling_dict=profiling_dict, name=self.__class__.__name__
+        ):
+            self._set_fit_attributes()
+
+    def _set_fit_attributes(self):
+
         self.data = self.fit.data
         self.noise_map = self.fit.noise_map
         self.model_data = self.fit.model_data
@@ -220,3 +234,307 @@ class FitInterferometer(FitDataset):
     @property
     def dirty_chi_squared_map(self):
         return self.transformer.image_from(visibilities=self.chi_squared_map)
+
+
+class FitImagingBatch:
+    def __init__(
+        self,
+        dataset,
+        model_image_batch: Optional[np.ndarray] = None,
+        blurred_mapping_matrix_batch: Optional[np.ndarray] = None,
+        regularization_matrix: Optional[np.ndarray] = None,
+    ):
+        """
+        Fits a batch of models to a single masked imaging dataset, returning the `log_likelihood`, `log_evidence`
+        and `figure_of_merit` of every model as an ndarray of shape [total_models].
+
+        This is used when many models are evaluated at once (e.g. the walkers of an MCMC sampler or a batch of live
+        points of a nested sampler). Every quantity is computed in a single vectorized pass over the slimmed arrays
+        of the dataset, without creating the residual-map, chi-squared-map and other data structures of each
+        model's fit.
+
+        Each model is given by a model image and / or a blurred mapping matrix of a linear inversion:
+
+        - If only `model_image_batch` is input, every model's `log_likelihood` is computed.
+
+        - If `blurred_mapping_matrix_batch` and `regularization_matrix` are input, every model's linear inversion is
+          solved using the data with the model image (if input) subtracted, and its `log_evidence` is computed. This
+          matches the calculation performed by an `Inversion` which uses the mapping matrix formalism.
+
+        Models whose `curvature_reg_matrix` is not positive-definite, or whose `regularization_matrix` has no log
+        determinant, cannot be solved and have a `log_likelihood` and `log_evidence` of `-np.inf`, as opposed to
+        raising an `InversionException` for the whole batch.
+
+        The batched matrices scale as [total_models, image_pixels, source_pixels], therefore large batches of large
+        mapping matrices should be split into smaller batches.
+
+        Parameters
+        -----------
+        dataset : MaskedImaging
+            The masked imaging dataset that every model is fitted to.
+        model_image_batch
+            The slimmed model image of every model, of shape [total_models, image_pixels].
+        blurred_mapping_matrix_batch
+            The blurred mapping matrix of every model's inversion, of shape
+            [total_models, image_pixels, source_pixels].
+        regularization_matrix
+            The regularization matrix of every model's inversion, of shape [total_models, source_pixels,
+            source_pixels], or of shape [source_pixels, source_pixels] if it is shared by every model.
+        """
+        if model_image_batch is None and blurred_mapping_matrix_batch is None:
+            raise exc.FitException(
+                "A FitImagingBatch requires a model_image_batch and / or a blurred_mapping_matrix_batch."
+            )
+
+        if blurred_mapping_matrix_batch is not None and regularization_matrix is None:
+            raise exc.FitException(
+                "A FitImagingBatch with a blurred_mapping_matrix_batch requires a regularization_matrix."
+            )
+
+        self.dataset = dataset
+
+        self.data = np.asarray(dataset.image)
+        self.noise_map = np.asarray(dataset.noise_map)
+
+        self.model_image_batch = (
+            None if model_image_batch is None else np.asarray(model_image_batch)
+        )
+        self.blurred_mapping_matrix_batch = (
+            None
+            if blurred_mapping_matrix_batch is None
+            else np.asarray(blurred_mapping_matrix_batch)
+        )
+        self.regularization_matrix = (
+            None if regularization_matrix is None else np.asarray(regularization_matrix)
+        )
+
+    @property
+    def has_inversion(self) -> bool:
+        return self.blurred_mapping_matrix_batch is not None
+
+    @property
+    def total_models(self) -> int:
+        if self.model_image_batch is not None:
+            return self.model_image_batch.shape[0]
+        return self.blurred_mapping_matrix_batch.shape[0]
+
+    @cached_property
+    def noise_normalization(self) -> float:
+        """
+        The noise-map normalization term, which is the same for every model.
+        """
+        return fit_util.noise_normalization_from(noise_map=self.noise_map)
+
+    @cached_property
+    def profiled_data_batch(self) -> np.ndarray:
+        """
+        The data fitted by every model's inversion, which is the data with the model image subtracted.
+        """
+        if self.model_image_batch is None:
+            return np.broadcast_to(self.data, (self.total_models, self.data.shape[0]))
+        return self.data - self.model_image_batch
+
+    @cached_property
+    def weighted_mapping_matrix_batch(self) -> np.ndarray:
+        """
+        The blurred mapping matrix of every model divided by the noise-map, such that the curvature matrix is the
+        product of its transpose and itself.
+        """
+        return self.blurred_mapping_matrix_batch / self.noise_map[None, :, None]
+
+    @cached_property
+    def data_vector_batch(self) -> np.ndarray:
+        """
+        The `data_vector` D of every model's inversion, of shape [total_models, source_pixels].
+        """
+        return np.matmul(
+            np.swapaxes(self.weighted_mapping_matrix_batch, 1, 2),
+            (self.profiled_data_batch / self.noise_map)[:, :, None],
+        )[:, :, 0]
+
+    @cached_property
+    def curvature_matrix_batch(self) -> np.ndarray:
+        """
+        The `curvature_matrix` F of every model's inversion, of shape [total_models, source_pixels, source_pixels].
+        """
+        return np.matmul(
+            np.swapaxes(self.weighted_mapping_matrix_batch, 1, 2),
+            self.weighted_mapping_matrix_batch,
+        )
+
+    @cached_property
+    def regularization_matrix_batch(self) -> np.ndarray:
+        return np.broadcast_to(
+            self.regularization_matrix, self.curvature_matrix_batch.shape
+        )
+
+    @cached_property
+    def curvature_reg_matrix_batch(self) -> np.ndarray:
+        return self.curvature_matrix_batch + self.regularization_matrix_batch
+
+    @cached_property
+    def _cholesky_batch(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The Cholesky decomposition of every model's `curvature_reg_matrix` and a boolean array which is `False`
+        for models whose `curvature_reg_matrix` is not positive-definite.
+
+        The decomposition of the whole batch is performed in one call, with every model decomposed separately
+        only if this fails. The decomposition of a model which is not positive-definite is set to the identity
+        matrix, such that the batched calculations which follow remain finite.
+        """
+        try:
+            cholesky_batch = np.linalg.cholesky(self.curvature_reg_matrix_batch)
+            return cholesky_batch, np.full(self.total_models, True)
+        except np.linalg.LinAlgError:
+            pass
+
+        identity = np.eye(self.curvature_reg_matrix_batch.shape[1])
+
+        cholesky_batch = np.zeros(self.curvature_reg_matrix_batch.shape)
+        valid = np.full(self.total_models, True)
+
+        for index, curvature_reg_matrix in enumerate(self.curvature_reg_matrix_batch):
+            try:
+                cholesky_batch[index] = np.linalg.cholesky(curvature_reg_matrix)
+            except np.linalg.LinAlgError:
+                cholesky_batch[index] = identity
+                valid[index] = False
+
+        return cholesky_batch, valid
+
+    @cached_property
+    def _log_det_regularization_batch(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The log determinant of every model's `regularization_matrix` and a boolean array which is `False` for
+        models where it could not be computed, which is computed once if the regularization matrix is shared by
+        every model.
+
+        The log determinant is computed in the same way as an `Inversion`, such that a model whose regularization
+        matrix raises an `InversionException` in an `Inversion` is invalid in the batch.
+        """
+        if self.regularization_matrix.ndim == 2:
+            regularization_matrix_list = [self.regularization_matrix]
+        else:
+            regularization_matrix_list = self.regularization_matrix
+
+        log_det = np.zeros(len(regularization_matrix_list))
+        valid = np.full(len(regularization_matrix_list), True)
+
+        for index, regularization_matrix in enumerate(regularization_matrix_list):
+            try:
+                log_det[index] = inversion_util.log_det_regularization_matrix_from(
+                    regularization_matrix=regularization_matrix
+                )
+            except exc.InversionException:
+                valid[index] = False
+
+        return (
+            np.broadcast_to(log_det, (self.total_models,)),
+            np.broadcast_to(valid, (self.total_models,)),
+        )
+
+    @property
+    def valid(self) -> np.ndarray:
+        """
+        A boolean array which is `False` for models whose inversion could not be solved.
+        """
+        if not self.has_inversion:
+            return np.full(self.total_models, True)
+        return self._cholesky_batch[1] & self._log_det_regularization_batch[1]
+
+    @cached_property
+    def reconstruction_batch(self) -> np.ndarray:
+        """
+        The reconstruction S = [F + H]^-1 D of every model's inversion, of shape [total_models, source_pixels].
+
+        Every reconstruction is solved via two batched solves with the Cholesky decomposition L of its model's
+        `curvature_reg_matrix` (see `_cholesky_batch`), first L y = D and then L^T S = y, such that every matrix is
+        only decomposed once. The `curvature_reg_matrix` of models which are not positive-definite is replaced
+        with the identity matrix.
+        """
+        cholesky_batch = self._cholesky_batch[0]
+
+        y_batch = np.linalg.solve(cholesky_batch, self.data_vector_batch[:, :, None])
+
+        return np.linalg.solve(np.swapaxes(cholesky_batch, 1, 2), y_batch)[:, :, 0]
+
+    @cached_property
+    def mapped_reconstructed_image_batch(self) -> np.ndarray:
+        return np.matmul(
+            self.blurred_mapping_matrix_batch, self.reconstruction_batch[:, :, None]
+        )[:, :, 0]
+
+    @cached_property
+    def model_data_batch(self) -> np.ndarray:
+        """
+        The slimmed model data of every model, of shape [total_models, image_pixels], which is the sum of its
+        model image and the image of its reconstruction.
+        """
+        if not self.has_inversion:
+            return self.model_image_batch
+
+        if self.model_image_batch is None:
+            return self.mapped_reconstructed_image_batch
+
+        return self.model_image_batch + self.mapped_reconstructed_image_batch
+
+    @cached_property
+    def chi_squared(self) -> np.ndarray:
+        return fit_util.chi_squared_batch_from(
+            data=self.data,
+            noise_map=self.noise_map,
+            model_data_batch=self.model_data_batch,
+        )
+
+    @cached_property
+    def regularization_term(self) -> np.ndarray:
+        """
+        The regularization term s_T * H * s of every model's inversion.
+        """
+        return np.einsum(
+            "ij,ijk,ik->i",
+            self.reconstruction_batch,
+            self.regularization_matrix_batch,
+            self.reconstruction_batch,
+        )
+
+    @cached_property
+    def log_det_curvature_reg_matrix_term(self) -> np.ndarray:
+        return 2.0 * np.sum(
+            np.log(np.diagonal(self._cholesky_batch[0], axis1=1, axis2=2)), axis=1
+        )
+
+    @cached_property
+    def log_det_regularization_matrix_term(self) -> np.ndarray:
+        """
+        The log determinant of the regularization matrix of every model (see `_log_det_regularization_batch`).
+        """
+        return self._log_det_regularization_batch[0]
+
+    @property
+    def log_likelihood(self) -> np.ndarray:
+        log_likelihood = fit_util.log_likelihood_batch_from(
+            chi_squared_batch=self.chi_squared,
+            noise_normalization=self.noise_normalization,
+        )
+        return np.where(self.valid, log_likelihood, -np.inf)
+
+    @property
+    def log_evidence(self) -> Optional[np.ndarray]:
+        if not self.has_inversion:
+            return None
+
+        log_evidence = fit_util.log_evidence_batch_from(
+            chi_squared_batch=self.chi_squared,
+            regularization_term_batch=self.regularization_term,
+            log_curvature_regularization_term_batch=self.log_det_curvature_reg_matrix_term,
+            log_regularization_term_batch=self.log_det_regularization_matrix_term,
+            noise_normalization=self.noise_normalization,
+        )
+        return np.where(self.valid, log_evidence, -np.inf)
+
+    @property
+    def figure_of_merit(self) -> np.ndarray:
+        if not self.has_inversion:
+            return self.log_likelihood
+        return self.log_evidence
@@ -490,3 +490,86 @@ def log_evidence_from(
             + noise_normalization
         )
     )
+
+
+def chi_squared_batch_from(
+    *, data: np.ndarray, noise_map: np.ndarray, model_data_batch: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the chi-squared terms of the fits of a batch of model data to a dataset, where every chi-squared is the
+    sum of:
+
+    Chi_Squared = ((Data - Model)**2.0)/(Variances)
+
+    The chi-squared values of every model are computed in a single vectorized pass over the slimmed (e.g. masked
+    1D) arrays, without computing the residual-map or chi-squared-map of every model as a data structure.
+
+    Parameters
+    ----------
+    data
+        The slimmed data that is fitted.
+    noise_map
+        The slimmed noise-map of the data.
+    model_data_batch
+        The slimmed model data of every model, of shape [total_models, data_points].
+    """
+    normalized_residual_map_batch = np.subtract(model_data_batch, data)
+    normalized_residual_map_batch /= noise_map
+
+    return np.einsum(
+        "ij,ij->i", normalized_residual_map_batch, normalized_residual_map_batch
+    )
+
+
+def log_likelihood_batch_from(
+    *, chi_squared_batch: np.ndarray, noise_normalization: float
+) -> np.ndarray:
+    """
+    Returns the log likelihood of the fits of a batch of model data to a dataset, where every log likelihood is:
+
+    Log Likelihood = -0.5*[Chi_Squared_Term + Noise_Term] (see functions above for these definitions)
+
+    Parameters
+    ----------
+    chi_squared_batch
+        The chi-squared term of the fit of every model to the dataset.
+    noise_normalization
+        The normalization noise_map-term for the dataset's noise-map.
+    """
+    return -0.5 * (np.asarray(chi_squared_batch) + noise_normalization)
+
+
+def log_evidence_batch_from(
+    *,
+    chi_squared_batch: np.ndarray,
+    regularization_term_batch: np.ndarray,
+    log_curvature_regularization_term_batch: np.ndarray,
+    log_regularization_term_batch: np.ndarray,
+    noise_normalization: float,
+) -> np.ndarray:
+    """
+    Returns the log evidence of the inversions of a batch of models fitted to a dataset, where every log evidence is:
+
+    Log Evidence = -0.5*[Chi_Squared_Term + Regularization_Term + Log(Covariance_Regularization_Term) -
+                           Log(Regularization_Matrix_Term) + Noise_Term]
+
+    Parameters
+    ----------
+    chi_squared_batch
+        The chi-squared term of the inversion of every model's fit to the dataset.
+    regularization_term_batch
+        The regularization term of the inversion of every model.
+    log_curvature_regularization_term_batch
+        The log of the determinant of the sum of the curvature and regularization matrices of every model.
+    log_regularization_term_batch
+        The log of the determinant of the regularization matrix of every model.
+    noise_normalization
+        The normalization noise_map-term for the dataset's noise-map.
+    """
+    return -0.5 * (
+        np.asarray(chi_squared_batch)
+        + regularization_term_batch
+        + log_curvature_regularization_term_batch
+        - log_regularization_term_batch
+        + noise_normalization
+    )
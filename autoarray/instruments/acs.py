@@ -1,4 +1,3 @@
-from astropy.io import fits
 import copy
 import logging
 import numpy as np
@@ -336,6 +335,8 @@ class Array2DACS(Array2D):
             e.g. '/path/to/filename.fits'
         """
 
+        from astropy.io import fits
+
         new_file_dir = os.path.split(new_file_path)[0]
 
         if not os.path.exists(new_file_dir):
@@ -662,6 +663,8 @@ def output_quadrants_to_fits(
     overwrite: bool = False,
 ):
 
+    from astropy.io import fits
+
     file_dir = os.path.split(file_path)[0]
 
     if not os.path.exists(file_dir):
@@ -16,6 +16,8 @@ from autoarray.inversion.linear_eqn.imaging import AbstractLEqImaging
 from autoarray.inversion.linear_eqn.interferometer import AbstractLEqInterferometer
 from autoarray.inversion.inversion.settings import SettingsInversion
 from autoarray.preloads import Preloads
+from autoarray.preload_cache import cached_from
+from autoarray.preload_cache import fingerprint_from
 
 from autoarray import exc
 from autoarray.inversion.inversion import inversion_util
@@ -92,16 +94,36 @@ class AbstractInversion:
         if not self.has_mapper:
             return None
 
-        if self.has_one_mapper:
-            return self.regularization_list[0].regularization_matrix_from(
-                mapper=self.linear_obj_list[0]
+        def func():
+
+            if self.has_one_mapper:
+                return self.regularization_list[0].regularization_matrix_from(
+                    mapper=self.linear_obj_list[0]
+                )
+
+            return block_diag(
+                *[
+                    reg.regularization_matrix_from(mapper=mapper)
+                    for (reg, mapper) in zip(self.regularization_list, self.mapper_list)
+                ]
             )
 
-        return block_diag(
-            *[
-                reg.regularization_matrix_from(mapper=mapper)
-                for (reg, mapper) in zip(self.regularization_list, self.mapper_list)
-            ]
+        return cached_from(
+            cache=self.preloads.cache,
+            name="regularization_matrix",
+            key_func=lambda: self.regularization_fingerprint,
+            func=func,
+        )
+
+    @cached_property
+    def regularization_fingerprint(self) -> str:
+        """
+        A fingerprint of the regularization schemes and the mappers they regularize, which is the key of the
+        regularization matrix and the log determinant of the regularization matrix term in a `PreloadCache`.
+        """
+        return fingerprint_from(
+            [reg.fingerprint for reg in self.regularization_list],
+            [mapper.fingerprint for mapper in self.mapper_list],
         )
 
     @cached_property
@@ -5,14 +5,13 @@ from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.structures.visibilities import Visibilities
 from autoarray.structures.visibilities import VisibilitiesNoiseMap
 from autoarray.operators.convolver import Convolver
-from autoarray.operators.transformer import TransformerDFT
-from autoarray.operators.transformer import TransformerNUFFT
 from autoarray.inversion.linear_obj import LinearObj
 from autoarray.inversion.linear_eqn.imaging import LEqImagingWTilde
 from autoarray.inversion.linear_eqn.imaging import LEqImagingMapping
 from autoarray.inversion.inversion.matrices import InversionMatrices
 from autoarray.inversion.inversion.linear_operator import InversionLinearOperator
 from autoarray.inversion.linear_eqn.interferometer import LEqInterferometerMapping
+from autoarray.inversion.linear_eqn.interferometer import LEqInterferometerWTilde
 from autoarray.inversion.linear_eqn.interferometer import LEqInterferometerMappingPyLops
 from autoarray.inversion.regularization.abstract import AbstractRegularization
 from autoarray.inversion.inversion.settings import SettingsInversion
@@ -42,13 +41,20 @@ def inversion_from(
             profiling_dict=profiling_dict,
         )
 
+    if settings.use_w_tilde_interferometer and not settings.use_linear_operators:
+        w_tilde = dataset.w_tilde
+    else:
+        w_tilde = None
+
     return inversion_interferometer_unpacked_from(
         visibilities=dataset.visibilities,
         noise_map=dataset.noise_map,
         transformer=dataset.transformer,
+        w_tilde=w_tilde,
         linear_obj_list=linear_obj_list,
         regularization_list=regularization_list,
         settings=settings,
+        preloads=preloads,
         profiling_dict=profiling_dict,
     )
 
@@ -90,6 +96,7 @@ def inversion_imaging_unpacked_from(
             noise_map=noise_map,
             convolver=convolver,
             linear_obj_list=linear_obj_list,
+            settings=settings,
             profiling_dict=profiling_dict,
         )
 
@@ -106,25 +113,37 @@ def inversion_imaging_unpacked_from(
 def inversion_interferometer_unpacked_from(
     visibilities: Visibilities,
     noise_map: VisibilitiesNoiseMap,
-    transformer: Union[TransformerDFT, TransformerNUFFT],
+    transformer: Union["TransformerDFT", "TransformerNUFFT"],
     linear_obj_list: List[LinearObj],
+    w_tilde=None,
     regularization_list: Optional[List[AbstractRegularization]] = None,
     settings: SettingsInversion = SettingsInversion(),
     preloads: Preloads = Preloads(),
     profiling_dict: Optional[Dict] = None,
 ):
-    if not settings.use_linear_operators:
+    if settings.use_linear_operators:
 
-        leq = LEqInterferometerMapping(
+        leq = LEqInterferometerMappingPyLops(
+            noise_map=noise_map,
+            transformer=transformer,
+            linear_obj_list=linear_obj_list,
+            profiling_dict=profiling_dict,
+        )
+
+    elif settings.use_w_tilde_interferometer and w_tilde is not None:
+
+        leq = LEqInterferometerWTilde(
             noise_map=noise_map,
             transformer=transformer,
+            w_tilde=w_tilde,
             linear_obj_list=linear_obj_list,
+            settings=settings,
             profiling_dict=profiling_dict,
         )
 
     else:
 
-        leq = LEqInterferometerMappingPyLops(
+        leq = LEqInterferometerMapping(
             noise_map=noise_map,
             transformer=transformer,
             linear_obj_list=linear_obj_list,
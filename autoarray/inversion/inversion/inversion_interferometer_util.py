@@ -11,12 +11,82 @@ logger = logging.getLogger(__name__)
 @numba_util.jit()
 def w_tilde_data_interferometer_from(
     visibilities_real: np.ndarray,
+    visibilities_imag: np.ndarray,
     noise_map_real: np.ndarray,
+    noise_map_imag: np.ndarray,
     uv_wavelengths: np.ndarray,
     grid_radians_slim: np.ndarray,
-    native_index_for_slim_index,
 ) -> np.ndarray:
-    pass
+    """
+    When w_tilde is used to perform an inversion, the mapping matrices are not computed, meaning that they cannot be
+    used to compute the data vector. This method creates the vector `w_tilde_data` which allows for the data
+    vector to be computed efficiently without the mapping matrix.
+
+    The vector `w_tilde_data` is dimensions [image_pixels] and is the (real) direct Fourier transform of the
+    visibilities divided by the noise-map values squared back to every real-space image pixel:
+
+    w_tilde_data[i] = sum_k [ vis_real[k] * cos(-2 pi (x_i u_k + y_i v_k)) / noise_real[k]**2
+                            + vis_imag[k] * sin(-2 pi (x_i u_k + y_i v_k)) / noise_imag[k]**2 ]
+
+    This is the weighted dirty image of the interferometer dataset. Because it depends only on the data, it is
+    computed once per dataset and the data vector of every inversion is then computed via the unique mappings of
+    image pixels to pixelization pixels (see `leq_util.data_vector_via_w_tilde_data_imaging_from`).
+
+    Parameters
+    ----------
+    visibilities_real
+        The real visibilities of the interferometer data.
+    visibilities_imag
+        The imaginary visibilities of the interferometer data.
+    noise_map_real
+        The real noise-map values of the interferometer data.
+    noise_map_imag
+        The imaginary noise-map values of the interferometer data.
+    uv_wavelengths
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+    grid_radians_slim
+        The 1D (y,x) grid of coordinates in radians corresponding to real-space mask within which the image that is
+        Fourier transformed is computed.
+
+    Returns
+    -------
+    ndarray
+        A vector that encodes the Fourier transform of the visibilities divided by the noise map**2 that enables
+        efficient calculation of the data vector.
+    """
+
+    image_pixels = grid_radians_slim.shape[0]
+
+    w_tilde_data = np.zeros(image_pixels)
+
+    weight_map_real = visibilities_real / noise_map_real ** 2.0
+    weight_map_imag = visibilities_imag / noise_map_imag ** 2.0
+
+    for ip0 in range(image_pixels):
+
+        value = 0.0
+
+        y = grid_radians_slim[ip0, 0]
+        x = grid_radians_slim[ip0, 1]
+
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            phase = (
+                -2.0
+                * np.pi
+                * (
+                    x * uv_wavelengths[vis_1d_index, 0]
+                    + y * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            value += weight_map_real[vis_1d_index] * np.cos(phase)
+            value += weight_map_imag[vis_1d_index] * np.sin(phase)
+
+        w_tilde_data[ip0] = value
+
+    return w_tilde_data
 
 
 @numba_util.jit()
@@ -36,6 +106,11 @@ def w_tilde_curvature_interferometer_from(
     `w_tilde_preload_interferometer_from` describes a compressed representation that overcomes this hurdles. It is
     advised `w_tilde` and this method are only used for testing.
 
+    The real and imaginary noise-map values of every visibility are assumed to be equal, such that every entry
+    of w_tilde depends only on the separation of the two image pixels:
+
+    w_tilde[i, j] = sum_k cos(2 pi ((x_i - x_j) u_k + (y_i - y_j) v_k)) / noise_real[k]**2
+
     Parameters
     ----------
     noise_map_real
@@ -53,7 +128,33 @@ def w_tilde_curvature_interferometer_from(
         A matrix that encodes the NUFFT values between the noise map that enables efficient calculation of the curvature
         matrix.
     """
-    pass
+
+    image_pixels = grid_radians_slim.shape[0]
+
+    w_tilde = np.zeros((image_pixels, image_pixels))
+
+    for ip0 in range(image_pixels):
+        for ip1 in range(ip0, image_pixels):
+
+            y_offset = grid_radians_slim[ip0, 0] - grid_radians_slim[ip1, 0]
+            x_offset = grid_radians_slim[ip0, 1] - grid_radians_slim[ip1, 1]
+
+            value = 0.0
+
+            for vis_1d_index in range(uv_wavelengths.shape[0]):
+                value += noise_map_real[vis_1d_index] ** -2.0 * np.cos(
+                    2.0
+                    * np.pi
+                    * (
+                        x_offset * uv_wavelengths[vis_1d_index, 0]
+                        + y_offset * uv_wavelengths[vis_1d_index, 1]
+                    )
+                )
+
+            w_tilde[ip0, ip1] = value
+            w_tilde[ip1, ip0] = value
+
+    return w_tilde
 
 
 @numba_util.jit()
@@ -63,21 +164,228 @@ def w_tilde_curvature_preload_interferometer_from(
     shape_masked_pixels_2d: Tuple[int, int],
     grid_radians_2d: np.ndarray,
 ) -> np.ndarray:
-    pass
+    """
+    The matrix w_tilde is a matrix of dimensions [image_pixels, image_pixels] that encodes the NUFFT of every pair of
+    image pixels given the noise map (see `w_tilde_curvature_interferometer_from`).
+
+    Every entry of w_tilde depends only on the (y,x) offset between the two image pixels in the pair, because the
+    real-space grid is uniform. The matrix is therefore translation invariant and can be fully described by its
+    values for every possible pixel offset within the mask. This function computes these values, giving a
+    `curvature_preload` of dimensions [2 * y_shape - 1, 2 * x_shape - 1], where (y_shape, x_shape) is the extent of
+    unmasked pixels of the real-space mask (e.g. `Mask2D.shape_native_masked_pixels`).
+
+    The entry for an image pixel pair separated by (y_offset, x_offset) pixels, where an offset is the native index of
+    the first pixel minus that of the second, is stored at index [y_shape - 1 + y_offset, x_shape - 1 + x_offset].
+
+    This preload has a memory footprint that is independent of the number of visibilities and only scales with the
+    size of the mask, whereas its calculation (which is performed once per dataset) scales with the number of
+    visibilities. Because w_tilde is symmetric, only half the offsets are computed and the other half are mirrored.
+
+    Parameters
+    ----------
+    noise_map_real
+        The real noise-map values of the interferometer data.
+    uv_wavelengths
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+    shape_masked_pixels_2d
+        The (y,x) shape corresponding to the extent of unmasked pixels that go vertically and horizontally across the
+        mask.
+    grid_radians_2d
+        The 2D (y,x) grid of coordinates in radians corresponding to real-space mask within which the image that is
+        Fourier transformed is computed.
+
+    Returns
+    -------
+    ndarray
+        A matrix that precomputes the values for fast computation of w_tilde for every image pixel offset.
+    """
+
+    y_shape = shape_masked_pixels_2d[0]
+    x_shape = shape_masked_pixels_2d[1]
+
+    curvature_preload = np.zeros((2 * y_shape - 1, 2 * x_shape - 1))
+
+    for y_offset_index in range(y_shape):
+        for x_offset_index in range(-x_shape + 1, x_shape):
+
+            y_offset = grid_radians_2d[y_offset_index, 0, 0] - grid_radians_2d[0, 0, 0]
+
+            if x_offset_index >= 0:
+                x_offset = (
+                    grid_radians_2d[0, x_offset_index, 1] - grid_radians_2d[0, 0, 1]
+                )
+            else:
+                x_offset = (
+                    grid_radians_2d[0, 0, 1] - grid_radians_2d[0, -x_offset_index, 1]
+                )
+
+            value = 0.0
+
+            for vis_1d_index in range(uv_wavelengths.shape[0]):
+                value += noise_map_real[vis_1d_index] ** -2.0 * np.cos(
+                    2.0
+                    * np.pi
+                    * (
+                        x_offset * uv_wavelengths[vis_1d_index, 0]
+                        + y_offset * uv_wavelengths[vis_1d_index, 1]
+                    )
+                )
+
+            curvature_preload[
+                y_shape - 1 + y_offset_index, x_shape - 1 + x_offset_index
+            ] = value
+            curvature_preload[
+                y_shape - 1 - y_offset_index, x_shape - 1 - x_offset_index
+            ] = value
+
+    return curvature_preload
 
 
 @numba_util.jit()
 def w_tilde_curvature_interferometer_via_preload_from(
-    w_tilde_preload, native_index_for_slim_index
-):
-    pass
+    curvature_preload: np.ndarray, native_index_for_slim_index: np.ndarray
+) -> np.ndarray:
+    """
+    Use the preloaded values of the w_tilde matrix for every image pixel offset (see
+    `w_tilde_curvature_preload_interferometer_from`) to compute the full w_tilde matrix of dimensions
+    [image_pixels, image_pixels].
+
+    This is only used for testing, as the full matrix can exceed many 10s of GB's for large masks.
+
+    Parameters
+    ----------
+    curvature_preload
+        A matrix that precomputes the values for fast computation of w_tilde for every image pixel offset.
+    native_index_for_slim_index
+        An array of shape [total_unmasked_pixels] that maps pixels from the slimmed array to the native array.
+
+    Returns
+    -------
+    ndarray
+        A matrix that encodes the NUFFT values between the noise map that enables efficient calculation of the curvature
+        matrix.
+    """
+
+    image_pixels = native_index_for_slim_index.shape[0]
+
+    y_centre = (curvature_preload.shape[0] - 1) // 2
+    x_centre = (curvature_preload.shape[1] - 1) // 2
+
+    w_tilde = np.zeros((image_pixels, image_pixels))
+
+    for ip0 in range(image_pixels):
+
+        ip0_y, ip0_x = native_index_for_slim_index[ip0]
+
+        for ip1 in range(image_pixels):
+
+            ip1_y, ip1_x = native_index_for_slim_index[ip1]
+
+            w_tilde[ip0, ip1] = curvature_preload[
+                y_centre + ip0_y - ip1_y, x_centre + ip0_x - ip1_x
+            ]
+
+    return w_tilde
 
 
 @numba_util.jit()
 def curvature_matrix_via_w_tilde_curvature_preload_interferometer_from(
     curvature_preload: np.ndarray,
-    pix_indexes_for_sub_slim_index: np.ndarray,
     native_index_for_slim_index: np.ndarray,
-    pixelization_pixels: int,
+    data_to_pix_unique: np.ndarray,
+    data_weights: np.ndarray,
+    pix_lengths: np.ndarray,
+    pix_pixels: int,
 ) -> np.ndarray:
-    pass
+    """
+    Returns the curvature matrix `F` (see Warren & Dye 2003) by computing it using `curvature_preload`
+    (see `w_tilde_curvature_preload_interferometer_from`) for an interferometer inversion.
+
+    To compute the curvature matrix via w_tilde the following matrix multiplication is normally performed:
+
+    curvature_matrix = mapping_matrix.T * w_tilde * mapping matrix
+
+    This function speeds this calculation up in two ways:
+
+    1) Instead of using `w_tilde` (dimensions [image_pixels, image_pixels] it uses `curvature_preload`, which stores
+    the value of w_tilde for every image pixel offset and is therefore small enough to remain in memory for any
+    number of visibilities.
+
+    2) It omits the `mapping_matrix` and instead uses directly the unique mappings of every image pixel to its
+    pixelization pixels. This exploits the sparsity in the `mapping_matrix` to directly compute the
+    `curvature_matrix`, without performing a NUFFT of the mapping matrix.
+
+    Owing to the symmetry of w_tilde, only pairs of image pixels where `ip1 >= ip0` are iterated over, with the
+    pairs corresponding to the same image pixel divided by two so they are not double counted when the matrix is
+    symmetrized.
+
+    Parameters
+    ----------
+    curvature_preload
+        A matrix that precomputes the values for fast computation of w_tilde for every image pixel offset.
+    native_index_for_slim_index
+        An array of shape [total_unmasked_pixels] that maps pixels from the slimmed array to the native array.
+    data_to_pix_unique
+        An array that maps every data pixel index (e.g. the masked image pixel indexes in 1D) to its unique set of
+        pixelization pixel indexes (see `data_slim_to_pixelization_unique_from`).
+    data_weights
+        For every unique mapping between a set of data sub-pixels and a pixelization pixel, the weight of these mapping
+        based on the number of sub-pixels that map to pixelization pixel.
+    pix_lengths
+        A 1D array describing how many unique pixels each data pixel maps too, which is used to iterate over
+        `data_to_pix_unique` and `data_weights`.
+    pix_pixels
+        The total number of pixels in the pixelization that reconstructs the data.
+
+    Returns
+    -------
+    ndarray
+        The curvature matrix `F` (see Warren & Dye 2003).
+    """
+
+    image_pixels = native_index_for_slim_index.shape[0]
+
+    y_centre = (curvature_preload.shape[0] - 1) // 2
+    x_centre = (curvature_preload.shape[1] - 1) // 2
+
+    curvature_matrix = np.zeros((pix_pixels, pix_pixels))
+
+    for ip0 in range(image_pixels):
+
+        ip0_y, ip0_x = native_index_for_slim_index[ip0]
+
+        for ip1 in range(ip0, image_pixels):
+
+            ip1_y, ip1_x = native_index_for_slim_index[ip1]
+
+            w_tilde_value = curvature_preload[
+                y_centre + ip0_y - ip1_y, x_centre + ip0_x - ip1_x
+            ]
+
+            if ip0 == ip1:
+                w_tilde_value /= 2.0
+
+            for pix_0_index in range(pix_lengths[ip0]):
+
+                data_0_weight = data_weights[ip0, pix_0_index]
+                pix_0 = data_to_pix_unique[ip0, pix_0_index]
+
+                for pix_1_index in range(pix_lengths[ip1]):
+
+                    data_1_weight = data_weights[ip1, pix_1_index]
+                    pix_1 = data_to_pix_unique[ip1, pix_1_index]
+
+                    curvature_matrix[pix_0, pix_1] += (
+                        data_0_weight * data_1_weight * w_tilde_value
+                    )
+
+    for i in range(pix_pixels):
+        for j in range(i, pix_pixels):
+            curvature_matrix[i, j] += curvature_matrix[j, i]
+
+    for i in range(pix_pixels):
+        for j in range(i, pix_pixels):
+            curvature_matrix[j, i] = curvature_matrix[i, j]
+
+    return curvature_matrix
@@ -1,7 +1,9 @@
 import numpy as np
-from scipy.linalg import cho_solve
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu
 
 from autoarray.inversion.inversion.settings import SettingsInversion
+from autoarray.inversion.inversion.solver import AbstractSolver
 
 from autoarray import numba_util
 from autoarray import exc
@@ -65,7 +67,7 @@ def curvature_reg_matrix_from(
 
 def reconstruction_from(
     data_vector: np.ndarray,
-    curvature_reg_matrix_cholesky: np.ndarray,
+    curvature_reg_matrix_solver: AbstractSolver,
     settings: SettingsInversion = SettingsInversion(),
 ):
     """
@@ -82,8 +84,9 @@ def reconstruction_from(
     ----------
     data_vector
         The `data_vector` D which is solved for.
-    curvature_reg_matrix_cholesky
-        The cholesky decomposition of the sum of the curvature and regularization matrices.
+    curvature_reg_matrix_solver
+        The factorization of the sum of the curvature and regularization matrices (e.g. its Cholesky
+        decomposition), which is used to solve the linear system.
     settings
         Controls the settings of the inversion, for this function where the solution is checked to not be all
         the same values.
@@ -93,10 +96,7 @@ def reconstruction_from(
     curvature_reg_matrix
         The curvature_matrix plus regularization matrix, overwriting the curvature_matrix in memory.
     """
-    try:
-        reconstruction = cho_solve((curvature_reg_matrix_cholesky, True), data_vector)
-    except np.linalg.LinAlgError:
-        raise exc.InversionException()
+    reconstruction = curvature_reg_matrix_solver.solve(data_vector)
 
     if settings.check_solution:
         if np.isclose(a=reconstruction[0], b=reconstruction[1], atol=1e-4).all():
@@ -106,6 +106,44 @@ def reconstruction_from(
     return reconstruction
 
 
+def log_det_regularization_matrix_from(regularization_matrix: np.ndarray) -> float:
+    """
+    Returns the log determinant of a regularization matrix, Log[Det[Lambda*H]], which is used by the Bayesian
+    evidence of an inversion.
+
+    The determinant is computed via a sparse LU decomposition, falling back to a Cholesky decomposition if the
+    matrix is singular. If both fail an exception is raised.
+
+    Parameters
+    ----------
+    regularization_matrix
+        The regularization matrix H whose log determinant is computed.
+
+    Returns
+    -------
+    float
+        The log determinant of the regularization matrix.
+    """
+    try:
+
+        lu = splu(csc_matrix(regularization_matrix))
+        diagL = lu.L.diagonal()
+        diagU = lu.U.diagonal()
+        diagL = diagL.astype(np.complex128)
+        diagU = diagU.astype(np.complex128)
+
+        return np.real(np.log(diagL).sum() + np.log(diagU).sum())
+
+    except RuntimeError:
+
+        try:
+            return 2.0 * np.sum(
+                np.log(np.diag(np.linalg.cholesky(regularization_matrix)))
+            )
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+
 def preconditioner_matrix_via_mapping_matrix_from(
     mapping_matrix: np.ndarray,
     regularization_matrix: np.ndarray,
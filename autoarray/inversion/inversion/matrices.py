@@ -1,7 +1,5 @@
 import numpy as np
-
-from scipy.sparse import csc_matrix
-from scipy.sparse.linalg import splu
+import warnings
 
 from autoconf import cached_property
 from autoarray.numba_util import profile_func
@@ -10,8 +8,13 @@ from autoarray.inversion.linear_eqn.imaging import AbstractLEqImaging
 from autoarray.inversion.inversion.abstract import AbstractInversion
 
 from autoarray import exc
+from autoarray.preload_cache import cached_from
+from autoarray.preload_cache import fingerprint_from
 from autoarray.inversion.linear_eqn import leq_util
 from autoarray.inversion.inversion import inversion_util
+from autoarray.inversion.inversion.solver import AbstractSolver
+from autoarray.inversion.inversion.solver import SolverDense
+from autoarray.inversion.inversion.solver import solver_from
 
 
 class InversionMatrices(AbstractInversion):
@@ -28,7 +31,29 @@ class InversionMatrices(AbstractInversion):
         """
         return self.leq.mapping_matrix
 
-    @property
+    @cached_property
+    def operated_mapping_matrix_fingerprint(self) -> str:
+        """
+        A fingerprint of the linear objects and the operation applied to their mapping matrices (e.g. a 2D convolution
+        with the PSF), which is the key of the operated mapping matrix in a `PreloadCache` and part of the key of every
+        quantity computed from it.
+        """
+        return fingerprint_from(
+            [linear_obj.fingerprint for linear_obj in self.linear_obj_list],
+            self.leq.operator_fingerprint,
+            self.settings.dtype,
+        )
+
+    @cached_property
+    def curvature_matrix_fingerprint(self) -> str:
+        """
+        A fingerprint of the inputs of the curvature matrix, which are the operated mapping matrix and noise-map.
+        """
+        return fingerprint_from(
+            self.operated_mapping_matrix_fingerprint, self.noise_map
+        )
+
+    @cached_property
     def operated_mapping_matrix(self) -> np.ndarray:
         """
         For a given pixelization pixel on the mapping matrix, we can use it to map it to a set of image-pixels in the
@@ -43,7 +68,12 @@ class InversionMatrices(AbstractInversion):
         if self.preloads.operated_mapping_matrix is not None:
             return self.preloads.operated_mapping_matrix
 
-        return self.leq.operated_mapping_matrix
+        return cached_from(
+            cache=self.preloads.cache,
+            name="operated_mapping_matrix",
+            key_func=lambda: self.operated_mapping_matrix_fingerprint,
+            func=lambda: self.leq.operated_mapping_matrix,
+        )
 
     @cached_property
     def data_vector(self) -> np.ndarray:
@@ -59,7 +89,19 @@ class InversionMatrices(AbstractInversion):
 
         The calculation is performed by the method `w_tilde_data_imaging_from`.
         """
-        return self.leq.data_vector_from(data=self.data, preloads=self.preloads)
+        if self.preloads.data_vector is not None:
+            return self.preloads.data_vector
+
+        return cached_from(
+            cache=self.preloads.cache,
+            name="data_vector",
+            key_func=lambda: fingerprint_from(
+                self.curvature_matrix_fingerprint, self.data
+            ),
+            func=lambda: self.leq.data_vector_from(
+                data=self.data, preloads=self.preloads
+            ),
+        )
 
     @cached_property
     @profile_func
@@ -75,18 +117,38 @@ class InversionMatrices(AbstractInversion):
         because for large matrices this avoids overhead. For this reason, `curvature_matrix` is not a cached property
         to ensure if we access it after computing the `curvature_reg_matrix` it is correctly recalculated in a new
         array of memory.
+
+        If the curvature matrix is preloaded (e.g. because only the regularization coefficients vary during a
+        model-fit) or stored in a `PreloadCache`, a copy is returned, so that adding the regularization matrix to it
+        in-place does not change the stored matrix.
         """
-        if (
-            self.preloads.curvature_matrix_preload is None
-            or not self.settings.use_curvature_matrix_preload
-        ):
-            return self.leq.curvature_matrix
-
-        return leq_util.curvature_matrix_via_sparse_preload_from(
-            mapping_matrix=self.operated_mapping_matrix,
-            noise_map=self.noise_map,
-            curvature_matrix_preload=self.preloads.curvature_matrix_preload,
-            curvature_matrix_counts=self.preloads.curvature_matrix_counts,
+        if self.preloads.curvature_matrix is not None:
+            return np.copy(self.preloads.curvature_matrix)
+
+        def func():
+
+            if (
+                self.preloads.curvature_matrix_preload is None
+                or not self.settings.use_curvature_matrix_preload
+            ):
+                return self.leq.curvature_matrix
+
+            return leq_util.curvature_matrix_via_sparse_preload_from(
+                mapping_matrix=self.operated_mapping_matrix,
+                noise_map=self.noise_map,
+                curvature_matrix_preload=self.preloads.curvature_matrix_preload,
+                curvature_matrix_counts=self.preloads.curvature_matrix_counts,
+            )
+
+        if self.preloads.cache is None:
+            return func()
+
+        return np.copy(
+            self.preloads.cache.cached_from(
+                name="curvature_matrix",
+                key=self.curvature_matrix_fingerprint,
+                func=func,
+            )
         )
 
     @cached_property
@@ -124,14 +186,58 @@ class InversionMatrices(AbstractInversion):
 
     @cached_property
     @profile_func
-    def curvature_reg_matrix_cholesky(self):
+    def curvature_reg_matrix_solver(self) -> AbstractSolver:
         """
-        Performs a Cholesky decomposition of the `curvature_reg_matrix`, the result of which is used to solve the
-        linear system of equations of the `LEq`.
+        Factorizes the `curvature_reg_matrix` using the solver specified by the inversion settings (see
+        `inversion.solver`), for example a dense Cholesky decomposition or a sparse LDL^T decomposition.
 
-        The method `np.linalg.solve` is faster to do this, but the Cholesky decomposition is used later in the code
-        to speed up the calculation of `log_det_curvature_reg_matrix_term`.
+        The `reconstruction`, `log_det_curvature_reg_matrix_term` and `errors` are all computed from this single
+        factorization.
+
+        If the generalized eigendecomposition of the `curvature_reg_matrix` is preloaded and this inversion's
+        regularization matrix is a change of only its regularization coefficients (see `CurvatureRegEigen`), the
+        eigendecomposition is used instead, which avoids computing and factorizing the `curvature_reg_matrix`.
+        """
+        if self.preloads.curvature_reg_eigen is not None:
+
+            step = self.preloads.curvature_reg_eigen.step_from(
+                regularization_matrix=self.regularization_matrix
+            )
+
+            if step is not None:
+                return self.preloads.curvature_reg_eigen.solver_from(step=step)
+
+        return cached_from(
+            cache=self.preloads.cache,
+            name="curvature_reg_matrix_solver",
+            key_func=lambda: fingerprint_from(
+                self.curvature_matrix_fingerprint,
+                self.regularization_fingerprint if self.has_mapper else None,
+                self.settings.solver,
+            ),
+            func=lambda: solver_from(
+                matrix=self.curvature_reg_matrix, solver=self.settings.solver
+            ),
+        )
+
+    @cached_property
+    def curvature_reg_matrix_cholesky(self) -> np.ndarray:
+        """
+        The Cholesky decomposition of the `curvature_reg_matrix`.
+
+        This is deprecated and will be removed in a future release, as the `curvature_reg_matrix` is now factorized
+        by the solver specified by the inversion settings (see `curvature_reg_matrix_solver`). The decomposition of
+        a dense solver is returned if it is used and the `curvature_reg_matrix` is decomposed otherwise.
         """
+        warnings.warn(
+            "`curvature_reg_matrix_cholesky` is deprecated, use "
+            "`curvature_reg_matrix_solver` instead.",
+            DeprecationWarning,
+        )
+
+        if isinstance(self.curvature_reg_matrix_solver, SolverDense):
+            return self.curvature_reg_matrix_solver.cholesky
+
         try:
             return np.linalg.cholesky(self.curvature_reg_matrix)
         except np.linalg.LinAlgError:
@@ -149,7 +255,7 @@ class InversionMatrices(AbstractInversion):
 
         return inversion_util.reconstruction_from(
             data_vector=self.data_vector,
-            curvature_reg_matrix_cholesky=self.curvature_reg_matrix_cholesky,
+            curvature_reg_matrix_solver=self.curvature_reg_matrix_solver,
             settings=self.settings,
         )
 
@@ -159,9 +265,10 @@ class InversionMatrices(AbstractInversion):
         """
         The log determinant of [F + reg_coeff*H] is used to determine the Bayesian evidence of the solution.
 
-        This uses the Cholesky decomposition which is already computed before solving the reconstruction.
+        This uses the factorization of the `curvature_reg_matrix` which is already computed before solving the
+        reconstruction.
         """
-        return 2.0 * np.sum(np.log(np.diag(self.curvature_reg_matrix_cholesky)))
+        return self.curvature_reg_matrix_solver.log_det
 
     @cached_property
     @profile_func
@@ -181,28 +288,21 @@ class InversionMatrices(AbstractInversion):
         if self.preloads.log_det_regularization_matrix_term is not None:
             return self.preloads.log_det_regularization_matrix_term
 
-        try:
-
-            lu = splu(csc_matrix(self.regularization_matrix))
-            diagL = lu.L.diagonal()
-            diagU = lu.U.diagonal()
-            diagL = diagL.astype(np.complex128)
-            diagU = diagU.astype(np.complex128)
-
-            return np.real(np.log(diagL).sum() + np.log(diagU).sum())
-
-        except RuntimeError:
+        return cached_from(
+            cache=self.preloads.cache,
+            name="log_det_regularization_matrix_term",
+            key_func=lambda: self.regularization_fingerprint,
+            func=self._log_det_regularization_matrix_term,
+        )
 
-            try:
-                return 2.0 * np.sum(
-                    np.log(np.diag(np.linalg.cholesky(self.regularization_matrix)))
-                )
-            except np.linalg.LinAlgError:
-                raise exc.InversionException()
+    def _log_det_regularization_matrix_term(self) -> float:
+        return inversion_util.log_det_regularization_matrix_from(
+            regularization_matrix=self.regularization_matrix
+        )
 
     @property
     def errors_with_covariance(self):
-        return np.linalg.inv(self.curvature_reg_matrix)
+        return self.curvature_reg_matrix_solver.inverse
 
     @property
     def errors(self):
@@ -8,16 +8,24 @@ class SettingsInversion:
     def __init__(
         self,
         use_w_tilde: bool = True,
+        use_w_tilde_interferometer: bool = False,
         use_linear_operators: bool = False,
         tolerance: float = 1e-8,
         maxiter: int = 250,
         check_solution: bool = True,
         use_curvature_matrix_preload: bool = True,
+        use_sparse_mapping_matrix: bool = False,
+        solver: str = "dense",
+        dtype: str = "float64",
     ):
 
         self.use_w_tilde = use_w_tilde
+        self.use_w_tilde_interferometer = use_w_tilde_interferometer
         self.use_linear_operators = use_linear_operators
         self.tolerance = tolerance
         self.maxiter = maxiter
         self.check_solution = check_solution
         self.use_curvature_matrix_preload = use_curvature_matrix_preload
+        self.use_sparse_mapping_matrix = use_sparse_mapping_matrix
+        self.solver = solver
+        self.dtype = dtype
@@ -0,0 +1,271 @@
+import numpy as np
+from scipy.linalg import cho_solve, eigh
+from typing import Optional
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu
+
+from autoarray import exc
+
+
+class AbstractSolver:
+    def __init__(self, matrix: np.ndarray):
+        """
+        Factorizes a symmetric positive-definite matrix (e.g. the `curvature_reg_matrix` F + reg_coeff*H of an
+        inversion), such that the linear system of equations, the log determinant and the inverse of the matrix can
+        all be computed from a single factorization.
+
+        If the matrix is not positive-definite an `InversionException` is raised.
+
+        Parameters
+        ----------
+        matrix
+            The symmetric positive-definite matrix which is factorized.
+        """
+        self.pixels = matrix.shape[0]
+
+    def solve(self, vector: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    @property
+    def log_det(self) -> float:
+        raise NotImplementedError
+
+    @property
+    def inverse(self) -> np.ndarray:
+        return self.solve(np.eye(self.pixels))
+
+
+class SolverDense(AbstractSolver):
+    def __init__(self, matrix: np.ndarray):
+        """
+        Factorizes a symmetric positive-definite matrix via a dense Cholesky decomposition (see `AbstractSolver`).
+
+        This scales as O(n^3) with the number of pixels and is the fastest solver for small and dense matrices.
+
+        Parameters
+        ----------
+        matrix
+            The symmetric positive-definite matrix which is factorized.
+        """
+        super().__init__(matrix=matrix)
+
+        try:
+            self.cholesky = np.linalg.cholesky(matrix)
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+    def solve(self, vector: np.ndarray) -> np.ndarray:
+        try:
+            return cho_solve((self.cholesky, True), vector)
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+    @property
+    def log_det(self) -> float:
+        return 2.0 * np.sum(np.log(np.diag(self.cholesky)))
+
+
+class SolverSparse(AbstractSolver):
+    def __init__(self, matrix: np.ndarray):
+        """
+        Factorizes a symmetric positive-definite matrix via a sparse LDL^T decomposition (see `AbstractSolver`).
+
+        The decomposition is performed by SuperLU in symmetric mode without pivoting, using a fill-reducing
+        minimum degree ordering of the matrix's rows and columns. For sparse matrices (e.g. the curvature and
+        regularization matrices of rectangular and Delaunay pixelizations, whose pixels only neighbor a few others)
+        this is significantly faster than a dense Cholesky decomposition.
+
+        Because no pivoting is performed, the diagonal of the upper triangular factor is the diagonal matrix D of the
+        LDL^T decomposition, which is positive if and only if the matrix is positive-definite.
+
+        Parameters
+        ----------
+        matrix
+            The symmetric positive-definite matrix which is factorized.
+        """
+        super().__init__(matrix=matrix)
+
+        try:
+            self.lu = splu(
+                csc_matrix(matrix),
+                permc_spec="MMD_AT_PLUS_A",
+                diag_pivot_thresh=0.0,
+                options={"SymmetricMode": True},
+            )
+        except RuntimeError:
+            raise exc.InversionException()
+
+        self.diag = self.lu.U.diagonal()
+
+        if not (
+            np.all(self.diag > 0.0) and np.array_equal(self.lu.perm_r, self.lu.perm_c)
+        ):
+            raise exc.InversionException()
+
+    def solve(self, vector: np.ndarray) -> np.ndarray:
+        return self.lu.solve(np.asarray(vector, dtype="float"))
+
+    @property
+    def log_det(self) -> float:
+        return np.sum(np.log(self.diag))
+
+
+class SolverEigen(AbstractSolver):
+    def __init__(self, curvature_reg_eigen: "CurvatureRegEigen", step: float):
+        """
+        Solves the linear system of a `curvature_reg_matrix` F + H_0 + t * dH, where t is a scalar, using a
+        precomputed generalized eigendecomposition of dH and F + H_0 (see `CurvatureRegEigen`).
+
+        Every calculation is a product of the eigenvectors with a vector or diagonal matrix, which scales as O(n^2)
+        as opposed to the O(n^3) of factorizing the matrix.
+
+        Parameters
+        ----------
+        curvature_reg_eigen
+            The generalized eigendecomposition of dH and F + H_0.
+        step
+            The scalar t which multiplies the change in regularization matrix dH.
+        """
+        self.pixels = curvature_reg_eigen.eigenvalues.shape[0]
+
+        self.curvature_reg_eigen = curvature_reg_eigen
+        self.step = step
+
+        self.diag = 1.0 + step * curvature_reg_eigen.eigenvalues
+
+        if not np.all(self.diag > 0.0):
+            raise exc.InversionException()
+
+    def solve(self, vector: np.ndarray) -> np.ndarray:
+
+        eigenvectors = self.curvature_reg_eigen.eigenvectors
+
+        if vector.ndim == 1:
+            return eigenvectors @ ((eigenvectors.T @ vector) / self.diag)
+
+        return eigenvectors @ ((eigenvectors.T @ vector) / self.diag[:, None])
+
+    @property
+    def log_det(self) -> float:
+        return self.curvature_reg_eigen.log_det_curvature_reg_matrix + np.sum(
+            np.log(self.diag)
+        )
+
+
+class CurvatureRegEigen:
+    def __init__(
+        self,
+        curvature_reg_matrix: np.ndarray,
+        regularization_matrix: np.ndarray,
+        regularization_matrix_change: np.ndarray,
+    ):
+        """
+        The generalized eigendecomposition of a change in regularization matrix dH and a `curvature_reg_matrix`
+        F + H_0, which is used to solve the linear system of equations of any regularization matrix H_0 + t * dH,
+        where t is a scalar, in O(n^2) operations.
+
+        This is used when only the regularization coefficient of a model changes (e.g. in a hyper search where the
+        mappers are fixed), in which case the curvature matrix F and data vector D are fixed and every new
+        regularization matrix lies on the line H_0 + t * dH. For example, the `Constant` regularization matrix is
+        the coefficient squared multiplied by a fixed matrix, plus a fixed small value on its diagonal.
+
+        The generalized eigenvalues mu and eigenvectors U satisfy dH U = (F + H_0) U diag(mu), normalized such that
+        U^T (F + H_0) U = I. It follows that:
+
+        F + H_0 + t * dH = U^-T [I + t * diag(mu)] U^-1
+
+        such that the reconstruction, log determinant and inverse of the `curvature_reg_matrix` are all computed using
+        products with U.
+
+        Decomposing relative to F + H_0 (as opposed to the regularization matrix alone) ensures the calculation is as
+        well conditioned as the linear system itself, as regularization matrices are often close to singular.
+
+        Parameters
+        ----------
+        curvature_reg_matrix
+            The matrix F + H_0 the eigendecomposition is computed relative to.
+        regularization_matrix
+            The regularization matrix H_0 used to compute the `curvature_reg_matrix`.
+        regularization_matrix_change
+            The change in regularization matrix dH, for example the difference of the regularization matrices of two
+            fits with different regularization coefficients.
+        """
+        try:
+            self.eigenvalues, self.eigenvectors = eigh(
+                regularization_matrix_change, curvature_reg_matrix
+            )
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+        self.regularization_matrix = regularization_matrix
+        self.regularization_matrix_change = regularization_matrix_change
+
+        self.log_det_curvature_reg_matrix = SolverDense(
+            matrix=curvature_reg_matrix
+        ).log_det
+
+        self.max_index = np.unravel_index(
+            np.argmax(np.abs(regularization_matrix_change)),
+            regularization_matrix_change.shape,
+        )
+
+    def step_from(self, regularization_matrix: np.ndarray) -> Optional[float]:
+        """
+        Returns the scalar t such that an input regularization matrix is H_0 + t * dH.
+
+        If the input regularization matrix does not lie on this line, `None` is returned, indicating that the
+        eigendecomposition cannot be used to solve its linear system.
+
+        Parameters
+        ----------
+        regularization_matrix
+            The regularization matrix which is compared to H_0 + t * dH.
+        """
+        if regularization_matrix.shape != self.regularization_matrix.shape:
+            return None
+
+        step = (
+            regularization_matrix[self.max_index]
+            - self.regularization_matrix[self.max_index]
+        ) / self.regularization_matrix_change[self.max_index]
+
+        if not np.allclose(
+            regularization_matrix,
+            self.regularization_matrix + step * self.regularization_matrix_change,
+            rtol=1.0e-8,
+            atol=1.0e-12,
+        ):
+            return None
+
+        return step
+
+    def solver_from(self, step: float) -> SolverEigen:
+        return SolverEigen(curvature_reg_eigen=self, step=step)
+
+
+solver_class_dict = {"dense": SolverDense, "sparse": SolverSparse}
+
+
+def solver_from(matrix: np.ndarray, solver: str = "dense") -> AbstractSolver:
+    """
+    Returns the factorization of a symmetric positive-definite matrix using the input solver, where the options
+    are:
+
+    - `dense`: a dense Cholesky decomposition (`SolverDense`).
+    - `sparse`: a sparse LDL^T decomposition with a fill-reducing ordering (`SolverSparse`).
+
+    Parameters
+    ----------
+    matrix
+        The symmetric positive-definite matrix which is factorized.
+    solver
+        The name of the solver used to factorize the matrix.
+    """
+    try:
+        solver_class = solver_class_dict[solver]
+    except KeyError:
+        raise exc.InversionException(
+            f"The solver {solver} is not supported, the options are {list(solver_class_dict)}."
+        )
+
+    return solver_class(matrix=matrix)
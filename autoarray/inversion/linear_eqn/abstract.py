@@ -109,6 +109,14 @@ class AbstractLEq:
         """
         raise NotImplementedError
 
+    @property
+    def operator_fingerprint(self) -> str:
+        """
+        A fingerprint of the operation applied to the mapping matrices of the linear objects (e.g. a 2D convolution
+        with the PSF), which is part of the key of the operated mapping matrix in a `PreloadCache`.
+        """
+        raise NotImplementedError
+
     @profile_func
     def data_vector_from(self, data, preloads):
         raise NotImplementedError
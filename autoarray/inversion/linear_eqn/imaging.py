@@ -1,5 +1,6 @@
 import numpy as np
 from scipy.linalg import block_diag
+from scipy.sparse import csr_matrix, hstack
 from typing import Dict, List, Optional
 
 from autoconf import cached_property
@@ -7,9 +8,11 @@ from autoarray.numba_util import profile_func
 
 from autoarray.inversion.linear_obj import LinearObj
 from autoarray.inversion.linear_eqn.abstract import AbstractLEq
+from autoarray.inversion.inversion.settings import SettingsInversion
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.operators.convolver import Convolver
 from autoarray.dataset.imaging import WTildeImaging
+from autoarray.preload_cache import fingerprint_from
 
 from autoarray.inversion.linear_eqn import leq_util
 
@@ -55,6 +58,18 @@ class AbstractLEqImaging(AbstractLEq):
     def mask(self) -> Array2D:
         return self.noise_map.mask
 
+    @cached_property
+    def operator_fingerprint(self) -> str:
+        """
+        A fingerprint of the operation applied to the mapping matrices of the linear objects, which for imaging data
+        is the 2D convolution with the PSF and is part of the key of the blurred mapping matrix in a `PreloadCache`.
+        """
+        return fingerprint_from(
+            self.convolver.__class__.__name__,
+            self.convolver.kernel,
+            self.convolver.mask,
+        )
+
     @cached_property
     @profile_func
     def blurred_mapping_matrix(self) -> np.ndarray:
@@ -133,6 +148,7 @@ class LEqImagingMapping(AbstractLEqImaging):
         noise_map: Array2D,
         convolver: Convolver,
         linear_obj_list: List[LinearObj],
+        settings: SettingsInversion = SettingsInversion(),
         profiling_dict: Optional[Dict] = None,
     ):
         """
@@ -146,6 +162,16 @@ class LEqImagingMapping(AbstractLEqImaging):
         This class uses the mapping formalism, which constructs the simultaneous linear equations using the
         `mapping_matrix` of every linear object.
 
+        If `settings.use_sparse_mapping_matrix` is `True`, the mapping matrices are stored and convolved as sparse
+        matrices, which only store their non-zero entries, and the `data_vector` and `curvature_matrix` are computed
+        via sparse matrix products. This gives identical results but uses significantly less memory for large
+        datasets and pixelizations.
+
+        If `settings.dtype` is `float32`, the dense blurred mapping matrix is stored and its products (which
+        construct the `data_vector` and `curvature_matrix`) are computed in single precision, which halves their
+        memory and speeds up these memory-bandwidth bound calculations. The `curvature_matrix` is returned in
+        double precision, such that its Cholesky decomposition and log determinant are computed in double precision.
+
         Parameters
         -----------
         noise_map
@@ -155,10 +181,14 @@ class LEqImagingMapping(AbstractLEqImaging):
         linear_obj_list
             The linear objects used to reconstruct the data's observed values. If multiple linear objects are passed
             the simultaneous linear equations are combined and solved simultaneously.
+        settings
+            Settings controlling how an inversion is fitted, for example whether sparse mapping matrices are used.
         profiling_dict
             A dictionary which contains timing of certain functions calls which is used for profiling.
         """
 
+        self.settings = settings
+
         super().__init__(
             noise_map=noise_map,
             convolver=convolver,
@@ -166,6 +196,46 @@ class LEqImagingMapping(AbstractLEqImaging):
             profiling_dict=profiling_dict,
         )
 
+    @property
+    def blurred_mapping_matrix_list(self) -> List[np.ndarray]:
+        """
+        The `blurred_mapping_matrix` of every linear object, where each linear object's `mapping_matrix` is
+        converted to the data type of the settings (e.g. `float32`) before it is convolved with the PSF, such that the
+        blurred mapping matrix is also of this data type.
+        """
+        return [
+            self.convolver.convolve_mapping_matrix(
+                mapping_matrix=linear_obj.mapping_matrix.astype(
+                    self.settings.dtype, copy=False
+                )
+            )
+            for linear_obj in self.linear_obj_list
+        ]
+
+    @cached_property
+    @profile_func
+    def blurred_sparse_mapping_matrix(self) -> csr_matrix:
+        """
+        The `blurred_mapping_matrix` stored as a sparse matrix in compressed sparse row (CSR) format.
+
+        If there are multiple linear objects, the sparse blurred mapping matrices are stacked such that their
+        simultaneous linear equations are solved simultaneously.
+        """
+        return hstack(self.blurred_sparse_mapping_matrix_list, format="csr")
+
+    @property
+    def blurred_sparse_mapping_matrix_list(self) -> List[csr_matrix]:
+        """
+        The `blurred_mapping_matrix` of every linear object stored as a sparse matrix, which is computed by
+        convolving each linear object's `sparse_mapping_matrix` with the PSF via a sparse matrix product.
+        """
+        return [
+            self.convolver.convolve_mapping_matrix_sparse(
+                mapping_matrix=linear_obj.sparse_mapping_matrix
+            )
+            for linear_obj in self.linear_obj_list
+        ]
+
     @profile_func
     def data_vector_from(self, data: Array2D, preloads) -> np.ndarray:
         """
@@ -183,6 +253,12 @@ class LEqImagingMapping(AbstractLEqImaging):
 
         if preloads.operated_mapping_matrix is not None:
             blurred_mapping_matrix = preloads.operated_mapping_matrix
+        elif self.settings.use_sparse_mapping_matrix:
+            return leq_util.data_vector_via_sparse_blurred_mapping_matrix_from(
+                blurred_mapping_matrix=self.blurred_sparse_mapping_matrix,
+                image=data,
+                noise_map=self.noise_map,
+            )
         else:
             blurred_mapping_matrix = self.blurred_mapping_matrix
 
@@ -206,6 +282,12 @@ class LEqImagingMapping(AbstractLEqImaging):
         concatenated ensuring their `curvature_matrix` values are solved for simultaneously. This includes all
         diagonal and off-diagonal terms describing the covariances between linear objects.
         """
+        if self.settings.use_sparse_mapping_matrix:
+            return leq_util.curvature_matrix_via_sparse_mapping_matrix_from(
+                mapping_matrix=self.blurred_sparse_mapping_matrix,
+                noise_map=self.noise_map,
+            )
+
         return leq_util.curvature_matrix_via_mapping_matrix_from(
             mapping_matrix=self.operated_mapping_matrix, noise_map=self.noise_map
         )
@@ -243,13 +325,22 @@ class LEqImagingMapping(AbstractLEqImaging):
             source_quantity=reconstruction
         )
 
-        blurred_mapping_matrix_list = self.blurred_mapping_matrix_list
+        if self.settings.use_sparse_mapping_matrix:
+            blurred_mapping_matrix_list = self.blurred_sparse_mapping_matrix_list
+            mapped_reconstructed_data_func = (
+                leq_util.mapped_reconstructed_data_via_sparse_mapping_matrix_from
+            )
+        else:
+            blurred_mapping_matrix_list = self.blurred_mapping_matrix_list
+            mapped_reconstructed_data_func = (
+                leq_util.mapped_reconstructed_data_via_mapping_matrix_from
+            )
 
         for index, linear_obj in enumerate(self.linear_obj_list):
 
             reconstruction = reconstruction_dict[linear_obj]
 
-            mapped_reconstructed_image = leq_util.mapped_reconstructed_data_via_mapping_matrix_from(
+            mapped_reconstructed_image = mapped_reconstructed_data_func(
                 mapping_matrix=blurred_mapping_matrix_list[index],
                 reconstruction=reconstruction,
             )
@@ -359,7 +450,9 @@ class LEqImagingWTilde(AbstractLEqImaging):
 
         If there are multiple linear objects the curvature_matrices are combined to ensure their values are solved
         for simultaneously. In the w-tilde formalism this requires us to consider the mappings between data and every
-        linear object, meaning that the linear alegbra has both on and off diagonal terms.
+        linear object, meaning that the linear alegbra has both on and off diagonal terms. The unique mappings of
+        every linear object are stacked (see `data_unique_mappings_stacked_from`), such that the on and off diagonal
+        terms of every linear object are computed in a single pass over the w-tilde preload.
 
         The `curvature_matrix` computed here is overwritten in memory when the regularization matrix is added to it,
         because for large matrices this avoids overhead. For this reason, `curvature_matrix` is not a cached property
@@ -369,21 +462,35 @@ class LEqImagingWTilde(AbstractLEqImaging):
         if len(self.linear_obj_list) == 1:
             return self.curvature_matrix_diag
 
-        curvature_matrix = self.curvature_matrix_diag
-
-        curvature_matrix_off_diag = self.curvature_matrix_off_diag_from(
-            mapper_index_0=0, mapper_index_1=1
+        (
+            data_to_pix_unique,
+            data_weights,
+            pix_lengths,
+        ) = leq_util.data_unique_mappings_stacked_from(
+            data_to_pix_unique_list=[
+                linear_obj.data_unique_mappings.data_to_pix_unique
+                for linear_obj in self.linear_obj_list
+            ],
+            data_weights_list=[
+                linear_obj.data_unique_mappings.data_weights
+                for linear_obj in self.linear_obj_list
+            ],
+            pix_lengths_list=[
+                linear_obj.data_unique_mappings.pix_lengths
+                for linear_obj in self.linear_obj_list
+            ],
+            pix_pixels_list=[linear_obj.pixels for linear_obj in self.linear_obj_list],
         )
 
-        pixels_diag = self.linear_obj_list[0].pixels
-
-        curvature_matrix[0:pixels_diag, pixels_diag:] = curvature_matrix_off_diag
-
-        for i in range(curvature_matrix.shape[0]):
-            for j in range(curvature_matrix.shape[1]):
-                curvature_matrix[j, i] = curvature_matrix[i, j]
-
-        return curvature_matrix
+        return leq_util.curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+            curvature_preload=self.w_tilde.curvature_preload,
+            curvature_indexes=self.w_tilde.indexes,
+            curvature_lengths=self.w_tilde.lengths,
+            data_to_pix_unique=data_to_pix_unique,
+            data_weights=data_weights,
+            pix_lengths=pix_lengths,
+            pix_pixels=sum(linear_obj.pixels for linear_obj in self.linear_obj_list),
+        )
 
     @property
     @profile_func
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.linalg import block_diag
 from typing import Dict, List, Optional, Union
 
 from autoconf import cached_property
@@ -9,7 +10,7 @@ from autoarray.mask.mask_2d import Mask2D
 from autoarray.inversion.linear_obj import LinearObj
 from autoarray.inversion.inversion.settings import SettingsInversion
 from autoarray.preloads import Preloads
-from autoarray.operators.transformer import TransformerNUFFT
+from autoarray.preload_cache import fingerprint_from
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.structures.visibilities import Visibilities
 from autoarray.structures.visibilities import VisibilitiesNoiseMap
@@ -24,7 +25,7 @@ class AbstractLEqInterferometer(AbstractLEq):
     def __init__(
         self,
         noise_map: VisibilitiesNoiseMap,
-        transformer: TransformerNUFFT,
+        transformer: "TransformerNUFFT",
         linear_obj_list: List[LinearObj],
         profiling_dict: Optional[Dict] = None,
     ):
@@ -63,6 +64,27 @@ class AbstractLEqInterferometer(AbstractLEq):
     def mask(self) -> Mask2D:
         return self.transformer.real_space_mask
 
+    @cached_property
+    def operator_fingerprint(self) -> str:
+        """
+        A fingerprint of the operation applied to the mapping matrices of the linear objects, which for interferometer
+        data is the Fourier transform to the uv-wavelengths and is part of the key of the transformed mapping matrix in
+        a `PreloadCache`.
+
+        The scalar settings of the transformer (e.g. the accuracy of a non-uniform FFT) are included, as they change
+        the transformed mapping matrix.
+        """
+        return fingerprint_from(
+            self.transformer.__class__.__name__,
+            self.transformer.uv_wavelengths,
+            self.transformer.real_space_mask,
+            [
+                (key, value)
+                for key, value in sorted(vars(self.transformer).items())
+                if isinstance(value, (bool, int, float, str))
+            ],
+        )
+
     @cached_property
     @profile_func
     def transformed_mapping_matrix(self) -> np.ndarray:
@@ -162,7 +184,7 @@ class LEqInterferometerMapping(AbstractLEqInterferometer):
     def __init__(
         self,
         noise_map: VisibilitiesNoiseMap,
-        transformer: TransformerNUFFT,
+        transformer: "TransformerNUFFT",
         linear_obj_list: List[LinearObj],
         profiling_dict: Optional[Dict] = None,
     ):
@@ -300,7 +322,7 @@ class LEqInterferometerWTilde(AbstractLEqInterferometer):
     def __init__(
         self,
         noise_map: VisibilitiesNoiseMap,
-        transformer: TransformerNUFFT,
+        transformer: "TransformerNUFFT",
         w_tilde: WTildeInterferometer,
         linear_obj_list: List[LinearObj],
         settings: SettingsInversion = SettingsInversion(),
@@ -357,13 +379,27 @@ class LEqInterferometerWTilde(AbstractLEqInterferometer):
         If there are multiple linear objects the `data_vectors` are concatenated ensuring their values are solved
         for simultaneously.
 
-        The calculation is described in more detail in `leq_util.w_tilde_data_interferometer_from`.
+        In the w-tilde formalism the visibilities divided by the noise-map squared are Fourier transformed to every
+        real-space image pixel once per dataset and stored in the `w_tilde` object (see
+        `inversion_interferometer_util.w_tilde_data_interferometer_from`). The data vector is then computed via the
+        unique mappings of image pixels to every linear object, without a NUFFT of the mapping matrix.
         """
-        return None
+        return np.concatenate(
+            [
+                leq_util.data_vector_via_w_tilde_data_imaging_from(
+                    w_tilde_data=self.w_tilde.dirty_image,
+                    data_to_pix_unique=linear_obj.data_unique_mappings.data_to_pix_unique,
+                    data_weights=linear_obj.data_unique_mappings.data_weights,
+                    pix_lengths=linear_obj.data_unique_mappings.pix_lengths,
+                    pix_pixels=linear_obj.pixels,
+                )
+                for linear_obj in self.linear_obj_list
+            ]
+        )
 
     @property
     @profile_func
-    def curvature_matrix_diag(self) -> np.ndarray:
+    def curvature_matrix(self) -> np.ndarray:
         """
         The `curvature_matrix` is a 2D matrix which uses the mappings between the data and the linear objects to
         construct the simultaneous linear equations.
@@ -371,21 +407,133 @@ class LEqInterferometerWTilde(AbstractLEqInterferometer):
         The linear algebra is described in the paper https://arxiv.org/pdf/astro-ph/0302587.pdf, where the
         curvature matrix given by equation (4) and the letter F.
 
-        This function computes the diagonal terms of F using the w_tilde formalism.
+        This function computes F using the w_tilde formalism, which is faster as it precomputes the NUFFT of every
+        image pixel offset (see `curvature_matrix_via_w_tilde_curvature_preload_interferometer_from`).
+
+        If there are multiple linear objects the curvature_matrices are combined to ensure their values are solved
+        for simultaneously. In the w-tilde formalism this requires us to consider the mappings between data and every
+        linear object, meaning that the linear alegbra has both on and off diagonal terms. The unique mappings of
+        every linear object are stacked (see `data_unique_mappings_stacked_from`), such that the on and off diagonal
+        terms of every pair of linear objects are computed in a single pass over the w-tilde preload.
+
+        The `curvature_matrix` computed here is overwritten in memory when the regularization matrix is added to it,
+        because for large matrices this avoids overhead. For this reason, `curvature_matrix` is not a cached property
+        to ensure if we access it after computing the `curvature_reg_matrix` it is correctly recalculated in a new
+        array of memory.
         """
+        if len(self.linear_obj_list) == 1:
+            return self.curvature_matrix_diag
+
+        (
+            data_to_pix_unique,
+            data_weights,
+            pix_lengths,
+        ) = leq_util.data_unique_mappings_stacked_from(
+            data_to_pix_unique_list=[
+                linear_obj.data_unique_mappings.data_to_pix_unique
+                for linear_obj in self.linear_obj_list
+            ],
+            data_weights_list=[
+                linear_obj.data_unique_mappings.data_weights
+                for linear_obj in self.linear_obj_list
+            ],
+            pix_lengths_list=[
+                linear_obj.data_unique_mappings.pix_lengths
+                for linear_obj in self.linear_obj_list
+            ],
+            pix_pixels_list=[linear_obj.pixels for linear_obj in self.linear_obj_list],
+        )
+
         return inversion_interferometer_util.curvature_matrix_via_w_tilde_curvature_preload_interferometer_from(
             curvature_preload=self.w_tilde.curvature_preload,
-            pix_indexes_for_sub_slim_index=self.mapper_list[
-                0
-            ].pix_indexes_for_sub_slim_index,
-            native_index_for_slim_index=self.transformer.real_space_mask.mask.native_index_for_slim_index,
-            pixelization_pixels=self.linear_obj_list[0].pixels,
+            native_index_for_slim_index=self.mask.native_index_for_slim_index,
+            data_to_pix_unique=data_to_pix_unique,
+            data_weights=data_weights,
+            pix_lengths=pix_lengths,
+            pix_pixels=sum(linear_obj.pixels for linear_obj in self.linear_obj_list),
+        )
+
+    @property
+    @profile_func
+    def curvature_matrix_diag(self) -> np.ndarray:
+        """
+        The `curvature_matrix` is a 2D matrix which uses the mappings between the data and the linear objects to
+        construct the simultaneous linear equations.
+
+        The linear algebra is described in the paper https://arxiv.org/pdf/astro-ph/0302587.pdf, where the
+        curvature matrix given by equation (4) and the letter F.
+
+        This function computes the diagonal terms of F using the w_tilde formalism.
+        """
+
+        curvature_matrix_list = [
+            inversion_interferometer_util.curvature_matrix_via_w_tilde_curvature_preload_interferometer_from(
+                curvature_preload=self.w_tilde.curvature_preload,
+                native_index_for_slim_index=self.mask.native_index_for_slim_index,
+                data_to_pix_unique=linear_obj.data_unique_mappings.data_to_pix_unique,
+                data_weights=linear_obj.data_unique_mappings.data_weights,
+                pix_lengths=linear_obj.data_unique_mappings.pix_lengths,
+                pix_pixels=linear_obj.pixels,
+            )
+            for linear_obj in self.linear_obj_list
+        ]
+
+        if len(curvature_matrix_list) == 1:
+            return curvature_matrix_list[0]
+
+        return block_diag(*curvature_matrix_list)
+
+    @profile_func
+    def mapped_reconstructed_image_dict_from(
+        self, reconstruction: np.ndarray
+    ) -> Dict[LinearObj, Array2D]:
+        """
+        When constructing the simultaneous linear equations (via vectors and matrices) the quantities of each individual
+        linear object (e.g. their `mapping_matrix`) are combined into single ndarrays. This does not track which
+        quantities belong to which linear objects, therefore the linear equation's solutions (which are returned as
+        ndarrays) do not contain information on which linear object(s) they correspond to.
+
+        This function converts an ndarray of a `reconstruction` to a dictionary of ndarrays containing each linear
+        object's reconstructed images, where the keys are the instances of each mapper in the inversion.
+
+        The w-tilde formalism bypasses the calculation of the `mapping_matrix` and it therefore cannot be used to map
+        the reconstruction's values to the image. Instead, the unique data-to-pixelization mappings are used.
+
+        Parameters
+        ----------
+        reconstruction
+            The reconstruction (in the source frame) whose values are mapped to a dictionary of values for each
+            individual mapper (in the image frame).
+        """
+        mapped_reconstructed_image_dict = {}
+
+        reconstruction_dict = self.source_quantity_dict_from(
+            source_quantity=reconstruction
         )
 
+        for linear_obj in self.linear_obj_list:
+
+            reconstruction = reconstruction_dict[linear_obj]
+
+            mapped_reconstructed_image = leq_util.mapped_reconstructed_data_via_image_to_pix_unique_from(
+                data_to_pix_unique=linear_obj.data_unique_mappings.data_to_pix_unique,
+                data_weights=linear_obj.data_unique_mappings.data_weights,
+                pix_lengths=linear_obj.data_unique_mappings.pix_lengths,
+                reconstruction=reconstruction,
+            )
+
+            mapped_reconstructed_image = Array2D(
+                array=mapped_reconstructed_image, mask=self.mask.mask_sub_1
+            )
+
+            mapped_reconstructed_image_dict[linear_obj] = mapped_reconstructed_image
+
+        return mapped_reconstructed_image_dict
+
     @profile_func
     def mapped_reconstructed_data_dict_from(
         self, reconstruction: np.ndarray
-    ) -> Visibilities:
+    ) -> Dict[LinearObj, Visibilities]:
         """
         When constructing the simultaneous linear equations (via vectors and matrices) the quantities of each individual
         linear object (e.g. their `mapping_matrix`) are combined into single ndarrays. This does not track which
@@ -409,18 +557,22 @@ class LEqInterferometerWTilde(AbstractLEqInterferometer):
             The reconstruction (in the source frame) whose values are mapped to a dictionary of values for each
             individual mapper (in the data frame).
         """
-        return self.transformer.visibilities_from(
-            image=self.mapped_reconstructed_data_dict_from(
-                reconstruction=reconstruction
-            )
+
+        mapped_reconstructed_image_dict = self.mapped_reconstructed_image_dict_from(
+            reconstruction=reconstruction
         )
 
+        return {
+            linear_obj: self.transformer.visibilities_from(image=image)
+            for linear_obj, image in mapped_reconstructed_image_dict.items()
+        }
+
 
 class LEqInterferometerMappingPyLops(AbstractLEqInterferometer):
     def __init__(
         self,
         noise_map: VisibilitiesNoiseMap,
-        transformer: TransformerNUFFT,
+        transformer: "TransformerNUFFT",
         linear_obj_list: List[LinearObj],
         profiling_dict: Optional[Dict] = None,
     ):
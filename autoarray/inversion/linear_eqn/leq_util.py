@@ -1,5 +1,7 @@
+import numba
 import numpy as np
-from typing import Tuple
+from scipy.sparse import csr_matrix, diags
+from typing import List, Optional, Tuple
 
 from autoarray import numba_util
 
@@ -133,7 +135,7 @@ def w_tilde_curvature_imaging_from(
     return w_tilde_curvature
 
 
-@numba_util.jit()
+@numba_util.jit_prange()
 def w_tilde_curvature_preload_imaging_from(
     noise_map_native: np.ndarray, kernel_native: np.ndarray, native_index_for_slim_index
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -171,6 +173,15 @@ def w_tilde_curvature_preload_imaging_from(
     This matrix can then be used to compute the `curvature_matrix` in a memory efficient way that exploits the sparsity
     of the linear algebra.
 
+    Because only image pixel pairs within the kernel overlap window can have non-zero values, the pairs of every image
+    pixel are found by iterating over this window on a native 2D grid of slim indexes, as opposed to iterating over
+    every other image pixel. This reduces the cost of computing the preload from O(image_pixels**2) to
+    O(image_pixels * kernel_overlap_size). The window is iterated over in row-major order starting from the image
+    pixel itself, such that every pair is found in the same (ascending slim index) order as a brute force search.
+
+    The pairs of every image pixel are found independently of one another, therefore the image pixels are iterated
+    over in parallel when more than one thread is used (see `numba_util.set_num_threads`).
+
     Parameters
     ----------
     noise_map_native
@@ -192,41 +203,66 @@ def w_tilde_curvature_preload_imaging_from(
 
     image_pixels = len(native_index_for_slim_index)
 
-    kernel_overlap_size = (2 * kernel_native.shape[0] - 1) * (
-        2 * kernel_native.shape[1] - 1
+    native_shape_y = noise_map_native.shape[0]
+    native_shape_x = noise_map_native.shape[1]
+
+    window_y = 2 * (kernel_native.shape[1] // 2)
+    window_x = 2 * (kernel_native.shape[0] // 2)
+
+    kernel_overlap_size = (2 * window_y + 1) * (2 * window_x + 1)
+
+    slim_index_for_native = -1 * np.ones(
+        (native_shape_y, native_shape_x), dtype=np.int64
     )
 
+    for ip in range(image_pixels):
+        slim_index_for_native[
+            native_index_for_slim_index[ip, 0], native_index_for_slim_index[ip, 1]
+        ] = ip
+
     curvature_preload_tmp = np.zeros((image_pixels, kernel_overlap_size))
     curvature_indexes_tmp = np.zeros((image_pixels, kernel_overlap_size))
     curvature_lengths = np.zeros(image_pixels)
 
-    for ip0 in range(image_pixels):
+    for ip0 in numba.prange(image_pixels):
 
         ip0_y, ip0_x = native_index_for_slim_index[ip0]
 
         kernel_index = 0
 
-        for ip1 in range(ip0, curvature_preload_tmp.shape[0]):
+        for ip1_y in range(ip0_y, min(ip0_y + window_y + 1, native_shape_y)):
 
-            ip1_y, ip1_x = native_index_for_slim_index[ip1]
+            if ip1_y == ip0_y:
+                ip1_x_start = ip0_x
+            else:
+                ip1_x_start = max(ip0_x - window_x, 0)
 
-            noise_value = w_tilde_curvature_value_from(
-                value_native=noise_map_native,
-                kernel_native=kernel_native,
-                ip0_y=ip0_y,
-                ip0_x=ip0_x,
-                ip1_y=ip1_y,
-                ip1_x=ip1_x,
-            )
+            for ip1_x in range(
+                ip1_x_start, min(ip0_x + window_x + 1, native_shape_x)
+            ):
+
+                ip1 = slim_index_for_native[ip1_y, ip1_x]
+
+                if ip1 < 0:
+                    continue
+
+                noise_value = w_tilde_curvature_value_from(
+                    value_native=noise_map_native,
+                    kernel_native=kernel_native,
+                    ip0_y=ip0_y,
+                    ip0_x=ip0_x,
+                    ip1_y=ip1_y,
+                    ip1_x=ip1_x,
+                )
 
-            if ip0 == ip1:
-                noise_value /= 2.0
+                if ip0 == ip1:
+                    noise_value /= 2.0
 
-            if noise_value > 0.0:
+                if noise_value > 0.0:
 
-                curvature_preload_tmp[ip0, kernel_index] = noise_value
-                curvature_indexes_tmp[ip0, kernel_index] = ip1
-                kernel_index += 1
+                    curvature_preload_tmp[ip0, kernel_index] = noise_value
+                    curvature_indexes_tmp[ip0, kernel_index] = ip1
+                    kernel_index += 1
 
         curvature_lengths[ip0] = kernel_index
 
@@ -235,16 +271,17 @@ def w_tilde_curvature_preload_imaging_from(
     curvature_preload = np.zeros((curvature_total_pairs))
     curvature_indexes = np.zeros((curvature_total_pairs))
 
-    index = 0
+    curvature_offsets = np.zeros(image_pixels + 1, dtype=np.int64)
+    curvature_offsets[1:] = np.cumsum(curvature_lengths)
 
-    for i in range(image_pixels):
+    for i in numba.prange(image_pixels):
 
-        for data_index in range(int(curvature_lengths[i])):
+        index = curvature_offsets[i]
 
-            curvature_preload[index] = curvature_preload_tmp[i, data_index]
-            curvature_indexes[index] = curvature_indexes_tmp[i, data_index]
+        for data_index in range(int(curvature_lengths[i])):
 
-            index += 1
+            curvature_preload[index + data_index] = curvature_preload_tmp[i, data_index]
+            curvature_indexes[index + data_index] = curvature_indexes_tmp[i, data_index]
 
     return (curvature_preload, curvature_indexes, curvature_lengths)
 
@@ -434,6 +471,30 @@ def data_vector_via_blurred_mapping_matrix_from(
     return data_vector
 
 
+def data_vector_via_sparse_blurred_mapping_matrix_from(
+    blurred_mapping_matrix: csr_matrix, image: np.ndarray, noise_map: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the data vector `D` from a sparse blurred mapping matrix `f` and the 1D image `d` and 1D noise-map
+    $\sigma$` (see Warren & Dye 2003).
+
+    This gives identical values to `data_vector_via_blurred_mapping_matrix_from`, but uses a sparse-dense product
+    which only iterates over the non-zero entries of the blurred mapping matrix.
+
+    Parameters
+    -----------
+    blurred_mapping_matrix
+        The sparse matrix representing the blurred mappings between sub-grid pixels and pixelization pixels.
+    image
+        Flattened 1D array of the observed image the inversion is fitting.
+    noise_map
+        Flattened 1D array of the noise-map used by the inversion during the fit.
+    """
+    return blurred_mapping_matrix.T @ (
+        np.asarray(image) / np.asarray(noise_map) ** 2.0
+    )
+
+
 @numba_util.jit()
 def data_vector_via_transformed_mapping_matrix_from(
     transformed_mapping_matrix: np.ndarray,
@@ -509,8 +570,97 @@ def curvature_matrix_via_w_tilde_from(
     return np.dot(mapping_matrix.T, np.dot(w_tilde, mapping_matrix))
 
 
-@numba_util.jit()
-def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+def data_order_via_pix_tiles_from(
+    data_to_pix_unique: np.ndarray, tile_size: int = 64
+) -> np.ndarray:
+    """
+    Returns the order in which the data pixels are iterated over when the curvature matrix is computed via w-tilde
+    (see `curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from`), which groups data pixels by the tile
+    of pixelization pixels (of `tile_size` consecutive pixel indexes) their first unique mapping is to.
+
+    The curvature matrix is summed by scattering the values of every data pixel pair into the rows of the
+    pixelization pixels they map to. For large pixelizations (e.g. many thousands of pixels) the curvature matrix
+    is too large to fit in the CPU cache, therefore iterating over data pixels in their slim order (which scans across
+    the image and therefore across the pixelization) scatters into rows far apart in memory. Iterating over data
+    pixels grouped by pixelization tile means consecutive data pixels write to the same block of rows, which is
+    memory-bound code's main bottleneck.
+
+    The sort is stable, such that within a tile data pixels are in their slim order.
+
+    Parameters
+    ----------
+    data_to_pix_unique
+        An array that maps every data pixel index (e.g. the masked image pixel indexes in 1D) to its unique set of
+        pixelization pixel indexes (see `data_slim_to_pixelization_unique_from`).
+    tile_size
+        The number of consecutive pixelization pixel indexes grouped into a tile.
+    """
+    return np.argsort(data_to_pix_unique[:, 0] // tile_size, kind="stable")
+
+
+def data_unique_mappings_stacked_from(
+    data_to_pix_unique_list: List[np.ndarray],
+    data_weights_list: List[np.ndarray],
+    pix_lengths_list: List[np.ndarray],
+    pix_pixels_list: List[int],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the unique mappings of every data pixel to the pixels of multiple pixelizations (see
+    `data_slim_to_pixelization_unique_from`), stacked such that the pixels of every pixelization are indexed
+    consecutively (e.g. if the first pixelization has 100 pixels, the first pixel of the second pixelization has
+    index 100).
+
+    The stacked mappings describe the mapping matrix of every pixelization stacked horizontally, meaning the curvature
+    matrix of an inversion with multiple mappers (including the off-diagonal terms between mappers) can be computed
+    from them in a single pass over the w-tilde preload.
+
+    Parameters
+    ----------
+    data_to_pix_unique_list
+        The unique pixelization pixel indexes of every data pixel of every pixelization.
+    data_weights_list
+        The weights of the unique mappings of every data pixel of every pixelization.
+    pix_lengths_list
+        The number of unique pixelization pixels every data pixel maps to of every pixelization.
+    pix_pixels_list
+        The total number of pixels of every pixelization.
+    """
+    pix_offsets = np.cumsum([0] + list(pix_pixels_list[:-1]))
+
+    valid = np.concatenate(
+        [
+            np.arange(data_to_pix_unique.shape[1])[None, :] < pix_lengths[:, None]
+            for data_to_pix_unique, pix_lengths in zip(
+                data_to_pix_unique_list, pix_lengths_list
+            )
+        ],
+        axis=1,
+    )
+
+    data_to_pix_unique = np.concatenate(
+        [
+            data_to_pix_unique + pix_offset
+            for data_to_pix_unique, pix_offset in zip(
+                data_to_pix_unique_list, pix_offsets
+            )
+        ],
+        axis=1,
+    )
+    data_to_pix_unique = np.where(valid, data_to_pix_unique, -1)
+
+    data_weights = np.where(valid, np.concatenate(data_weights_list, axis=1), 0.0)
+
+    order = np.argsort(~valid, axis=1, kind="stable")
+
+    return (
+        np.take_along_axis(data_to_pix_unique, order, axis=1),
+        np.take_along_axis(data_weights, order, axis=1),
+        np.sum(pix_lengths_list, axis=0).astype("int"),
+    )
+
+
+@numba_util.jit_prange()
+def curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from(
     curvature_preload: np.ndarray,
     curvature_indexes: np.ndarray,
     curvature_lengths: np.ndarray,
@@ -518,24 +668,26 @@ def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
     data_weights: np.ndarray,
     pix_lengths: np.ndarray,
     pix_pixels: int,
+    data_order: np.ndarray,
+    total_chunks: int = 1,
+    max_chunks_gb: float = 1.0,
 ) -> np.ndarray:
     """
-    Returns the curvature matrix `F` (see Warren & Dye 2003) by computing it using `w_tilde_preload`
-    (see `w_tilde_preload_interferometer_from`) for an imaging inversion.
+    Returns the upper triangle (including the diagonal) of the curvature matrix `F` (see Warren & Dye 2003) by
+    computing it using `w_tilde_preload` (see `w_tilde_curvature_preload_imaging_from`) for an imaging inversion,
+    where the lower triangle is zeros.
 
-    To compute the curvature matrix via w_tilde the following matrix multiplication is normally performed:
+    The w-tilde preload stores every pair of data pixels once (with the second data pixel at or after the first in
+    slim order), and the curvature matrix is the sum of the values of every pair and its transpose. Every value is
+    therefore summed directly into the upper triangle, such that no pass over the full matrix is needed to
+    symmetrize it, and the lower triangle is never written to.
 
-    curvature_matrix = mapping_matrix.T * w_tilde * mapping matrix
+    The data pixels are iterated over in the input `data_order`, which groups them by the pixelization pixels they
+    map to (see `data_order_via_pix_tiles_from`), such that the curvature matrix is written to in blocks of nearby
+    rows.
 
-    This function speeds this calculation up in two ways:
-
-    1) Instead of using `w_tilde` (dimensions [image_pixels, image_pixels] it uses `w_tilde_preload` (dimensions
-    [image_pixels, kernel_overlap]). The massive reduction in the size of this matrix in memory allows for much fast
-    computation.
-
-    2) It omits the `mapping_matrix` and instead uses directly the 1D vector that maps every image pixel to a source
-    pixel `native_index_for_slim_index`. This exploits the sparsity in the `mapping_matrix` to directly
-    compute the `curvature_matrix` (e.g. it condenses the triple matrix multiplication into a double for loop!).
+    For multiple pixelizations their unique mappings can be stacked (see `data_unique_mappings_stacked_from`),
+    such that the full curvature matrix (including its off-diagonal terms) is computed in one pass.
 
     Parameters
     ----------
@@ -558,53 +710,203 @@ def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
         `data_to_pix_unique` and `data_weights`.
     pix_pixels
         The total number of pixels in the pixelization that reconstructs the data.
+    data_order
+        The order in which the data pixels are iterated over.
+    total_chunks
+        The number of chunks the data pixels are divided into, which are iterated over in parallel when more than one
+        thread is used (see `numba_util.set_num_threads`), where every chunk sums its values in a separate curvature
+        matrix.
+    max_chunks_gb
+        The maximum memory (in gigabytes) of the curvature matrices the chunks sum their values in, where the number
+        of chunks is reduced to fit within it. For large pixelizations run with many threads (e.g. 10000 pixels and
+        64 threads) one matrix per thread would otherwise use tens of gigabytes.
 
     Returns
     -------
     ndarray
-        The curvature matrix `F` (see Warren & Dye 2003).
+        The upper triangle of the curvature matrix `F` (see Warren & Dye 2003).
     """
 
     data_pixels = curvature_lengths.shape[0]
 
-    curvature_matrix = np.zeros((pix_pixels, pix_pixels))
+    total_chunks = max(
+        1,
+        min(total_chunks, int(max_chunks_gb * 1.0e9 / (8.0 * pix_pixels * pix_pixels))),
+    )
 
-    curvature_index = 0
+    curvature_offsets = np.zeros(data_pixels + 1, dtype=np.int64)
+    curvature_offsets[1:] = np.cumsum(curvature_lengths)
 
-    for data_0 in range(data_pixels):
+    curvature_matrix_chunks = np.zeros((total_chunks, pix_pixels, pix_pixels))
 
-        for data_1_index in range(curvature_lengths[data_0]):
+    for chunk in numba.prange(total_chunks):
 
-            data_1 = curvature_indexes[curvature_index]
-            w_tilde_value = curvature_preload[curvature_index]
+        curvature_matrix_chunk = curvature_matrix_chunks[chunk]
 
-            for pix_0_index in range(pix_lengths[data_0]):
+        for order_index in range(
+            chunk * data_pixels // total_chunks,
+            (chunk + 1) * data_pixels // total_chunks,
+        ):
 
-                data_0_weight = data_weights[data_0, pix_0_index]
-                pix_0 = data_to_pix_unique[data_0, pix_0_index]
+            data_0 = data_order[order_index]
 
-                for pix_1_index in range(pix_lengths[data_1]):
+            for data_1_index in range(curvature_lengths[data_0]):
 
-                    data_1_weight = data_weights[data_1, pix_1_index]
-                    pix_1 = data_to_pix_unique[data_1, pix_1_index]
+                curvature_index = curvature_offsets[data_0] + data_1_index
 
-                    curvature_matrix[pix_0, pix_1] += (
-                        data_0_weight * data_1_weight * w_tilde_value
-                    )
+                data_1 = curvature_indexes[curvature_index]
+                w_tilde_value = curvature_preload[curvature_index]
 
-            curvature_index += 1
+                for pix_0_index in range(pix_lengths[data_0]):
 
-    for i in range(pix_pixels):
-        for j in range(i, pix_pixels):
-            curvature_matrix[i, j] += curvature_matrix[j, i]
+                    value_0 = data_weights[data_0, pix_0_index] * w_tilde_value
+                    pix_0 = data_to_pix_unique[data_0, pix_0_index]
 
-    for i in range(pix_pixels):
-        for j in range(i, pix_pixels):
-            curvature_matrix[j, i] = curvature_matrix[i, j]
+                    for pix_1_index in range(pix_lengths[data_1]):
+
+                        value = value_0 * data_weights[data_1, pix_1_index]
+                        pix_1 = data_to_pix_unique[data_1, pix_1_index]
+
+                        if pix_0 < pix_1:
+                            curvature_matrix_chunk[pix_0, pix_1] += value
+                        elif pix_0 > pix_1:
+                            curvature_matrix_chunk[pix_1, pix_0] += value
+                        else:
+                            curvature_matrix_chunk[pix_0, pix_0] += 2.0 * value
+
+    if total_chunks == 1:
+        return curvature_matrix_chunks[0]
+
+    curvature_matrix = np.zeros((pix_pixels, pix_pixels))
+
+    for i in numba.prange(pix_pixels):
+        for chunk in range(total_chunks):
+            for j in range(i, pix_pixels):
+                curvature_matrix[i, j] += curvature_matrix_chunks[chunk, i, j]
 
     return curvature_matrix
 
 
+@numba_util.jit_prange()
+def symmetric_matrix_via_upper_triangle_from(
+    matrix: np.ndarray, block_size: int = 64
+) -> np.ndarray:
+    """
+    Fills the lower triangle of a symmetric matrix whose upper triangle is computed (e.g. the curvature matrix
+    computed via `curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from`) in place.
+
+    The lower triangle is filled in square blocks of `block_size` rows and columns, such that the block read by rows
+    and the block written to by columns both fit in the CPU cache, as opposed to writing down every full column of a
+    large matrix. The rows of blocks are filled in parallel when more than one thread is used.
+
+    Parameters
+    ----------
+    matrix
+        The square matrix whose upper triangle is copied to its lower triangle.
+    block_size
+        The number of rows and columns of every block.
+    """
+    pixels = matrix.shape[0]
+
+    total_blocks = (pixels + block_size - 1) // block_size
+
+    for block_0 in numba.prange(total_blocks):
+
+        i_start = block_0 * block_size
+        i_end = min(i_start + block_size, pixels)
+
+        for block_1 in range(block_0, total_blocks):
+
+            j_start = block_1 * block_size
+            j_end = min(j_start + block_size, pixels)
+
+            for i in range(i_start, i_end):
+                for j in range(max(i + 1, j_start), j_end):
+                    matrix[j, i] = matrix[i, j]
+
+    return matrix
+
+
+def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+    curvature_preload: np.ndarray,
+    curvature_indexes: np.ndarray,
+    curvature_lengths: np.ndarray,
+    data_to_pix_unique: np.ndarray,
+    data_weights: np.ndarray,
+    pix_lengths: np.ndarray,
+    pix_pixels: int,
+    total_chunks: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Returns the curvature matrix `F` (see Warren & Dye 2003) by computing it using `w_tilde_preload`
+    (see `w_tilde_preload_interferometer_from`) for an imaging inversion.
+
+    To compute the curvature matrix via w_tilde the following matrix multiplication is normally performed:
+
+    curvature_matrix = mapping_matrix.T * w_tilde * mapping matrix
+
+    This function speeds this calculation up in two ways:
+
+    1) Instead of using `w_tilde` (dimensions [image_pixels, image_pixels] it uses `w_tilde_preload` (dimensions
+    [image_pixels, kernel_overlap]). The massive reduction in the size of this matrix in memory allows for much fast
+    computation.
+
+    2) It omits the `mapping_matrix` and instead uses directly the 1D vector that maps every image pixel to a source
+    pixel `native_index_for_slim_index`. This exploits the sparsity in the `mapping_matrix` to directly
+    compute the `curvature_matrix` (e.g. it condenses the triple matrix multiplication into a double for loop!).
+
+    The upper triangle is computed with the data pixels grouped by pixelization tile (see
+    `curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from`) and then copied to the lower triangle.
+
+    Parameters
+    ----------
+    curvature_preload
+        A matrix that precomputes the values for fast computation of the curvature matrix in a memory efficient way.
+    curvature_indexes
+        The image-pixel indexes of the values stored in the w tilde preload matrix, which are used to compute
+        the weights of the data values when computing the curvature matrix.
+    curvature_lengths
+        The number of image pixels in every row of `w_tilde_curvature`, which is iterated over when computing the
+        curvature matrix.
+    data_to_pix_unique
+        An array that maps every data pixel index (e.g. the masked image pixel indexes in 1D) to its unique set of
+        pixelization pixel indexes (see `data_slim_to_pixelization_unique_from`).
+    data_weights
+        For every unique mapping between a set of data sub-pixels and a pixelization pixel, the weight of these mapping
+        based on the number of sub-pixels that map to pixelization pixel.
+    pix_lengths
+        A 1D array describing how many unique pixels each data pixel maps too, which is used to iterate over
+        `data_to_pix_unique` and `data_weights`.
+    pix_pixels
+        The total number of pixels in the pixelization that reconstructs the data.
+    total_chunks
+        The number of chunks the data pixels are divided into, which are iterated over in parallel when more than one
+        thread is used (see `numba_util.set_num_threads`). Different data pixels map to the same pixelization pixels,
+        therefore every chunk sums its values in a separate curvature matrix which are added together at the end.
+        If `None`, there is one chunk per thread in use.
+
+    Returns
+    -------
+    ndarray
+        The curvature matrix `F` (see Warren & Dye 2003).
+    """
+    chunk_dict = {} if total_chunks is None else {"total_chunks": total_chunks}
+
+    curvature_matrix = curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from(
+        curvature_preload=curvature_preload,
+        curvature_indexes=curvature_indexes,
+        curvature_lengths=curvature_lengths,
+        data_to_pix_unique=data_to_pix_unique,
+        data_weights=data_weights,
+        pix_lengths=pix_lengths,
+        pix_pixels=pix_pixels,
+        data_order=data_order_via_pix_tiles_from(data_to_pix_unique=data_to_pix_unique),
+        **chunk_dict,
+    )
+
+    return symmetric_matrix_via_upper_triangle_from(matrix=curvature_matrix)
+
+
 @numba_util.jit()
 def curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from(
     curvature_preload: np.ndarray,
@@ -706,6 +1008,9 @@ def curvature_matrix_via_mapping_matrix_from(
     Returns the curvature matrix `F` from a blurred mapping matrix `f` and the 1D noise-map $\sigma$
      (see Warren & Dye 2003).
 
+    The matrix product is computed in the data type of the mapping matrix (e.g. `float32`, which halves the memory
+    and time of this memory-bandwidth bound product), but the curvature matrix is returned in double precision.
+
     Parameters
     -----------
     mapping_matrix
@@ -714,9 +1019,32 @@ def curvature_matrix_via_mapping_matrix_from(
     noise_map
         Flattened 1D array of the noise-map used by the inversion during the fit.
     """
-    array = mapping_matrix / noise_map[:, None]
+    array = mapping_matrix / np.asarray(noise_map, dtype=mapping_matrix.dtype)[:, None]
     curvature_matrix = np.dot(array.T, array)
-    return curvature_matrix
+    return curvature_matrix.astype("float64", copy=False)
+
+
+def curvature_matrix_via_sparse_mapping_matrix_from(
+    mapping_matrix: csr_matrix, noise_map: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the curvature matrix `F` from a sparse blurred mapping matrix `f` and the 1D noise-map $\sigma$
+     (see Warren & Dye 2003).
+
+    This gives identical values to `curvature_matrix_via_mapping_matrix_from`, but uses a sparse-sparse product
+    such that a dense matrix of dimensions [data_pixels, pixelization_pixels] is never created. The curvature matrix
+    itself is returned as a dense ndarray, as it is subsequently added to the regularization matrix and solved for.
+
+    Parameters
+    -----------
+    mapping_matrix
+        The sparse matrix representing the mappings (these could be blurred or transfomed) between sub-grid pixels and
+        pixelization pixels.
+    noise_map
+        Flattened 1D array of the noise-map used by the inversion during the fit.
+    """
+    array = diags(1.0 / np.asarray(noise_map)) @ mapping_matrix
+    return (array.T @ array).toarray()
 
 
 @numba_util.jit()
@@ -861,6 +1189,20 @@ def mapped_reconstructed_data_via_mapping_matrix_from(
     return mapped_reconstructed_data
 
 
+def mapped_reconstructed_data_via_sparse_mapping_matrix_from(
+    mapping_matrix: csr_matrix, reconstruction: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the reconstructed data vector from a sparse blurred mapping matrix `f` and solution vector *S*.
+
+    Parameters
+    -----------
+    mapping_matrix
+        The sparse matrix representing the blurred mappings between sub-grid pixels and pixelization pixels.
+    """
+    return mapping_matrix @ np.asarray(reconstruction)
+
+
 @numba_util.jit()
 def mapped_reconstructed_visibilities_from(
     transformed_mapping_matrix: np.ndarray, reconstruction: np.ndarray
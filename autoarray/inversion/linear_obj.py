@@ -1,9 +1,11 @@
 import numpy as np
+from scipy.sparse import csr_matrix
 from typing import Optional, Dict
 
 from autoconf import cached_property
 
 from autoarray.numba_util import profile_func
+from autoarray.preload_cache import fingerprint_from
 
 
 class UniqueMappings:
@@ -47,6 +49,18 @@ class LinearObj:
     def mapping_matrix(self) -> np.ndarray:
         raise NotImplementedError
 
+    @property
+    def sparse_mapping_matrix(self) -> csr_matrix:
+        return csr_matrix(self.mapping_matrix)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        A fingerprint of the linear object, which is the key of the quantities of an inversion computed from it (e.g.
+        the blurred mapping matrix) in a `PreloadCache`.
+        """
+        return fingerprint_from(self.__class__.__name__, self.mapping_matrix)
+
     @cached_property
     @profile_func
     def data_unique_mappings(self):
@@ -1,11 +1,15 @@
 import itertools
 import numpy as np
+from scipy.sparse import csr_matrix
 from typing import Dict, List, Optional
 
 from autoconf import cached_property
 
 from autoarray.inversion.linear_obj import LinearObj
 from autoarray.inversion.linear_obj import UniqueMappings
+from autoarray.preload_cache import PreloadCache
+from autoarray.preload_cache import cached_from
+from autoarray.preload_cache import fingerprint_from
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
 
@@ -21,6 +25,7 @@ class AbstractMapper(LinearObj):
         data_pixelization_grid: Grid2D = None,
         hyper_image: Array2D = None,
         profiling_dict: Optional[Dict] = None,
+        preload_cache: Optional[PreloadCache] = None,
     ):
         """
         To understand a `Mapper` one must be familiar `Pixelization` objects and the `pixelization` package, where
@@ -79,6 +84,9 @@ class AbstractMapper(LinearObj):
             pixels of the Delaunay grid to the data it discretizes.
         profiling_dict
             A dictionary which contains timing of certain functions calls which is used for profiling.
+        preload_cache
+            A cache which stores the mapping matrix and unique mappings of the mapper under a fingerprint of its
+            grids, such that they are reused by mappers with the same grids (see `PreloadCache`).
         """
 
         self.source_grid_slim = source_grid_slim
@@ -87,11 +95,32 @@ class AbstractMapper(LinearObj):
 
         self.hyper_image = hyper_image
         self.profiling_dict = profiling_dict
+        self.preload_cache = preload_cache
 
     @property
     def pixels(self) -> int:
         return self.source_pixelization_grid.pixels
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        A fingerprint of the grids the mappings of the mapper are computed from, which is the key the mapping matrix
+        and unique mappings of the mapper are stored under in a `PreloadCache`.
+
+        The `hyper_image` is included because it changes the regularization matrices of adaptive regularization
+        schemes, which use the mapper fingerprint as their key.
+        """
+        mask = self.source_grid_slim.mask
+
+        return fingerprint_from(
+            self.__class__.__name__,
+            self.source_grid_slim,
+            mask,
+            mask.sub_size,
+            self.source_pixelization_grid,
+            self.hyper_image,
+        )
+
     @property
     def pix_sub_weights(self) -> "PixSubWeights":
         raise NotImplementedError
@@ -188,22 +217,31 @@ class AbstractMapper(LinearObj):
         function `mapper_util.data_slim_to_pixelization_unique_from()`.
         """
 
-        (
-            data_to_pix_unique,
-            data_weights,
-            pix_lengths,
-        ) = mapper_util.data_slim_to_pixelization_unique_from(
-            data_pixels=self.source_grid_slim.shape_slim,
-            pix_indexes_for_sub_slim_index=self.pix_indexes_for_sub_slim_index,
-            pix_sizes_for_sub_slim_index=self.pix_sizes_for_sub_slim_index,
-            pix_weights_for_sub_slim_index=self.pix_weights_for_sub_slim_index,
-            sub_size=self.source_grid_slim.sub_size,
-        )
+        def func():
+
+            (
+                data_to_pix_unique,
+                data_weights,
+                pix_lengths,
+            ) = mapper_util.data_slim_to_pixelization_unique_from(
+                data_pixels=self.source_grid_slim.shape_slim,
+                pix_indexes_for_sub_slim_index=self.pix_indexes_for_sub_slim_index,
+                pix_sizes_for_sub_slim_index=self.pix_sizes_for_sub_slim_index,
+                pix_weights_for_sub_slim_index=self.pix_weights_for_sub_slim_index,
+                sub_size=self.source_grid_slim.sub_size,
+            )
 
-        return UniqueMappings(
-            data_to_pix_unique=data_to_pix_unique,
-            data_weights=data_weights,
-            pix_lengths=pix_lengths,
+            return UniqueMappings(
+                data_to_pix_unique=data_to_pix_unique,
+                data_weights=data_weights,
+                pix_lengths=pix_lengths,
+            )
+
+        return cached_from(
+            cache=self.preload_cache,
+            name="data_unique_mappings",
+            key_func=lambda: self.fingerprint,
+            func=func,
         )
 
     @cached_property
@@ -215,7 +253,31 @@ class AbstractMapper(LinearObj):
 
         A full description is given in `mapper_util.mapping_matrix_from()`.
         """
-        return mapper_util.mapping_matrix_from(
+        return cached_from(
+            cache=self.preload_cache,
+            name="mapping_matrix",
+            key_func=lambda: self.fingerprint,
+            func=lambda: mapper_util.mapping_matrix_from(
+                pix_weights_for_sub_slim_index=self.pix_weights_for_sub_slim_index,
+                pixels=self.pixels,
+                total_mask_sub_pixels=self.source_grid_slim.mask.pixels_in_mask,
+                slim_index_for_sub_slim_index=self.slim_index_for_sub_slim_index,
+                pix_indexes_for_sub_slim_index=self.pix_indexes_for_sub_slim_index,
+                pix_size_for_sub_slim_index=self.pix_sizes_for_sub_slim_index,
+                sub_fraction=self.source_grid_slim.mask.sub_fraction,
+            ),
+        )
+
+    @cached_property
+    @profile_func
+    def sparse_mapping_matrix(self) -> csr_matrix:
+        """
+        The `mapping_matrix` stored as a sparse matrix in compressed sparse row (CSR) format, which only stores its
+        non-zero entries and therefore uses significantly less memory for large datasets and pixelizations.
+
+        A full description is given in `mapper_util.sparse_mapping_matrix_from()`.
+        """
+        return mapper_util.sparse_mapping_matrix_from(
             pix_weights_for_sub_slim_index=self.pix_weights_for_sub_slim_index,
             pixels=self.pixels,
             total_mask_sub_pixels=self.source_grid_slim.mask.pixels_in_mask,
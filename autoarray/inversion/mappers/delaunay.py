@@ -5,6 +5,7 @@ from autoconf import cached_property
 
 from autoarray.inversion.mappers.abstract import AbstractMapper
 from autoarray.inversion.mappers.abstract import PixSubWeights
+from autoarray.preload_cache import PreloadCache
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
 
@@ -20,6 +21,7 @@ class MapperDelaunay(AbstractMapper):
         data_pixelization_grid: Grid2D = None,
         hyper_image: Array2D = None,
         profiling_dict: Optional[Dict] = None,
+        preload_cache: Optional[PreloadCache] = None,
     ):
         """
         To understand a `Mapper` one must be familiar `Pixelization` objects and the `pixelization` package, where
@@ -72,6 +74,9 @@ class MapperDelaunay(AbstractMapper):
             pixels of the Delaunay grid to the data it discretizes.
         profiling_dict
             A dictionary which contains timing of certain functions calls which is used for profiling.
+        preload_cache
+            A cache which stores the mapping matrix and unique mappings of the mapper under a fingerprint of its
+            grids, such that they are reused by mappers with the same grids (see `PreloadCache`).
         """
         super().__init__(
             source_grid_slim=source_grid_slim,
@@ -79,6 +84,7 @@ class MapperDelaunay(AbstractMapper):
             data_pixelization_grid=data_pixelization_grid,
             hyper_image=hyper_image,
             profiling_dict=profiling_dict,
+            preload_cache=preload_cache,
         )
 
     @property
@@ -127,65 +133,74 @@ class MapperDelaunay(AbstractMapper):
 
         The interpolation weights of these multiple mappings are stored in the array `pix_weights_for_sub_slim_index`.
 
-        For the Delaunay pixelization these mappings are calculated using the Scipy spatial library
-        (see `mapper_util.pix_indexes_for_sub_slim_index_delaunay_from`).
+        For the Delaunay pixelization these mappings are calculated by locating every sub-pixel in the Delaunay
+        triangulation (see `pix_sub_weights_from`).
         """
-        delaunay = self.delaunay
+        return self.pix_sub_weights_from(grid=self.source_grid_slim)
 
-        simplex_index_for_sub_slim_index = delaunay.find_simplex(self.source_grid_slim)
-        pix_indexes_for_simplex_index = delaunay.simplices
+    @property
+    def pix_sub_weights_split_cross(self) -> PixSubWeights:
 
-        mappings, sizes = mapper_util.pix_indexes_for_sub_slim_index_delaunay_from(
-            source_grid_slim=self.source_grid_slim,
-            simplex_index_for_sub_slim_index=simplex_index_for_sub_slim_index,
-            pix_indexes_for_simplex_index=pix_indexes_for_simplex_index,
-            delaunay_points=delaunay.points,
+        pix_sub_weights = self.pix_sub_weights_from(
+            grid=self.source_pixelization_grid.split_cross
         )
 
-        mappings = mappings.astype("int")
-        sizes = sizes.astype("int")
+        append_line_int = np.zeros((len(pix_sub_weights.weights), 1), dtype="int") - 1
+        append_line_float = np.zeros((len(pix_sub_weights.weights), 1), dtype="float")
 
-        weights = mapper_util.pixel_weights_delaunay_from(
-            source_grid_slim=self.source_grid_slim,
-            source_pixelization_grid=self.source_pixelization_grid,
-            slim_index_for_sub_slim_index=self.slim_index_for_sub_slim_index,
-            pix_indexes_for_sub_slim_index=mappings,
+        return PixSubWeights(
+            mappings=np.hstack((pix_sub_weights.mappings, append_line_int)),
+            sizes=pix_sub_weights.sizes,
+            weights=np.hstack((pix_sub_weights.weights, append_line_float)),
         )
 
-        return PixSubWeights(mappings=mappings, sizes=sizes, weights=weights)
+    def pix_sub_weights_from(self, grid: np.ndarray) -> PixSubWeights:
+        """
+        Returns the mappings between every (y,x) coordinate of a grid and the pixels of the `Delaunay` pixelization,
+        the number of mappings of every coordinate and their interpolation weights.
 
-    @property
-    def pix_sub_weights_split_cross(self) -> PixSubWeights:
+        Every coordinate is located in the Delaunay triangulation by walking from the triangle of the previous
+        coordinate (see `mapper_util.simplex_index_and_barycentric_weights_delaunay_from`), which also computes the
+        barycentric interpolation weights of the triangle's three vertices. Coordinates outside the convex hull of
+        the triangulation map to their nearest pixel, which is found via a KD-tree of the pixelization grid.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates which are paired with the Delaunay pixelization (e.g. the `source_grid_slim`).
+        """
+        from scipy.spatial import cKDTree
 
         delaunay = self.delaunay
 
-        splitted_simplex_index_for_sub_slim_index = delaunay.find_simplex(
-            self.source_pixelization_grid.split_cross
-        )
-        pix_indexes_for_simplex_index = delaunay.simplices
+        grid = np.asarray(grid)
 
         (
-            splitted_mappings,
-            splitted_sizes,
-        ) = mapper_util.pix_indexes_for_sub_slim_index_delaunay_from(
-            source_grid_slim=self.source_pixelization_grid.split_cross,
-            simplex_index_for_sub_slim_index=splitted_simplex_index_for_sub_slim_index,
-            pix_indexes_for_simplex_index=pix_indexes_for_simplex_index,
-            delaunay_points=delaunay.points,
+            simplex_index_for_sub_slim_index,
+            barycentric_weights,
+        ) = mapper_util.simplex_index_and_barycentric_weights_delaunay_from(
+            grid=grid,
+            simplex_transforms=delaunay.transform,
+            simplex_neighbors=delaunay.neighbors,
         )
 
-        splitted_weights = mapper_util.pixel_weights_delaunay_from(
-            source_grid_slim=self.source_pixelization_grid.split_cross,
-            source_pixelization_grid=self.source_pixelization_grid,
-            slim_index_for_sub_slim_index=self.source_pixelization_grid.split_cross,
-            pix_indexes_for_sub_slim_index=splitted_mappings.astype("int"),
-        )
+        nearest_pix_index_for_sub_slim_index = np.zeros(grid.shape[0], dtype="int")
+
+        is_outside = simplex_index_for_sub_slim_index == -1
 
-        append_line_int = np.zeros((len(splitted_weights), 1), dtype="int") - 1
-        append_line_float = np.zeros((len(splitted_weights), 1), dtype="float")
+        if np.any(is_outside):
+
+            nearest_pix_index_for_sub_slim_index[is_outside] = cKDTree(
+                delaunay.points
+            ).query(grid[is_outside])[1]
+
+        mappings, sizes, weights = mapper_util.pix_indexes_and_weights_delaunay_from(
+            simplex_index_for_sub_slim_index=simplex_index_for_sub_slim_index,
+            barycentric_weights=barycentric_weights,
+            pix_indexes_for_simplex_index=delaunay.simplices,
+            nearest_pix_index_for_sub_slim_index=nearest_pix_index_for_sub_slim_index,
+        )
 
         return PixSubWeights(
-            mappings=np.hstack((splitted_mappings.astype("int"), append_line_int)),
-            sizes=splitted_sizes.astype("int"),
-            weights=np.hstack((splitted_weights, append_line_float)),
+            mappings=mappings.astype("int"), sizes=sizes.astype("int"), weights=weights
         )
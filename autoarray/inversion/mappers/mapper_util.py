@@ -1,4 +1,6 @@
+import numba
 import numpy as np
+from scipy.sparse import csr_matrix
 from typing import Tuple
 
 from autoarray import numba_util
@@ -134,6 +136,225 @@ def pix_indexes_for_sub_slim_index_delaunay_from(
     return pix_indexes_for_sub_slim_index, pix_indexes_for_sub_slim_index_sizes
 
 
+@numba_util.jit()
+def barycentric_weights_from(
+    simplex_transforms: np.ndarray, simplex_index: int, y: float, x: float
+) -> Tuple[float, float, float]:
+    """
+    Returns the barycentric coordinates of a (y,x) coordinate with respect to the three vertices of a Delaunay
+    triangle, using the affine transform of the triangle computed by scipy (the `transform` attribute of a
+    `scipy.spatial.Delaunay` object).
+
+    The coordinate is inside the triangle if all three barycentric coordinates are positive, in which case they
+    are the interpolation weights of the triangle's three vertices.
+
+    Parameters
+    ----------
+    simplex_transforms
+        The affine transform from (y,x) coordinates to barycentric coordinates of every Delaunay triangle.
+    simplex_index
+        The index of the Delaunay triangle.
+    y
+        The y coordinate.
+    x
+        The x coordinate.
+    """
+    dy = y - simplex_transforms[simplex_index, 2, 0]
+    dx = x - simplex_transforms[simplex_index, 2, 1]
+
+    weight_0 = (
+        simplex_transforms[simplex_index, 0, 0] * dy
+        + simplex_transforms[simplex_index, 0, 1] * dx
+    )
+    weight_1 = (
+        simplex_transforms[simplex_index, 1, 0] * dy
+        + simplex_transforms[simplex_index, 1, 1] * dx
+    )
+
+    return weight_0, weight_1, 1.0 - weight_0 - weight_1
+
+
+@numba_util.jit()
+def simplex_index_and_barycentric_weights_delaunay_from(
+    grid: np.ndarray,
+    simplex_transforms: np.ndarray,
+    simplex_neighbors: np.ndarray,
+    eps: float = 100.0 * np.finfo(np.float64).eps,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the index of the Delaunay triangle every (y,x) coordinate of a grid is located in and the barycentric
+    interpolation weights of the triangle's three vertices, where the index is -1 for coordinates outside the
+    convex hull of the triangulation.
+
+    Every coordinate is located by walking through the triangulation starting from the triangle of the previous
+    coordinate. The walk steps to the neighboring triangle opposite the vertex with the most negative barycentric
+    coordinate, until a triangle with all positive barycentric coordinates is found. If the walk steps outside the
+    triangulation the coordinate is outside its convex hull.
+
+    Neighboring sub-pixels of a grid map to neighboring triangles, therefore the walk typically takes a few steps
+    per coordinate, as opposed to the O(log(N_triangles)) search of `scipy.spatial.Delaunay.find_simplex`
+    which does not use the triangle of the previous coordinate. For degenerate triangulations, where the walk does
+    not terminate, the coordinate is located by a brute-force search over every triangle.
+
+    The barycentric weights are equivalent to those computed via triangle areas in `pixel_weights_delaunay_from`.
+
+    Parameters
+    ----------
+    grid
+        The (y,x) coordinates which are located in the triangulation (e.g. the `source_grid_slim`).
+    simplex_transforms
+        The affine transform from (y,x) coordinates to barycentric coordinates of every Delaunay triangle (the
+        `transform` attribute of a `scipy.spatial.Delaunay` object).
+    simplex_neighbors
+        The indexes of the three neighbors of every Delaunay triangle, where the k-th neighbor is opposite the k-th
+        vertex and -1 denotes the boundary of the triangulation (the `neighbors` attribute of a
+        `scipy.spatial.Delaunay` object).
+    eps
+        The tolerance of the barycentric coordinates, such that coordinates on the edge of a triangle are inside it.
+    """
+    total_simplices = simplex_transforms.shape[0]
+
+    simplex_index_for_sub_slim_index = -1 * np.ones(grid.shape[0], dtype=np.int64)
+    barycentric_weights = np.zeros((grid.shape[0], 3))
+
+    simplex_index = 0
+
+    for sub_slim_index in range(grid.shape[0]):
+
+        y = grid[sub_slim_index, 0]
+        x = grid[sub_slim_index, 1]
+
+        is_located = False
+        is_outside = False
+
+        for step in range(total_simplices):
+
+            weights = barycentric_weights_from(
+                simplex_transforms=simplex_transforms,
+                simplex_index=simplex_index,
+                y=y,
+                x=x,
+            )
+
+            if not (
+                np.isfinite(weights[0])
+                and np.isfinite(weights[1])
+                and np.isfinite(weights[2])
+            ):
+                break
+
+            vertex_index = 0
+
+            if weights[1] < weights[vertex_index]:
+                vertex_index = 1
+            if weights[2] < weights[vertex_index]:
+                vertex_index = 2
+
+            if weights[vertex_index] >= -eps:
+                is_located = True
+                break
+
+            neighbor_index = simplex_neighbors[simplex_index, vertex_index]
+
+            if neighbor_index == -1:
+                is_outside = True
+                break
+
+            simplex_index = neighbor_index
+
+        if not is_located and not is_outside:
+
+            simplex_index = 0
+
+            for brute_simplex_index in range(total_simplices):
+
+                weights = barycentric_weights_from(
+                    simplex_transforms=simplex_transforms,
+                    simplex_index=brute_simplex_index,
+                    y=y,
+                    x=x,
+                )
+
+                if weights[0] >= -eps and weights[1] >= -eps and weights[2] >= -eps:
+                    simplex_index = brute_simplex_index
+                    is_located = True
+                    break
+
+        if is_located:
+
+            simplex_index_for_sub_slim_index[sub_slim_index] = simplex_index
+
+            barycentric_weights[sub_slim_index, 0] = weights[0]
+            barycentric_weights[sub_slim_index, 1] = weights[1]
+            barycentric_weights[sub_slim_index, 2] = weights[2]
+
+    return simplex_index_for_sub_slim_index, barycentric_weights
+
+
+@numba_util.jit()
+def pix_indexes_and_weights_delaunay_from(
+    simplex_index_for_sub_slim_index: np.ndarray,
+    barycentric_weights: np.ndarray,
+    pix_indexes_for_simplex_index: np.ndarray,
+    nearest_pix_index_for_sub_slim_index: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the mappings between every sub-pixel and the Delaunay pixelization pixels, the number of mappings of
+    every sub-pixel and their interpolation weights, using the Delaunay triangle every sub-pixel is located in (see
+    `simplex_index_and_barycentric_weights_delaunay_from`).
+
+    A sub-pixel inside a triangle maps to its three vertices with its barycentric weights, whereas a sub-pixel
+    outside the convex hull of the triangulation maps to its nearest pixel with a weight of 1.0. The outputs are
+    therefore the same as `pix_indexes_for_sub_slim_index_delaunay_from` and `pixel_weights_delaunay_from`.
+
+    Parameters
+    ----------
+    simplex_index_for_sub_slim_index
+        The index of the Delaunay triangle every sub-pixel is located in, which is -1 outside the convex hull.
+    barycentric_weights
+        The barycentric weights of every sub-pixel in its Delaunay triangle.
+    pix_indexes_for_simplex_index
+        The indexes of the three pixels which are the vertices of every Delaunay triangle.
+    nearest_pix_index_for_sub_slim_index
+        The index of the nearest pixel to every sub-pixel, which is only used for sub-pixels outside the convex hull.
+    """
+    total_sub_pixels = simplex_index_for_sub_slim_index.shape[0]
+
+    pix_indexes_for_sub_slim_index = -1 * np.ones((total_sub_pixels, 3), dtype=np.int64)
+    pix_sizes_for_sub_slim_index = np.zeros(total_sub_pixels, dtype=np.int64)
+    pix_weights_for_sub_slim_index = np.zeros((total_sub_pixels, 3))
+
+    for sub_slim_index in range(total_sub_pixels):
+
+        simplex_index = simplex_index_for_sub_slim_index[sub_slim_index]
+
+        if simplex_index != -1:
+
+            for vertex_index in range(3):
+                pix_indexes_for_sub_slim_index[
+                    sub_slim_index, vertex_index
+                ] = pix_indexes_for_simplex_index[simplex_index, vertex_index]
+                pix_weights_for_sub_slim_index[
+                    sub_slim_index, vertex_index
+                ] = barycentric_weights[sub_slim_index, vertex_index]
+
+            pix_sizes_for_sub_slim_index[sub_slim_index] = 3
+
+        else:
+
+            pix_indexes_for_sub_slim_index[
+                sub_slim_index, 0
+            ] = nearest_pix_index_for_sub_slim_index[sub_slim_index]
+            pix_weights_for_sub_slim_index[sub_slim_index, 0] = 1.0
+            pix_sizes_for_sub_slim_index[sub_slim_index] = 1
+
+    return (
+        pix_indexes_for_sub_slim_index,
+        pix_sizes_for_sub_slim_index,
+        pix_weights_for_sub_slim_index,
+    )
+
+
 @numba_util.jit()
 def pix_indexes_for_sub_slim_index_voronoi_from(
     grid: np.ndarray,
@@ -327,7 +548,7 @@ def pixel_weights_delaunay_from(
 
 
 def pix_size_weights_voronoi_nn_from(
-    grid: np.ndarray, pixelization_grid: np.ndarray
+    grid: np.ndarray, pixelization_grid: np.ndarray, nn_triangulation=None
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Returns the mappings between a set of slimmed sub-grid pixels and pixelization pixels, using information on
@@ -355,26 +576,32 @@ def pix_size_weights_voronoi_nn_from(
     pixel_neighbors_sizes
         An array of length (voronoi_pixels) which gives the number of neighbors of every pixel in the
         Voronoi grid.
+    nn_triangulation : nn_py.NNTriangulation
+        The triangulation of the `pixelization_grid` used for the natural neighbor interpolation, which is built
+        once and reused for every call with the same pixelization grid (see `Grid2DVoronoi.nn_triangulation`). If
+        `None` it is built from the `pixelization_grid`.
     """
 
-    try:
-        from autoarray.util.nn import nn_py
-    except ImportError as e:
-        raise ImportError(
-            "In order to use the VoronoiNN pixelization you must install the "
-            "Natural Neighbor Interpolation c package.\n\n"
-            ""
-            "See: https://github.com/Jammy2211/PyAutoArray/tree/master/autoarray/util/nn"
-        ) from e
+    if nn_triangulation is None:
+
+        try:
+            from autoarray.util.nn import nn_py
+
+            nn_triangulation = nn_py.NNTriangulation(yx_in=pixelization_grid)
+        except (ImportError, AttributeError) as e:
+            raise ImportError(
+                "In order to use the VoronoiNN pixelization you must install the "
+                "Natural Neighbor Interpolation c package.\n\n"
+                ""
+                "See: https://github.com/Jammy2211/PyAutoArray/tree/master/autoarray/util/nn"
+            ) from e
 
     max_nneighbours = 100
 
-    pix_weights_for_sub_slim_index, pix_indexes_for_sub_slim_index = nn_py.natural_interpolation_weights(
-        x_in=pixelization_grid[:, 1],
-        y_in=pixelization_grid[:, 0],
-        x_target=grid[:, 1],
-        y_target=grid[:, 0],
+    pix_weights_for_sub_slim_index, pix_indexes_for_sub_slim_index = nn_triangulation.weights_from(
+        yx_target=grid,
         max_nneighbours=max_nneighbours,
+        total_threads=numba_util.get_num_threads(),
     )
 
     bad_indexes = np.argwhere(np.sum(pix_weights_for_sub_slim_index < 0.0, axis=1) > 0)
@@ -516,7 +743,7 @@ def adaptive_pixel_signals_from(
     return pixel_signals ** signal_scale
 
 
-@numba_util.jit()
+@numba_util.jit_prange()
 def mapping_matrix_from(
     pix_indexes_for_sub_slim_index: np.ndarray,
     pix_size_for_sub_slim_index: np.ndarray,
@@ -525,6 +752,7 @@ def mapping_matrix_from(
     total_mask_sub_pixels: int,
     slim_index_for_sub_slim_index: np.ndarray,
     sub_fraction: float,
+    total_chunks: int = 1,
 ) -> np.ndarray:
     """
     Returns the mapping matrix, which is a matrix representing the mapping between every unmasked sub-pixel of the data
@@ -590,25 +818,99 @@ def mapping_matrix_from(
         The weights of the mappings of every data sub pixel and pixelizaiton pixel.
     pixels
         The number of pixels in the pixelization.
-    total_mask_pixels
-        The number of datas pixels in the observed datas and thus on the grid.
+    total_mask_sub_pixels
+        The number of data pixels in the observed data and thus on the grid, which is the number of rows of the
+        mapping matrix.
     slim_index_for_sub_slim_index
         The mappings between the data's sub slimmed indexes and the slimmed indexes on the non sub-sized indexes.
     sub_fraction
         The fractional area each sub-pixel takes up in an pixel.
+    total_chunks
+        The number of chunks the sub-pixels are divided into, which are iterated over in parallel when more than one
+        thread is used (see `numba_util.set_num_threads`). The sub-pixels of every data pixel are in the same chunk so
+        that no two threads write to the same row of the mapping matrix.
     """
 
     mapping_matrix = np.zeros((total_mask_sub_pixels, pixels))
 
-    for sub_slim_index in range(slim_index_for_sub_slim_index.shape[0]):
+    chunk_bounds = numba_util.chunk_bounds_from(
+        group_index=slim_index_for_sub_slim_index, total_chunks=total_chunks
+    )
 
-        slim_index = slim_index_for_sub_slim_index[sub_slim_index]
+    for chunk in numba.prange(total_chunks):
 
-        for pix_count in range(pix_size_for_sub_slim_index[sub_slim_index]):
+        for sub_slim_index in range(chunk_bounds[chunk], chunk_bounds[chunk + 1]):
 
-            pix_index = pix_indexes_for_sub_slim_index[sub_slim_index, pix_count]
-            pix_weight = pix_weights_for_sub_slim_index[sub_slim_index, pix_count]
+            slim_index = slim_index_for_sub_slim_index[sub_slim_index]
 
-            mapping_matrix[slim_index][pix_index] += sub_fraction * pix_weight
+            for pix_count in range(pix_size_for_sub_slim_index[sub_slim_index]):
+
+                pix_index = pix_indexes_for_sub_slim_index[sub_slim_index, pix_count]
+                pix_weight = pix_weights_for_sub_slim_index[sub_slim_index, pix_count]
+
+                mapping_matrix[slim_index][pix_index] += sub_fraction * pix_weight
 
     return mapping_matrix
+
+
+def sparse_mapping_matrix_from(
+    pix_indexes_for_sub_slim_index: np.ndarray,
+    pix_size_for_sub_slim_index: np.ndarray,
+    pix_weights_for_sub_slim_index: np.ndarray,
+    pixels: int,
+    total_mask_sub_pixels: int,
+    slim_index_for_sub_slim_index: np.ndarray,
+    sub_fraction: float,
+) -> csr_matrix:
+    """
+    Returns the mapping matrix as a sparse matrix in compressed sparse row (CSR) format, which stores only the
+    non-zero entries of the mapping matrix.
+
+    Every data pixel maps to at most a handful of pixelization pixels (e.g. its sub-pixels' mappings), therefore the
+    vast majority of entries in the dense mapping matrix of dimensions [data_pixels, pixelization_pixels] are zero.
+    For large datasets and pixelizations the dense matrix requires many GB of memory, whereas the sparse matrix
+    requires memory proportional only to the number of mappings.
+
+    The values of the matrix are identical to those computed by `mapping_matrix_from`, where mappings of different
+    sub-pixels of the same data pixel to the same pixelization pixel are summed.
+
+    Parameters
+    -----------
+    pix_indexes_for_sub_slim_index
+        The mappings from a data sub-pixel index to a pixelization pixel index.
+    pix_size_for_sub_slim_index
+        The number of mappings between each data sub pixel and pixelizaiton pixel.
+    pix_weights_for_sub_slim_index
+        The weights of the mappings of every data sub pixel and pixelizaiton pixel.
+    pixels
+        The number of pixels in the pixelization.
+    total_mask_sub_pixels
+        The number of data pixels in the observed data and thus on the grid, which is the number of rows of the
+        mapping matrix.
+    slim_index_for_sub_slim_index
+        The mappings between the data's sub slimmed indexes and the slimmed indexes on the non sub-sized indexes.
+    sub_fraction
+        The fractional area each sub-pixel takes up in an pixel.
+    """
+
+    pix_indexes_for_sub_slim_index = np.asarray(pix_indexes_for_sub_slim_index)
+    pix_weights_for_sub_slim_index = np.asarray(pix_weights_for_sub_slim_index)
+
+    if pix_indexes_for_sub_slim_index.ndim == 1:
+        pix_indexes_for_sub_slim_index = pix_indexes_for_sub_slim_index[:, None]
+        pix_weights_for_sub_slim_index = pix_weights_for_sub_slim_index[:, None]
+
+    is_mapping = (
+        np.arange(pix_indexes_for_sub_slim_index.shape[1])[None, :]
+        < np.asarray(pix_size_for_sub_slim_index)[:, None]
+    )
+
+    rows = np.broadcast_to(
+        np.asarray(slim_index_for_sub_slim_index)[:, None], is_mapping.shape
+    )[is_mapping]
+    columns = pix_indexes_for_sub_slim_index[is_mapping]
+    values = sub_fraction * pix_weights_for_sub_slim_index[is_mapping]
+
+    return csr_matrix(
+        (values, (rows, columns)), shape=(total_mask_sub_pixels, pixels)
+    )
@@ -5,6 +5,7 @@ from autoconf import cached_property
 
 from autoarray.inversion.mappers.abstract import AbstractMapper
 from autoarray.inversion.mappers.abstract import PixSubWeights
+from autoarray.preload_cache import PreloadCache
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
 
@@ -20,6 +21,7 @@ class AbstractMapperVoronoi(AbstractMapper):
         data_pixelization_grid: Grid2D = None,
         hyper_image: Array2D = None,
         profiling_dict: Optional[Dict] = None,
+        preload_cache: Optional[PreloadCache] = None,
     ):
         """
         To understand a `Mapper` one must be familiar `Pixelization` objects and the `pixelization` package, where
@@ -71,6 +73,9 @@ class AbstractMapperVoronoi(AbstractMapper):
             pixels of the Delaunay grid to the data it discretizes.
         profiling_dict
             A dictionary which contains timing of certain functions calls which is used for profiling.
+        preload_cache
+            A cache which stores the mapping matrix and unique mappings of the mapper under a fingerprint of its
+            grids, such that they are reused by mappers with the same grids (see `PreloadCache`).
         """
         super().__init__(
             source_grid_slim=source_grid_slim,
@@ -78,6 +83,7 @@ class AbstractMapperVoronoi(AbstractMapper):
             data_pixelization_grid=data_pixelization_grid,
             hyper_image=hyper_image,
             profiling_dict=profiling_dict,
+            preload_cache=preload_cache,
         )
 
     @property
@@ -89,6 +95,7 @@ class AbstractMapperVoronoi(AbstractMapper):
         (mappings, sizes, weights) = mapper_util.pix_size_weights_voronoi_nn_from(
             grid=self.source_pixelization_grid.split_cross,
             pixelization_grid=self.source_pixelization_grid,
+            nn_triangulation=self.source_pixelization_grid.nn_triangulation,
         )
 
         return PixSubWeights(mappings=mappings, sizes=sizes, weights=weights)
@@ -140,7 +147,9 @@ class MapperVoronoi(AbstractMapperVoronoi):
         """
 
         mappings, sizes, weights = mapper_util.pix_size_weights_voronoi_nn_from(
-            grid=self.source_grid_slim, pixelization_grid=self.source_pixelization_grid
+            grid=self.source_grid_slim,
+            pixelization_grid=self.source_pixelization_grid,
+            nn_triangulation=self.source_pixelization_grid.nn_triangulation,
         )
 
         mappings = mappings.astype("int")
@@ -5,6 +5,8 @@ from autoarray.inversion.pixelizations.settings import SettingsPixelization
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
 from autoarray.structures.grids.two_d.grid_2d import Grid2DSparse
 from autoarray.preloads import Preloads
+from autoarray.preload_cache import cached_from
+from autoarray.preload_cache import fingerprint_from
 
 from autoarray.numba_util import profile_func
 
@@ -90,7 +92,18 @@ class AbstractPixelization:
         if preloads.relocated_grid is None:
 
             if settings.use_border:
-                return source_grid_slim.relocated_grid_from(grid=source_grid_slim)
+                return cached_from(
+                    cache=preloads.cache,
+                    name="relocated_grid",
+                    key_func=lambda: fingerprint_from(
+                        source_grid_slim,
+                        source_grid_slim.mask,
+                        source_grid_slim.mask.sub_size,
+                    ),
+                    func=lambda: source_grid_slim.relocated_grid_from(
+                        grid=source_grid_slim
+                    ),
+                )
             return source_grid_slim
 
         else:
@@ -145,6 +145,7 @@ class Delaunay(AbstractPixelization):
                 data_pixelization_grid=data_pixelization_grid,
                 hyper_image=hyper_image,
                 profiling_dict=profiling_dict,
+                preload_cache=preloads.cache,
             )
 
         except ValueError as e:
@@ -428,6 +429,8 @@ class DelaunayBrightnessImage(Delaunay):
             weight_map=weight_map,
             seed=settings.kmeans_seed,
             stochastic=settings.is_stochastic,
+            warm_start=settings.kmeans_warm_start,
+            mini_batch_size=settings.kmeans_mini_batch_size,
         )
 
     @property
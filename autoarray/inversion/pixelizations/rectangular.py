@@ -137,6 +137,7 @@ class Rectangular(AbstractPixelization):
             source_pixelization_grid=pixelization_grid,
             hyper_image=hyper_image,
             profiling_dict=profiling_dict,
+            preload_cache=preloads.cache,
         )
 
     @profile_func
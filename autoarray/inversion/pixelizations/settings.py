@@ -1,9 +1,15 @@
 import copy
+from typing import Optional
 
 
 class SettingsPixelization:
     def __init__(
-        self, use_border: bool = True, is_stochastic: bool = False, kmeans_seed: int = 0
+        self,
+        use_border: bool = True,
+        is_stochastic: bool = False,
+        kmeans_seed: int = 0,
+        kmeans_warm_start: bool = False,
+        kmeans_mini_batch_size: Optional[int] = None,
     ):
         """
         Settings which control how a pixelization is performed.
@@ -20,10 +26,19 @@ class SettingsPixelization:
         kmeans_seed
             A fixed value for the KMeans seed that dictates the pixelization that is derived for
             a `VoronoiBrightnessImage` pixelization.
+        kmeans_warm_start
+            If `True`, the KMeans clustering of a `VoronoiBrightnessImage` pixelization is initialized from the
+            cluster centres of the previous clustering, which speeds up hyper searches where the hyper image changes
+            only slightly between calls.
+        kmeans_mini_batch_size
+            If input, the KMeans clustering of a `VoronoiBrightnessImage` pixelization uses a weighted mini-batch
+            algorithm with batches of this size, which is faster for large masks.
         """
         self.use_border = use_border
         self.is_stochastic = is_stochastic
         self.kmeans_seed = kmeans_seed
+        self.kmeans_warm_start = kmeans_warm_start
+        self.kmeans_mini_batch_size = kmeans_mini_batch_size
 
     def settings_with_is_stochastic_true(self):
         """
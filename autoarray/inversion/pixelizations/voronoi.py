@@ -142,6 +142,7 @@ class Voronoi(AbstractPixelization):
                 data_pixelization_grid=data_pixelization_grid,
                 hyper_image=hyper_image,
                 profiling_dict=profiling_dict,
+                preload_cache=preloads.cache,
             )
 
         return MapperVoronoiNoInterp(
@@ -150,6 +151,7 @@ class Voronoi(AbstractPixelization):
             data_pixelization_grid=data_pixelization_grid,
             hyper_image=hyper_image,
             profiling_dict=profiling_dict,
+            preload_cache=preloads.cache,
         )
 
     @property
@@ -444,6 +446,8 @@ class VoronoiBrightnessImage(Voronoi):
             weight_map=weight_map,
             seed=settings.kmeans_seed,
             stochastic=settings.is_stochastic,
+            warm_start=settings.kmeans_warm_start,
+            mini_batch_size=settings.kmeans_mini_batch_size,
         )
 
     @property
@@ -1,11 +1,6 @@
 import numpy as np
 
-try:
-    import pylops
-
-    PyLopsOperator = pylops.LinearOperator
-except ModuleNotFoundError:
-    PyLopsOperator = object
+from autoarray.preload_cache import fingerprint_from
 
 
 class AbstractRegularization:
@@ -130,6 +125,14 @@ class AbstractRegularization:
     def __eq__(self, other):
         return self.__dict__ == other.__dict__ and self.__class__ is other.__class__
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        A fingerprint of the regularization scheme and its coefficients, which is part of the key of the
+        regularization matrix in a `PreloadCache`.
+        """
+        return fingerprint_from(self.__class__.__name__, sorted(vars(self).items()))
+
     def regularization_weights_from(self, mapper):
         raise NotImplementedError
 
@@ -137,17 +140,16 @@ class AbstractRegularization:
         raise NotImplementedError
 
 
-class RegularizationLop(PyLopsOperator):
-    def __init__(self, regularization_matrix):
-        self.regularization_matrix = regularization_matrix
-        self.pixels = regularization_matrix.shape[0]
-        self.dims = self.pixels
-        self.shape = (self.pixels, self.pixels)
-        self.dtype = dtype
-        self.explicit = False
+def __getattr__(name):
+    """
+    The `RegularizationLop` is defined in its own module, which is only imported when it is used because it imports
+    the optional library PyLops.
+    """
+    if name == "RegularizationLop":
+        from autoarray.inversion.regularization.regularization_lop import (
+            RegularizationLop,
+        )
 
-    def _matvec(self, x):
-        return np.dot(self.regularization_matrix, x)
+        return RegularizationLop
 
-    def _rmatvec(self, x):
-        return np.dot(self.regularization_matrix.T, x)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,24 @@
+import numpy as np
+
+try:
+    import pylops
+
+    PyLopsOperator = pylops.LinearOperator
+except ModuleNotFoundError:
+    PyLopsOperator = object
+
+
+class RegularizationLop(PyLopsOperator):
+    def __init__(self, regularization_matrix):
+        self.regularization_matrix = regularization_matrix
+        self.pixels = regularization_matrix.shape[0]
+        self.dims = self.pixels
+        self.shape = (self.pixels, self.pixels)
+        self.dtype = dtype
+        self.explicit = False
+
+    def _matvec(self, x):
+        return np.dot(self.regularization_matrix, x)
+
+    def _rmatvec(self, x):
+        return np.dot(self.regularization_matrix.T, x)
@@ -3,6 +3,7 @@ import logging
 import numpy as np
 
 from autoarray import exc
+from autoarray import shared_buffer
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -64,14 +65,26 @@ class AbstractMask(np.ndarray):
 
     def __reduce__(self):
 
+        # The index of a mask's mappings (see `Mask2D.mask_index`) is recomputed or loaded from the shared index
+        # cache after unpickling, as opposed to being pickled with every mask.
+
+        class_dict = {}
+        for key, value in self.__dict__.items():
+            if key != "_mask_index":
+                class_dict[key] = value
+
+        shared_buffer_reduce = shared_buffer.structure_reduce_from(
+            structure=self, class_dict=class_dict
+        )
+
+        if shared_buffer_reduce is not None:
+            return shared_buffer_reduce
+
         # Get the parent's __reduce__ tuple
         pickled_state = super().__reduce__()
 
         # Create our own tuple to pass to __setstate__
 
-        class_dict = {}
-        for key, value in self.__dict__.items():
-            class_dict[key] = value
         new_state = pickled_state[2] + (class_dict,)
 
         # Return a tuple that replaces the parent's __setstate__ tuple with our own
@@ -12,6 +12,8 @@ from autoarray.structures.arrays.two_d import array_2d_util
 from autoarray.geometry import geometry_util
 from autoarray.structures.grids.two_d import grid_2d_util
 from autoarray.mask import mask_2d_util
+from autoarray.mask.mask_2d_index import Mask2DIndex
+from autoarray.mask.mask_2d_index import mask_2d_index_from
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -506,14 +508,30 @@ class AbstractMask2D(AbstractMask):
 
         return Grid2D(grid=grid_scaled_1d, mask=self.edge_mask.mask_sub_1)
 
+    @property
+    def mask_index(self) -> Mask2DIndex:
+        """
+        The index of the mask's mappings between its native, slim, sub and border / edge pixels, which are computed
+        once and shared between all masks with identical values and sub-size (see `Mask2DIndex`).
+
+        The index is stored on the mask and only recomputed if the mask is changed in-place.
+        """
+        mask_index = self.__dict__.get("_mask_index")
+
+        if mask_index is None or not mask_index.is_index_of(
+            mask_2d=self, sub_size=self.sub_size
+        ):
+            mask_index = mask_2d_index_from(mask_2d=self, sub_size=self.sub_size)
+            self.__dict__["_mask_index"] = mask_index
+
+        return mask_index
+
     @property
     def native_index_for_slim_index(self) -> np.ndarray:
         """
         A 1D array of mappings between every unmasked pixel and its 2D pixel coordinates.
         """
-        return mask_2d_util.native_index_for_slim_index_2d_from(
-            mask_2d=self, sub_size=1
-        ).astype("int")
+        return self.mask_index.native_index_for_slim_index
 
     @property
     def edge_1d_indexes(self) -> np.ndarray:
@@ -521,7 +539,7 @@ class AbstractMask2D(AbstractMask):
         The indicies of the mask's edge pixels, where an edge pixel is any unmasked pixel on its edge
         (next to at least one pixel with a `True` value).
         """
-        return mask_2d_util.edge_1d_indexes_from(mask_2d=self).astype("int")
+        return self.mask_index.edge_1d_indexes
 
     @property
     def edge_2d_indexes(self) -> np.ndarray:
@@ -529,7 +547,7 @@ class AbstractMask2D(AbstractMask):
         The indicies of the mask's edge pixels, where an edge pixel is any unmasked pixel on its edge
         (next to at least one pixel with a `True` value).
         """
-        return self.native_index_for_slim_index[self.edge_1d_indexes].astype("int")
+        return self.mask_index.edge_2d_indexes
 
     @property
     def border_1d_indexes(self) -> np.ndarray:
@@ -538,7 +556,7 @@ class AbstractMask2D(AbstractMask):
         exterior edge e.g. next to at least one pixel with a `True` value but not central pixels like those within
         an annulus mask.
         """
-        return mask_2d_util.border_slim_indexes_from(mask_2d=self).astype("int")
+        return self.mask_index.border_1d_indexes
 
     @property
     def border_2d_indexes(self) -> np.ndarray:
@@ -546,7 +564,7 @@ class AbstractMask2D(AbstractMask):
         exterior edge e.g. next to at least one pixel with a `True` value but not central pixels like those within
         an annulus mask.
         """
-        return self.native_index_for_slim_index[self.border_1d_indexes].astype("int")
+        return self.mask_index.border_2d_indexes
 
     @cached_property
     def sub_border_flat_indexes(self) -> np.ndarray:
@@ -555,9 +573,7 @@ class AbstractMask2D(AbstractMask):
         exterior edge e.g. next to at least one pixel with a `True` value but not central pixels like those within
         an annulus mask.
         """
-        return mask_2d_util.sub_border_pixel_slim_indexes_from(
-            mask_2d=self, sub_size=self.sub_size
-        ).astype("int")
+        return self.mask_index.sub_border_flat_indexes
 
     def blurring_mask_from(self, kernel_shape_native) -> "Mask2D":
         """
@@ -635,9 +651,7 @@ class AbstractMask2D(AbstractMask):
         """
         A 1D array of mappings between every unmasked sub pixel and its 2D sub-pixel coordinates.
         """
-        return mask_2d_util.native_index_for_slim_index_2d_from(
-            mask_2d=self, sub_size=self.sub_size
-        ).astype("int")
+        return self.mask_index.sub_mask_index_for_sub_mask_1d_index
 
     @cached_property
     def slim_index_for_sub_slim_index(self) -> np.ndarray:
@@ -649,9 +663,7 @@ class AbstractMask2D(AbstractMask):
         sub_to_pixel[8] = 2 -  The ninth sub-pixel is within the 3rd pixel.
         sub_to_pixel[20] = 4 -  The twenty first sub-pixel is within the 5th pixel.
         """
-        return mask_2d_util.slim_index_for_sub_slim_index_via_mask_2d_from(
-            mask_2d=self, sub_size=self.sub_size
-        ).astype("int")
+        return self.mask_index.slim_index_for_sub_slim_index
 
     @property
     def shape_native_masked_pixels(self) -> Tuple[int, int]:
@@ -0,0 +1,165 @@
+from collections import OrderedDict
+import hashlib
+import numpy as np
+
+from autoconf import cached_property
+
+from autoarray.mask import mask_2d_util
+
+"""
+The maximum number of `Mask2DIndex` objects stored in the cache of `mask_2d_index_from`, above which the least
+recently used index is removed from the cache.
+"""
+mask_2d_index_cache_size = 32
+
+_mask_2d_index_cache = OrderedDict()
+
+
+def index_array_from(array: np.ndarray) -> np.ndarray:
+    """
+    Returns an array of indexes as a compact read-only int32 array, such that an index shared by many masks cannot
+    be modified in-place by any of them.
+    """
+    array = np.ascontiguousarray(array, dtype="int32")
+    array.setflags(write=False)
+    return array
+
+
+class Mask2DIndex:
+    def __init__(self, mask_2d: np.ndarray, sub_size: int, key: str):
+        """
+        The mappings between the native, slim, sub and border / edge pixels of a 2D mask, which are computed once
+        and stored as compact read-only int32 arrays.
+
+        Every mapping is computed from the values of the mask alone, therefore the same index is shared between all
+        masks with identical values and sub-size via a cache keyed on a hash of the mask (see `mask_2d_index_from`).
+
+        Parameters
+        ----------
+        mask_2d
+            The 2D mask of bools whose mappings are computed, which is stored as a copy such that an in-place change
+            of the original mask can be detected (see `is_index_of`).
+        sub_size
+            The size (sub_size x sub_size) of each unmasked pixels sub-array.
+        key
+            The hash of the mask and sub-size this index is stored in the cache with.
+        """
+        self.mask_2d = np.array(mask_2d, dtype="bool")
+        self.sub_size = sub_size
+        self.key = key
+
+    def is_index_of(self, mask_2d: np.ndarray, sub_size: int) -> bool:
+        """
+        Returns `True` if this is the index of the input mask, which is `False` if the mask has been changed in-place
+        since the index was computed.
+        """
+        return sub_size == self.sub_size and np.array_equal(mask_2d, self.mask_2d)
+
+    @property
+    def index_sub_1(self) -> "Mask2DIndex":
+        """
+        The index of the mask with a sub-size of 1, which the mappings that do not depend on the sub-size are
+        computed via.
+        """
+        if self.sub_size == 1:
+            return self
+        return mask_2d_index_from(mask_2d=self.mask_2d, sub_size=1)
+
+    @cached_property
+    def native_index_for_slim_index(self) -> np.ndarray:
+        if self.sub_size != 1:
+            return self.index_sub_1.native_index_for_slim_index
+        return self.sub_mask_index_for_sub_mask_1d_index
+
+    @cached_property
+    def sub_mask_index_for_sub_mask_1d_index(self) -> np.ndarray:
+        return index_array_from(
+            mask_2d_util.native_index_for_slim_index_2d_from(
+                mask_2d=self.mask_2d, sub_size=self.sub_size
+            )
+        )
+
+    @cached_property
+    def slim_index_for_sub_slim_index(self) -> np.ndarray:
+        return index_array_from(
+            mask_2d_util.slim_index_for_sub_slim_index_via_mask_2d_from(
+                mask_2d=self.mask_2d, sub_size=self.sub_size
+            )
+        )
+
+    @cached_property
+    def edge_1d_indexes(self) -> np.ndarray:
+        if self.sub_size != 1:
+            return self.index_sub_1.edge_1d_indexes
+        return index_array_from(mask_2d_util.edge_1d_indexes_from(mask_2d=self.mask_2d))
+
+    @cached_property
+    def edge_2d_indexes(self) -> np.ndarray:
+        return index_array_from(self.native_index_for_slim_index[self.edge_1d_indexes])
+
+    @cached_property
+    def border_1d_indexes(self) -> np.ndarray:
+        if self.sub_size != 1:
+            return self.index_sub_1.border_1d_indexes
+        return index_array_from(
+            mask_2d_util.border_slim_indexes_from(mask_2d=self.mask_2d)
+        )
+
+    @cached_property
+    def border_2d_indexes(self) -> np.ndarray:
+        return index_array_from(
+            self.native_index_for_slim_index[self.border_1d_indexes]
+        )
+
+    @cached_property
+    def sub_border_flat_indexes(self) -> np.ndarray:
+        return index_array_from(
+            mask_2d_util.sub_border_pixel_slim_indexes_from(
+                mask_2d=self.mask_2d, sub_size=self.sub_size
+            )
+        )
+
+
+def mask_2d_index_key_from(mask_2d: np.ndarray, sub_size: int) -> str:
+    """
+    Returns the hash of a 2D mask's values, shape and sub-size, which is the key of its `Mask2DIndex` in the cache.
+    """
+    mask_2d = np.ascontiguousarray(mask_2d, dtype="bool")
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str((mask_2d.shape, sub_size)).encode())
+    hasher.update(mask_2d.tobytes())
+
+    return hasher.hexdigest()
+
+
+def mask_2d_index_from(mask_2d: np.ndarray, sub_size: int) -> Mask2DIndex:
+    """
+    Returns the `Mask2DIndex` of a 2D mask and sub-size, which is shared between all masks with identical values via
+    a cache keyed on a hash of the mask.
+
+    The cache stores the `mask_2d_index_cache_size` most recently used indexes.
+
+    Parameters
+    ----------
+    mask_2d
+        The 2D mask of bools whose index is returned.
+    sub_size
+        The size (sub_size x sub_size) of each unmasked pixels sub-array.
+    """
+    key = mask_2d_index_key_from(mask_2d=mask_2d, sub_size=sub_size)
+
+    mask_2d_index = _mask_2d_index_cache.get(key)
+
+    if mask_2d_index is not None:
+        _mask_2d_index_cache.move_to_end(key)
+        return mask_2d_index
+
+    mask_2d_index = Mask2DIndex(mask_2d=mask_2d, sub_size=sub_size, key=key)
+
+    _mask_2d_index_cache[key] = mask_2d_index
+
+    while len(_mask_2d_index_cache) > mask_2d_index_cache_size:
+        _mask_2d_index_cache.popitem(last=False)
+
+    return mask_2d_index
@@ -1,5 +1,4 @@
 import numpy as np
-from skimage.transform import rescale
 from typing import Tuple, Union
 import warnings
 
@@ -1019,6 +1018,8 @@ def rescaled_mask_2d_from(mask_2d: np.ndarray, rescale_factor: float) -> np.ndar
         The rescaled mask.
     """
 
+    from skimage.transform import rescale
+
     warnings.filterwarnings("ignore")
 
     rescaled_mask_2d = rescale(
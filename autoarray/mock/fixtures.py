@@ -22,6 +22,7 @@ from autoarray.structures.grids.two_d.grid_2d_pixelization import Grid2DRectangu
 from autoarray.structures.grids.two_d.grid_2d_pixelization import Grid2DDelaunay
 from autoarray.structures.grids.two_d.grid_2d_pixelization import Grid2DVoronoi
 from autoarray.dataset.imaging import Imaging
+from autoarray.dataset.imaging import SettingsImaging
 from autoarray.dataset.interferometer import Interferometer
 from autoarray.structures.kernel_2d import Kernel2D
 from autoarray.layout.layout import Layout2D
@@ -510,3 +511,61 @@ def make_acs_ccd():
 
 def make_acs_quadrant():
     return np.zeros((2068, 2072))
+
+
+### BENCHMARKS ###
+
+
+def make_mask_2d_benchmark(mask_radius, sub_size=1, pixel_scales=0.1):
+
+    total_pixels = 2 * int(np.ceil(mask_radius / pixel_scales)) + 32
+
+    return Mask2D.circular(
+        shape_native=(total_pixels, total_pixels),
+        radius=mask_radius,
+        pixel_scales=pixel_scales,
+        sub_size=sub_size,
+    )
+
+
+def make_psf_benchmark(kernel_size, pixel_scales=0.1):
+    return Kernel2D.from_gaussian(
+        shape_native=(kernel_size, kernel_size),
+        pixel_scales=pixel_scales,
+        sigma=0.2,
+        normalize=True,
+    )
+
+
+def make_masked_imaging_benchmark(mask_radius, sub_size=1, kernel_size=5):
+
+    mask = make_mask_2d_benchmark(mask_radius=mask_radius, sub_size=sub_size)
+
+    random_state = np.random.RandomState(seed=1)
+
+    imaging = Imaging(
+        image=Array2D.manual_native(
+            array=random_state.normal(size=mask.shape_native),
+            pixel_scales=mask.pixel_scales,
+        ),
+        psf=make_psf_benchmark(kernel_size=kernel_size),
+        noise_map=Array2D.manual_native(
+            array=random_state.uniform(low=1.0, high=2.0, size=mask.shape_native),
+            pixel_scales=mask.pixel_scales,
+        ),
+        settings=SettingsImaging(
+            sub_size=sub_size, sub_size_inversion=sub_size, use_w_tilde_cache=False
+        ),
+        name="mock_imaging_benchmark",
+    )
+
+    return imaging.apply_mask(mask=mask)
+
+
+def make_uv_wavelengths_benchmark(total_visibilities):
+
+    random_state = np.random.RandomState(seed=1)
+
+    return random_state.uniform(
+        low=-2.0e5, high=2.0e5, size=(int(total_visibilities), 2)
+    )
@@ -205,6 +205,13 @@ class MockLEq(AbstractLEq):
 
         return self._data_vector
 
+    @property
+    def curvature_matrix(self):
+        if self._curvature_matrix is None:
+            return super().curvature_matrix
+
+        return self._curvature_matrix
+
     @property
     def curvature_matrix_diag(self):
         return self._curvature_matrix
@@ -1,11 +1,16 @@
+from contextlib import contextmanager
 from functools import wraps
+import inspect
 import numba
+import numpy as np
 import time
+import types
 from typing import Callable
 
 from autoconf import conf
 
 from autoarray import exc
+from autoarray.profiler import Profiler
 
 """
 Depending on if we're using a super computer, we want two different numba decorators:
@@ -36,6 +41,169 @@ def jit(nopython=nopython, cache=cache, parallel=parallel):
     return wrapper
 
 
+"""
+The number of threads used by functions decorated with `jit_prange`, which is set at runtime via `set_num_threads`
+or the `num_threads` context manager. If `parallel=True` in the general.ini config file it defaults to every thread
+numba can use, otherwise the functions run serially.
+"""
+_num_threads = numba.config.NUMBA_NUM_THREADS if parallel else 1
+
+
+def get_num_threads() -> int:
+    return _num_threads
+
+
+def set_num_threads(num_threads: int):
+    """
+    Set the number of threads used by functions decorated with `jit_prange`, where a value of 1 calls the serial
+    compilation of every function and a higher value calls its parallel compilation with this many threads.
+
+    The number of threads cannot exceed the number of threads numba is launched with (the environment variable
+    `NUMBA_NUM_THREADS`, which defaults to the number of CPU cores) and is reduced to this value if it does.
+
+    Parameters
+    ----------
+    num_threads
+        The number of threads used by parallel functions.
+    """
+    global _num_threads
+
+    _num_threads = max(1, min(int(num_threads), numba.config.NUMBA_NUM_THREADS))
+
+
+@contextmanager
+def num_threads(num_threads: int):
+    """
+    A context manager which sets the number of threads used by functions decorated with `jit_prange` (see
+    `set_num_threads`) and restores the previous number of threads on exit, for example:
+
+    with aa.num_threads(8):
+        fit = aa.FitImaging(dataset=imaging, inversion=inversion)
+
+    Parameters
+    ----------
+    num_threads
+        The number of threads used by parallel functions inside the context.
+    """
+    num_threads_previous = get_num_threads()
+
+    set_num_threads(num_threads=num_threads)
+
+    try:
+        yield
+    finally:
+        set_num_threads(num_threads=num_threads_previous)
+
+
+def jit_prange(nopython=nopython, cache=cache):
+    """
+    Compile a function whose loops use `numba.prange` twice, once serially and once in parallel, and return a
+    function which calls the parallel compilation if more than one thread is in use (see `set_num_threads`) and the
+    serial compilation otherwise. This means the parallelism can be changed at runtime without re-importing
+    autoarray.
+
+    Functions decorated with `jit_prange` must be free of race conditions when their `prange` loops are run in
+    parallel, for example by using a separate accumulator for every thread when values are scattered to the same
+    entries of an array. Such functions can take an input `total_chunks` (which must default to 1), which is set to
+    the number of threads in use by the returned function if it is not input (by keyword or position), such that the
+    work is divided into one chunk per thread.
+    This is passed as an input (as opposed to calling `numba.get_num_threads()` in the compiled function) so that
+    the compiled functions can be cached.
+
+    The parallel compilation is given a different qualified name to the serial compilation, such that the two are
+    stored separately in numba's cache.
+    """
+
+    def wrapper(func):
+
+        func_parallel = types.FunctionType(
+            func.__code__,
+            func.__globals__,
+            func.__name__,
+            func.__defaults__,
+            func.__closure__,
+        )
+        func_parallel.__qualname__ = f"{func.__qualname__}_parallel"
+
+        func_serial = numba.jit(func, nopython=nopython, cache=cache, parallel=False)
+        func_parallel = numba.jit(
+            func_parallel, nopython=nopython, cache=cache, parallel=True
+        )
+
+        parameter_names = list(inspect.signature(func).parameters)
+
+        if "total_chunks" in parameter_names:
+            chunks_index = parameter_names.index("total_chunks")
+        else:
+            chunks_index = None
+
+        @wraps(func)
+        def dispatch(*args, **kwargs):
+
+            if _num_threads == 1:
+                return func_serial(*args, **kwargs)
+
+            if numba.get_num_threads() != _num_threads:
+                numba.set_num_threads(_num_threads)
+
+            if (
+                chunks_index is not None
+                and len(args) <= chunks_index
+                and "total_chunks" not in kwargs
+            ):
+                kwargs["total_chunks"] = _num_threads
+
+            return func_parallel(*args, **kwargs)
+
+        dispatch.serial = func_serial
+        dispatch.parallel = func_parallel
+
+        return dispatch
+
+    return wrapper
+
+
+@jit()
+def chunk_bounds_from(group_index: np.ndarray, total_chunks: int) -> np.ndarray:
+    """
+    Divide the indexes of an array into contiguous chunks of roughly equal size, such that the chunks can be iterated
+    over in parallel by a `numba.prange` loop, without any group of consecutive equal values of `group_index` being
+    split between two chunks.
+
+    For example, if `group_index` is the slim image pixel index of every sub-pixel of a sub-grid, no image pixel's
+    sub-pixels are divided between chunks, meaning two threads never write to the same row of a matrix indexed by
+    image pixel.
+
+    Parameters
+    ----------
+    group_index
+        The group of every index of the array, where the indexes of each group are contiguous.
+    total_chunks
+        The number of chunks the array is divided into.
+
+    Returns
+    -------
+    The index bounds of every chunk, where chunk i spans the indexes bounds[i] to bounds[i + 1].
+    """
+    total_indexes = group_index.shape[0]
+
+    chunk_bounds = np.zeros(total_chunks + 1, dtype=np.int64)
+    chunk_bounds[total_chunks] = total_indexes
+
+    for chunk in range(1, total_chunks):
+
+        bound = max(chunk * total_indexes // total_chunks, chunk_bounds[chunk - 1])
+
+        while (
+            0 < bound < total_indexes and group_index[bound] == group_index[bound - 1]
+        ):
+            bound += 1
+
+        chunk_bounds[chunk] = bound
+
+    return chunk_bounds
+
+
 def profile_func(func: Callable):
     """
     Time every function called in a class and averages over repeated calls for profiling likelihood functions.
@@ -43,6 +211,9 @@ def profile_func(func: Callable):
     The timings are stored in the variable `_profiling_dict` of the class(s) from which each function is called,
     which are collected at the end of the profiling process via recursion.
 
+    If the `profiling_dict` is a `Profiler`, every call is instead recorded once as a span of the profiler's tree of
+    spans (see `autoarray.profiler`), with no repeated calls or limit on the number of calls of a function.
+
     Parameters
     ----------
     func : (obj, grid, *args, **kwargs) -> Object
@@ -71,6 +242,10 @@ def profile_func(func: Callable):
         if obj.profiling_dict is None:
             return func(obj, *args, **kwargs)
 
+        if isinstance(obj.profiling_dict, Profiler):
+            with obj.profiling_dict.span(name=func.__name__):
+                return func(obj, *args, **kwargs)
+
         repeats = conf.instance["general"]["profiling"]["repeats"]
 
         last_key_before_call = (
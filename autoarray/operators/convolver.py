@@ -1,11 +1,22 @@
 from autoarray import numba_util
+import numba
 import numpy as np
+from scipy import fft
+from scipy.sparse import csr_matrix
+
+from autoconf import cached_property
 
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 
 from autoarray import exc
 from autoarray.mask import mask_2d_util
 
+"""
+The maximum number of values in the stack of images that `ConvolverFFT.convolve_mapping_matrix` transforms in a single
+batched FFT call, which bounds the memory used when convolving large mapping matrices.
+"""
+fft_batch_size = 2 ** 24
+
 
 class Convolver:
     def __init__(self, mask, kernel):
@@ -516,8 +527,12 @@ class Convolver:
         Parameters
         -----------
         mapping_matrix
-            The 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel.
+            The 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel, where a
+            `float32` mapping matrix is blurred in single precision and any other is blurred in double precision.
         """
+        if mapping_matrix.dtype != np.float32:
+            mapping_matrix = mapping_matrix.astype("float64", copy=False)
+
         return self.convolve_matrix_jit(
             mapping_matrix=mapping_matrix,
             image_frame_1d_indexes=self.image_frame_1d_indexes,
@@ -526,17 +541,25 @@ class Convolver:
         )
 
     @staticmethod
-    @numba_util.jit()
+    @numba_util.jit_prange()
     def convolve_matrix_jit(
         mapping_matrix,
         image_frame_1d_indexes,
         image_frame_1d_kernels,
         image_frame_1d_lengths,
     ):
+        """
+        Convolve every column of a mapping matrix with the PSF kernel.
 
-        blurred_mapping_matrix = np.zeros(mapping_matrix.shape)
+        Every column is blurred independently and only written to its own column of the blurred mapping matrix,
+        therefore the columns are convolved in parallel when more than one thread is used (see
+        `numba_util.set_num_threads`).
 
-        for pixel_1d_index in range(mapping_matrix.shape[1]):
+        The blurred mapping matrix has the same data type as the mapping matrix (e.g. `float32`).
+        """
+        blurred_mapping_matrix = np.zeros_like(mapping_matrix)
+
+        for pixel_1d_index in numba.prange(mapping_matrix.shape[1]):
             for image_1d_index in range(mapping_matrix.shape[0]):
 
                 value = mapping_matrix[image_1d_index, pixel_1d_index]
@@ -555,3 +578,278 @@ class Convolver:
                         )
 
         return blurred_mapping_matrix
+
+    @cached_property
+    def convolution_matrix(self) -> csr_matrix:
+        """
+        The 2D convolution of a masked image with the PSF kernel represented as a sparse matrix of dimensions
+        [image_pixels, image_pixels] in compressed sparse row (CSR) format, where entry [j, i] is the kernel value
+        which blurs flux in image pixel i into image pixel j.
+
+        Each image pixel is only blurred into the unmasked pixels within the kernel's footprint, therefore this
+        matrix has at most `kernel_max_size` entries per column. Multiplying it with a sparse mapping matrix
+        performs the same convolution as `convolve_mapping_matrix` without constructing any dense matrices.
+        """
+        is_frame = (
+            np.arange(self.kernel_max_size)[None, :]
+            < self.image_frame_1d_lengths[:, None]
+        )
+
+        columns = np.broadcast_to(
+            np.arange(self.pixels_in_mask)[:, None], is_frame.shape
+        )[is_frame]
+
+        return csr_matrix(
+            (
+                self.image_frame_1d_kernels[is_frame],
+                (self.image_frame_1d_indexes[is_frame], columns),
+            ),
+            shape=(self.pixels_in_mask, self.pixels_in_mask),
+        )
+
+    def convolve_mapping_matrix_sparse(self, mapping_matrix: csr_matrix) -> csr_matrix:
+        """
+        For a given sparse inversion mapping matrix, convolve every pixel's mapped image with the PSF kernel,
+        returning the blurred mapping matrix as a sparse matrix.
+
+        The calculation is identical to `convolve_mapping_matrix`, but is performed as a sparse-sparse matrix product
+        with the `convolution_matrix`, meaning that the memory used scales with the number of non-zero entries of
+        the blurred mapping matrix as opposed to its full dimensions.
+
+        Parameters
+        -----------
+        mapping_matrix
+            The sparse 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel.
+        """
+        return (self.convolution_matrix @ mapping_matrix).tocsr()
+
+
+class ConvolverFFT(Convolver):
+    def __init__(self, mask, kernel):
+        """
+        Class to setup the 1D convolution of an image / mapping matrix using Fast Fourier Transforms (FFTs).
+
+        The `Convolver` performs convolution by precomputing for every unmasked pixel the frame of pixels it blurs
+        light into, which scales as O(N * K^2) for N unmasked pixels and a K x K kernel for both the set up and every
+        convolution. For large kernels (e.g. the 41 x 41 or larger PSFs of HST and JWST imaging) this becomes
+        expensive.
+
+        This class instead performs every convolution via FFTs, which scale as O(M log M) where M is the number of
+        pixels in the padded image, independent of the kernel size. The values are identical to those of the
+        `Convolver` (to numerical precision) and the same interface is used, so the two classes are interchangeable.
+
+        To make each FFT as small as possible, the images are cropped to the smallest rectangle containing every
+        unmasked pixel and every pixel of the blurring mask (see `Mask2D.blurring_mask_from`), and padded by the
+        kernel size such that no light wraps around the edges of the FFT. The FFT of the kernel for this padded
+        shape is computed once and stored.
+
+        The image frames of the `Convolver` are not computed on set up, but are computed lazily if they are used
+        (e.g. by `convolution_matrix`).
+
+        Parameters
+        ----------
+        mask : Mask2D
+            The mask within which the convolved signal is calculated.
+        kernel : grid.PSF or ndarray
+            An array representing a PSF.
+        """
+        if kernel.shape_native[0] % 2 == 0 or kernel.shape_native[1] % 2 == 0:
+            raise exc.ConvolverException("PSF kernel must be odd")
+
+        self.mask = mask
+        self.kernel = kernel
+
+        self.pixels_in_mask = int(np.size(mask) - np.sum(mask))
+        self.kernel_max_size = self.kernel.shape_native[0] * self.kernel.shape_native[1]
+
+        self.blurring_mask = mask_2d_util.blurring_mask_2d_from(
+            mask_2d=mask, kernel_shape_native=kernel.shape_native
+        )
+
+        self.pixels_in_blurring_mask = int(
+            np.size(self.blurring_mask) - np.sum(self.blurring_mask)
+        )
+
+        unmasked = np.invert(np.asarray(mask, dtype="bool"))
+        unmasked_blurring = np.invert(np.asarray(self.blurring_mask, dtype="bool"))
+
+        rows = np.where(np.any(unmasked | unmasked_blurring, axis=1))[0]
+        columns = np.where(np.any(unmasked | unmasked_blurring, axis=0))[0]
+
+        self.fft_origin = (rows[0], columns[0])
+        self.fft_image_shape = (
+            rows[-1] - rows[0] + 1,
+            columns[-1] - columns[0] + 1,
+        )
+
+        self.fft_shape = (
+            fft.next_fast_len(self.fft_image_shape[0] + kernel.shape_native[0] - 1),
+            fft.next_fast_len(self.fft_image_shape[1] + kernel.shape_native[1] - 1),
+        )
+
+        self.kernel_fft = fft.rfft2(np.asarray(kernel.native), s=self.fft_shape)
+
+        image_indexes = np.where(unmasked)
+        blurring_indexes = np.where(unmasked_blurring)
+
+        self.image_fft_indexes = (
+            image_indexes[0] - self.fft_origin[0],
+            image_indexes[1] - self.fft_origin[1],
+        )
+        self.blurring_fft_indexes = (
+            blurring_indexes[0] - self.fft_origin[0],
+            blurring_indexes[1] - self.fft_origin[1],
+        )
+
+    @cached_property
+    def frame_convolver(self) -> Convolver:
+        """
+        A `Convolver` of the same mask and kernel, whose image frames are used by functionality which requires the
+        explicit pixel-to-pixel convolution indexing (e.g. `convolution_matrix`).
+        """
+        return Convolver(mask=self.mask, kernel=self.kernel)
+
+    @property
+    def mask_index_array(self):
+        return self.frame_convolver.mask_index_array
+
+    @property
+    def image_frame_1d_indexes(self):
+        return self.frame_convolver.image_frame_1d_indexes
+
+    @property
+    def image_frame_1d_kernels(self):
+        return self.frame_convolver.image_frame_1d_kernels
+
+    @property
+    def image_frame_1d_lengths(self):
+        return self.frame_convolver.image_frame_1d_lengths
+
+    @property
+    def blurring_frame_1d_indexes(self):
+        return self.frame_convolver.blurring_frame_1d_indexes
+
+    @property
+    def blurring_frame_1d_kernels(self):
+        return self.frame_convolver.blurring_frame_1d_kernels
+
+    @property
+    def blurring_frame_1d_lengths(self):
+        return self.frame_convolver.blurring_frame_1d_lengths
+
+    def convolve_fft_from(self, image_fft: np.ndarray) -> np.ndarray:
+        """
+        Convolve a stack of images, which are cropped to the `fft_image_shape`, with the kernel via FFTs and return
+        the values of the convolved images in the unmasked pixels of the mask.
+
+        The FFT of every image in the stack is performed in a single call.
+
+        Parameters
+        ----------
+        image_fft
+            The images which are convolved, of shape [..., fft_image_shape[0], fft_image_shape[1]].
+        """
+        convolved_fft = fft.irfft2(
+            fft.rfft2(image_fft, s=self.fft_shape) * self.kernel_fft, s=self.fft_shape
+        )
+
+        half_y = self.kernel.shape_native[0] // 2
+        half_x = self.kernel.shape_native[1] // 2
+
+        return convolved_fft[
+            ...,
+            self.image_fft_indexes[0] + half_y,
+            self.image_fft_indexes[1] + half_x,
+        ]
+
+    def convolve_image(self, image, blurring_image):
+        """
+        For a given 1D array and blurring array, convolve the two using this convolver.
+
+        Parameters
+        -----------
+        image
+            1D array of the values which are to be blurred with the convolver's PSF.
+        blurring_image
+            1D array of the blurring values which blur into the array after PSF convolution.
+        """
+        image_fft = np.zeros(self.fft_image_shape)
+
+        image_fft[self.image_fft_indexes] = image.binned.slim
+        image_fft[self.blurring_fft_indexes] = blurring_image.binned.slim
+
+        return Array2D(
+            array=self.convolve_fft_from(image_fft=image_fft),
+            mask=self.mask.mask_sub_1,
+        )
+
+    def convolve_image_no_blurring(self, image):
+        """
+        For a given 1D array, convolve it using this convolver without including the light of a blurring array.
+
+        Parameters
+        -----------
+        image
+            1D array of the values which are to be blurred with the convolver's PSF.
+        """
+        return self.convolve_image_no_blurring_interpolation(image=image.binned.slim)
+
+    def convolve_image_no_blurring_interpolation(self, image):
+        """
+        For a given 1D ndarray, convolve it using this convolver without including the light of a blurring array.
+
+        Parameters
+        -----------
+        image
+            1D array of the values which are to be blurred with the convolver's PSF.
+        """
+        image_fft = np.zeros(self.fft_image_shape)
+
+        image_fft[self.image_fft_indexes] = image
+
+        return Array2D(
+            array=self.convolve_fft_from(image_fft=image_fft),
+            mask=self.mask.mask_sub_1,
+        )
+
+    def convolve_mapping_matrix(self, mapping_matrix):
+        """
+        For a given inversion mapping matrix, convolve every pixel's mapped image with the PSF kernel (see
+        `Convolver.convolve_mapping_matrix` for a full description).
+
+        Every column of the mapping matrix is convolved in a single batched FFT call. To bound the memory used, the
+        columns are split into batches whose cropped images contain at most `fft_batch_size` values in total.
+
+        Parameters
+        -----------
+        mapping_matrix
+            The 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel, where the
+            FFTs of a `float32` mapping matrix are performed in single precision.
+        """
+        if mapping_matrix.dtype != np.float32:
+            mapping_matrix = mapping_matrix.astype("float64", copy=False)
+
+        blurred_mapping_matrix = np.zeros(mapping_matrix.shape, mapping_matrix.dtype)
+
+        batch_columns = max(
+            1, fft_batch_size // (self.fft_shape[0] * self.fft_shape[1])
+        )
+
+        for column in range(0, mapping_matrix.shape[1], batch_columns):
+
+            mapping_matrix_batch = mapping_matrix[:, column : column + batch_columns]
+
+            image_fft = np.zeros(
+                (mapping_matrix_batch.shape[1],) + self.fft_image_shape,
+                dtype=mapping_matrix.dtype,
+            )
+
+            image_fft[
+                :, self.image_fft_indexes[0], self.image_fft_indexes[1]
+            ] = mapping_matrix_batch.T
+
+            blurred_mapping_matrix[
+                :, column : column + batch_columns
+            ] = self.convolve_fft_from(image_fft=image_fft).T
+
+        return blurred_mapping_matrix
@@ -1,6 +1,7 @@
-from astropy import units
 import copy
 import numpy as np
+import scipy.fft
+from typing import Dict, Optional
 import warnings
 
 
@@ -26,12 +27,14 @@ except ModuleNotFoundError:
 
     PyLopsOperator = PyLopsPlaceholder
 
+from autoarray.dataset.w_tilde_cache import WTildeCache
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
 from autoarray.structures.visibilities import Visibilities
 
 from autoarray.structures.arrays.two_d import array_2d_util
 from autoarray.operators import transformer_util
+from autoarray import numba_util
 
 
 def pynufft_exception():
@@ -59,8 +62,50 @@ def pylops_exception():
 
 
 class TransformerDFT(PyLopsOperator):
-    def __init__(self, uv_wavelengths, real_space_mask, preload_transform=True):
-
+    def __init__(
+        self,
+        uv_wavelengths,
+        real_space_mask,
+        preload_transform=True,
+        use_complex_transforms=False,
+        complex_dtype="complex128",
+        max_block_gb=0.1,
+        preload_dtype="float64",
+    ):
+        """
+        Performs the direct Fourier transform (DFT) of images and mapping matrices to the uv-plane of an interferometer
+        dataset.
+
+        By default the transform uses numba loops over the real and imaginary terms of the transform, which are
+        optionally preloaded in two arrays.
+
+        If `use_complex_transforms=True`, the complex terms of the transform are instead computed via vectorized numpy
+        and every transform is a complex matrix product performed in blocks of visibilities, which uses BLAS and is
+        significantly faster. If `preload_transform=True` the complex terms are stored in a single array, otherwise
+        every block is computed when a transform is performed, such that the transform uses at most `max_block_gb`
+        of memory.
+
+        Parameters
+        ----------
+        uv_wavelengths
+            The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is Fourier
+            transformed.
+        real_space_mask
+            The 2D mask in real space defining the image-pixels that are Fourier transformed.
+        preload_transform
+            Whether the terms of the transform are computed once and stored in memory.
+        use_complex_transforms
+            Whether the transform is computed via complex matrix products as opposed to numba loops.
+        complex_dtype
+            The complex data type of the complex terms, where `complex64` halves their memory at the expense of
+            precision.
+        max_block_gb
+            The maximum memory in gigabytes of every block of complex terms used to perform a transform.
+        preload_dtype
+            The data type of the preloaded real and imaginary terms used by the numba loops, where `float32` halves
+            their memory and speeds up the memory-bandwidth bound transforms (which are still summed in double
+            precision).
+        """
         if isinstance(self, PyLopsPlaceholder):
             pylops_exception()
 
@@ -74,16 +119,33 @@ class TransformerDFT(PyLopsOperator):
         self.total_image_pixels = self.real_space_mask.pixels_in_mask
 
         self.preload_transform = preload_transform
+        self.use_complex_transforms = use_complex_transforms
+        self.complex_dtype = complex_dtype
+        self.max_block_gb = max_block_gb
+        self.preload_dtype = preload_dtype
+
+        self.preload_complex_transforms = None
+
+        if use_complex_transforms:
+
+            if preload_transform:
+
+                self.preload_complex_transforms = transformer_util.preload_complex_transforms_from(
+                    grid_radians=self.grid,
+                    uv_wavelengths=self.uv_wavelengths,
+                    dtype=complex_dtype,
+                    max_block_gb=max_block_gb,
+                )
 
-        if preload_transform:
+        elif preload_transform:
 
             self.preload_real_transforms = transformer_util.preload_real_transforms(
                 grid_radians=self.grid, uv_wavelengths=self.uv_wavelengths
-            )
+            ).astype(preload_dtype, copy=False)
 
             self.preload_imag_transforms = transformer_util.preload_imag_transforms(
                 grid_radians=self.grid, uv_wavelengths=self.uv_wavelengths
-            )
+            ).astype(preload_dtype, copy=False)
 
         self.real_space_pixels = self.real_space_mask.pixels_in_mask
 
@@ -94,9 +156,30 @@ class TransformerDFT(PyLopsOperator):
         self.dtype = "complex128"
         self.explicit = False
 
+    @property
+    def complex_transform_blocks(self):
+        """
+        The complex terms of the transform in blocks of visibilities, which are views of the preloaded complex terms
+        if they are preloaded and otherwise computed as they are iterated over (see
+        `transformer_util.complex_transform_blocks_from`).
+        """
+        return transformer_util.complex_transform_blocks_from(
+            grid_radians=self.grid,
+            uv_wavelengths=self.uv_wavelengths,
+            dtype=self.complex_dtype,
+            max_block_gb=self.max_block_gb,
+            preloaded_transforms=self.preload_complex_transforms,
+        )
+
     def visibilities_from(self, image):
 
-        if self.preload_transform:
+        if self.use_complex_transforms:
+
+            visibilities = transformer_util.visibilities_via_complex_transforms_from(
+                image_1d=image.binned, transform_blocks=self.complex_transform_blocks
+            )
+
+        elif self.preload_transform:
 
             visibilities = transformer_util.visibilities_via_preload_jit_from(
                 image_1d=image.binned,
@@ -116,12 +199,21 @@ class TransformerDFT(PyLopsOperator):
 
     def image_from(self, visibilities):
 
-        image_slim = transformer_util.image_via_jit_from(
-            n_pixels=self.grid.shape[0],
-            grid_radians=self.grid,
-            uv_wavelengths=self.uv_wavelengths,
-            visibilities=visibilities.in_array,
-        )
+        if self.use_complex_transforms:
+
+            image_slim = transformer_util.image_via_complex_transforms_from(
+                visibilities=visibilities.in_array,
+                transform_blocks=self.complex_transform_blocks,
+            )
+
+        else:
+
+            image_slim = transformer_util.image_via_jit_from(
+                n_pixels=self.grid.shape[0],
+                grid_radians=self.grid,
+                uv_wavelengths=self.uv_wavelengths,
+                visibilities=visibilities.in_array,
+            )
 
         image_native = array_2d_util.array_2d_native_from(
             array_2d_slim=image_slim,
@@ -135,6 +227,14 @@ class TransformerDFT(PyLopsOperator):
 
     def transform_mapping_matrix(self, mapping_matrix):
 
+        if self.use_complex_transforms:
+
+            return transformer_util.transformed_mapping_matrix_via_complex_transforms_from(
+                mapping_matrix=mapping_matrix,
+                transform_blocks=self.complex_transform_blocks,
+                total_visibilities=self.total_visibilities,
+            )
+
         if self.preload_transform:
 
             return transformer_util.transformed_mapping_matrix_via_preload_jit_from(
@@ -153,7 +253,27 @@ class TransformerDFT(PyLopsOperator):
 
 
 class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
-    def __init__(self, uv_wavelengths, real_space_mask):
+    def __init__(self, uv_wavelengths, real_space_mask, max_batch_gb=0.1):
+        """
+        Performs the non-uniform fast Fourier transform (NUFFT) of images and mapping matrices to the uv-plane of an
+        interferometer dataset, using the NUFFT plan of PyNUFFT.
+
+        The mapping matrix and the blocks of images of PyLops solves are transformed in batches, where every column
+        of a batch is mapped to a stack of native images and the FFTs and interpolation of the whole stack are each
+        performed in a single call (see `transformer_util.nufft_forward_batch_from`), as opposed to one NUFFT per
+        column.
+
+        Parameters
+        ----------
+        uv_wavelengths
+            The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is Fourier
+            transformed.
+        real_space_mask
+            The 2D mask in real space defining the image-pixels that are Fourier transformed.
+        max_batch_gb
+            The maximum memory in gigabytes of the oversampled FFTs of every batch of images.
+        """
+        from astropy import units
 
         if isinstance(self, NUFFTPlaceholder):
             pynufft_exception()
@@ -164,6 +284,7 @@ class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
         super(TransformerNUFFT, self).__init__()
 
         self.uv_wavelengths = uv_wavelengths
+        self.max_batch_gb = max_batch_gb
         self.real_space_mask = real_space_mask.mask_sub_1
         #        self.grid = self.real_space_mask.unmasked_grid.in_radians
         self.grid = Grid2D.from_mask(mask=self.real_space_mask).in_radians
@@ -213,6 +334,8 @@ class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
 
     def initialize_plan(self, ratio=2, interp_kernel=(6, 6)):
 
+        from astropy import units
+
         if not isinstance(ratio, int):
             ratio = int(ratio)
 
@@ -255,58 +378,102 @@ class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
             array=image, pixel_scales=self.real_space_mask.pixel_scales
         )
 
-    def transform_mapping_matrix(self, mapping_matrix):
+    @property
+    def batch_size(self) -> int:
+        """
+        The number of images transformed in every batch, such that the oversampled FFTs of a batch use at most
+        `max_batch_gb` of memory.
+        """
+        return transformer_util.nufft_batch_size_from(
+            oversampled_shape=self.Kd, max_batch_gb=self.max_batch_gb
+        )
+
+    def native_stack_from(self, array_2d_slim):
+        """
+        Returns the stack of native images of a 2D array of slim images (e.g. a mapping matrix), flipped in y due to
+        the internal flip of PyNUFFT.
+        """
+        native_stack = transformer_util.native_stack_from(
+            array_2d_slim=array_2d_slim,
+            native_index_for_slim_index=self.native_index_for_slim_index,
+            shape_native=self.real_space_mask.shape_native,
+        )
+
+        return native_stack[::-1]
 
-        transformed_mapping_matrix = 0 + 0j * np.zeros(
-            (self.uv_wavelengths.shape[0], mapping_matrix.shape[1])
+    def visibilities_batch_from(self, array_2d_slim):
+        """
+        Returns the NUFFT of every column of a 2D array of slim images (e.g. a mapping matrix) as a complex array of
+        shape [visibilities, columns], where the columns are transformed in batches of `batch_size`.
+        """
+        visibilities = np.zeros(
+            (self.uv_wavelengths.shape[0], array_2d_slim.shape[1]), dtype="complex128"
         )
 
-        for source_pixel_1d_index in range(mapping_matrix.shape[1]):
+        for column in range(0, array_2d_slim.shape[1], self.batch_size):
+
+            batch = slice(column, column + self.batch_size)
 
-            image_2d = array_2d_util.array_2d_native_from(
-                array_2d_slim=mapping_matrix[:, source_pixel_1d_index],
-                mask_2d=self.grid.mask,
-                sub_size=1,
+            native_stack = self.native_stack_from(array_2d_slim=array_2d_slim[:, batch])
+
+            visibilities[:, batch] = transformer_util.nufft_forward_batch_from(
+                native_stack=native_stack,
+                scaling_factors=self.sn,
+                interpolation_matrix=self.sp,
+                oversampled_shape=self.Kd,
             )
 
-            image = Array2D(array=image_2d, mask=self.grid.mask)
+        return visibilities
+
+    def image_batch_from(self, visibilities):
+        """
+        Returns the real part of the adjoint NUFFT of every column of a 2D array of visibilities as a 2D array of
+        slim images of shape [image_pixels, columns], including the normalization of the inverse FFT.
+        """
+        native_index = self.native_index_for_slim_index
+
+        image_batch = np.zeros(
+            (native_index.shape[0], visibilities.shape[1]), dtype="float64"
+        )
+
+        for column in range(0, visibilities.shape[1], self.batch_size):
 
-            visibilities = self.visibilities_from(image=image)
+            batch = slice(column, column + self.batch_size)
 
-            transformed_mapping_matrix[:, source_pixel_1d_index] = visibilities
+            native_stack = transformer_util.nufft_adjoint_batch_from(
+                visibilities=visibilities[:, batch],
+                scaling_factors=self.sn,
+                interpolation_matrix_adjoint=self.spH,
+                oversampled_shape=self.Kd,
+            )[::-1]
 
-        return transformed_mapping_matrix
+            image_batch[:, batch] = native_stack[
+                native_index[:, 0], native_index[:, 1]
+            ].real
+
+        return image_batch
+
+    def transform_mapping_matrix(self, mapping_matrix):
+        return self.visibilities_batch_from(array_2d_slim=mapping_matrix)
 
     def forward_lop(self, x):
         """
-        Forward NUFFT on CPU
-        :param x: The input numpy array, with the size of Nd or Nd + (batch,)
-        :type: numpy array with the dtype of numpy.complex64
-        :return: y: The output numpy array, with the size of (M,) or (M, batch)
-        :rtype: numpy array with the dtype of numpy.complex64
+        The forward NUFFT of a slim image of shape [image_pixels] or a block of slim images of shape
+        [image_pixels, batch], returning the real and imaginary parts of the visibilities concatenated along the
+        first axis.
         """
-
         warnings.filterwarnings("ignore")
 
-        x2d = array_2d_util.array_2d_native_complex_via_indexes_from(
-            array_2d_slim=x,
-            sub_shape_native=self.real_space_mask.shape_native,
-            native_index_for_slim_index_2d=self.native_index_for_slim_index,
-        )[::-1, :]
+        y = self.visibilities_batch_from(array_2d_slim=x.reshape(x.shape[0], -1))
+        y = np.concatenate((y.real, y.imag), axis=0)
 
-        y = self.k2y(self.xx2k(self.x2xx(x2d)))
-        return np.concatenate((y.real, y.imag), axis=0)
+        return y.reshape((y.shape[0],) + x.shape[1:])
 
     def adjoint_lop(self, y):
         """
-        Adjoint NUFFT on CPU
-        :param y: The input numpy array, with the size of (M,) or (M, batch)
-        :type: numpy array with the dtype of numpy.complex64
-        :return: x: The output numpy array,
-                    with the size of Nd or Nd + (batch, )
-        :rtype: numpy array with the dtype of numpy.complex64
+        The adjoint NUFFT of the real and imaginary parts of visibilities concatenated along the first axis, of shape
+        [2 * visibilities] or [2 * visibilities, batch], returning a slim image or block of slim images.
         """
-
         warnings.filterwarnings("ignore")
 
         def a_complex_from(a_real, a_imag):
@@ -317,20 +484,391 @@ class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
             a_real=y[: int(self.shape[0] / 2.0)], a_imag=y[int(self.shape[0] / 2.0) :]
         )
 
-        x2d = np.real(self.xx2x(self.k2xx(self.y2k(y))))
-
-        x = array_2d_util.array_2d_slim_complex_from(
-            array_2d_native=x2d[::-1, :], sub_size=1, mask=self.real_space_mask
-        )
-        x = x.real  # NOTE:
+        x = self.image_batch_from(visibilities=y.reshape(y.shape[0], -1))
 
         # NOTE:
         x *= self.adjoint_scaling
 
-        return x
+        return x.reshape((x.shape[0],) + y.shape[1:])
+
+    def _matvec(self, x):
+        return self.forward_lop(x)
+
+    def _rmatvec(self, x):
+        return self.adjoint_lop(x)
+
+    def _matmat(self, X):
+        return self.forward_lop(X)
+
+    def _rmatmat(self, X):
+        return self.adjoint_lop(X)
+
+
+class TransformerKaiserBessel(PyLopsOperator):
+    def __init__(
+        self,
+        uv_wavelengths,
+        real_space_mask,
+        eps: float = 1.0e-6,
+        oversampling: float = 2.0,
+        precision: str = "float64",
+        workers: int = 1,
+        max_batch_gb: float = 0.1,
+        cache: Optional[WTildeCache] = None,
+    ):
+        """
+        Performs the non-uniform fast Fourier transform (NUFFT) of images and mapping matrices to the uv-plane of an
+        interferometer dataset, using Kaiser-Bessel gridding implemented in numba and the FFTs of `scipy.fft`, such
+        that no NUFFT library (e.g. PyNUFFT) is required. The values approximate those of the `TransformerDFT` to a
+        relative accuracy of `eps`.
+
+        Every image is divided by the Fourier transform of the Kaiser-Bessel kernel, placed on an FFT grid
+        oversampled by the factor `oversampling` and Fourier transformed, where every visibility is then
+        interpolated from the FFT pixels within the kernel's width of it.
+
+        The indexes and weights of the FFT pixels every visibility is interpolated from are computed once and stored,
+        such that they are pickled with the dataset. If a `WTildeCache` is input they are also stored in the on-disk
+        cache, such that they are computed once and loaded by every other process which uses the same uv-wavelengths,
+        mask and accuracy.
+
+        The mapping matrix and the blocks of images of PyLops solves are transformed in batches, with one FFT call and
+        one interpolation of every batch.
+
+        Parameters
+        ----------
+        uv_wavelengths
+            The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is Fourier
+            transformed.
+        real_space_mask
+            The 2D mask in real space defining the image-pixels that are Fourier transformed.
+        eps
+            The relative accuracy of the transform, where a smaller value uses a wider gridding kernel which is
+            slower (see `transformer_util.kaiser_bessel_parameters_from`).
+        oversampling
+            The factor by which the FFT grid is oversampled relative to the image, which must be above 1.
+        precision
+            The precision of the FFTs, interpolation and gridding (`float64` or `float32`), where `float32` halves
+            their memory and is faster but limits the accuracy to ~1e-6.
+        workers
+            The number of threads used by every FFT (see `scipy.fft.fft2`), where the interpolation and gridding use
+            the threads set via `numba_util.set_num_threads`.
+        max_batch_gb
+            The maximum memory in gigabytes of the oversampled FFTs of every batch of images.
+        cache
+            The on-disk cache the interpolation indexes and weights are loaded from and saved to.
+        """
+        if isinstance(self, PyLopsPlaceholder):
+            pylops_exception()
+
+        super().__init__()
+
+        self.uv_wavelengths = uv_wavelengths.astype("float")
+        self.real_space_mask = real_space_mask.mask_sub_1
+
+        self.eps = eps
+        self.oversampling = oversampling
+        self.precision = precision
+        self.workers = workers
+        self.max_batch_gb = max_batch_gb
+
+        self.width, self.beta = transformer_util.kaiser_bessel_parameters_from(
+            eps=eps, oversampling=oversampling
+        )
+
+        native_index_for_slim_index = (
+            self.real_space_mask.native_index_for_slim_index.astype("int")
+        )
+
+        native_min = np.min(native_index_for_slim_index, axis=0)
+        native_max = np.max(native_index_for_slim_index, axis=0)
+
+        self.native_centre = (native_min + native_max) // 2
+
+        self.oversampled_shape = tuple(
+            scipy.fft.next_fast_len(int(np.ceil(oversampling * extent)))
+            for extent in native_max - native_min + 1
+        )
+
+        if cache is None:
+            array_dict = self.interpolation_array_dict_from()
+        else:
+            key = cache.key_from(
+                "nufft_kaiser_bessel",
+                self.uv_wavelengths,
+                np.asarray(self.real_space_mask),
+                self.real_space_mask.pixel_scales,
+                self.width,
+                self.beta,
+                self.oversampled_shape,
+                np.dtype(precision).str,
+            )
+
+            array_dict = cache.cached_arrays_from(
+                key=key, func=self.interpolation_array_dict_from
+            )
+
+        self.indexes_y = array_dict["indexes_y"]
+        self.weights_y = array_dict["weights_y"]
+        self.indexes_x = array_dict["indexes_x"]
+        self.weights_x = array_dict["weights_x"]
+        self.phases = array_dict["phases"]
+        self.oversampled_indexes = array_dict["oversampled_indexes"]
+        self.corrections = array_dict["corrections"]
+
+        self.real_space_pixels = self.real_space_mask.pixels_in_mask
+
+        # NOTE: The operator outputs the real and imaginary visibilities concatenated.
+        self.total_visibilities = int(uv_wavelengths.shape[0] * uv_wavelengths.shape[1])
+
+        self.shape = (
+            int(np.prod(self.total_visibilities)),
+            int(np.prod(self.real_space_pixels)),
+        )
+        self.dtype = "float64"
+        self.explicit = False
+
+    def interpolation_array_dict_from(self) -> Dict[str, np.ndarray]:
+        """
+        Computes the arrays used by every transform:
+
+        - `indexes_y`, `weights_y`, `indexes_x`, `weights_x`: The indexes and weights of the oversampled FFT pixels
+          every visibility is interpolated from (see `transformer_util.kaiser_bessel_interpolation_from`).
+
+        - `phases`: The phase of every visibility due to the coordinates of the central pixel of the image, which
+          the FFT treats as its origin.
+
+        - `oversampled_indexes`: The indexes of every unmasked image pixel on the oversampled FFT grid.
+
+        - `corrections`: The inverse of the Fourier transform of the kernel at every unmasked image pixel.
+        """
+        native_index_for_slim_index = (
+            self.real_space_mask.native_index_for_slim_index.astype("int")
+        )
+
+        grid_radians = np.asarray(Grid2D.from_mask(mask=self.real_space_mask).in_radians)
+
+        pixel_scales_radians = np.asarray(self.real_space_mask.pixel_scales) * (
+            np.pi / 648000.0
+        )
+
+        offsets = native_index_for_slim_index - self.native_centre
+
+        centre_y = grid_radians[0, 0] + pixel_scales_radians[0] * offsets[0, 0]
+        centre_x = grid_radians[0, 1] - pixel_scales_radians[1] * offsets[0, 1]
+
+        indexes_y, weights_y = transformer_util.kaiser_bessel_interpolation_from(
+            coordinates=-pixel_scales_radians[0]
+            * self.uv_wavelengths[:, 1]
+            * self.oversampled_shape[0],
+            oversampled_size=self.oversampled_shape[0],
+            width=self.width,
+            beta=self.beta,
+            dtype=self.precision,
+        )
+
+        indexes_x, weights_x = transformer_util.kaiser_bessel_interpolation_from(
+            coordinates=pixel_scales_radians[1]
+            * self.uv_wavelengths[:, 0]
+            * self.oversampled_shape[1],
+            oversampled_size=self.oversampled_shape[1],
+            width=self.width,
+            beta=self.beta,
+            dtype=self.precision,
+        )
+
+        phases = np.exp(
+            -2.0j
+            * np.pi
+            * (
+                centre_x * self.uv_wavelengths[:, 0]
+                + centre_y * self.uv_wavelengths[:, 1]
+            )
+        )
+
+        corrections = 1.0 / (
+            transformer_util.kaiser_bessel_correction_from(
+                indexes=offsets[:, 0],
+                oversampled_size=self.oversampled_shape[0],
+                width=self.width,
+                beta=self.beta,
+            )
+            * transformer_util.kaiser_bessel_correction_from(
+                indexes=offsets[:, 1],
+                oversampled_size=self.oversampled_shape[1],
+                width=self.width,
+                beta=self.beta,
+            )
+        )
+
+        return {
+            "indexes_y": indexes_y,
+            "weights_y": weights_y,
+            "indexes_x": indexes_x,
+            "weights_x": weights_x,
+            "phases": phases,
+            "oversampled_indexes": offsets % np.asarray(self.oversampled_shape),
+            "corrections": corrections.astype(self.precision),
+        }
+
+    @property
+    def complex_dtype(self) -> str:
+        return "complex64" if np.dtype(self.precision) == np.float32 else "complex128"
+
+    @property
+    def batch_size(self) -> int:
+        """
+        The number of images transformed in every batch, such that the oversampled FFTs of a batch use at most
+        `max_batch_gb` of memory.
+        """
+        return transformer_util.nufft_batch_size_from(
+            oversampled_shape=self.oversampled_shape, max_batch_gb=self.max_batch_gb
+        )
+
+    def visibilities_batch_from(self, array_2d_slim):
+        """
+        Returns the NUFFT of every column of a 2D array of slim images (e.g. a mapping matrix) as a complex array of
+        shape [visibilities, columns], where the columns are transformed in batches of `batch_size`.
+        """
+        visibilities = np.zeros(
+            (self.uv_wavelengths.shape[0], array_2d_slim.shape[1]), dtype="complex128"
+        )
+
+        for column in range(0, array_2d_slim.shape[1], self.batch_size):
+
+            batch = slice(column, column + self.batch_size)
+
+            oversampled_stack = np.zeros(
+                self.oversampled_shape + (array_2d_slim[:, batch].shape[1],),
+                dtype=self.complex_dtype,
+            )
+
+            oversampled_stack[
+                self.oversampled_indexes[:, 0], self.oversampled_indexes[:, 1]
+            ] = (array_2d_slim[:, batch] * self.corrections[:, None])
+
+            oversampled_fft = scipy.fft.fft2(
+                oversampled_stack, axes=(0, 1), workers=self.workers, overwrite_x=True
+            )
+
+            visibilities[:, batch] = (
+                transformer_util.nufft_interpolate_from(
+                    oversampled_fft=oversampled_fft,
+                    indexes_y=self.indexes_y,
+                    weights_y=self.weights_y,
+                    indexes_x=self.indexes_x,
+                    weights_x=self.weights_x,
+                )
+                * self.phases[:, None]
+            )
+
+        return visibilities
+
+    def image_batch_from(self, visibilities):
+        """
+        Returns the real part of the adjoint NUFFT of every column of a 2D array of visibilities as a 2D array of
+        slim images of shape [image_pixels, columns], which is the adjoint of `visibilities_batch_from`.
+
+        The gridding of every batch uses a separate oversampled grid for every chunk of visibilities gridded in
+        parallel (see `transformer_util.nufft_grid_from`), therefore the batch size and number of chunks are reduced
+        such that all of these grids use at most `max_batch_gb` of memory.
+        """
+        image_batch = np.zeros(
+            (self.real_space_pixels, visibilities.shape[1]), dtype="float64"
+        )
+
+        total_chunks = min(numba_util.get_num_threads(), self.batch_size)
+        batch_size = self.batch_size // total_chunks
+
+        for column in range(0, visibilities.shape[1], batch_size):
+
+            batch = slice(column, column + batch_size)
+
+            visibilities_batch = visibilities[:, batch] * np.conj(self.phases)[:, None]
+
+            oversampled_grid = transformer_util.nufft_grid_from(
+                visibilities=visibilities_batch.astype(self.complex_dtype),
+                oversampled_shape=self.oversampled_shape,
+                indexes_y=self.indexes_y,
+                weights_y=self.weights_y,
+                indexes_x=self.indexes_x,
+                weights_x=self.weights_x,
+                total_chunks=total_chunks,
+            )
+
+            oversampled_stack = scipy.fft.ifft2(
+                oversampled_grid,
+                axes=(0, 1),
+                norm="forward",
+                workers=self.workers,
+                overwrite_x=True,
+            )
+
+            image_batch[:, batch] = (
+                oversampled_stack[
+                    self.oversampled_indexes[:, 0], self.oversampled_indexes[:, 1]
+                ].real
+                * self.corrections[:, None]
+            )
+
+        return image_batch
+
+    def visibilities_from(self, image):
+
+        visibilities = self.visibilities_batch_from(
+            array_2d_slim=np.asarray(image.binned.slim)[:, None]
+        )
+
+        return Visibilities(visibilities=visibilities[:, 0])
+
+    def image_from(self, visibilities):
+
+        image_slim = self.image_batch_from(
+            visibilities=np.asarray(visibilities)[:, None]
+        )[:, 0]
+
+        image_native = array_2d_util.array_2d_native_from(
+            array_2d_slim=image_slim, mask_2d=self.real_space_mask, sub_size=1
+        )
+
+        return Array2D.manual_native(
+            array=image_native, pixel_scales=self.real_space_mask.pixel_scales
+        )
+
+    def transform_mapping_matrix(self, mapping_matrix):
+        return self.visibilities_batch_from(array_2d_slim=mapping_matrix)
+
+    def forward_lop(self, x):
+        """
+        The forward NUFFT of a slim image of shape [image_pixels] or a block of slim images of shape
+        [image_pixels, batch], returning the real and imaginary parts of the visibilities concatenated along the
+        first axis.
+        """
+        y = self.visibilities_batch_from(array_2d_slim=x.reshape(x.shape[0], -1))
+        y = np.concatenate((y.real, y.imag), axis=0)
+
+        return y.reshape((y.shape[0],) + x.shape[1:])
+
+    def adjoint_lop(self, y):
+        """
+        The adjoint NUFFT of the real and imaginary parts of visibilities concatenated along the first axis, of shape
+        [2 * visibilities] or [2 * visibilities, batch], returning a slim image or block of slim images.
+        """
+        total_visibilities = self.uv_wavelengths.shape[0]
+
+        y = y[:total_visibilities] + 1j * y[total_visibilities:]
+
+        x = self.image_batch_from(visibilities=y.reshape(y.shape[0], -1))
+
+        return x.reshape((x.shape[0],) + y.shape[1:])
 
     def _matvec(self, x):
         return self.forward_lop(x)
 
     def _rmatvec(self, x):
         return self.adjoint_lop(x)
+
+    def _matmat(self, X):
+        return self.forward_lop(X)
+
+    def _rmatmat(self, X):
+        return self.adjoint_lop(X)
@@ -1,4 +1,6 @@
+import numba
 import numpy as np
+from typing import Iterator, Optional, Tuple
 
 from autoarray import numba_util
 
@@ -217,3 +219,688 @@ def transformed_mapping_matrix_jit(mapping_matrix, grid_radians, uv_wavelengths)
                     )
 
     return transfomed_mapping_matrix
+
+
+def complex_transforms_from(
+    grid_radians: np.ndarray, uv_wavelengths: np.ndarray, dtype: str = "complex128"
+) -> np.ndarray:
+    """
+    Returns the complex terms exp(-2 pi i (x * u + y * v)) of the direct Fourier transform (`TransformerDFT`) for every
+    (y,x) radian coordinate on the real-space grid and every `uv_wavelength` value, computed via vectorized numpy.
+
+    The real and imaginary components are the values of `preload_real_transforms` and `preload_imag_transforms`
+    respectively, such that a Fourier transform is a single complex matrix product with this array.
+
+    The complex terms are separable, exp(-2 pi i (x * u + y * v)) = exp(-2 pi i x * u) * exp(-2 pi i y * v), so the
+    exponentials are only computed for the unique y and x coordinates of the grid (e.g. the rows and columns of a
+    uniform grid) and every term is the product of two of them. This replaces the evaluation of a sine and cosine
+    for every term with a complex multiplication.
+
+    Parameters
+    ----------
+    grid_radians
+        The grid in radians corresponding to real-space mask within which the image that is Fourier transformed is
+        computed.
+    uv_wavelengths
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+    dtype
+        The complex data type of the returned array, where `complex64` halves the memory of the transforms at the
+        expense of precision.
+
+    Returns
+    -------
+    np.ndarray
+        The complex terms of the direct Fourier transform of shape [image_pixels, visibilities].
+    """
+    grid_radians = np.asarray(grid_radians)
+    uv_wavelengths = np.asarray(uv_wavelengths)
+
+    y_unique, y_index = np.unique(grid_radians[:, 0], return_inverse=True)
+    x_unique, x_index = np.unique(grid_radians[:, 1], return_inverse=True)
+
+    transforms_y = np.exp(-2.0j * np.pi * np.outer(y_unique, uv_wavelengths[:, 1]))
+    transforms_x = np.exp(-2.0j * np.pi * np.outer(x_unique, uv_wavelengths[:, 0]))
+
+    transforms_y = transforms_y.astype(dtype)
+    transforms_x = transforms_x.astype(dtype)
+
+    complex_transforms = transforms_y[y_index.ravel()]
+    complex_transforms *= transforms_x[x_index.ravel()]
+
+    return complex_transforms
+
+
+def complex_transform_blocks_from(
+    grid_radians: np.ndarray,
+    uv_wavelengths: np.ndarray,
+    dtype: str = "complex128",
+    max_block_gb: float = 0.1,
+    preloaded_transforms: Optional[np.ndarray] = None,
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Yields the complex terms of the direct Fourier transform (see `complex_transforms_from`) in blocks of
+    visibilities, where the size of every block is below an input memory limit.
+
+    If the complex terms are preloaded every block is a view of the preloaded array, otherwise every block is computed
+    when it is yielded, such that the Fourier transform of a dataset with too many visibilities to store the complex
+    terms in memory uses at most `max_block_gb` of memory.
+
+    Computing a block holds three arrays of the block's size in memory: the block, the terms of the x coordinates it
+    is multiplied by (see `complex_transforms_from`) and the previous block, which the caller holds until the next
+    block is yielded. Computed blocks are therefore sized such that all three fit within `max_block_gb`.
+
+    Parameters
+    ----------
+    grid_radians
+        The grid in radians corresponding to real-space mask within which the image that is Fourier transformed is
+        computed.
+    uv_wavelengths
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+    dtype
+        The complex data type of the complex terms.
+    max_block_gb
+        The maximum memory in gigabytes used by every block of complex terms, including the temporary memory used to
+        compute it.
+    preloaded_transforms
+        The preloaded complex terms of every visibility, which are used instead of computing every block if input.
+
+    Returns
+    -------
+    A generator of the slice of the visibilities of every block and its complex terms of shape
+    [image_pixels, block_visibilities].
+    """
+    total_image_pixels = grid_radians.shape[0]
+    total_visibilities = uv_wavelengths.shape[0]
+
+    arrays_per_block = 1 if preloaded_transforms is not None else 3
+
+    block_size = int(
+        max_block_gb
+        * 1.0e9
+        // (arrays_per_block * total_image_pixels * np.dtype(dtype).itemsize)
+    )
+    block_size = max(block_size, 1)
+
+    for vis_1d_index in range(0, total_visibilities, block_size):
+
+        block = slice(vis_1d_index, min(vis_1d_index + block_size, total_visibilities))
+
+        if preloaded_transforms is not None:
+            yield block, preloaded_transforms[:, block]
+        else:
+            yield block, complex_transforms_from(
+                grid_radians=grid_radians,
+                uv_wavelengths=uv_wavelengths[block],
+                dtype=dtype,
+            )
+
+
+def preload_complex_transforms_from(
+    grid_radians: np.ndarray,
+    uv_wavelengths: np.ndarray,
+    dtype: str = "complex128",
+    max_block_gb: float = 0.1,
+) -> np.ndarray:
+    """
+    Sets up the complex preloaded values used by the direct fourier transform (`TransformerDFT`), which replace the
+    separate real and imaginary preloads (`preload_real_transforms` and `preload_imag_transforms`) with a single array.
+
+    The values are computed in blocks of visibilities (see `complex_transform_blocks_from`), such that the temporary
+    memory used to compute them is bounded.
+
+    For large numbers of visibilities (> 100000) this array requires large amounts of memory ( > 1 GB) and it is
+    recommended this preloading is not used.
+
+    Parameters
+    ----------
+    grid_radians
+        The grid in radians corresponding to real-space mask within which the image that is Fourier transformed is
+        computed.
+    uv_wavelengths
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+    dtype
+        The complex data type of the preloaded values.
+    max_block_gb
+        The maximum memory in gigabytes of every block of values computed.
+
+    Returns
+    -------
+    np.ndarray
+        The preloaded complex terms of the direct Fourier transform of shape [image_pixels, visibilities].
+    """
+    preloaded_transforms = np.empty(
+        shape=(grid_radians.shape[0], uv_wavelengths.shape[0]), dtype=dtype
+    )
+
+    for block, complex_transforms in complex_transform_blocks_from(
+        grid_radians=grid_radians,
+        uv_wavelengths=uv_wavelengths,
+        dtype=dtype,
+        max_block_gb=max_block_gb,
+    ):
+        preloaded_transforms[:, block] = complex_transforms
+
+    return preloaded_transforms
+
+
+def visibilities_via_complex_transforms_from(
+    image_1d: np.ndarray, transform_blocks: Iterator[Tuple[slice, np.ndarray]]
+) -> np.ndarray:
+    """
+    Returns the visibilities of the direct Fourier transform of an image as a complex matrix product of the image
+    with every block of complex terms (see `complex_transform_blocks_from`).
+
+    Because the image is real, the product is performed as a real matrix product with a view of the complex terms
+    as interleaved real and imaginary values, which uses half the floating point operations of a complex product.
+
+    Parameters
+    ----------
+    image_1d
+        The 1D image which is Fourier transformed.
+    transform_blocks
+        The slice of the visibilities of every block and its complex terms.
+    """
+    image_1d = np.asarray(image_1d)
+
+    visibilities = []
+
+    for block, complex_transforms in transform_blocks:
+
+        real_transforms = complex_transforms.view(complex_transforms.real.dtype)
+
+        visibilities.append(
+            (image_1d.astype(real_transforms.dtype) @ real_transforms).view(
+                complex_transforms.dtype
+            )
+        )
+
+    return np.concatenate(visibilities).astype("complex128")
+
+
+def image_via_complex_transforms_from(
+    visibilities: np.ndarray, transform_blocks: Iterator[Tuple[slice, np.ndarray]]
+) -> np.ndarray:
+    """
+    Returns the real-space image of visibilities via the inverse direct Fourier transform, computed as the real
+    component of a complex matrix product of the conjugate of every block of complex terms with the visibilities
+    (see `complex_transform_blocks_from`).
+
+    The real component of this product is the real matrix product of a view of the complex terms as interleaved real
+    and imaginary values with the interleaved real and imaginary values of the visibilities.
+
+    Parameters
+    ----------
+    visibilities
+        The visibilities which are transformed to real-space, of shape [total_visibilities, 2] where the two columns
+        are the real and imaginary components.
+    transform_blocks
+        The slice of the visibilities of every block and its complex terms.
+    """
+    visibilities = np.asarray(visibilities)
+
+    image_1d = None
+
+    for block, complex_transforms in transform_blocks:
+
+        real_transforms = complex_transforms.view(complex_transforms.real.dtype)
+
+        image_block = real_transforms @ visibilities[block].ravel().astype(
+            real_transforms.dtype
+        )
+
+        image_1d = image_block if image_1d is None else image_1d + image_block
+
+    return image_1d.astype("float")
+
+
+def transformed_mapping_matrix_via_complex_transforms_from(
+    mapping_matrix: np.ndarray,
+    transform_blocks: Iterator[Tuple[slice, np.ndarray]],
+    total_visibilities: int,
+) -> np.ndarray:
+    """
+    Returns the direct Fourier transform of every column of a mapping matrix, computed as a complex matrix product of
+    every block of complex terms with the mapping matrix (see `complex_transform_blocks_from`).
+
+    Because the mapping matrix is real, every product is performed as a real matrix product with a view of the
+    complex terms as interleaved real and imaginary values, which uses half the floating point operations of a
+    complex product.
+
+    Parameters
+    ----------
+    mapping_matrix
+        The matrix which maps every pixel of a linear object (e.g. a source-pixel) to the image-pixels.
+    transform_blocks
+        The slice of the visibilities of every block and its complex terms.
+    total_visibilities
+        The total number of visibilities of the transformed mapping matrix.
+    """
+    transformed_mapping_matrix = np.zeros(
+        (total_visibilities, mapping_matrix.shape[1]), dtype="complex128"
+    )
+
+    mapping_matrix_t = None
+
+    for block, complex_transforms in transform_blocks:
+
+        real_transforms = complex_transforms.view(complex_transforms.real.dtype)
+
+        if mapping_matrix_t is None:
+            mapping_matrix_t = np.asarray(mapping_matrix).T.astype(real_transforms.dtype)
+
+        transformed_block = mapping_matrix_t @ real_transforms
+
+        transformed_mapping_matrix[block] = transformed_block.view(
+            complex_transforms.dtype
+        ).T
+
+    return transformed_mapping_matrix
+
+
+def native_stack_from(
+    array_2d_slim: np.ndarray,
+    native_index_for_slim_index: np.ndarray,
+    shape_native: Tuple[int, int],
+) -> np.ndarray:
+    """
+    Returns a stack of native 2D arrays from a 2D array of slim arrays (e.g. a mapping matrix), where every column
+    of the input is mapped to its native 2D array in one scatter, such that the batch axis is the last axis.
+
+    Parameters
+    ----------
+    array_2d_slim
+        The slim arrays of shape [image_pixels, batch] which are mapped to their native 2D arrays.
+    native_index_for_slim_index
+        The native 2D index of every slim index of the mask the slim arrays are defined in.
+    shape_native
+        The 2D shape of the native arrays.
+
+    Returns
+    -------
+    The native 2D arrays of shape [shape_native[0], shape_native[1], batch].
+    """
+    native_stack = np.zeros(
+        shape_native + (array_2d_slim.shape[1],), dtype=array_2d_slim.dtype
+    )
+
+    native_stack[
+        native_index_for_slim_index[:, 0], native_index_for_slim_index[:, 1]
+    ] = array_2d_slim
+
+    return native_stack
+
+
+def nufft_batch_size_from(
+    oversampled_shape: Tuple[int, int], max_batch_gb: float = 0.1
+) -> int:
+    """
+    Returns the number of images in every batch of a batched NUFFT, such that the oversampled complex FFT of a batch
+    uses at most `max_batch_gb` of memory.
+
+    Parameters
+    ----------
+    oversampled_shape
+        The 2D shape of the oversampled FFT of every image.
+    max_batch_gb
+        The maximum memory in gigabytes of the oversampled FFT of every batch.
+    """
+    batch_size = int(
+        max_batch_gb
+        * 1.0e9
+        // (np.prod(oversampled_shape) * np.dtype("complex128").itemsize)
+    )
+
+    return max(batch_size, 1)
+
+
+def nufft_forward_batch_from(
+    native_stack: np.ndarray,
+    scaling_factors: np.ndarray,
+    interpolation_matrix,
+    oversampled_shape: Tuple[int, int],
+) -> np.ndarray:
+    """
+    Returns the non-uniform fast Fourier transform (NUFFT) of a stack of native 2D images, using the scaling factors
+    and interpolation matrix of a NUFFT plan (e.g. that of PyNUFFT).
+
+    Every image is multiplied by the scaling factors and zero-padded to the oversampled shape, the FFTs of every image
+    are performed in a single call over the first two axes and the oversampled FFTs are interpolated to the
+    visibilities in a single sparse matrix product. This gives identical values to transforming every image
+    separately, but with one call per step for the whole stack.
+
+    Parameters
+    ----------
+    native_stack
+        The native 2D images of shape [y_pixels, x_pixels, batch] that are transformed.
+    scaling_factors
+        The scaling factors of the NUFFT plan of shape [y_pixels, x_pixels].
+    interpolation_matrix
+        The sparse matrix of shape [visibilities, oversampled_pixels] of the NUFFT plan, which interpolates the
+        oversampled FFT of an image to the visibilities.
+    oversampled_shape
+        The 2D shape of the oversampled FFT of every image.
+
+    Returns
+    -------
+    The complex visibilities of every image, of shape [visibilities, batch].
+    """
+    shape_native = native_stack.shape[:2]
+
+    oversampled_stack = np.zeros(
+        tuple(oversampled_shape) + native_stack.shape[2:], dtype="complex128"
+    )
+    oversampled_stack[: shape_native[0], : shape_native[1]] = (
+        native_stack * scaling_factors[:, :, None]
+    )
+
+    oversampled_fft = np.fft.fft2(oversampled_stack, axes=(0, 1))
+
+    return np.asarray(
+        interpolation_matrix.dot(oversampled_fft.reshape(-1, native_stack.shape[2]))
+    )
+
+
+def nufft_adjoint_batch_from(
+    visibilities: np.ndarray,
+    scaling_factors: np.ndarray,
+    interpolation_matrix_adjoint,
+    oversampled_shape: Tuple[int, int],
+) -> np.ndarray:
+    """
+    Returns the adjoint non-uniform fast Fourier transform (NUFFT) of a batch of visibilities, which is the adjoint of
+    `nufft_forward_batch_from`, using the scaling factors and adjoint interpolation matrix of a NUFFT plan.
+
+    The inverse FFTs of every batch are performed in a single call, therefore the values include the 1 / N
+    normalization of the inverse FFT (where N is the number of oversampled pixels).
+
+    Parameters
+    ----------
+    visibilities
+        The complex visibilities of shape [visibilities, batch].
+    scaling_factors
+        The scaling factors of the NUFFT plan of shape [y_pixels, x_pixels].
+    interpolation_matrix_adjoint
+        The sparse matrix of shape [oversampled_pixels, visibilities] of the NUFFT plan, which is the conjugate
+        transpose of its interpolation matrix.
+    oversampled_shape
+        The 2D shape of the oversampled FFT of every image.
+
+    Returns
+    -------
+    The complex native 2D images of shape [y_pixels, x_pixels, batch].
+    """
+    shape_native = scaling_factors.shape
+
+    oversampled_fft = np.asarray(interpolation_matrix_adjoint.dot(visibilities))
+    oversampled_fft = oversampled_fft.reshape(
+        tuple(oversampled_shape) + (visibilities.shape[1],)
+    )
+
+    oversampled_stack = np.fft.ifft2(oversampled_fft, axes=(0, 1))
+
+    return (
+        oversampled_stack[: shape_native[0], : shape_native[1]]
+        * scaling_factors[:, :, None]
+    )
+
+
+def kaiser_bessel_parameters_from(
+    eps: float = 1.0e-6, oversampling: float = 2.0
+) -> Tuple[int, float]:
+    """
+    Returns the width (in oversampled grid pixels) and shape parameter beta of the Kaiser-Bessel gridding kernel of a
+    NUFFT whose relative error is approximately `eps`, using the shape parameter of Beatty et al. 2005
+    (https://ieeexplore.ieee.org/document/1421787) for the input oversampling factor.
+
+    Parameters
+    ----------
+    eps
+        The relative accuracy of the NUFFT, where a smaller value uses a wider kernel which is slower.
+    oversampling
+        The factor by which the FFT of the image is oversampled, which must be above 1.
+    """
+    width = int(np.ceil(np.log10(1.0 / eps))) + 1
+    width = min(max(width, 2), 16)
+
+    beta = np.pi * np.sqrt(
+        (width / oversampling) ** 2 * (oversampling - 0.5) ** 2 - 0.8
+    )
+
+    return width, float(beta)
+
+
+def kaiser_bessel_kernel_from(
+    offsets: np.ndarray, width: int, beta: float
+) -> np.ndarray:
+    """
+    Returns the Kaiser-Bessel gridding kernel at offsets (in oversampled grid pixels) from its centre, which is
+    normalized to 1 at its centre and is zero at offsets beyond half its width.
+
+    Parameters
+    ----------
+    offsets
+        The offsets from the centre of the kernel the kernel is evaluated at.
+    width
+        The width of the kernel in oversampled grid pixels.
+    beta
+        The shape parameter of the kernel.
+    """
+    argument = 1.0 - (2.0 * offsets / width) ** 2
+
+    return np.where(
+        argument > 0.0,
+        np.i0(beta * np.sqrt(np.maximum(argument, 0.0))) / np.i0(beta),
+        0.0,
+    )
+
+
+def kaiser_bessel_correction_from(
+    indexes: np.ndarray, oversampled_size: int, width: int, beta: float
+) -> np.ndarray:
+    """
+    Returns the Fourier transform of the Kaiser-Bessel gridding kernel at the (centred) pixel indexes of an image,
+    which the image is divided by before its FFT is computed in order to correct for the convolution of the FFT by
+    the kernel.
+
+    The Fourier transform is computed via Gauss-Legendre quadrature, such that no closed form expression is relied on.
+
+    Parameters
+    ----------
+    indexes
+        The pixel indexes of the image relative to its central pixel.
+    oversampled_size
+        The size of the oversampled FFT of the image along the same dimension.
+    width
+        The width of the kernel in oversampled grid pixels.
+    beta
+        The shape parameter of the kernel.
+    """
+    nodes, node_weights = np.polynomial.legendre.leggauss(4 * width + 20)
+
+    offsets = 0.5 * width * nodes
+
+    kernel = kaiser_bessel_kernel_from(offsets=offsets, width=width, beta=beta)
+
+    return (0.5 * width) * np.sum(
+        node_weights
+        * kernel
+        * np.cos(2.0 * np.pi * np.outer(indexes, offsets) / oversampled_size),
+        axis=1,
+    )
+
+
+def kaiser_bessel_interpolation_from(
+    coordinates: np.ndarray,
+    oversampled_size: int,
+    width: int,
+    beta: float,
+    dtype: str = "float64",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the indexes and weights of the oversampled FFT pixels every visibility is interpolated from (and gridded
+    to) along one dimension, which are computed once and reused by every transform.
+
+    Parameters
+    ----------
+    coordinates
+        The coordinate of every visibility along the dimension, in oversampled grid pixels.
+    oversampled_size
+        The size of the oversampled FFT along the dimension, which the indexes wrap around.
+    width
+        The width of the kernel in oversampled grid pixels.
+    beta
+        The shape parameter of the kernel.
+    dtype
+        The data type of the weights.
+
+    Returns
+    -------
+    The indexes and weights of shape [total_visibilities, width].
+    """
+    indexes = np.ceil(coordinates - 0.5 * width).astype("int")[:, None] + np.arange(
+        width
+    )
+
+    weights = kaiser_bessel_kernel_from(
+        offsets=coordinates[:, None] - indexes, width=width, beta=beta
+    )
+
+    return indexes % oversampled_size, weights.astype(dtype)
+
+
+@numba_util.jit_prange()
+def nufft_interpolate_from(
+    oversampled_fft: np.ndarray,
+    indexes_y: np.ndarray,
+    weights_y: np.ndarray,
+    indexes_x: np.ndarray,
+    weights_x: np.ndarray,
+) -> np.ndarray:
+    """
+    Interpolates a batch of oversampled FFTs to the visibilities using the separable weights of a gridding kernel
+    (see `kaiser_bessel_interpolation_from`).
+
+    Every visibility is interpolated independently, therefore the visibilities are iterated over in parallel when
+    more than one thread is used (see `numba_util.set_num_threads`).
+
+    Parameters
+    ----------
+    oversampled_fft
+        The oversampled FFTs of shape [y_pixels, x_pixels, batch].
+    indexes_y
+        The y indexes of the oversampled FFT pixels every visibility is interpolated from.
+    weights_y
+        The y weights of the oversampled FFT pixels every visibility is interpolated from.
+    indexes_x
+        The x indexes of the oversampled FFT pixels every visibility is interpolated from.
+    weights_x
+        The x weights of the oversampled FFT pixels every visibility is interpolated from.
+
+    Returns
+    -------
+    The visibilities of every FFT of the batch, of shape [total_visibilities, batch].
+    """
+    total_visibilities = indexes_y.shape[0]
+    width = indexes_y.shape[1]
+    batch = oversampled_fft.shape[2]
+
+    visibilities = np.zeros((total_visibilities, batch), dtype=oversampled_fft.dtype)
+
+    for vis_1d_index in numba.prange(total_visibilities):
+        for width_y_index in range(width):
+
+            y = indexes_y[vis_1d_index, width_y_index]
+            weight_y = weights_y[vis_1d_index, width_y_index]
+
+            for width_x_index in range(width):
+
+                x = indexes_x[vis_1d_index, width_x_index]
+                weight = weight_y * weights_x[vis_1d_index, width_x_index]
+
+                for batch_index in range(batch):
+                    visibilities[vis_1d_index, batch_index] += (
+                        weight * oversampled_fft[y, x, batch_index]
+                    )
+
+    return visibilities
+
+
+@numba_util.jit_prange()
+def nufft_grid_from(
+    visibilities: np.ndarray,
+    oversampled_shape: Tuple[int, int],
+    indexes_y: np.ndarray,
+    weights_y: np.ndarray,
+    indexes_x: np.ndarray,
+    weights_x: np.ndarray,
+    total_chunks: int = 1,
+) -> np.ndarray:
+    """
+    Grids a batch of visibilities to the oversampled FFT pixels using the separable weights of a gridding kernel,
+    which is the adjoint of `nufft_interpolate_from`.
+
+    Different visibilities are gridded to the same pixels, therefore the visibilities are divided into chunks which
+    are iterated over in parallel when more than one thread is used (see `numba_util.set_num_threads`), where every
+    chunk is gridded to a separate oversampled grid which are added together at the end.
+
+    Parameters
+    ----------
+    visibilities
+        The visibilities of shape [total_visibilities, batch].
+    oversampled_shape
+        The 2D shape of the oversampled FFT.
+    indexes_y
+        The y indexes of the oversampled FFT pixels every visibility is gridded to.
+    weights_y
+        The y weights of the oversampled FFT pixels every visibility is gridded to.
+    indexes_x
+        The x indexes of the oversampled FFT pixels every visibility is gridded to.
+    weights_x
+        The x weights of the oversampled FFT pixels every visibility is gridded to.
+    total_chunks
+        The number of chunks the visibilities are divided into, where every chunk is gridded to a separate
+        oversampled grid such that the memory used is `total_chunks` times that of the returned grid.
+
+    Returns
+    -------
+    The gridded visibilities of shape [y_pixels, x_pixels, batch].
+    """
+    total_visibilities = indexes_y.shape[0]
+    width = indexes_y.shape[1]
+    batch = visibilities.shape[1]
+
+    grid_chunks = np.zeros(
+        (total_chunks, oversampled_shape[0], oversampled_shape[1], batch),
+        dtype=visibilities.dtype,
+    )
+
+    for chunk in numba.prange(total_chunks):
+
+        grid = grid_chunks[chunk]
+
+        for vis_1d_index in range(
+            chunk * total_visibilities // total_chunks,
+            (chunk + 1) * total_visibilities // total_chunks,
+        ):
+            for width_y_index in range(width):
+
+                y = indexes_y[vis_1d_index, width_y_index]
+                weight_y = weights_y[vis_1d_index, width_y_index]
+
+                for width_x_index in range(width):
+
+                    x = indexes_x[vis_1d_index, width_x_index]
+                    weight = weight_y * weights_x[vis_1d_index, width_x_index]
+
+                    for batch_index in range(batch):
+                        grid[y, x, batch_index] += (
+                            weight * visibilities[vis_1d_index, batch_index]
+                        )
+
+    for chunk in range(1, total_chunks):
+        grid_chunks[0] += grid_chunks[chunk]
+
+    return grid_chunks[0]
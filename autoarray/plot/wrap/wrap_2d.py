@@ -21,6 +21,7 @@ from autoarray.structures.grids.two_d.grid_2d_irregular import Grid2DIrregular
 from autoarray.structures.vectors.irregular import VectorYX2DIrregular
 
 from autoarray import exc
+from autoarray import numba_util
 
 
 class AbstractMatWrap2D(AbstractMatWrap):
@@ -885,7 +886,7 @@ class VoronoiNNDrawer(AbstractMatWrap2D):
             return
 
         interpolating_values = self.voronoiNN_interpolation_from(
-            voronoi=mapper.voronoi,
+            pixelization_grid=mapper.source_pixelization_grid,
             interpolating_yx=np.vstack((ys_grid_1d, xs_grid_1d)).T,
             pixel_values=values,
         )
@@ -920,30 +921,16 @@ class VoronoiNNDrawer(AbstractMatWrap2D):
         # plt.xlim([-0.6, 0.6])
         # plt.ylim([-0.6, 0.6])
 
-    def voronoiNN_interpolation_from(self, voronoi, interpolating_yx, pixel_values):
+    def voronoiNN_interpolation_from(
+        self, pixelization_grid, interpolating_yx, pixel_values
+    ):
 
-        try:
-            from autoarray.util.nn import nn_py
-        except ImportError as e:
-            raise ImportError(
-                "In order to use the VoronoiNN pixelization you must install the "
-                "Natural Neighbor Interpolation c package.\n\n"
-                ""
-                "See: https://github.com/Jammy2211/PyAutoArray/tree/master/autoarray/util/nn"
-            ) from e
-
-        pixel_points = voronoi.points
-
-        interpolating_values = nn_py.natural_interpolation(
-            pixel_points[:, 0],
-            pixel_points[:, 1],
-            pixel_values,
-            interpolating_yx[:, 1],
-            interpolating_yx[:, 0],
+        return pixelization_grid.nn_triangulation.interpolate_from(
+            z_in=pixel_values,
+            yx_target=interpolating_yx,
+            total_threads=numba_util.get_num_threads(),
         )
 
-        return interpolating_values
-
 
 class OriginScatter(GridScatter):
     """
@@ -0,0 +1,253 @@
+from collections import OrderedDict
+import hashlib
+import threading
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+
+def fingerprint_from(*args) -> str:
+    """
+    Returns a fingerprint of the input values, which is a short hash that is the same for two sets of inputs if (and,
+    up to hash collisions, only if) their values are the same.
+
+    A `np.ndarray` is hashed via its shape, data type and the bytes of its values, such that the fingerprint of a
+    large array (e.g. a mapping matrix) is computed in a single pass over its memory, which is much cheaper than the
+    calculation it is used to skip. Lists and tuples are hashed recursively and all other values via their `repr`,
+    meaning a fingerprint can itself be an input of a fingerprint (e.g. the fingerprint of a curvature matrix is
+    computed from the fingerprints of the mappers and noise-map it is computed from).
+
+    Parameters
+    ----------
+    args
+        The values which are fingerprinted, for example the arrays a calculation takes as inputs.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+
+    def update(value):
+
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            hasher.update(f"ndarray{value.shape}{value.dtype.str}".encode())
+            hasher.update(np.ascontiguousarray(value).data)
+        elif isinstance(value, np.ndarray):
+            update(value.tolist())
+        elif isinstance(value, (list, tuple)):
+            hasher.update(f"{type(value).__name__}{len(value)}".encode())
+            for item in value:
+                update(item)
+        else:
+            hasher.update(repr(value).encode())
+
+        hasher.update(b"|")
+
+    for arg in args:
+        update(arg)
+
+    return hasher.hexdigest()
+
+
+def nbytes_from(value, _depth: int = 0) -> int:
+    """
+    Returns an estimate of the memory (in bytes) used by a value stored in a `PreloadCache`, which is the memory of
+    the `np.ndarray`'s it contains, including those which are attributes of an object (e.g. the factorization of a
+    solver).
+
+    Sparse matrices and the SuperLU factorization of a `SolverSparse` store their values outside of any attribute
+    which is a `np.ndarray`, therefore the memory of their values and indexes is counted explicitly.
+    """
+    from scipy.sparse import issparse
+    from scipy.sparse.linalg import SuperLU
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+
+    if issparse(value):
+        value = value.tocsc()
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+
+    if isinstance(value, SuperLU):
+        return (
+            nbytes_from(value.L)
+            + nbytes_from(value.U)
+            + value.perm_r.nbytes
+            + value.perm_c.nbytes
+        )
+
+    if _depth > 2:
+        return 0
+
+    if isinstance(value, (list, tuple)):
+        return sum(nbytes_from(item, _depth=_depth + 1) for item in value)
+
+    if isinstance(value, dict):
+        return sum(nbytes_from(item, _depth=_depth + 1) for item in value.values())
+
+    if hasattr(value, "__dict__"):
+        return sum(
+            nbytes_from(item, _depth=_depth + 1) for item in vars(value).values()
+        )
+
+    return 0
+
+
+class PreloadCache:
+    def __init__(self, max_size_gb: float = 1.0):
+        """
+        A cache of the intermediate quantities of an inversion (e.g. the relocated grid, the mapping matrix of a
+        mapper, the blurred mapping matrix, curvature matrix and regularization matrix), where every quantity is
+        stored under a key which is a fingerprint of the inputs it is computed from (see `fingerprint_from`).
+
+        A quantity is therefore reused whenever the inputs it is computed from recur during a model-fit, irrespective
+        of which parameters of the model vary, as opposed to the `set_*` methods of the `Preloads`, which compare
+        the quantities of two fits before the model-fit and preload a quantity only if it is the same for both.
+
+        For example, if the mass model is fixed in a hyper search, the mapper fingerprint of every fit is the same and
+        the mapping matrix, blurred mapping matrix, curvature matrix and data vector are all computed once, whereas
+        the regularization matrix is recomputed for every new regularization coefficient.
+
+        The cache is passed to an inversion via the `cache` of its `Preloads`:
+
+        preloads = aa.Preloads(cache=aa.PreloadCache(max_size_gb=2.0))
+
+        The memory used by the cache is bounded by `max_size_gb`, where the least recently used quantities are
+        removed once it is exceeded. The number of hits and misses of every quantity are recorded (see `stats`),
+        which can be used to tune this size.
+
+        Parameters
+        ----------
+        max_size_gb
+            The maximum memory (in gigabytes) of the quantities stored in the cache.
+        """
+        self.max_size_gb = max_size_gb
+
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+        self._entry_dict: OrderedDict = OrderedDict()
+        self._nbytes = 0
+
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_lock")
+        state["_entry_dict"] = OrderedDict()
+        state["_nbytes"] = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entry_dict)
+
+    @property
+    def size_gb(self) -> float:
+        """
+        The memory (in gigabytes) of the quantities stored in the cache.
+        """
+        return self._nbytes / 1.0e9
+
+    def cached_from(self, name: str, key: str, func: Callable):
+        """
+        Returns the quantity `name` stored under the fingerprint `key` if it is in the cache and otherwise computes
+        it via `func`, stores it and returns it.
+
+        Quantities returned by the cache are shared between the inversions which use them and must therefore not be
+        modified in place.
+
+        Parameters
+        ----------
+        name
+            The name of the quantity (e.g. `curvature_matrix`), which the hits and misses are recorded under.
+        key
+            The fingerprint of the inputs the quantity is computed from.
+        func
+            The function (with no inputs) which computes the quantity.
+        """
+        entry_key = (name, key)
+
+        with self._lock:
+
+            if entry_key in self._entry_dict:
+
+                self._entry_dict.move_to_end(entry_key)
+                self.hits[name] = self.hits.get(name, 0) + 1
+
+                return self._entry_dict[entry_key][0]
+
+            self.misses[name] = self.misses.get(name, 0) + 1
+
+        value = func()
+
+        nbytes = nbytes_from(value)
+
+        if nbytes > self.max_size_gb * 1.0e9:
+            return value
+
+        with self._lock:
+
+            if entry_key not in self._entry_dict:
+
+                self._entry_dict[entry_key] = (value, nbytes)
+                self._nbytes += nbytes
+
+            while self._nbytes > self.max_size_gb * 1.0e9:
+
+                _, (_, removed_nbytes) = self._entry_dict.popitem(last=False)
+                self._nbytes -= removed_nbytes
+
+        return value
+
+    @property
+    def stats(self) -> Dict[str, Dict]:
+        """
+        The number of hits and misses and the hit rate of every quantity which has been requested from the cache.
+        """
+        stats = {}
+
+        for name in sorted(set(self.hits) | set(self.misses)):
+
+            hits = self.hits.get(name, 0)
+            misses = self.misses.get(name, 0)
+
+            stats[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses),
+            }
+
+        return stats
+
+    def clear(self):
+        """
+        Remove every quantity from the cache, which keeps its hit and miss statistics.
+        """
+        with self._lock:
+            self._entry_dict.clear()
+            self._nbytes = 0
+
+
+def cached_from(
+    cache: Optional[PreloadCache], name: str, key_func: Callable, func: Callable
+):
+    """
+    Returns a quantity via a `PreloadCache` if one is used and otherwise computes it, where the fingerprint of the
+    quantity's inputs is only computed if a cache is used.
+
+    Parameters
+    ----------
+    cache
+        The cache the quantity is stored in, or `None` if no cache is used.
+    name
+        The name of the quantity (e.g. `curvature_matrix`).
+    key_func
+        The function (with no inputs) which returns the fingerprint of the inputs the quantity is computed from.
+    func
+        The function (with no inputs) which computes the quantity.
+    """
+    if cache is None:
+        return func()
+
+    return cache.cached_from(name=name, key=key_func(), func=func)
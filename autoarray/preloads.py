@@ -1,11 +1,11 @@
 import logging
 import numpy as np
-from typing import List
+from typing import List, Optional
 
 from autoarray.inversion.linear_eqn.imaging import AbstractLEqImaging
+from autoarray.preload_cache import PreloadCache
 
 from autoarray import exc
-from autoarray.inversion.linear_eqn import leq_util
 
 
 logger = logging.getLogger(__name__)
@@ -24,12 +24,31 @@ class Preloads:
         operated_mapping_matrix=None,
         curvature_matrix_preload=None,
         curvature_matrix_counts=None,
+        curvature_matrix=None,
+        data_vector=None,
         regularization_matrix=None,
         log_det_regularization_matrix_term=None,
+        curvature_reg_eigen=None,
         traced_sparse_grids_list_of_planes=None,
         sparse_image_plane_grid_list=None,
+        cache: Optional[PreloadCache] = None,
     ):
+        """
+        Quantities of the inversion of a model-fit which are preloaded, such that they are not recomputed for every
+        fit.
+
+        Most quantities are preloaded via a `set_*` method, which compares the quantity of two fits corresponding to
+        two model instances and preloads it if it is the same for both.
 
+        A `PreloadCache` can also be passed via `cache`, which stores the intermediate quantities of every inversion
+        under fingerprints of their inputs and reuses them whenever these inputs recur, without fits having to be
+        compared beforehand.
+
+        Parameters
+        ----------
+        cache
+            The cache of inversion quantities keyed on fingerprints of their inputs, which is not used if `None`.
+        """
         self.w_tilde = w_tilde
         self.use_w_tilde = use_w_tilde
 
@@ -39,12 +58,17 @@ class Preloads:
         self.operated_mapping_matrix = operated_mapping_matrix
         self.curvature_matrix_preload = curvature_matrix_preload
         self.curvature_matrix_counts = curvature_matrix_counts
+        self.curvature_matrix = curvature_matrix
+        self.data_vector = data_vector
         self.regularization_matrix = regularization_matrix
         self.log_det_regularization_matrix_term = log_det_regularization_matrix_term
+        self.curvature_reg_eigen = curvature_reg_eigen
 
         self.traced_sparse_grids_list_of_planes = traced_sparse_grids_list_of_planes
         self.sparse_image_plane_grid_list = sparse_image_plane_grid_list
 
+        self.cache = cache
+
     def set_w_tilde_imaging(self, fit_0, fit_1):
         """
         The w-tilde linear algebra formalism speeds up inversions by computing beforehand quantities that enable
@@ -75,19 +99,13 @@ class Preloads:
 
             logger.info("PRELOADS - Computing W-Tilde... May take a moment.")
 
-            from autoarray.dataset.imaging import WTildeImaging
+            from autoarray.dataset.imaging import w_tilde_imaging_from
 
-            preload, indexes, lengths = leq_util.w_tilde_curvature_preload_imaging_from(
-                noise_map_native=fit_0.noise_map.native,
-                kernel_native=fit_0.dataset.psf.native,
-                native_index_for_slim_index=fit_0.dataset.mask.native_index_for_slim_index,
-            )
-
-            self.w_tilde = WTildeImaging(
-                curvature_preload=preload,
-                indexes=indexes.astype("int"),
-                lengths=lengths.astype("int"),
-                noise_map_value=fit_0.noise_map[0],
+            self.w_tilde = w_tilde_imaging_from(
+                noise_map=fit_0.noise_map,
+                psf=fit_0.dataset.psf,
+                mask=fit_0.dataset.mask,
+                w_tilde_cache=fit_0.dataset.settings.w_tilde_cache,
             )
 
             self.use_w_tilde = True
@@ -249,6 +267,157 @@ class Preloads:
                     "PRELOADS - LEq linear algebra quantities preloaded for this model-fit."
                 )
 
+    def set_curvature_matrix(self, fit_0, fit_1):
+        """
+        If the `MassProfile`'s, `Pixelization`'s and noise-map in a model are fixed, the curvature matrix F of the
+        linear algebra does not change during the model-fit and can be preloaded, such that changing only the
+        regularization coefficients does not recompute it.
+
+        This function compares the curvature matrix of two fit's corresponding to two model instances, and preloads
+        it if the curvature matrix of both fits are the same.
+
+        The preload is typically used in hyper searches, where the mass model and pixelization are fixed and the
+        regularization coefficients are varied.
+
+        Parameters
+        ----------
+        fit_0
+            The first fit corresponding to a model with a specific set of unit-values.
+        fit_1
+            The second fit corresponding to a model with a different set of unit-values.
+        """
+        self.curvature_matrix = None
+
+        from autoarray.inversion.inversion.linear_operator import (
+            InversionLinearOperator,
+        )
+
+        if isinstance(fit_0.inversion, InversionLinearOperator):
+            return
+
+        inversion_0 = fit_0.inversion
+        inversion_1 = fit_1.inversion
+
+        if inversion_0 is None:
+            return
+
+        curvature_matrix_0 = np.copy(inversion_0.curvature_matrix)
+        curvature_matrix_1 = inversion_1.curvature_matrix
+
+        if curvature_matrix_0.shape == curvature_matrix_1.shape:
+
+            if np.max(abs(curvature_matrix_0 - curvature_matrix_1)) < 1e-8:
+
+                self.curvature_matrix = curvature_matrix_0
+
+                logger.info(
+                    "PRELOADS - LEq Curvature Matrix preloaded for this model-fit."
+                )
+
+    def set_data_vector(self, fit_0, fit_1):
+        """
+        If the `MassProfile`'s, `Pixelization`'s, noise-map and the image fitted by an inversion (e.g. after
+        subtracting the light profiles) are fixed in a model, the data vector D of the linear algebra does not change
+        during the model-fit and can be preloaded.
+
+        This function compares the data vector of two fit's corresponding to two model instances, and preloads it if
+        the data vector of both fits are the same.
+
+        The preload is typically used in hyper searches, where the mass model, light profiles and pixelization are
+        fixed and the regularization coefficients are varied.
+
+        Parameters
+        ----------
+        fit_0
+            The first fit corresponding to a model with a specific set of unit-values.
+        fit_1
+            The second fit corresponding to a model with a different set of unit-values.
+        """
+        self.data_vector = None
+
+        from autoarray.inversion.inversion.linear_operator import (
+            InversionLinearOperator,
+        )
+
+        if isinstance(fit_0.inversion, InversionLinearOperator):
+            return
+
+        inversion_0 = fit_0.inversion
+        inversion_1 = fit_1.inversion
+
+        if inversion_0 is None:
+            return
+
+        if inversion_0.data_vector.shape == inversion_1.data_vector.shape:
+
+            if np.max(abs(inversion_0.data_vector - inversion_1.data_vector)) < 1e-8:
+
+                self.data_vector = inversion_0.data_vector
+
+                logger.info("PRELOADS - LEq Data Vector preloaded for this model-fit.")
+
+    def set_curvature_reg_eigen(self, fit_0, fit_1):
+        """
+        If the curvature matrix is preloaded (see `set_curvature_matrix`) but the regularization matrix changes
+        between fits because only the regularization coefficients vary, the generalized eigendecomposition of the
+        change in regularization matrix and the `curvature_reg_matrix` can be preloaded. This is used to compute the
+        reconstruction and log determinant of the `curvature_reg_matrix` of every subsequent fit in O(n^2) operations
+        as opposed to the O(n^3) of factorizing it (see `CurvatureRegEigen`).
+
+        This function therefore requires the curvature matrix to be preloaded and the regularization matrices of the
+        two fits to be different, and should be called after `set_curvature_matrix`.
+
+        The preload is typically used in hyper searches, where the mass model and pixelization are fixed and the
+        regularization coefficients are varied.
+
+        Parameters
+        ----------
+        fit_0
+            The first fit corresponding to a model with a specific set of unit-values.
+        fit_1
+            The second fit corresponding to a model with a different set of unit-values.
+        """
+        self.curvature_reg_eigen = None
+
+        if self.curvature_matrix is None:
+            return
+
+        inversion_0 = fit_0.inversion
+        inversion_1 = fit_1.inversion
+
+        if inversion_0 is None:
+            return
+
+        regularization_matrix_0 = inversion_0.regularization_matrix
+        regularization_matrix_1 = inversion_1.regularization_matrix
+
+        if regularization_matrix_0.shape != regularization_matrix_1.shape:
+            return
+
+        regularization_matrix_change = regularization_matrix_1 - regularization_matrix_0
+
+        if np.max(abs(regularization_matrix_change)) < 1e-8:
+            return
+
+        from autoarray.inversion.inversion.solver import CurvatureRegEigen
+
+        logger.info(
+            "PRELOADS - Computing Curvature Reg Matrix Eigendecomposition... May take a moment."
+        )
+
+        try:
+            self.curvature_reg_eigen = CurvatureRegEigen(
+                curvature_reg_matrix=self.curvature_matrix + regularization_matrix_0,
+                regularization_matrix=regularization_matrix_0,
+                regularization_matrix_change=regularization_matrix_change,
+            )
+        except exc.InversionException:
+            return
+
+        logger.info(
+            "PRELOADS - Curvature Reg Matrix Eigendecomposition preloaded for this model-fit."
+        )
+
     def set_regularization_matrix_and_term(self, fit_0, fit_1):
         """
         If the `MassProfile`'s and `Pixelization`'s in a model are fixed, the mapping of image-pixels to the
@@ -333,8 +502,14 @@ class Preloads:
         self.operated_mapping_matrix = None
         self.curvature_matrix_preload = None
         self.curvature_matrix_counts = None
+        self.curvature_matrix = None
+        self.data_vector = None
         self.regularization_matrix = None
         self.log_det_regularization_matrix_term = None
+        self.curvature_reg_eigen = None
+
+        if self.cache is not None:
+            self.cache.clear()
 
     @property
     def info(self) -> List[str]:
@@ -354,9 +529,21 @@ class Preloads:
         line += [
             f"Curvature Matrix Sparse = {self.curvature_matrix_preload is not None}\n"
         ]
+        line += [f"Curvature Matrix = {self.curvature_matrix is not None}\n"]
+        line += [f"Data Vector = {self.data_vector is not None}\n"]
         line += [f"Regularization Matrix = {self.regularization_matrix is not None}\n"]
         line += [
             f"Log Det Regularization Matrix Term = {self.log_det_regularization_matrix_term is not None}\n"
         ]
+        line += [
+            f"Curvature Reg Matrix Eigen = {self.curvature_reg_eigen is not None}\n"
+        ]
+
+        if self.cache is not None:
+
+            for name, stats in self.cache.stats.items():
+                line += [
+                    f"Cache {name} = {stats['hits']} hits, {stats['misses']} misses\n"
+                ]
 
         return line
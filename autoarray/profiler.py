@@ -0,0 +1,267 @@
+from contextlib import contextmanager
+from contextlib import nullcontext
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+
+class Span:
+    def __init__(self, name: str, parent: Optional["Span"] = None):
+        """
+        A span of a `Profiler`, which records the wall time, CPU time and (optionally) memory allocated by one call
+        of a profiled function.
+
+        Spans are nested, such that a span's children are the profiled functions called inside it.
+
+        Parameters
+        ----------
+        name
+            The name of the profiled function.
+        parent
+            The span of the profiled function this function is called inside, which is `None` for a root span.
+        """
+        self.name = name
+        self.parent = parent
+        self.children: List["Span"] = []
+
+        self.thread_id = threading.get_ident()
+
+        self.start = 0.0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+        self.allocated_bytes: Optional[int] = None
+        self.peak_allocated_bytes: Optional[int] = None
+
+        self._peak_traced_memory = 0
+
+    @property
+    def self_time(self) -> float:
+        """
+        The wall time of the span excluding the wall time of its children.
+        """
+        return self.wall_time - sum(child.wall_time for child in self.children)
+
+    @property
+    def dict(self) -> Dict:
+        """
+        The span and its children as a nested dictionary, which is used to output the profile as a .json file.
+        """
+        span_dict = {
+            "name": self.name,
+            "wall_time": self.wall_time,
+            "self_time": self.self_time,
+            "cpu_time": self.cpu_time,
+        }
+
+        if self.allocated_bytes is not None:
+            span_dict["allocated_bytes"] = self.allocated_bytes
+            span_dict["peak_allocated_bytes"] = self.peak_allocated_bytes
+
+        span_dict["children"] = [child.dict for child in self.children]
+
+        return span_dict
+
+
+class Profiler(dict):
+    def __init__(self, trace_allocations: bool = False):
+        """
+        A hierarchical profiler, which records a tree of `Span` objects for every call of a function decorated with
+        `profile_func` (e.g. the `log_likelihood` of a fit, the `curvature_matrix` of an inversion or the
+        `pix_sub_weights` of a mapper), where each span is timed once.
+
+        The profiler is passed through the same `profiling_dict` input as a dictionary, for example:
+
+        profiler = aa.Profiler()
+
+        fit = aa.FitImaging(dataset=dataset, fit=fit_data, profiling_dict=profiler)
+        fit.figure_of_merit
+
+        profiler.output_to_chrome_trace(file_path="profile.json")
+
+        Because the profiler is a dictionary it is also filled with the same entries as a profiling dictionary, where
+        the key of every call is the function name followed by a count of its calls (e.g. `curvature_matrix_0`) and
+        the value is the span's `self_time` (its wall time excluding that of the profiled functions it calls).
+
+        Parameters
+        ----------
+        trace_allocations
+            If `True`, the memory allocated by every span is recorded via `tracemalloc`, which slows down the
+            profiled code.
+        """
+        super().__init__()
+
+        self.trace_allocations = trace_allocations
+
+        self.spans: List[Span] = []
+        self.call_counts: Dict[str, int] = {}
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_local")
+        state.pop("_lock")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+
+        return stack
+
+    @contextmanager
+    def span(self, name: str):
+        """
+        Context manager which records a span of the code inside it, which is used by `profile_func` and can be used
+        directly to profile code which is not a decorated function.
+
+        Parameters
+        ----------
+        name
+            The name of the span.
+        """
+        stack = self._stack
+
+        parent = stack[-1] if stack else None
+
+        span = Span(name=name, parent=parent)
+
+        if self.trace_allocations:
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            allocated_start, peak = tracemalloc.get_traced_memory()
+
+            if parent is not None:
+                parent._peak_traced_memory = max(parent._peak_traced_memory, peak)
+
+            tracemalloc.reset_peak()
+
+        stack.append(span)
+
+        span.start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            yield span
+        finally:
+            span.wall_time = time.perf_counter() - span.start
+            span.cpu_time = time.process_time() - cpu_start
+
+            stack.pop()
+
+            if self.trace_allocations:
+
+                allocated_end, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, span._peak_traced_memory)
+
+                span.allocated_bytes = allocated_end - allocated_start
+                span.peak_allocated_bytes = peak - allocated_start
+
+                if parent is not None:
+                    parent._peak_traced_memory = max(parent._peak_traced_memory, peak)
+
+            with self._lock:
+
+                if parent is None:
+                    self.spans.append(span)
+                else:
+                    parent.children.append(span)
+
+                call_count = self.call_counts.get(name, 0)
+                self.call_counts[name] = call_count + 1
+
+                self[f"{name}_{call_count}"] = span.self_time
+
+    @property
+    def dict(self) -> Dict:
+        """
+        Every root span and its children as a nested dictionary.
+        """
+        return {"spans": [span.dict for span in self.spans]}
+
+    def output_to_json(self, file_path: str):
+        """
+        Output the tree of spans to a .json file (see `dict`).
+        """
+        with open(file_path, "w") as f:
+            json.dump(self.dict, f, indent=4)
+
+    @property
+    def chrome_trace_dict(self) -> Dict:
+        """
+        The spans in the Chrome trace event format, which can be viewed in a browser via `chrome://tracing` or
+        https://ui.perfetto.dev.
+        """
+        events = []
+
+        pid = os.getpid()
+
+        origin = min((span.start for span in self.spans), default=0.0)
+
+        def add_events(span: Span):
+
+            args = {"cpu_time": span.cpu_time, "self_time": span.self_time}
+
+            if span.allocated_bytes is not None:
+                args["allocated_bytes"] = span.allocated_bytes
+                args["peak_allocated_bytes"] = span.peak_allocated_bytes
+
+            events.append(
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": (span.start - origin) * 1.0e6,
+                    "dur": span.wall_time * 1.0e6,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+
+            for child in span.children:
+                add_events(child)
+
+        for span in self.spans:
+            add_events(span)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def output_to_chrome_trace(self, file_path: str):
+        """
+        Output the spans to a .json file in the Chrome trace event format (see `chrome_trace_dict`).
+        """
+        with open(file_path, "w") as f:
+            json.dump(self.chrome_trace_dict, f)
+
+
+def span_from(profiling_dict: Optional[Dict], name: str):
+    """
+    Returns a context manager which records a span of the code inside it if the `profiling_dict` is a `Profiler`,
+    and otherwise does nothing, which is used to profile code which is not a function decorated with `profile_func`.
+
+    Parameters
+    ----------
+    profiling_dict
+        The profiling dictionary, which records the span if it is a `Profiler`.
+    name
+        The name of the span.
+    """
+    if isinstance(profiling_dict, Profiler):
+        return profiling_dict.span(name=name)
+    return nullcontext()
@@ -0,0 +1,243 @@
+import copyreg
+from contextlib import contextmanager
+import numpy as np
+import os
+from os import path
+import shutil
+import tempfile
+import uuid
+import weakref
+from typing import Dict, Optional, Tuple
+
+"""
+The `SharedBuffers` used to pickle the buffers of arrays as memory mapped files, which is set via the
+`shared_buffers` context manager. If `None`, arrays are pickled with a copy of their buffer.
+"""
+_shared_buffers = None
+
+
+def default_shared_buffer_path() -> str:
+    """
+    The directory memory mapped files are written to, which is a RAM backed file system where available such that
+    the files are never written to hard-disk.
+    """
+    if path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+class SharedBuffers:
+    def __init__(
+        self,
+        shared_buffer_path: Optional[str] = None,
+        min_size_bytes: int = 1000000,
+        mmap_mode: str = "r",
+    ):
+        """
+        Writes the buffers of large arrays to memory mapped files, such that pickling an array (or a structure, mask,
+        dataset or preloads containing arrays) pickles a lightweight handle to the file as opposed to a copy of its
+        buffer.
+
+        This is used when sending datasets and preloads to the worker processes of a parallel non-linear search, which
+        otherwise copies the data, noise-map, PSF, grids and masks for every worker and every job. Every worker
+        instead maps the same file into memory, meaning the arrays share physical memory across processes and loading
+        them is near instantaneous.
+
+        Every array is written to a file once, the first time it is pickled, and its file is reused every time it is
+        pickled again. An array must therefore not be modified in-place after it is first pickled, as workers will
+        load the array as it was when it was first pickled.
+
+        Arrays are only written to files by the process which created the `SharedBuffers`, such that worker processes
+        started via a fork pickle their outputs as normal.
+
+        Parameters
+        ----------
+        shared_buffer_path
+            The directory the memory mapped files are written to, in a new temporary directory which is removed
+            by `close`. Defaults to `/dev/shm` if available, otherwise the system's temporary directory.
+        min_size_bytes
+            Arrays whose buffers are smaller than this number of bytes are pickled as normal.
+        mmap_mode
+            The mode arrays are memory mapped with when unpickled, where `r` maps them as read-only arrays and `c`
+            maps them copy-on-write, such that in-place changes are private to each process.
+        """
+        self.path = tempfile.mkdtemp(
+            prefix="autoarray_shared_",
+            dir=shared_buffer_path or default_shared_buffer_path(),
+        )
+        self.min_size_bytes = min_size_bytes
+        self.mmap_mode = mmap_mode
+
+        self.pid = os.getpid()
+
+        self.file_path_dict: Dict[int, Tuple[weakref.ref, str]] = {}
+
+    def file_path_from(self, array: np.ndarray) -> Optional[str]:
+        """
+        Returns the path of the memory mapped file of an array, writing the array to a new file the first time it is
+        pickled.
+
+        Returns `None` if the array should be pickled as normal, because it is below `min_size_bytes`, cannot be
+        referenced weakly, is an object array or this is not the process which created the `SharedBuffers`.
+
+        Parameters
+        ----------
+        array
+            The array which is pickled.
+        """
+        if (
+            os.getpid() != self.pid
+            or array.nbytes < self.min_size_bytes
+            or array.dtype.hasobject
+        ):
+            return None
+
+        entry = self.file_path_dict.get(id(array))
+
+        if entry is not None and entry[0]() is array:
+            return entry[1]
+
+        try:
+            array_ref = weakref.ref(array)
+        except TypeError:
+            return None
+
+        file_path = path.join(self.path, f"{uuid.uuid4().hex}.npy")
+
+        np.save(file_path, np.asarray(array))
+
+        self.file_path_dict[id(array)] = (array_ref, file_path)
+
+        return file_path
+
+    def close(self):
+        """
+        Remove every memory mapped file.
+
+        On POSIX systems, arrays which have already been loaded by other processes remain valid after their files are
+        removed.
+        """
+        self.file_path_dict = {}
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def array_from(file_path: str, mmap_mode: str) -> np.ndarray:
+    return np.load(file_path, mmap_mode=mmap_mode)
+
+
+def structure_from(cls, file_path: str, mmap_mode: str, class_dict: Dict):
+    """
+    Returns a structure (e.g. an `Array2D`, `Grid2D` or `Mask2D`) whose buffer is a view of a memory mapped file,
+    with its attributes (e.g. its mask) set from the pickled dictionary of attributes.
+
+    Parameters
+    ----------
+    cls
+        The class of the structure.
+    file_path
+        The path of the memory mapped file of the structure's buffer.
+    mmap_mode
+        The mode the file is memory mapped with.
+    class_dict
+        The attributes of the structure.
+    """
+    structure = array_from(file_path=file_path, mmap_mode=mmap_mode).view(cls)
+
+    for key, value in class_dict.items():
+        setattr(structure, key, value)
+
+    return structure
+
+
+def structure_reduce_from(
+    structure: np.ndarray, class_dict: Optional[Dict] = None
+) -> Optional[Tuple]:
+    """
+    Returns the tuple which pickles a structure as a handle to the memory mapped file of its buffer and its
+    dictionary of attributes, which is used by the `__reduce__` method of every structure.
+
+    Returns `None` if shared buffers are not used, in which case the structure is pickled with a copy of its buffer.
+
+    Parameters
+    ----------
+    structure
+        The structure (e.g. an `Array2D`, `Grid2D` or `Mask2D`) which is pickled.
+    class_dict
+        The attributes of the structure which are pickled, where all of its attributes are pickled if `None`.
+    """
+    if _shared_buffers is None:
+        return None
+
+    file_path = _shared_buffers.file_path_from(array=structure)
+
+    if file_path is None:
+        return None
+
+    return (
+        structure_from,
+        (
+            type(structure),
+            file_path,
+            _shared_buffers.mmap_mode,
+            dict(structure.__dict__) if class_dict is None else class_dict,
+        ),
+    )
+
+
+def _reduce_ndarray(array: np.ndarray):
+
+    file_path = _shared_buffers.file_path_from(array=array)
+
+    if file_path is None:
+        return array.__reduce__()
+
+    return array_from, (file_path, _shared_buffers.mmap_mode)
+
+
+@contextmanager
+def shared_buffers(
+    shared_buffer_path: Optional[str] = None,
+    min_size_bytes: int = 1000000,
+    mmap_mode: str = "r",
+):
+    """
+    Context manager within which arrays, structures and masks are pickled as handles to memory mapped files of their
+    buffers (see `SharedBuffers`), for example:
+
+    with aa.shared_buffers():
+        pool.map(func, [(dataset, preloads, job) for job in job_list])
+
+    The files are removed on exiting the context manager, therefore the worker processes must unpickle every object
+    before it exits.
+
+    Parameters
+    ----------
+    shared_buffer_path
+        The directory the memory mapped files are written to.
+    min_size_bytes
+        Arrays whose buffers are smaller than this number of bytes are pickled as normal.
+    mmap_mode
+        The mode arrays are memory mapped with when unpickled (`r` for read-only, `c` for copy-on-write).
+    """
+    global _shared_buffers
+
+    previous_shared_buffers = _shared_buffers
+    previous_reducer = copyreg.dispatch_table.get(np.ndarray)
+
+    _shared_buffers = SharedBuffers(
+        shared_buffer_path=shared_buffer_path,
+        min_size_bytes=min_size_bytes,
+        mmap_mode=mmap_mode,
+    )
+    copyreg.pickle(np.ndarray, _reduce_ndarray)
+
+    try:
+        yield _shared_buffers
+    finally:
+        _shared_buffers.close()
+        _shared_buffers = previous_shared_buffers
+
+        if previous_reducer is None:
+            copyreg.dispatch_table.pop(np.ndarray, None)
+        else:
+            copyreg.dispatch_table[np.ndarray] = previous_reducer
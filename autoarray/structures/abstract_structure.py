@@ -2,6 +2,8 @@ import numpy as np
 from os import path
 import pickle
 
+from autoarray import shared_buffer
+
 
 class AbstractStructure(np.ndarray):
     def __array_finalize__(self, obj):
@@ -14,6 +16,11 @@ class AbstractStructure(np.ndarray):
 
     def __reduce__(self):
 
+        shared_buffer_reduce = shared_buffer.structure_reduce_from(structure=self)
+
+        if shared_buffer_reduce is not None:
+            return shared_buffer_reduce
+
         # Get the parent's __reduce__ tuple
         pickled_state = super().__reduce__()
 
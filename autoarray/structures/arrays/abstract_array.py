@@ -1,5 +1,4 @@
 import logging
-from astropy import time
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
 
@@ -54,6 +53,8 @@ class Header:
 
     @property
     def modified_julian_date(self) -> Optional[str]:
+        from astropy import time
+
         if (
             self.date_of_observation is not None
             and self.time_of_observation is not None
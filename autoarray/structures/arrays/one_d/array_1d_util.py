@@ -1,6 +1,5 @@
 import os
 import numpy as np
-from astropy.io import fits
 
 from autoarray import numba_util
 from autoarray.mask import mask_1d_util
@@ -167,6 +166,8 @@ def numpy_array_1d_to_fits(
     numpy_array_to_fits(array_2d=array_2d, file_path='/path/to/file/filename.fits', overwrite=True)
     """
 
+    from astropy.io import fits
+
     file_dir = os.path.split(file_path)[0]
 
     if not os.path.exists(file_dir):
@@ -203,5 +204,8 @@ def numpy_array_1d_via_fits_from(file_path: str, hdu: int):
     --------
     array_2d = numpy_array_via_fits(file_path='/path/to/file/filename.fits', hdu=0)
     """
+
+    from astropy.io import fits
+
     hdu_list = fits.open(file_path)
     return np.array(hdu_list[hdu].data)
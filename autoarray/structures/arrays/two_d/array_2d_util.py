@@ -1,4 +1,3 @@
-from astropy.io import fits
 from functools import wraps
 import inspect
 import numpy as np
@@ -8,6 +7,7 @@ from typing import Tuple
 from autoconf import conf
 from autoarray import numba_util
 from autoarray.mask import mask_2d_util
+from autoarray.mask.mask_2d_index import mask_2d_index_from
 
 
 @numba_util.jit()
@@ -403,9 +403,9 @@ def array_2d_native_from(
 
     sub_shape = (mask_2d.shape[0] * sub_size, mask_2d.shape[1] * sub_size)
 
-    native_index_for_slim_index_2d = mask_2d_util.native_index_for_slim_index_2d_from(
+    native_index_for_slim_index_2d = mask_2d_index_from(
         mask_2d=mask_2d, sub_size=sub_size
-    ).astype("int")
+    ).sub_mask_index_for_sub_mask_1d_index
 
     return array_2d_via_indexes_from(
         array_2d_slim=array_2d_slim,
@@ -582,6 +582,8 @@ def numpy_array_2d_to_fits(
     numpy_array_to_fits(array_2d=array_2d, file_path='/path/to/file/filename.fits', overwrite=True)
     """
 
+    from astropy.io import fits
+
     file_dir = os.path.split(file_path)[0]
 
     if not os.path.exists(file_dir):
@@ -628,6 +630,9 @@ def numpy_array_2d_via_fits_from(
     --------
     array_2d = numpy_array_2d_via_fits_from(file_path='/path/to/file/filename.fits', hdu=0)
     """
+
+    from astropy.io import fits
+
     hdu_list = fits.open(file_path, do_not_scale_image_data=do_not_scale_image_data)
 
     flip_for_ds9 = conf.instance["general"]["fits"]["flip_for_ds9"]
@@ -662,6 +667,9 @@ def header_obj_from(file_path: str, hdu: int):
     --------
     array_2d = numpy_array_2d_via_fits_from(file_path='/path/to/file/filename.fits', hdu=0)
     """
+
+    from astropy.io import fits
+
     hdu_list = fits.open(file_path)
 
     return hdu_list[hdu].header
@@ -433,6 +433,19 @@ class AbstractGrid2D(AbstractStructure2D):
         """
         return self[self.mask.sub_border_flat_indexes]
 
+    @cached_property
+    def sub_border_grid_tree(self) -> "cKDTree":
+        """
+        A KD-tree of the (y,x) coordinates of the `sub_border_grid`, which is used to find the nearest border pixel
+        of every coordinate of a grid which is relocated to the border in O(log(N_border)) operations.
+
+        The KD-tree is computed once and reused for every grid that is relocated (e.g. every model-fit of a
+        non-linear search).
+        """
+        from scipy.spatial import cKDTree
+
+        return cKDTree(np.asarray(self.sub_border_grid))
+
     def relocated_grid_from(self, grid: "Grid2D") -> "Grid2D":
         """
         Relocate the coordinates of a grid to the border of this grid if they are outside the border, where the
@@ -442,7 +455,7 @@ class AbstractGrid2D(AbstractStructure2D):
 
         1: Use the mean value of the grid's y and x coordinates to determine the origin of the grid.
         2: Compute the radial distance of every grid coordinate from the origin.
-        3: For every coordinate, find its nearest pixel in the border.
+        3: For every coordinate, find its nearest pixel in the border (via the KD-tree `sub_border_grid_tree`).
         4: Determine if it is outside the border, by comparing its radial distance from the origin to its paired
         border pixel's radial distance.
         5: If its radial distance is larger, use the ratio of radial distances to move the coordinate to the
@@ -463,8 +476,10 @@ class AbstractGrid2D(AbstractStructure2D):
             return grid
 
         return Grid2D(
-            grid=grid_2d_util.relocated_grid_via_jit_from(
-                grid=grid, border_grid=self.sub_border_grid
+            grid=grid_2d_util.relocated_grid_via_kd_tree_from(
+                grid=grid,
+                border_grid=self.sub_border_grid,
+                border_grid_tree=self.sub_border_grid_tree,
             ),
             mask=grid.mask,
             sub_size=grid.mask.sub_size,
@@ -491,8 +506,10 @@ class AbstractGrid2D(AbstractStructure2D):
             return pixelization_grid
 
         return Grid2DSparse(
-            grid=grid_2d_util.relocated_grid_via_jit_from(
-                grid=pixelization_grid, border_grid=self.sub_border_grid
+            grid=grid_2d_util.relocated_grid_via_kd_tree_from(
+                grid=pixelization_grid,
+                border_grid=self.sub_border_grid,
+                border_grid_tree=self.sub_border_grid_tree,
             ),
             sparse_index_for_slim_index=pixelization_grid.sparse_index_for_slim_index,
         )
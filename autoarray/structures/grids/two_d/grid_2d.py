@@ -1,5 +1,4 @@
 import numpy as np
-from sklearn.cluster import KMeans
 from typing import List, Optional, Tuple, Union
 import warnings
 
@@ -14,6 +13,7 @@ from autoarray.structures.arrays.two_d import array_2d_util
 from autoarray.structures.grids.two_d import grid_2d_util
 from autoarray.geometry import geometry_util
 from autoarray.mask.mask_2d import mask_2d_util
+from autoarray.structures.grids.two_d import sparse_kmeans
 from autoarray.structures.grids.two_d import sparse_util
 
 from autoarray import type as ty
@@ -984,6 +984,8 @@ class Grid2DSparse(AbstractGrid2D):
         max_iter: int = 5,
         seed: Optional[int] = None,
         stochastic: bool = False,
+        warm_start: bool = False,
+        mini_batch_size: Optional[int] = None,
     ) -> "Grid2DSparse":
         """
         Calculate a Grid2DSparse from a Grid2D and weight map.
@@ -1010,6 +1012,13 @@ class Grid2DSparse(AbstractGrid2D):
         stochastic : bool
             If True, the random number seed is randommly chosen every time the function is called, ensuring every
             pixel-grid is randomly determined and thus stochastic.
+        warm_start
+            If True, the KMeans algorithm is initialized from the cluster centres of the previous call with the same
+            grid and total pixels, which converges in far fewer iterations when the weight map changes only slightly
+            between calls (e.g. in a hyper search).
+        mini_batch_size
+            If input, a weighted mini-batch KMeans algorithm is used which updates the cluster centres with random
+            batches of this many coordinates, which is faster for large masks.
         """
 
         warnings.filterwarnings("ignore")
@@ -1020,22 +1029,22 @@ class Grid2DSparse(AbstractGrid2D):
         if total_pixels > grid.shape[0]:
             raise exc.GridException
 
-        kmeans = KMeans(
-            n_clusters=int(total_pixels),
-            random_state=seed,
-            n_init=n_iter,
-            max_iter=max_iter,
-        )
-
         try:
-            kmeans = kmeans.fit(X=grid.binned, sample_weight=weight_map)
+            cluster_centers, labels = sparse_kmeans.cluster_centers_and_labels_from(
+                grid=grid.binned,
+                weight_map=weight_map,
+                total_pixels=total_pixels,
+                n_iter=n_iter,
+                max_iter=max_iter,
+                seed=seed,
+                use_cache=seed is not None and not stochastic,
+                warm_start=warm_start,
+                mini_batch_size=mini_batch_size,
+            )
         except ValueError or OverflowError:
             raise exc.InversionException()
 
-        return Grid2DSparse(
-            grid=kmeans.cluster_centers_,
-            sparse_index_for_slim_index=kmeans.labels_.astype("int"),
-        )
+        return Grid2DSparse(grid=cluster_centers, sparse_index_for_slim_index=labels)
 
     @property
     def total_sparse_pixels(self) -> int:
@@ -6,13 +6,22 @@ import pickle
 from typing import List, Optional, Tuple, Union
 import json
 
+from autoconf import cached_property
+
 from autoarray.structures.arrays.values import ValuesIrregular
 
 from autoarray import exc
+from autoarray import shared_buffer
 from autoarray.mask.mask_2d import Mask2D
 from autoarray.structures.grids.two_d import grid_2d_util
 from autoarray.geometry import geometry_util
 
+# The number of pairs of coordinates whose distances are computed (e.g. the number of coordinates of a
+# `Grid2DIrregular` multiplied by the number of coordinates of the grid it is paired with) above which the closest and
+# furthest coordinates of a `Grid2DIrregular` are found via its KD-tree and convex hull, as opposed to computing the
+# distance of every pair in a single NumPy calculation.
+distance_pairs_threshold = 10000
+
 
 class Grid2DIrregular(np.ndarray):
     def __new__(cls, grid: Union[np.ndarray, List]):
@@ -53,6 +62,12 @@ class Grid2DIrregular(np.ndarray):
         return obj
 
     def __reduce__(self):
+
+        shared_buffer_reduce = shared_buffer.structure_reduce_from(structure=self)
+
+        if shared_buffer_reduce is not None:
+            return shared_buffer_reduce
+
         # Get the parent's __reduce__ tuple
         pickled_state = super().__reduce__()
         # Create our own tuple to pass to __setstate__
@@ -251,8 +266,10 @@ class Grid2DIrregular(np.ndarray):
             coordinate
                 The (y,x) coordinate from which the squared distance of every *Coordinate* is computed.
         """
-        squared_distances = np.square(self[:, 0] - coordinate[0]) + np.square(
-            self[:, 1] - coordinate[1]
+        grid = np.asarray(self)
+
+        squared_distances = np.square(grid[:, 0] - coordinate[0]) + np.square(
+            grid[:, 1] - coordinate[1]
         )
         return self.values_from(array_slim=squared_distances)
 
@@ -267,9 +284,117 @@ class Grid2DIrregular(np.ndarray):
             coordinate
                 The (y,x) coordinate from which the distance of every *Coordinate* is computed.
         """
-        distances = np.sqrt(self.squared_distances_to_coordinate(coordinate=coordinate))
+        grid = np.asarray(self)
+
+        distances = np.hypot(grid[:, 0] - coordinate[0], grid[:, 1] - coordinate[1])
         return self.values_from(array_slim=distances)
 
+    @cached_property
+    def kd_tree(self) -> "cKDTree":
+        """
+        A KD-tree of the (y,x) coordinates of the grid, which finds the closest coordinates of the grid to other
+        coordinates in O(log(N)) operations per coordinate.
+
+        The KD-tree is built the first time it is used and reused for every subsequent query of the grid (e.g. when a
+        point solver pairs many grids with the same grid), therefore the grid must not be changed in-place after it
+        is queried.
+        """
+        from scipy.spatial import cKDTree
+
+        return cKDTree(np.asarray(self))
+
+    @cached_property
+    def convex_hull_grid(self) -> np.ndarray:
+        """
+        The (y,x) coordinates of the grid which are the vertices of its convex hull.
+
+        The distance to a coordinate is a convex function, therefore the furthest coordinate of the grid from any
+        coordinate is a vertex of its convex hull, which is used to compute furthest distances from only these
+        vertices.
+
+        If the convex hull cannot be computed because the grid has fewer than three coordinates or all of its
+        coordinates lie on a line, the two end points of the line (the minimum and maximum coordinates sorted by y and
+        then x) are returned.
+        """
+        from scipy.spatial import ConvexHull
+
+        grid = np.asarray(self)
+
+        try:
+            return grid[ConvexHull(grid).vertices]
+        except (RuntimeError, ValueError):
+            return grid[np.lexsort((grid[:, 1], grid[:, 0]))[[0, -1]]]
+
+    def k_nearest_from(
+        self, grid: Union[np.ndarray, List], k: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        For every (y,x) coordinate of an input grid, returns the distances to and indexes of the `k` closest
+        coordinates of this grid, using its KD-tree.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates whose closest coordinates on this grid are found.
+        k
+            The number of closest coordinates which are found for every coordinate.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray)
+            The distances and indexes of the closest coordinates, which have shape [total_coordinates] for `k=1` and
+            [total_coordinates, k] otherwise, where the closest coordinates are sorted by distance.
+        """
+        return self.kd_tree.query(np.asarray(grid), k=k)
+
+    def indexes_within_radius_from(
+        self, grid: Union[np.ndarray, List], radius: float
+    ) -> List[List[int]]:
+        """
+        For every (y,x) coordinate of an input grid, returns the indexes of all coordinates of this grid within an
+        input radius of it, using its KD-tree.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates which the coordinates of this grid within the radius of are found, which can be a
+            single (y,x) coordinate.
+        radius
+            The radius within which coordinates are found.
+        """
+        grid = np.atleast_2d(np.asarray(grid))
+
+        return [
+            sorted(indexes) for indexes in self.kd_tree.query_ball_point(grid, r=radius)
+        ]
+
+    def furthest_distances_from(self, grid: Union[np.ndarray, List]) -> ValuesIrregular:
+        """
+        For every (y,x) coordinate of an input grid, returns the furthest distance to any coordinate of this grid.
+
+        If the number of pairs of coordinates is above the `distance_pairs_threshold`, the distances are computed to
+        only the vertices of the convex hull of this grid (see `convex_hull_grid`), which reduces the
+        O(N * N_grid) calculation to O(N * N_hull).
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates whose furthest distances to this grid are computed, which can be a single (y,x)
+            coordinate.
+        """
+        grid = np.atleast_2d(np.asarray(grid, dtype="float"))
+
+        if grid.shape[0] * self.shape[0] <= distance_pairs_threshold:
+            furthest_grid = np.asarray(self)
+        else:
+            furthest_grid = self.convex_hull_grid
+
+        return ValuesIrregular(
+            values=grid_2d_util.furthest_distances_from(
+                grid_2d=grid, furthest_grid_2d=furthest_grid
+            )
+        )
+
     @property
     def furthest_distances_to_other_coordinates(self) -> ValuesIrregular:
         """
@@ -284,22 +409,15 @@ class Grid2DIrregular(np.ndarray):
 
         [3.0, 2.0, 3.0]
 
+        The furthest distances are computed via `furthest_distances_from`, which uses the convex hull of the grid for
+        large grids.
+
         Returns
         -------
         ValuesIrregular
             The further distances of every coordinate to every other coordinate on the irregular grid.
         """
-
-        radial_distances_max = np.zeros((self.shape[0]))
-
-        for i in range(self.shape[0]):
-
-            x_distances = np.square(np.subtract(self[i, 0], self[:, 0]))
-            y_distances = np.square(np.subtract(self[i, 1], self[:, 1]))
-
-            radial_distances_max[i] = np.sqrt(np.max(np.add(x_distances, y_distances)))
-
-        return self.values_from(array_slim=radial_distances_max)
+        return self.furthest_distances_from(grid=self)
 
     def grid_of_closest_from(
         self, grid_pair: Union["Grid2DIrregular"]
@@ -308,6 +426,9 @@ class Grid2DIrregular(np.ndarray):
         From an input grid, find the closest coordinates of this instance of the `Grid2DIrregular` to each coordinate on
         the input grid and return each closest coordinate as a new `Grid2DIrregular`.
 
+        If the number of pairs of coordinates is above the `distance_pairs_threshold`, the closest coordinates are
+        found via the KD-tree of the grid (see `k_nearest_from`).
+
         Parameters
         ----------
         grid_pair
@@ -318,21 +439,23 @@ class Grid2DIrregular(np.ndarray):
         Grid2DIrregular
             The grid of coordinates corresponding to the closest coordinate of each coordinate of this instance of
             the `Grid2DIrregular` to the input grid.
-
         """
+        grid = np.asarray(self)
+        grid_pair = np.asarray(grid_pair)
 
-        grid_of_closest = np.zeros((grid_pair.shape[0], 2))
+        if grid_pair.shape[0] * grid.shape[0] <= distance_pairs_threshold:
 
-        for i in range(grid_pair.shape[0]):
+            squared_distances = np.sum(
+                np.square(grid_pair[:, None, :] - grid[None, :, :]), axis=2
+            )
 
-            x_distances = np.square(np.subtract(grid_pair[i, 0], self[:, 0]))
-            y_distances = np.square(np.subtract(grid_pair[i, 1], self[:, 1]))
+            closest_indexes = np.argmin(squared_distances, axis=1)
 
-            radial_distances = np.add(x_distances, y_distances)
+        else:
 
-            grid_of_closest[i, :] = self[np.argmin(radial_distances), :]
+            _, closest_indexes = self.k_nearest_from(grid=grid_pair)
 
-        return Grid2DIrregular(grid=grid_of_closest)
+        return Grid2DIrregular(grid=grid[closest_indexes])
 
     @classmethod
     def from_json(cls, file_path: str) -> "Grid2DIrregular":
@@ -1,6 +1,4 @@
 import numpy as np
-import scipy.spatial
-import scipy.spatial.qhull as qhull
 from typing import Optional, List, Union, Tuple
 
 from autoconf import cached_property
@@ -299,7 +297,7 @@ class AbstractGrid2DMeshTriangulation(AbstractStructure2D):
             self.uses_interpolation = obj.uses_interpolation
 
     @cached_property
-    def delaunay(self) -> scipy.spatial.Delaunay:
+    def delaunay(self) -> "scipy.spatial.Delaunay":
         """
         Returns a `scipy.spatial.Delaunay` object from the 2D (y,x) grid of irregular coordinates, which correspond to
         the corner of every triangle of a Delaunay triangulation.
@@ -312,13 +310,15 @@ class AbstractGrid2DMeshTriangulation(AbstractStructure2D):
         to compute the Voronoi mesh are ill posed. These exceptions are caught and combined into a single
         `PixelizationException`, which helps exception handling in the `inversion` package.
         """
+        import scipy.spatial
+
         try:
             return scipy.spatial.Delaunay(np.asarray([self[:, 0], self[:, 1]]).T)
         except (ValueError, OverflowError, scipy.spatial.qhull.QhullError) as e:
             raise exc.PixelizationException() from e
 
     @cached_property
-    def voronoi(self) -> scipy.spatial.Voronoi:
+    def voronoi(self) -> "scipy.spatial.Voronoi":
         """
         Returns a `scipy.spatial.Voronoi` object from the 2D (y,x) grid of irregular coordinates, which correspond to
         the centre of every Voronoi pixel.
@@ -330,6 +330,8 @@ class AbstractGrid2DMeshTriangulation(AbstractStructure2D):
         to compute the Delaunay triangulation are ill posed. These exceptions are caught and combined into a single
         `PixelizationException`, which helps exception handling in the `inversion` package.
         """
+        import scipy.spatial
+
         try:
             return scipy.spatial.Voronoi(
                 np.asarray([self[:, 1], self[:, 0]]).T, qhull_options="Qbb Qc Qx Qm"
@@ -490,6 +492,26 @@ class Grid2DVoronoi(AbstractGrid2DMeshTriangulation):
 
         return PixelNeighbors(arr=neighbors.astype("int"), sizes=sizes.astype("int"))
 
+    @cached_property
+    def nn_triangulation(self) -> "nn_py.NNTriangulation":
+        """
+        Returns the triangulation of the Voronoi pixel centres used for natural neighbor interpolation by the
+        `VoronoiNN` pixelization, which is built once by the natural neighbor interpolation C library and reused for
+        every interpolation of this grid (e.g. the mappings of the `source_grid_slim`, the `split_cross` used for
+        regularization and plotting).
+        """
+        try:
+            from autoarray.util.nn import nn_py
+
+            return nn_py.NNTriangulation(yx_in=np.asarray(self))
+        except (ImportError, AttributeError) as e:
+            raise ImportError(
+                "In order to use the VoronoiNN pixelization you must install the "
+                "Natural Neighbor Interpolation c package.\n\n"
+                ""
+                "See: https://github.com/Jammy2211/PyAutoArray/tree/master/autoarray/util/nn"
+            ) from e
+
     @classmethod
     def manual_slim(cls, grid) -> "Grid2DVoronoi":
         """
@@ -677,6 +677,42 @@ def grid_pixel_centres_2d_from(
     return grid_pixels_2d
 
 
+@numba_util.jit()
+def relocation_radii_from(
+    grid: np.ndarray, border_grid: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the quantities used to relocate a grid to its border, which are the origin of the border (the mean of
+    its y and x coordinates), the radial distance of every border coordinate from this origin and the radial
+    distance of every grid coordinate from this origin.
+
+    Parameters
+    ----------
+    grid
+        The grid (uniform or irregular) whose pixels are to be relocated to the border edge if outside it.
+    border_grid
+        The grid of border (y,x) coordinates.
+    """
+    border_origin = np.zeros(2)
+    border_origin[0] = np.mean(border_grid[:, 0])
+    border_origin[1] = np.mean(border_grid[:, 1])
+    border_grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(border_grid[:, 0], border_origin[0])),
+            np.square(np.subtract(border_grid[:, 1], border_origin[1])),
+        )
+    )
+
+    grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(grid[:, 0], border_origin[0])),
+            np.square(np.subtract(grid[:, 1], border_origin[1])),
+        )
+    )
+
+    return border_origin, border_grid_radii, grid_radii
+
+
 @numba_util.jit()
 def relocated_grid_via_jit_from(grid, border_grid):
     """
@@ -707,24 +743,11 @@ def relocated_grid_via_jit_from(grid, border_grid):
     grid_relocated = np.zeros(grid.shape)
     grid_relocated[:, :] = grid[:, :]
 
-    border_origin = np.zeros(2)
-    border_origin[0] = np.mean(border_grid[:, 0])
-    border_origin[1] = np.mean(border_grid[:, 1])
-    border_grid_radii = np.sqrt(
-        np.add(
-            np.square(np.subtract(border_grid[:, 0], border_origin[0])),
-            np.square(np.subtract(border_grid[:, 1], border_origin[1])),
-        )
+    border_origin, border_grid_radii, grid_radii = relocation_radii_from(
+        grid=grid, border_grid=border_grid
     )
     border_min_radii = np.min(border_grid_radii)
 
-    grid_radii = np.sqrt(
-        np.add(
-            np.square(np.subtract(grid[:, 0], border_origin[0])),
-            np.square(np.subtract(grid[:, 1], border_origin[1])),
-        )
-    )
-
     for pixel_index in range(grid.shape[0]):
 
         if grid_radii[pixel_index] > border_min_radii:
@@ -748,6 +771,151 @@ def relocated_grid_via_jit_from(grid, border_grid):
     return grid_relocated
 
 
+def relocated_grid_via_kd_tree_from(
+    grid: np.ndarray,
+    border_grid: np.ndarray,
+    border_grid_tree,
+    total_neighbors: int = 4,
+) -> np.ndarray:
+    """
+    Relocate the coordinates of a grid to its border if they are outside the border, using a KD-tree of the border
+    grid to find the nearest border pixel of every coordinate (see `relocated_grid_via_jit_from` for a description
+    of the relocation).
+
+    Finding the nearest border pixel via a brute force search scales as O(N_grid x N_border), whereas each query
+    of the KD-tree scales as O(log(N_border)). The KD-tree depends only on the border grid, therefore it is
+    computed once and reused for every grid that is relocated (see `AbstractGrid2D.sub_border_grid_tree`).
+
+    The relocated grid is identical to that computed by `relocated_grid_via_jit_from`. The KD-tree returns the
+    `total_neighbors` nearest border pixels of every coordinate, whose distances are recomputed exactly as in the
+    brute force search, with ties broken by the lowest border pixel index. If these distances cannot determine the
+    nearest border pixel (e.g. more than `total_neighbors` border pixels are equally near) a brute force search is
+    performed for that coordinate.
+
+    Parameters
+    ----------
+    grid
+        The grid (uniform or irregular) whose pixels are to be relocated to the border edge if outside it.
+    border_grid
+        The grid of border (y,x) coordinates.
+    border_grid_tree : scipy.spatial.cKDTree
+        The KD-tree of the border grid's (y,x) coordinates.
+    total_neighbors
+        The number of nearest border pixels returned by the KD-tree for every coordinate.
+    """
+    grid = np.asarray(grid)
+    border_grid = np.asarray(border_grid)
+
+    border_origin, border_grid_radii, grid_radii = relocation_radii_from(
+        grid=grid, border_grid=border_grid
+    )
+
+    outside_indexes = np.where(grid_radii > np.min(border_grid_radii))[0]
+
+    total_neighbors = min(total_neighbors, border_grid.shape[0])
+
+    _, neighbor_indexes = border_grid_tree.query(
+        grid[outside_indexes], k=total_neighbors
+    )
+
+    return relocated_grid_via_neighbors_from(
+        grid=grid,
+        border_grid=border_grid,
+        border_origin=border_origin,
+        border_grid_radii=border_grid_radii,
+        grid_radii=grid_radii,
+        outside_indexes=outside_indexes,
+        neighbor_indexes=neighbor_indexes.reshape(
+            outside_indexes.shape[0], total_neighbors
+        ),
+    )
+
+
+@numba_util.jit()
+def relocated_grid_via_neighbors_from(
+    grid: np.ndarray,
+    border_grid: np.ndarray,
+    border_origin: np.ndarray,
+    border_grid_radii: np.ndarray,
+    grid_radii: np.ndarray,
+    outside_indexes: np.ndarray,
+    neighbor_indexes: np.ndarray,
+) -> np.ndarray:
+    """
+    Relocate the coordinates of a grid to its border, where the nearest border pixels of every coordinate whose
+    radial distance is larger than the minimum radial distance of the border are input (see
+    `relocated_grid_via_kd_tree_from`).
+
+    Parameters
+    ----------
+    grid
+        The grid (uniform or irregular) whose pixels are to be relocated to the border edge if outside it.
+    border_grid
+        The grid of border (y,x) coordinates.
+    border_origin
+        The origin of the border, which is the mean of its (y,x) coordinates.
+    border_grid_radii
+        The radial distance of every border coordinate from the border's origin.
+    grid_radii
+        The radial distance of every grid coordinate from the border's origin.
+    outside_indexes
+        The indexes of the grid coordinates whose radial distance is larger than the minimum border radial distance.
+    neighbor_indexes
+        The indexes of the nearest border pixels of every coordinate in `outside_indexes`.
+    """
+    grid_relocated = np.zeros(grid.shape)
+    grid_relocated[:, :] = grid[:, :]
+
+    total_border_pixels = border_grid.shape[0]
+    total_neighbors = neighbor_indexes.shape[1]
+
+    for outside_index in range(outside_indexes.shape[0]):
+
+        pixel_index = outside_indexes[outside_index]
+
+        closest_pixel_index = -1
+        closest_distance = np.inf
+        furthest_distance = 0.0
+
+        for neighbor_index in range(total_neighbors):
+
+            border_index = neighbor_indexes[outside_index, neighbor_index]
+
+            distance = np.square(
+                grid[pixel_index, 0] - border_grid[border_index, 0]
+            ) + np.square(grid[pixel_index, 1] - border_grid[border_index, 1])
+
+            if distance < closest_distance or (
+                distance == closest_distance and border_index < closest_pixel_index
+            ):
+                closest_distance = distance
+                closest_pixel_index = border_index
+
+            if distance > furthest_distance:
+                furthest_distance = distance
+
+        if (
+            total_neighbors < total_border_pixels
+            and furthest_distance <= closest_distance * (1.0 + 1.0e-8)
+        ):
+
+            closest_pixel_index = np.argmin(
+                np.square(grid[pixel_index, 0] - border_grid[:, 0])
+                + np.square(grid[pixel_index, 1] - border_grid[:, 1])
+            )
+
+        move_factor = border_grid_radii[closest_pixel_index] / grid_radii[pixel_index]
+
+        if move_factor < 1.0:
+
+            grid_relocated[pixel_index, :] = (
+                move_factor * (grid[pixel_index, :] - border_origin[:])
+                + border_origin[:]
+            )
+
+    return grid_relocated
+
+
 @numba_util.jit()
 def furthest_grid_2d_slim_index_from(
     grid_2d_slim: np.ndarray, slim_indexes: np.ndarray, coordinate: Tuple[float, float]
@@ -768,6 +936,43 @@ def furthest_grid_2d_slim_index_from(
     return furthest_grid_2d_slim_index
 
 
+@numba_util.jit()
+def furthest_distances_from(grid_2d: np.ndarray, furthest_grid_2d: np.ndarray):
+    """
+    Returns the furthest distance of every (y,x) coordinate of a grid to any coordinate of a second grid.
+
+    This is used to compute the furthest distances of every coordinate of a grid to the vertices of a convex hull
+    (see `Grid2DIrregular.furthest_distances_from`), where the second grid is typically small, such that every
+    distance is computed in O(N * N_hull) operations without allocating an [N, N_hull] array of distances.
+
+    Parameters
+    ----------
+    grid_2d
+        The (y,x) coordinates whose furthest distances are computed.
+    furthest_grid_2d
+        The (y,x) coordinates the furthest distance of every coordinate to is computed.
+    """
+    furthest_distances = np.zeros(grid_2d.shape[0])
+
+    for i in range(grid_2d.shape[0]):
+
+        furthest_squared_distance = 0.0
+
+        for j in range(furthest_grid_2d.shape[0]):
+
+            y = grid_2d[i, 0] - furthest_grid_2d[j, 0]
+            x = grid_2d[i, 1] - furthest_grid_2d[j, 1]
+
+            squared_distance = y * y + x * x
+
+            if squared_distance > furthest_squared_distance:
+                furthest_squared_distance = squared_distance
+
+        furthest_distances[i] = np.sqrt(furthest_squared_distance)
+
+    return furthest_distances
+
+
 def grid_2d_slim_from(
     grid_2d_native: np.ndarray, mask: np.ndarray, sub_size: int
 ) -> np.ndarray:
@@ -0,0 +1,216 @@
+from collections import OrderedDict
+import hashlib
+import numpy as np
+from typing import Optional, Tuple
+
+"""
+The maximum number of KMeans clusterings stored in the cache of `cluster_centers_and_labels_from`, above which the
+least recently used clustering is removed from the cache.
+"""
+kmeans_cache_size = 32
+
+_kmeans_cache = OrderedDict()
+
+"""
+The cluster centres of the most recent KMeans clustering of every grid and number of clusters, which a clustering
+that is warm-started is initialized from.
+"""
+_warm_start_dict = {}
+
+
+def array_hash_from(array: np.ndarray) -> str:
+    """
+    Returns the hash of an array's values and shape.
+    """
+    array = np.ascontiguousarray(array)
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str((array.shape, array.dtype.str)).encode())
+    hasher.update(array.tobytes())
+
+    return hasher.hexdigest()
+
+
+def warm_start_update(key: Tuple[str, int], cluster_centers: np.ndarray):
+    """
+    Stores the cluster centres of the most recent clustering of a grid and number of clusters, which the next
+    warm-started clustering of them is initialized from.
+    """
+    _warm_start_dict.pop(key, None)
+    _warm_start_dict[key] = np.array(cluster_centers)
+
+    while len(_warm_start_dict) > kmeans_cache_size:
+        _warm_start_dict.pop(next(iter(_warm_start_dict)))
+
+
+def kmeans_from(
+    total_pixels: int,
+    n_iter: int,
+    max_iter: int,
+    seed: Optional[int],
+    init: Optional[np.ndarray] = None,
+    mini_batch_size: Optional[int] = None,
+):
+    """
+    Returns the (unfitted) sklearn KMeans object which clusters a grid.
+
+    Parameters
+    ----------
+    total_pixels
+        The number of clusters.
+    n_iter
+        The number of times the KMeans algorithm is repeated with different initial cluster centres, which is 1 if
+        the cluster centres are initialized via `init`.
+    max_iter
+        The maximum number of iterations in one run of the KMeans algorithm.
+    seed
+        The random number seed of the KMeans algorithm.
+    init
+        The initial cluster centres, where if `None` they are chosen via k-means++.
+    mini_batch_size
+        If input, the `MiniBatchKMeans` algorithm is used, which updates the cluster centres with random batches of
+        coordinates of this size.
+    """
+    from sklearn.cluster import KMeans
+    from sklearn.cluster import MiniBatchKMeans
+
+    if init is None:
+        init = "k-means++"
+    else:
+        n_iter = 1
+
+    if mini_batch_size is not None:
+        return MiniBatchKMeans(
+            n_clusters=int(total_pixels),
+            init=init,
+            batch_size=int(mini_batch_size),
+            random_state=seed,
+            n_init=n_iter,
+            max_iter=max_iter,
+        )
+
+    return KMeans(
+        n_clusters=int(total_pixels),
+        init=init,
+        random_state=seed,
+        n_init=n_iter,
+        max_iter=max_iter,
+    )
+
+
+def cluster_centers_and_labels_from(
+    grid: np.ndarray,
+    weight_map: np.ndarray,
+    total_pixels: int,
+    n_iter: int = 1,
+    max_iter: int = 5,
+    seed: Optional[int] = None,
+    use_cache: bool = True,
+    warm_start: bool = False,
+    mini_batch_size: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the cluster centres and the cluster label of every coordinate of a weighted KMeans clustering of a 2D
+    grid of (y,x) coordinates.
+
+    The clustering is the slowest step of a pixelization which adapts to the brightness of the data (e.g. the
+    `VoronoiBrightnessImage`), but in a hyper search its inputs often change only slightly (or not at all) between
+    calls. The following options therefore speed it up:
+
+    - `use_cache`: Clusterings are stored in a cache keyed on a hash of the grid, weight map, number of clusters,
+      seed, warm-start cluster centres and the KMeans settings, such that the same clustering is never computed
+      twice. The cache is only used with a fixed seed.
+
+    - `warm_start`: The clustering is initialized from the cluster centres of the previous clustering of the same
+      grid and number of clusters, which converges in far fewer iterations than k-means++ when the weight map only
+      changes slightly. The result therefore depends on the previous clustering, but for a fixed seed it is
+      reproducible for the same sequence of weight maps.
+
+    - `mini_batch_size`: The cluster centres are updated using random batches of coordinates of this size (via
+      sklearn's `MiniBatchKMeans`), which is much faster for large masks.
+
+    With all options at their defaults other than `use_cache`, the clustering is identical to a single call to
+    sklearn's `KMeans` for a fixed seed.
+
+    Parameters
+    ----------
+    grid
+        The (y,x) coordinates which are clustered.
+    weight_map
+        The weight of every coordinate in the clustering.
+    total_pixels
+        The number of clusters.
+    n_iter
+        The number of times the KMeans algorithm is repeated.
+    max_iter
+        The maximum number of iterations in one run of the KMeans algorithm.
+    seed
+        The random number seed of the KMeans algorithm.
+    use_cache
+        If `True` and `seed` is not `None`, clusterings are stored in and loaded from a cache.
+    warm_start
+        If `True`, the clustering is initialized from the previous clustering of the same grid and number of
+        clusters.
+    mini_batch_size
+        If input, the `MiniBatchKMeans` algorithm is used with batches of this size.
+    """
+    grid = np.asarray(grid)
+    weight_map = np.asarray(weight_map)
+
+    grid_hash = array_hash_from(array=grid)
+
+    warm_start_key = (grid_hash, int(total_pixels))
+
+    init = _warm_start_dict.get(warm_start_key) if warm_start else None
+
+    use_cache = use_cache and seed is not None
+
+    if use_cache:
+
+        key = (
+            grid_hash,
+            array_hash_from(array=weight_map),
+            int(total_pixels),
+            seed,
+            n_iter,
+            max_iter,
+            None if init is None else array_hash_from(array=init),
+            mini_batch_size,
+        )
+
+        cluster_centers_and_labels = _kmeans_cache.get(key)
+
+        if cluster_centers_and_labels is not None:
+            _kmeans_cache.move_to_end(key)
+            cluster_centers, labels = cluster_centers_and_labels
+
+            if warm_start:
+                warm_start_update(key=warm_start_key, cluster_centers=cluster_centers)
+
+            return np.array(cluster_centers), np.array(labels)
+
+    kmeans = kmeans_from(
+        total_pixels=total_pixels,
+        n_iter=n_iter,
+        max_iter=max_iter,
+        seed=seed,
+        init=init,
+        mini_batch_size=mini_batch_size,
+    )
+
+    kmeans = kmeans.fit(X=grid, sample_weight=weight_map)
+
+    cluster_centers = np.asarray(kmeans.cluster_centers_)
+    labels = kmeans.labels_.astype("int")
+
+    if warm_start:
+        warm_start_update(key=warm_start_key, cluster_centers=cluster_centers)
+
+    if use_cache:
+
+        _kmeans_cache[key] = (np.array(cluster_centers), np.array(labels))
+
+        while len(_kmeans_cache) > kmeans_cache_size:
+            _kmeans_cache.popitem(last=False)
+
+    return cluster_centers, labels
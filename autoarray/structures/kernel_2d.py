@@ -1,7 +1,4 @@
-from astropy import units
 import numpy as np
-import scipy.signal
-from skimage.transform import resize, rescale
 
 from autoarray.structures.arrays.two_d.array_2d import Array2D
 from autoarray.structures.grids.two_d.grid_2d import Grid2D
@@ -353,6 +350,8 @@ class Kernel2D(Array2D):
         normalize=False,
     ):
 
+        from astropy import units
+
         x_stddev = (
             x_stddev * (units.deg).to(units.arcsec) / (2.0 * np.sqrt(2.0 * np.log(2.0)))
         )
@@ -430,6 +429,8 @@ class Kernel2D(Array2D):
             Whether the PSF should be normalized after being rescaled.
         """
 
+        from skimage.transform import resize, rescale
+
         kernel_rescaled = rescale(
             self.native,
             rescale_factor,
@@ -513,6 +514,9 @@ class Kernel2D(Array2D):
         ------
         KernelException if either Kernel2D psf dimension is odd
         """
+
+        import scipy.signal
+
         if self.mask.shape[0] % 2 == 0 or self.mask.shape[1] % 2 == 0:
             raise exc.KernelException("Kernel2D Kernel2D must be odd")
 
@@ -547,6 +551,8 @@ class Kernel2D(Array2D):
         KernelException if either Kernel2D psf dimension is odd
         """
 
+        import scipy.signal
+
         if self.mask.shape[0] % 2 == 0 or self.mask.shape[1] % 2 == 0:
             raise exc.KernelException("Kernel2D Kernel2D must be odd")
 
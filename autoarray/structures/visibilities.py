@@ -6,6 +6,7 @@ from autoconf import cached_property
 from autoarray.structures.grids.two_d.grid_2d_irregular import Grid2DIrregular
 
 from autoarray.structures.arrays.two_d import array_2d_util
+from autoarray import shared_buffer
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -61,6 +62,12 @@ class AbstractVisibilities(np.ndarray):
             self.ordered_1d = obj.ordered_1d
 
     def __reduce__(self):
+
+        shared_buffer_reduce = shared_buffer.structure_reduce_from(structure=self)
+
+        if shared_buffer_reduce is not None:
+            return shared_buffer_reduce
+
         # Get the parent's __reduce__ tuple
         pickled_state = super(AbstractVisibilities, self).__reduce__()
         # Create our own tuple to pass to __setstate__
@@ -11,7 +11,4 @@ from autoarray.structures.grids.two_d.grid_2d_irregular import Grid2DIrregular
 Grid1D2DLike = Union[np.ndarray, "Grid1D", Grid2D, Grid2DIterate, Grid2DIrregular]
 Grid2DLike = Union[np.ndarray, Grid2D, Grid2DIterate, Grid2DIrregular]
 
-from autoarray.operators.transformer import TransformerDFT
-from autoarray.operators.transformer import TransformerNUFFT
-
-Transformer = Union[TransformerDFT, TransformerNUFFT]
+Transformer = Union["TransformerDFT", "TransformerNUFFT", "TransformerKaiserBessel"]
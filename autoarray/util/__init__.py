@@ -14,4 +14,7 @@ from autoarray.inversion.mappers import mapper_util as mapper
 from autoarray.inversion.regularization import regularization_util as regularization
 from autoarray.inversion.linear_eqn import leq_util as leq
 from autoarray.inversion.inversion import inversion_util as inversion
+from autoarray.inversion.inversion import (
+    inversion_interferometer_util as inversion_interferometer,
+)
 from autoarray.operators import transformer_util as transformer
@@ -1,4 +1,5 @@
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import ctypes
 import os
 
@@ -40,6 +41,163 @@ try:
     )
     interpolate_from.restype = ctypes.c_int
 
+    # triangulation_create, triangulation_weights_from and triangulation_destroy are for a
+    # triangulation which is built once and queried many times
+    triangulation_create = _mod.triangulation_create
+    triangulation_create.argtypes = (ctypes.POINTER(ctypes.c_double), ctypes.c_int)
+    triangulation_create.restype = ctypes.c_void_p
+
+    triangulation_weights_from = _mod.triangulation_weights_from
+    triangulation_weights_from.argtypes = (
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.c_int,
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.c_int,
+    )
+    triangulation_weights_from.restype = ctypes.c_int
+
+    triangulation_destroy = _mod.triangulation_destroy
+    triangulation_destroy.argtypes = (ctypes.c_void_p,)
+    triangulation_destroy.restype = None
+
+    class NNTriangulation:
+        def __init__(self, yx_in: np.ndarray):
+            """
+            The Delaunay triangulation of a set of (y,x) points used for natural neighbour interpolation, which is
+            built once by the C library and reused for every query (as opposed to `natural_interpolation_weights`,
+            which rebuilds the triangulation on every call).
+
+            The triangulation is not modified by a query, therefore queries are thread-safe. The GIL is released for
+            the duration of every call to the C library, such that queries can be split over a pool of threads (see
+            `weights_from`).
+
+            Parameters
+            ----------
+            yx_in
+                The (y,x) coordinates of the points which are triangulated (e.g. the centres of the pixels of a
+                Voronoi pixelization), which are used without a copy if input as a C-contiguous float64 array of
+                shape [total_points, 2].
+            """
+            self.yx_in = np.ascontiguousarray(yx_in, dtype=np.double)
+
+            self._handle = triangulation_create(
+                self.yx_in.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                ctypes.c_int(self.yx_in.shape[0]),
+            )
+
+        def __del__(self):
+            if getattr(self, "_handle", None) is not None:
+                triangulation_destroy(self._handle)
+                self._handle = None
+
+        def __reduce__(self):
+            return NNTriangulation, (self.yx_in,)
+
+        @property
+        def total_points(self) -> int:
+            return self.yx_in.shape[0]
+
+        def _weights_into(self, yx_target, weights_out, neighbour_indexes_out):
+
+            triangulation_weights_from(
+                self._handle,
+                yx_target.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                ctypes.c_int(yx_target.shape[0]),
+                weights_out.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                neighbour_indexes_out.ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
+                ctypes.c_int(weights_out.shape[1]),
+            )
+
+        def weights_from(self, yx_target, max_nneighbours, total_threads=1):
+            """
+            Returns the natural neighbour interpolation weights and neighbour indexes of a batch of (y,x)
+            coordinates, where entries of -1 in the neighbour indexes denote no neighbour.
+
+            Parameters
+            ----------
+            yx_target
+                The (y,x) coordinates which are interpolated, which are used without a copy if input as a
+                C-contiguous float64 array of shape [total_targets, 2].
+            max_nneighbours
+                The maximum number of natural neighbours of a coordinate.
+            total_threads
+                The number of threads the coordinates are split over.
+            """
+            yx_target = np.ascontiguousarray(yx_target, dtype=np.double)
+
+            nout = yx_target.shape[0]
+
+            weights_out = np.zeros((nout, max_nneighbours), dtype=np.double)
+            neighbour_indexes_out = np.full((nout, max_nneighbours), -1, dtype=np.intc)
+
+            if total_threads <= 1 or nout < 2 * total_threads:
+
+                self._weights_into(
+                    yx_target=yx_target,
+                    weights_out=weights_out,
+                    neighbour_indexes_out=neighbour_indexes_out,
+                )
+
+                return weights_out, neighbour_indexes_out
+
+            bounds = np.linspace(0, nout, total_threads + 1).astype("int")
+
+            with ThreadPoolExecutor(max_workers=total_threads) as executor:
+
+                futures = [
+                    executor.submit(
+                        self._weights_into,
+                        yx_target[start:end],
+                        weights_out[start:end],
+                        neighbour_indexes_out[start:end],
+                    )
+                    for start, end in zip(bounds[:-1], bounds[1:])
+                ]
+
+                for future in futures:
+                    future.result()
+
+            return weights_out, neighbour_indexes_out
+
+        def interpolate_from(self, z_in, yx_target, total_threads=1):
+            """
+            Returns the natural neighbour interpolation of values defined at the triangulation's points at a batch
+            of (y,x) coordinates, where coordinates with no natural neighbours or a negative weight (e.g. outside
+            the convex hull) are given the value of their closest point.
+
+            Parameters
+            ----------
+            z_in
+                The values at the triangulation's points.
+            yx_target
+                The (y,x) coordinates the values are interpolated to.
+            total_threads
+                The number of threads the coordinates are split over.
+            """
+            z_in = np.asarray(z_in, dtype=np.double)
+            yx_target = np.ascontiguousarray(yx_target, dtype=np.double)
+
+            weights, neighbour_indexes = self.weights_from(
+                yx_target=yx_target, max_nneighbours=100, total_threads=total_threads
+            )
+
+            z_target = np.sum(
+                weights * z_in[np.where(neighbour_indexes >= 0, neighbour_indexes, 0)],
+                axis=1,
+            )
+
+            is_bad = (neighbour_indexes[:, 0] == -1) | np.any(weights < 0.0, axis=1)
+
+            for i in np.where(is_bad)[0]:
+                cloest_point_index = np.argmin(
+                    np.sum((self.yx_in - yx_target[i]) ** 2.0, axis=1)
+                )
+                z_target[i] = z_in[cloest_point_index]
+
+            return z_target
+
     def natural_interpolation_weights(x_in, y_in, x_target, y_target, max_nneighbours):
 
         nin = len(x_in)
@@ -127,3 +127,92 @@ int interpolate_weights_from(
 
 	return 0;
 }
+
+/*
+ * A Delaunay triangulation which is built once and queried any number of times via
+ * `triangulation_weights_from`, as opposed to `interpolate_weights_from` which rebuilds
+ * the triangulation for every call.
+ *
+ * Every query creates its own interpolator (and therefore search state), and the
+ * triangulation is not modified by a query, such that the same triangulation can be
+ * queried by multiple threads at once.
+ */
+typedef struct {
+	point* points;
+	delaunay* d;
+} nn_triangulation;
+
+/*
+ * Builds the triangulation of `nin` points, which are input as an interleaved array of
+ * (y,x) coordinates, e.g. a C-contiguous numpy array of shape [nin, 2].
+ */
+void* triangulation_create(double *yx_in, int nin)
+{
+	nn_triangulation* triangulation = malloc(sizeof(nn_triangulation));
+
+	int i;
+
+	triangulation->points = malloc(nin * sizeof(point));
+
+	for (i = 0; i < nin; ++i) {
+		point* p = &triangulation->points[i];
+
+		p->x = yx_in[2 * i + 1];
+		p->y = yx_in[2 * i];
+		p->z = 0.0;
+	}
+
+	triangulation->d = delaunay_build(nin, triangulation->points, 0, NULL, 0, NULL);
+
+	return triangulation;
+}
+
+/*
+ * Computes the natural neighbour interpolation weights and neighbour indexes of `nout`
+ * points, input as an interleaved array of (y,x) coordinates, using a triangulation
+ * built via `triangulation_create`.
+ */
+int triangulation_weights_from(
+		void *handle,
+	   	double *yx_out,
+	   	int nout,
+	   	double *weights_out,
+		int *neighbor_index,
+		int max_nneighbor)
+{
+	nn_triangulation* triangulation = (nn_triangulation*) handle;
+	nnhpi* nn = NULL;
+	point* pout = NULL;
+
+	int i;
+
+	pout = malloc(nout * sizeof(point));
+
+	for (i = 0; i < nout; ++i) {
+		point* p = &pout[i];
+		p->x = yx_out[2 * i + 1];
+		p->y = yx_out[2 * i];
+	}
+
+	nn = nnhpi_create(triangulation->d, nout);
+
+	for (i = 0; i < nout; ++i) {
+		point* p = &pout[i];
+		nnhpi_interpolate_get_weights(nn, p, weights_out, neighbor_index, max_nneighbor, i);
+	}
+
+	nnhpi_destroy(nn);
+	free(nn);
+	free(pout);
+
+	return 0;
+}
+
+void triangulation_destroy(void *handle)
+{
+	nn_triangulation* triangulation = (nn_triangulation*) handle;
+
+	delaunay_destroy(triangulation->d);
+	free(triangulation->points);
+	free(triangulation);
+}
@@ -272,6 +272,48 @@ class TestImagingApplyMask:
         assert masked_imaging_7x7.w_tilde.indexes.shape == (35,)
         assert masked_imaging_7x7.w_tilde.lengths.shape == (9,)
 
+    def test__convolver_class_from_settings(self, imaging_7x7, sub_mask_2d_7x7):
+
+        masked_imaging_7x7 = imaging_7x7.apply_mask(mask=sub_mask_2d_7x7)
+
+        assert type(masked_imaging_7x7.convolver) == aa.Convolver
+
+        masked_imaging_7x7 = masked_imaging_7x7.apply_settings(
+            settings=aa.SettingsImaging(use_fft_convolver=True)
+        )
+
+        assert type(masked_imaging_7x7.convolver) == aa.ConvolverFFT
+
+        settings = aa.SettingsImaging(fft_convolver_kernel_size=21)
+
+        assert settings.convolver_class_from(kernel_shape_native=(3, 3)) == aa.Convolver
+        assert (
+            settings.convolver_class_from(kernel_shape_native=(21, 21))
+            == aa.ConvolverFFT
+        )
+
+    def test__w_tilde__loaded_from_cache(self, imaging_7x7, sub_mask_2d_7x7, tmp_path):
+
+        settings = aa.SettingsImaging(w_tilde_cache_path=str(tmp_path))
+
+        masked_imaging_7x7 = imaging_7x7.apply_mask(mask=sub_mask_2d_7x7)
+        masked_imaging_7x7 = masked_imaging_7x7.apply_settings(settings=settings)
+
+        w_tilde = masked_imaging_7x7.w_tilde
+
+        assert len(os.listdir(str(tmp_path))) == 1
+
+        masked_imaging_7x7 = imaging_7x7.apply_mask(mask=sub_mask_2d_7x7)
+        masked_imaging_7x7 = masked_imaging_7x7.apply_settings(settings=settings)
+
+        w_tilde_cached = masked_imaging_7x7.w_tilde
+
+        assert isinstance(w_tilde_cached.curvature_preload, np.memmap)
+        assert (w_tilde_cached.curvature_preload == w_tilde.curvature_preload).all()
+        assert (w_tilde_cached.indexes == w_tilde.indexes).all()
+        assert (w_tilde_cached.lengths == w_tilde.lengths).all()
+        assert w_tilde_cached.noise_map_value == w_tilde.noise_map_value
+
     def test__masked_imaging__uses_signal_to_noise_limit_and_radii(
         self, imaging_7x7, mask_2d_7x7
     ):
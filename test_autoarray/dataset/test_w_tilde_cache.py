@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+import numpy as np
+import pytest
+
+import autoarray as aa
+
+
+def test__key_from():
+
+    key_0 = aa.WTildeCache.key_from("w_tilde_imaging", np.ones((2, 2)), (0.1, 0.1))
+    key_1 = aa.WTildeCache.key_from("w_tilde_imaging", np.ones((2, 2)), (0.1, 0.1))
+
+    assert key_0 == key_1
+    assert key_0.startswith("w_tilde_imaging_")
+
+    key_1 = aa.WTildeCache.key_from("w_tilde_imaging", np.ones((4,)), (0.1, 0.1))
+
+    assert key_0 != key_1
+
+    key_1 = aa.WTildeCache.key_from("w_tilde_imaging", np.ones((2, 2)), (0.2, 0.2))
+
+    assert key_0 != key_1
+
+
+def test__save_and_load(tmp_path):
+
+    w_tilde_cache = aa.WTildeCache(cache_path=str(tmp_path))
+
+    assert w_tilde_cache.load(key="key") is None
+
+    w_tilde_cache.save(
+        key="key", array_dict={"preload": np.array([1.0, 2.0]), "indexes": np.array([3])}
+    )
+
+    array_dict = w_tilde_cache.load(key="key")
+
+    assert isinstance(array_dict["preload"], np.memmap)
+    assert (array_dict["preload"] == np.array([1.0, 2.0])).all()
+    assert (array_dict["indexes"] == np.array([3])).all()
+
+
+def test__cached_arrays_from__only_computes_once(tmp_path):
+
+    w_tilde_cache = aa.WTildeCache(cache_path=str(tmp_path))
+
+    calls = []
+
+    def func():
+        calls.append(1)
+        return {"preload": np.array([1.0, 2.0])}
+
+    w_tilde_cache.cached_arrays_from(key="key", func=func)
+    array_dict = w_tilde_cache.cached_arrays_from(key="key", func=func)
+
+    assert len(calls) == 1
+    assert (array_dict["preload"] == np.array([1.0, 2.0])).all()
+    assert not os.path.exists(os.path.join(str(tmp_path), ".lock_key"))
+
+
+def test__cached_arrays_from__threads_waiting_on_lock_load_entry(tmp_path):
+
+    calls = []
+
+    def func():
+        calls.append(1)
+        time.sleep(0.3)
+        return {"preload": np.array([1.0, 2.0])}
+
+    def cached_arrays_from():
+        aa.WTildeCache(cache_path=str(tmp_path)).cached_arrays_from(
+            key="key", func=func
+        )
+
+    thread_list = [threading.Thread(target=cached_arrays_from) for _ in range(8)]
+
+    for thread in thread_list:
+        thread.start()
+
+    for thread in thread_list:
+        thread.join()
+
+    assert len(calls) == 1
+
+
+def test__evict__removes_least_recently_used_entries(tmp_path):
+
+    w_tilde_cache = aa.WTildeCache(cache_path=str(tmp_path), max_size_gb=1.0e-9)
+
+    w_tilde_cache.save(key="key_0", array_dict={"preload": np.ones(10)})
+
+    assert w_tilde_cache.load(key="key_0") is not None
+
+    w_tilde_cache.save(key="key_1", array_dict={"preload": np.ones(10)})
+
+    assert w_tilde_cache.load(key="key_0") is None
+    assert w_tilde_cache.load(key="key_1") is not None
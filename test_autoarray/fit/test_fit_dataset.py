@@ -174,6 +174,147 @@ class TestFitImaging:
         assert fit.figure_of_merit == fit.log_evidence
 
 
+class TestFitImagingBatch:
+    def test__model_image_batch__log_likelihoods_match_individual_fits(
+        self, masked_imaging_7x7
+    ):
+
+        model_image_batch = np.array(
+            [
+                np.full(fill_value=value, shape=masked_imaging_7x7.image.shape[0])
+                for value in [0.0, 1.0, 2.5]
+            ]
+        )
+
+        fit_batch = aa.FitImagingBatch(
+            dataset=masked_imaging_7x7, model_image_batch=model_image_batch
+        )
+
+        assert fit_batch.log_evidence is None
+
+        for index, model_image in enumerate(model_image_batch):
+
+            fit = aa.FitData(
+                data=masked_imaging_7x7.image,
+                noise_map=masked_imaging_7x7.noise_map,
+                model_data=aa.Array2D.manual_mask(
+                    array=model_image, mask=masked_imaging_7x7.mask
+                ),
+                mask=masked_imaging_7x7.mask,
+                use_mask_in_fit=False,
+            )
+
+            assert fit_batch.chi_squared[index] == pytest.approx(fit.chi_squared, 1.0e-8)
+            assert fit_batch.log_likelihood[index] == pytest.approx(
+                fit.log_likelihood, 1.0e-8
+            )
+            assert fit_batch.figure_of_merit[index] == pytest.approx(
+                fit.figure_of_merit, 1.0e-8
+            )
+
+    def test__blurred_mapping_matrix_batch__log_evidences_match_inversions(
+        self, masked_imaging_7x7, rectangular_mapper_7x7_3x3
+    ):
+
+        inversion_list = [
+            aa.Inversion(
+                dataset=masked_imaging_7x7,
+                linear_obj_list=[rectangular_mapper_7x7_3x3],
+                regularization_list=[aa.reg.Constant(coefficient=coefficient)],
+                settings=aa.SettingsInversion(use_w_tilde=False, check_solution=False),
+            )
+            for coefficient in [0.5, 1.0, 2.0]
+        ]
+
+        fit_batch = aa.FitImagingBatch(
+            dataset=masked_imaging_7x7,
+            blurred_mapping_matrix_batch=np.array(
+                [inversion.operated_mapping_matrix for inversion in inversion_list]
+            ),
+            regularization_matrix=np.array(
+                [inversion.regularization_matrix for inversion in inversion_list]
+            ),
+        )
+
+        for index, inversion in enumerate(inversion_list):
+
+            fit = aa.FitData(
+                data=masked_imaging_7x7.image,
+                noise_map=masked_imaging_7x7.noise_map,
+                model_data=inversion.mapped_reconstructed_image,
+                mask=masked_imaging_7x7.mask,
+                inversion=inversion,
+                use_mask_in_fit=False,
+            )
+
+            assert fit_batch.reconstruction_batch[index] == pytest.approx(
+                inversion.reconstruction, 1.0e-4
+            )
+            assert fit_batch.log_likelihood[index] == pytest.approx(
+                fit.log_likelihood, 1.0e-4
+            )
+            assert fit_batch.log_evidence[index] == pytest.approx(
+                fit.log_evidence, 1.0e-4
+            )
+            assert fit_batch.figure_of_merit[index] == pytest.approx(
+                fit.figure_of_merit, 1.0e-4
+            )
+
+    def test__curvature_reg_matrix_not_positive_definite__figure_of_merit_is_minus_inf(
+        self, masked_imaging_7x7
+    ):
+
+        blurred_mapping_matrix_batch = np.ones(
+            shape=(2, masked_imaging_7x7.image.shape[0], 2)
+        )
+
+        regularization_matrix = np.array([np.eye(2), -1.0e8 * np.eye(2)])
+
+        fit_batch = aa.FitImagingBatch(
+            dataset=masked_imaging_7x7,
+            blurred_mapping_matrix_batch=blurred_mapping_matrix_batch,
+            regularization_matrix=regularization_matrix,
+        )
+
+        assert np.isfinite(fit_batch.figure_of_merit[0])
+        assert fit_batch.figure_of_merit[1] == -np.inf
+
+    def test__regularization_matrix_singular__figure_of_merit_is_minus_inf(
+        self, masked_imaging_7x7
+    ):
+
+        image_pixels = masked_imaging_7x7.image.shape[0]
+
+        blurred_mapping_matrix_batch = np.stack(
+            [np.ones(image_pixels), np.arange(image_pixels, dtype="float")], axis=1
+        )
+        blurred_mapping_matrix_batch = np.array([blurred_mapping_matrix_batch] * 2)
+
+        regularization_matrix = np.array(
+            [np.eye(2), np.array([[1.0, -1.0], [-1.0, 1.0]])]
+        )
+
+        fit_batch = aa.FitImagingBatch(
+            dataset=masked_imaging_7x7,
+            blurred_mapping_matrix_batch=blurred_mapping_matrix_batch,
+            regularization_matrix=regularization_matrix,
+        )
+
+        with pytest.raises(aa.exc.InversionException):
+            aa.util.inversion.log_det_regularization_matrix_from(
+                regularization_matrix=regularization_matrix[1]
+            )
+
+        assert np.isfinite(fit_batch.figure_of_merit[0])
+        assert fit_batch.log_likelihood[1] == -np.inf
+        assert fit_batch.figure_of_merit[1] == -np.inf
+
+    def test__no_models_input__raises_exception(self, masked_imaging_7x7):
+
+        with pytest.raises(aa.exc.FitException):
+            aa.FitImagingBatch(dataset=masked_imaging_7x7)
+
+
 class TestFitInterferometer:
     def test__visibilities_and_model_are_identical__no_masking__check_values_are_correct(
         self,
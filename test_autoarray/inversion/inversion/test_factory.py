@@ -6,6 +6,8 @@ import autoarray as aa
 from autoarray.inversion.mappers.voronoi import MapperVoronoiNoInterp
 from autoarray.inversion.mappers.delaunay import MapperDelaunay
 
+from autoarray.inversion.inversion.solver import SolverEigen
+from autoarray.mock.mock import MockFit
 from autoarray.mock.mock import MockLinearObjFunc
 
 
@@ -332,6 +334,146 @@ def test__inversion_imaging__compare_mapping_and_w_tilde_values(
     )
 
 
+def test__inversion_imaging__compare_mapping_and_sparse_mapping_values(
+    masked_imaging_7x7, delaunay_mapper_9_3x3, regularization_constant
+):
+
+    inversion_sparse = aa.Inversion(
+        dataset=masked_imaging_7x7,
+        linear_obj_list=[delaunay_mapper_9_3x3],
+        regularization_list=[regularization_constant],
+        settings=aa.SettingsInversion(
+            use_w_tilde=False, use_sparse_mapping_matrix=True
+        ),
+    )
+
+    inversion_mapping = aa.Inversion(
+        dataset=masked_imaging_7x7,
+        linear_obj_list=[delaunay_mapper_9_3x3],
+        regularization_list=[regularization_constant],
+        settings=aa.SettingsInversion(use_w_tilde=False),
+    )
+
+    assert inversion_sparse.curvature_matrix == pytest.approx(
+        inversion_mapping.curvature_matrix, 1.0e-4
+    )
+    assert inversion_sparse.reconstruction == pytest.approx(
+        inversion_mapping.reconstruction, 1.0e-4
+    )
+    assert inversion_sparse.mapped_reconstructed_image == pytest.approx(
+        inversion_mapping.mapped_reconstructed_image, 1.0e-4
+    )
+
+
+def test__inversion_imaging__compare_dense_and_sparse_solver_values(
+    masked_imaging_7x7, rectangular_mapper_7x7_3x3, regularization_constant
+):
+
+    inversion_dense = aa.Inversion(
+        dataset=masked_imaging_7x7,
+        linear_obj_list=[rectangular_mapper_7x7_3x3],
+        regularization_list=[regularization_constant],
+        settings=aa.SettingsInversion(solver="dense"),
+    )
+
+    inversion_sparse = aa.Inversion(
+        dataset=masked_imaging_7x7,
+        linear_obj_list=[rectangular_mapper_7x7_3x3],
+        regularization_list=[regularization_constant],
+        settings=aa.SettingsInversion(solver="sparse"),
+    )
+
+    assert inversion_sparse.reconstruction == pytest.approx(
+        inversion_dense.reconstruction, 1.0e-4
+    )
+    assert inversion_sparse.log_det_curvature_reg_matrix_term == pytest.approx(
+        inversion_dense.log_det_curvature_reg_matrix_term, 1.0e-4
+    )
+    assert inversion_sparse.errors == pytest.approx(inversion_dense.errors, 1.0e-4)
+
+
+def test__inversion_imaging__compare_with_and_without_curvature_reg_eigen_preload(
+    masked_imaging_7x7, rectangular_mapper_7x7_3x3
+):
+
+    def inversion_from(coefficient, preloads=aa.Preloads()):
+        return aa.Inversion(
+            dataset=masked_imaging_7x7,
+            linear_obj_list=[rectangular_mapper_7x7_3x3],
+            regularization_list=[aa.reg.Constant(coefficient=coefficient)],
+            settings=aa.SettingsInversion(check_solution=False),
+            preloads=preloads,
+        )
+
+    fit_0 = MockFit(inversion=inversion_from(coefficient=1.0))
+    fit_1 = MockFit(inversion=inversion_from(coefficient=2.0))
+
+    preloads = aa.Preloads()
+    preloads.set_curvature_matrix(fit_0=fit_0, fit_1=fit_1)
+    preloads.set_data_vector(fit_0=fit_0, fit_1=fit_1)
+    preloads.set_curvature_reg_eigen(fit_0=fit_0, fit_1=fit_1)
+
+    inversion = inversion_from(coefficient=3.0)
+    inversion_preloads = inversion_from(coefficient=3.0, preloads=preloads)
+
+    assert isinstance(inversion_preloads.curvature_reg_matrix_solver, SolverEigen)
+    assert inversion_preloads.reconstruction == pytest.approx(
+        inversion.reconstruction, 1.0e-4
+    )
+    assert inversion_preloads.log_det_curvature_reg_matrix_term == pytest.approx(
+        inversion.log_det_curvature_reg_matrix_term, 1.0e-4
+    )
+    assert inversion_preloads.errors == pytest.approx(inversion.errors, 1.0e-4)
+
+
+@pytest.mark.parametrize("use_w_tilde", [False, True])
+def test__inversion_imaging__float32_log_evidence_matches_float64(use_w_tilde):
+
+    # For single precision the blurred mapping matrix (or w_tilde preload) is rounded to float32, but the curvature
+    # matrix is summed and factorized in float64, such that the log evidence changes by ~1e-7 for this dataset.
+
+    def log_evidence_from(dtype):
+
+        imaging = aa.fixtures.make_masked_imaging_benchmark(
+            mask_radius=1.5, sub_size=2, kernel_size=5
+        )
+        imaging = imaging.apply_settings(
+            settings=aa.SettingsImaging(
+                sub_size_inversion=2, use_w_tilde_cache=False, dtype=dtype
+            )
+        )
+
+        mapper = aa.pix.Rectangular(shape=(12, 12)).mapper_from(
+            source_grid_slim=imaging.grid_inversion
+        )
+
+        inversion = aa.Inversion(
+            dataset=imaging,
+            linear_obj_list=[mapper],
+            regularization_list=[aa.reg.Constant(coefficient=1.0)],
+            settings=aa.SettingsInversion(use_w_tilde=use_w_tilde, dtype=dtype),
+        )
+
+        if use_w_tilde:
+            assert inversion.leq.w_tilde.curvature_preload.dtype == dtype
+        else:
+            assert inversion.leq.operated_mapping_matrix.dtype == dtype
+
+        assert inversion.curvature_matrix.dtype == "float64"
+
+        return aa.FitData(
+            data=imaging.image,
+            noise_map=imaging.noise_map,
+            model_data=inversion.mapped_reconstructed_image,
+            mask=imaging.mask,
+            inversion=inversion,
+        ).log_evidence
+
+    assert log_evidence_from(dtype="float32") == pytest.approx(
+        log_evidence_from(dtype="float64"), abs=1.0e-4
+    )
+
+
 def test__inversion_interferometer__via_mapper(
     interferometer_7_no_fft,
     rectangular_mapper_7x7_3x3,
@@ -401,6 +543,132 @@ def test__inversion_interferometer__via_mapper(
     assert isinstance(inversion.leq, aa.LEqInterferometerMappingPyLops)
 
 
+def test__inversion_interferometer__compare_mapping_and_w_tilde_values(
+    interferometer_7, voronoi_mapper_9_3x3, regularization_constant
+):
+
+    inversion_w_tilde = aa.Inversion(
+        dataset=interferometer_7,
+        linear_obj_list=[voronoi_mapper_9_3x3],
+        regularization_list=[regularization_constant],
+        settings=aa.SettingsInversion(use_w_tilde_interferometer=True),
+    )
+
+    inversion_mapping = aa.Inversion(
+        dataset=interferometer_7,
+        linear_obj_list=[voronoi_mapper_9_3x3],
+        regularization_list=[regularization_constant],
+    )
+
+    assert isinstance(inversion_w_tilde.leq, aa.LEqInterferometerWTilde)
+    assert isinstance(inversion_mapping.leq, aa.LEqInterferometerMapping)
+
+    assert inversion_w_tilde.curvature_matrix == pytest.approx(
+        inversion_mapping.curvature_matrix, 1.0e-4
+    )
+    assert inversion_w_tilde.data_vector == pytest.approx(
+        inversion_mapping.data_vector, 1.0e-4
+    )
+    assert inversion_w_tilde.reconstruction == pytest.approx(
+        inversion_mapping.reconstruction, 1.0e-4
+    )
+    assert inversion_w_tilde.mapped_reconstructed_data == pytest.approx(
+        inversion_mapping.mapped_reconstructed_data, 1.0e-4
+    )
+    assert inversion_w_tilde.log_det_curvature_reg_matrix_term == pytest.approx(
+        inversion_mapping.log_det_curvature_reg_matrix_term, 1.0e-4
+    )
+
+
+def test__inversion_interferometer__x3_mappers__compare_mapping_and_w_tilde_values(
+    interferometer_7,
+    rectangular_mapper_7x7_3x3,
+    delaunay_mapper_9_3x3,
+    voronoi_mapper_9_3x3,
+    regularization_constant,
+):
+
+    linear_obj_list = [
+        rectangular_mapper_7x7_3x3,
+        delaunay_mapper_9_3x3,
+        voronoi_mapper_9_3x3,
+    ]
+
+    inversion_w_tilde = aa.Inversion(
+        dataset=interferometer_7,
+        linear_obj_list=linear_obj_list,
+        regularization_list=[regularization_constant] * 3,
+        settings=aa.SettingsInversion(use_w_tilde_interferometer=True),
+    )
+
+    inversion_mapping = aa.Inversion(
+        dataset=interferometer_7,
+        linear_obj_list=linear_obj_list,
+        regularization_list=[regularization_constant] * 3,
+    )
+
+    assert isinstance(inversion_w_tilde.leq, aa.LEqInterferometerWTilde)
+    assert isinstance(inversion_mapping.leq, aa.LEqInterferometerMapping)
+
+    assert inversion_w_tilde.curvature_matrix == pytest.approx(
+        inversion_mapping.curvature_matrix, 1.0e-4
+    )
+    assert inversion_w_tilde.data_vector == pytest.approx(
+        inversion_mapping.data_vector, 1.0e-4
+    )
+
+
+def test__inversion_interferometer__float32_dft_preload_log_evidence_matches_float64():
+
+    # The preloaded terms of the DFT are rounded to float32 but summed in float64, such that the log evidence changes
+    # by ~1e-7 for this dataset.
+
+    mask = aa.fixtures.make_mask_2d_benchmark(mask_radius=1.0)
+
+    random_state = np.random.RandomState(seed=1)
+
+    visibilities = aa.Visibilities(
+        visibilities=random_state.normal(size=200) + 1j * random_state.normal(size=200)
+    )
+    noise_map = aa.VisibilitiesNoiseMap.full(shape_slim=(200,), fill_value=2.0)
+
+    mapper = aa.pix.Rectangular(shape=(8, 8)).mapper_from(
+        source_grid_slim=aa.Grid2D.from_mask(mask=mask)
+    )
+
+    def log_evidence_from(preload_dtype):
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=aa.fixtures.make_uv_wavelengths_benchmark(
+                total_visibilities=200
+            ),
+            real_space_mask=mask,
+            preload_dtype=preload_dtype,
+        )
+
+        assert transformer.preload_real_transforms.dtype == preload_dtype
+
+        inversion = aa.InversionInterferometer(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            transformer=transformer,
+            linear_obj_list=[mapper],
+            regularization_list=[aa.reg.Constant(coefficient=1.0)],
+            settings=aa.SettingsInversion(use_w_tilde=False),
+        )
+
+        return aa.FitDataComplex(
+            data=visibilities,
+            noise_map=noise_map,
+            model_data=inversion.mapped_reconstructed_data,
+            inversion=inversion,
+        ).log_evidence
+
+    assert log_evidence_from(preload_dtype="float32") == pytest.approx(
+        log_evidence_from(preload_dtype="float64"), abs=1.0e-4
+    )
+
+
 def test__inversion_matrices__x2_mappers(
     masked_imaging_7x7_no_blur,
     rectangular_mapper_7x7_3x3,
@@ -0,0 +1,182 @@
+import autoarray as aa
+import numpy as np
+import pytest
+
+
+class TestWTildeInterferometer:
+    def test__w_tilde_curvature_interferometer_from(self):
+
+        noise_map = np.array([1.0, 2.0])
+        uv_wavelengths = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        grid_radians_slim = np.array([[0.0, 0.0], [0.0, 0.25], [0.25, 0.0]])
+
+        w_tilde = aa.util.inversion_interferometer.w_tilde_curvature_interferometer_from(
+            noise_map_real=noise_map,
+            uv_wavelengths=uv_wavelengths,
+            grid_radians_slim=grid_radians_slim,
+        )
+
+        assert w_tilde == pytest.approx(
+            np.array([[1.25, 0.25, 1.0], [0.25, 1.25, 0.0], [1.0, 0.0, 1.25]]),
+            abs=1.0e-4,
+        )
+
+    def test__w_tilde_curvature_preload_interferometer_from__same_as_full_w_tilde(
+        self,
+    ):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(9, 9), pixel_scales=0.1, sub_size=1, radius=0.35
+        )
+
+        np.random.seed(1)
+
+        uv_wavelengths = np.random.uniform(low=-1.0e5, high=1.0e5, size=(20, 2))
+        noise_map = np.random.uniform(low=1.0, high=2.0, size=(20,))
+
+        w_tilde = aa.util.inversion_interferometer.w_tilde_curvature_interferometer_from(
+            noise_map_real=noise_map,
+            uv_wavelengths=uv_wavelengths,
+            grid_radians_slim=mask.masked_grid_sub_1.in_radians,
+        )
+
+        curvature_preload = aa.util.inversion_interferometer.w_tilde_curvature_preload_interferometer_from(
+            noise_map_real=noise_map,
+            uv_wavelengths=uv_wavelengths,
+            shape_masked_pixels_2d=mask.shape_native_masked_pixels,
+            grid_radians_2d=mask.unmasked_grid_sub_1.in_radians.native,
+        )
+
+        w_tilde_via_preload = aa.util.inversion_interferometer.w_tilde_curvature_interferometer_via_preload_from(
+            curvature_preload=curvature_preload,
+            native_index_for_slim_index=mask.native_index_for_slim_index,
+        )
+
+        assert curvature_preload.shape == (13, 13)
+        assert w_tilde_via_preload == pytest.approx(w_tilde, 1.0e-4)
+
+
+class TestDataVectorInterferometer:
+    def test__data_vector_via_w_tilde_data__same_as_transformed_mapping_matrix(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(9, 9), pixel_scales=0.1, sub_size=1, radius=0.35
+        )
+
+        np.random.seed(1)
+
+        uv_wavelengths = np.random.uniform(low=-1.0e5, high=1.0e5, size=(20, 2))
+
+        visibilities = aa.Visibilities(
+            visibilities=np.random.normal(size=20) + 1j * np.random.normal(size=20)
+        )
+        noise_map = aa.VisibilitiesNoiseMap(
+            visibilities=np.random.uniform(low=1.0, high=2.0, size=20)
+            + 1j * np.random.uniform(low=1.0, high=2.0, size=20)
+        )
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask
+        )
+
+        pixelization = aa.pix.Rectangular(shape=(4, 4))
+
+        for sub_size in range(1, 3):
+
+            mask_sub = mask.mask_new_sub_size_from(mask=mask, sub_size=sub_size)
+
+            grid = aa.Grid2D.from_mask(mask=mask_sub)
+
+            mapper = pixelization.mapper_from(source_grid_slim=grid)
+
+            transformed_mapping_matrix = transformer.transform_mapping_matrix(
+                mapping_matrix=mapper.mapping_matrix
+            )
+
+            data_vector = aa.util.leq.data_vector_via_transformed_mapping_matrix_from(
+                transformed_mapping_matrix=transformed_mapping_matrix,
+                visibilities=visibilities,
+                noise_map=noise_map,
+            )
+
+            w_tilde_data = aa.util.inversion_interferometer.w_tilde_data_interferometer_from(
+                visibilities_real=visibilities.real,
+                visibilities_imag=visibilities.imag,
+                noise_map_real=noise_map.real,
+                noise_map_imag=noise_map.imag,
+                uv_wavelengths=uv_wavelengths,
+                grid_radians_slim=transformer.grid,
+            )
+
+            data_vector_via_w_tilde = aa.util.leq.data_vector_via_w_tilde_data_imaging_from(
+                w_tilde_data=w_tilde_data,
+                data_to_pix_unique=mapper.data_unique_mappings.data_to_pix_unique,
+                data_weights=mapper.data_unique_mappings.data_weights,
+                pix_lengths=mapper.data_unique_mappings.pix_lengths,
+                pix_pixels=pixelization.pixels,
+            )
+
+            assert data_vector_via_w_tilde == pytest.approx(data_vector, 1.0e-4)
+
+
+class TestCurvatureMatrixInterferometer:
+    def test__curvature_matrix_via_w_tilde_preload__same_as_transformed_mapping_matrix(
+        self,
+    ):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(9, 9), pixel_scales=0.1, sub_size=1, radius=0.35
+        )
+
+        np.random.seed(1)
+
+        uv_wavelengths = np.random.uniform(low=-1.0e5, high=1.0e5, size=(20, 2))
+
+        noise_map = aa.VisibilitiesNoiseMap.full(fill_value=2.0, shape_slim=(20,))
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask
+        )
+
+        curvature_preload = aa.util.inversion_interferometer.w_tilde_curvature_preload_interferometer_from(
+            noise_map_real=noise_map.real,
+            uv_wavelengths=uv_wavelengths,
+            shape_masked_pixels_2d=mask.shape_native_masked_pixels,
+            grid_radians_2d=mask.unmasked_grid_sub_1.in_radians.native,
+        )
+
+        pixelization = aa.pix.Rectangular(shape=(4, 4))
+
+        for sub_size in range(1, 3):
+
+            mask_sub = mask.mask_new_sub_size_from(mask=mask, sub_size=sub_size)
+
+            grid = aa.Grid2D.from_mask(mask=mask_sub)
+
+            mapper = pixelization.mapper_from(source_grid_slim=grid)
+
+            transformed_mapping_matrix = transformer.transform_mapping_matrix(
+                mapping_matrix=mapper.mapping_matrix
+            )
+
+            curvature_matrix = aa.util.leq.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=transformed_mapping_matrix.real,
+                noise_map=noise_map.real,
+            ) + aa.util.leq.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=transformed_mapping_matrix.imag,
+                noise_map=noise_map.imag,
+            )
+
+            curvature_matrix_via_w_tilde = aa.util.inversion_interferometer.curvature_matrix_via_w_tilde_curvature_preload_interferometer_from(
+                curvature_preload=curvature_preload,
+                native_index_for_slim_index=mask.native_index_for_slim_index,
+                data_to_pix_unique=mapper.data_unique_mappings.data_to_pix_unique,
+                data_weights=mapper.data_unique_mappings.data_weights,
+                pix_lengths=mapper.data_unique_mappings.pix_lengths,
+                pix_pixels=pixelization.pixels,
+            )
+
+            assert curvature_matrix_via_w_tilde == pytest.approx(
+                curvature_matrix, 1.0e-4
+            )
@@ -156,3 +156,17 @@ def test__errors_and_errors_with_covariance():
         np.array([[2.5, -1.0, -0.5], [-1.0, 1.0, 0.0], [-0.5, 0.0, 0.5]]), 1.0e-2
     )
     assert inversion.errors == pytest.approx(np.array([2.5, 1.0, 0.5]), 1.0e-3)
+
+
+def test__curvature_reg_matrix_cholesky__deprecated_but_same_as_numpy():
+
+    curvature_reg_matrix = np.array([[1.0, 1.0, 1.0], [1.0, 2.0, 1.0], [1.0, 1.0, 3.0]])
+
+    inversion = MockInversion(curvature_reg_matrix=curvature_reg_matrix)
+
+    with pytest.warns(DeprecationWarning):
+        curvature_reg_matrix_cholesky = inversion.curvature_reg_matrix_cholesky
+
+    assert curvature_reg_matrix_cholesky == pytest.approx(
+        np.linalg.cholesky(curvature_reg_matrix), 1.0e-8
+    )
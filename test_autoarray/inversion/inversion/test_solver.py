@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+import autoarray as aa
+from autoarray import exc
+from autoarray.inversion.inversion.solver import CurvatureRegEigen
+from autoarray.inversion.inversion.solver import solver_from
+
+
+@pytest.fixture(name="matrix")
+def make_matrix():
+
+    matrix = np.zeros((6, 6))
+
+    for i in range(6):
+        matrix[i, i] = 4.0
+        if i > 0:
+            matrix[i, i - 1] = -1.0
+            matrix[i - 1, i] = -1.0
+
+    matrix[0, 5] = matrix[5, 0] = 0.5
+
+    return matrix
+
+
+def test__dense_and_sparse_solvers__same_as_numpy(matrix):
+
+    vector = np.arange(6, dtype="float")
+
+    for solver in ["dense", "sparse"]:
+
+        curvature_reg_matrix_solver = solver_from(matrix=matrix, solver=solver)
+
+        assert curvature_reg_matrix_solver.solve(vector) == pytest.approx(
+            np.linalg.solve(matrix, vector), 1.0e-8
+        )
+        assert curvature_reg_matrix_solver.log_det == pytest.approx(
+            np.linalg.slogdet(matrix)[1], 1.0e-8
+        )
+        assert curvature_reg_matrix_solver.inverse == pytest.approx(
+            np.linalg.inv(matrix), 1.0e-8
+        )
+
+
+def test__not_positive_definite__raises_exception(matrix):
+
+    matrix[2, 2] = -4.0
+
+    for solver in ["dense", "sparse"]:
+
+        with pytest.raises(exc.InversionException):
+            solver_from(matrix=matrix, solver=solver)
+
+
+def test__unknown_solver__raises_exception(matrix):
+
+    with pytest.raises(exc.InversionException):
+        solver_from(matrix=matrix, solver="unknown")
+
+
+def test__curvature_reg_eigen__same_as_dense_solver(matrix):
+
+    regularization_matrix = np.eye(6) + 1.0e-8 * np.eye(6)
+    regularization_matrix[0, 1] = regularization_matrix[1, 0] = -0.5
+
+    curvature_reg_eigen = CurvatureRegEigen(
+        curvature_reg_matrix=matrix + regularization_matrix,
+        regularization_matrix=regularization_matrix,
+        regularization_matrix_change=regularization_matrix - 1.0e-8 * np.eye(6),
+    )
+
+    vector = np.arange(6, dtype="float")
+
+    regularization_matrix_new = 3.0 * regularization_matrix - 2.0e-8 * np.eye(6)
+
+    step = curvature_reg_eigen.step_from(regularization_matrix=regularization_matrix_new)
+
+    assert step == pytest.approx(2.0, 1.0e-8)
+
+    curvature_reg_matrix_solver = curvature_reg_eigen.solver_from(step=step)
+    solver_dense = solver_from(matrix=matrix + regularization_matrix_new)
+
+    assert curvature_reg_matrix_solver.solve(vector) == pytest.approx(
+        solver_dense.solve(vector), 1.0e-8
+    )
+    assert curvature_reg_matrix_solver.log_det == pytest.approx(
+        solver_dense.log_det, 1.0e-8
+    )
+    assert curvature_reg_matrix_solver.inverse == pytest.approx(
+        solver_dense.inverse, 1.0e-8
+    )
+
+    assert curvature_reg_eigen.step_from(regularization_matrix=matrix) is None
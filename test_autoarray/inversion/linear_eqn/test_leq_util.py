@@ -103,6 +103,49 @@ class TestWTildeImaging:
 
         assert w_tilde_lengths == pytest.approx(np.array([4, 3, 2, 1]), 1.0e-4)
 
+    def test__w_tilde_curvature_preload_imaging_from__same_as_w_tilde_curvature(
+        self,
+    ):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(21, 21), pixel_scales=0.1, sub_size=1, radius=0.8
+        )
+
+        noise_map = np.random.uniform(low=1.0, high=2.0, size=mask.shape_native)
+        noise_map = aa.Array2D.manual_mask(array=noise_map, mask=mask)
+
+        kernel = np.random.uniform(size=(5, 5))
+
+        w_tilde = aa.util.leq.w_tilde_curvature_imaging_from(
+            noise_map_native=noise_map.native,
+            kernel_native=kernel,
+            native_index_for_slim_index=mask.native_index_for_slim_index,
+        )
+
+        w_tilde_preload, w_tilde_indexes, w_tilde_lengths = aa.util.leq.w_tilde_curvature_preload_imaging_from(
+            noise_map_native=noise_map.native,
+            kernel_native=kernel,
+            native_index_for_slim_index=mask.native_index_for_slim_index,
+        )
+
+        w_tilde_via_preload = np.zeros(w_tilde.shape)
+
+        index = 0
+
+        for ip0 in range(w_tilde_lengths.shape[0]):
+            for ip1_index in range(int(w_tilde_lengths[ip0])):
+
+                ip1 = int(w_tilde_indexes[index])
+
+                assert ip1 >= ip0
+
+                w_tilde_via_preload[ip0, ip1] += w_tilde_preload[index]
+                w_tilde_via_preload[ip1, ip0] += w_tilde_preload[index]
+
+                index += 1
+
+        assert w_tilde_via_preload == pytest.approx(w_tilde, 1.0e-4)
+
 
 class TestDataVectorFromData:
     def test__simple_blurred_mapping_matrix__correct_data_vector(self):
@@ -559,6 +602,161 @@ class TestCurvatureMatrixImaging:
                 curvature_matrix, 1.0e-4
             )
 
+            curvature_matrix_via_chunks = aa.util.leq.curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+                curvature_preload=w_tilde_preload,
+                curvature_indexes=w_tilde_indexes.astype("int"),
+                curvature_lengths=w_tilde_lengths.astype("int"),
+                data_to_pix_unique=data_to_pix_unique.astype("int"),
+                data_weights=data_weights,
+                pix_lengths=pix_lengths.astype("int"),
+                pix_pixels=pixelization.pixels,
+                total_chunks=3,
+            )
+
+            assert curvature_matrix_via_chunks == pytest.approx(
+                curvature_matrix_via_w_tilde, 1.0e-8
+            )
+
+    def test__curvature_matrix_via_w_tilde_preload__stacked_mappers__same_as_mapping_matrix(
+        self,
+    ):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(31, 31), pixel_scales=0.1, sub_size=1, radius=1.2
+        )
+
+        noise_map = np.random.uniform(low=0.5, high=1.5, size=mask.shape_native)
+        noise_map = aa.Array2D.manual_mask(array=noise_map, mask=mask)
+
+        kernel = aa.Kernel2D.from_gaussian(
+            shape_native=(5, 5), pixel_scales=mask.pixel_scales, sigma=1.0
+        )
+
+        convolver = aa.Convolver(mask=mask, kernel=kernel)
+
+        mask_sub = mask.mask_new_sub_size_from(mask=mask, sub_size=2)
+
+        grid = aa.Grid2D.from_mask(mask=mask_sub)
+
+        mapper_list = [
+            aa.pix.Rectangular(shape=(6, 6)).mapper_from(source_grid_slim=grid),
+            aa.pix.Rectangular(shape=(4, 5)).mapper_from(source_grid_slim=grid * 2.0),
+        ]
+
+        w_tilde_preload, w_tilde_indexes, w_tilde_lengths = aa.util.leq.w_tilde_curvature_preload_imaging_from(
+            noise_map_native=noise_map.native,
+            kernel_native=kernel.native,
+            native_index_for_slim_index=mask.native_index_for_slim_index,
+        )
+
+        data_to_pix_unique, data_weights, pix_lengths = aa.util.leq.data_unique_mappings_stacked_from(
+            data_to_pix_unique_list=[
+                mapper.data_unique_mappings.data_to_pix_unique for mapper in mapper_list
+            ],
+            data_weights_list=[
+                mapper.data_unique_mappings.data_weights for mapper in mapper_list
+            ],
+            pix_lengths_list=[
+                mapper.data_unique_mappings.pix_lengths for mapper in mapper_list
+            ],
+            pix_pixels_list=[mapper.pixels for mapper in mapper_list],
+        )
+
+        curvature_upper = aa.util.leq.curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from(
+            curvature_preload=w_tilde_preload,
+            curvature_indexes=w_tilde_indexes.astype("int"),
+            curvature_lengths=w_tilde_lengths.astype("int"),
+            data_to_pix_unique=data_to_pix_unique,
+            data_weights=data_weights,
+            pix_lengths=pix_lengths,
+            pix_pixels=56,
+            data_order=aa.util.leq.data_order_via_pix_tiles_from(
+                data_to_pix_unique=data_to_pix_unique, tile_size=4
+            ),
+        )
+
+        assert (np.tril(curvature_upper, k=-1) == 0.0).all()
+
+        curvature_matrix_via_w_tilde = aa.util.leq.symmetric_matrix_via_upper_triangle_from(
+            matrix=curvature_upper, block_size=8
+        )
+
+        blurred_mapping_matrix = np.hstack(
+            [
+                convolver.convolve_mapping_matrix(mapping_matrix=mapper.mapping_matrix)
+                for mapper in mapper_list
+            ]
+        )
+
+        curvature_matrix = aa.util.leq.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        )
+
+        assert curvature_matrix_via_w_tilde == pytest.approx(curvature_matrix, 1.0e-4)
+
+    def test__curvature_matrix_via_w_tilde_preload__total_chunks_only_passed_if_input(
+        self, monkeypatch
+    ):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(21, 21), pixel_scales=0.1, sub_size=1, radius=0.8
+        )
+
+        noise_map = aa.Array2D.manual_mask(
+            array=np.full(fill_value=2.0, shape=mask.shape_native), mask=mask
+        )
+
+        kernel = aa.Kernel2D.from_gaussian(
+            shape_native=(3, 3), pixel_scales=mask.pixel_scales, sigma=1.0
+        )
+
+        mapper = aa.pix.Rectangular(shape=(5, 5)).mapper_from(
+            source_grid_slim=aa.Grid2D.from_mask(mask=mask)
+        )
+
+        w_tilde_preload, w_tilde_indexes, w_tilde_lengths = aa.util.leq.w_tilde_curvature_preload_imaging_from(
+            noise_map_native=noise_map.native,
+            kernel_native=kernel.native,
+            native_index_for_slim_index=mask.native_index_for_slim_index,
+        )
+
+        curvature_upper_func = (
+            aa.util.leq.curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from
+        )
+
+        kwargs_list = []
+
+        def curvature_upper_recorded_from(**kwargs):
+            kwargs_list.append(kwargs)
+            return curvature_upper_func(**kwargs)
+
+        monkeypatch.setattr(
+            aa.util.leq,
+            "curvature_matrix_upper_via_w_tilde_curvature_preload_imaging_from",
+            curvature_upper_recorded_from,
+        )
+
+        curvature_matrix_list = [
+            aa.util.leq.curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+                curvature_preload=w_tilde_preload,
+                curvature_indexes=w_tilde_indexes.astype("int"),
+                curvature_lengths=w_tilde_lengths.astype("int"),
+                data_to_pix_unique=mapper.data_unique_mappings.data_to_pix_unique,
+                data_weights=mapper.data_unique_mappings.data_weights,
+                pix_lengths=mapper.data_unique_mappings.pix_lengths,
+                pix_pixels=mapper.pixels,
+                **chunk_dict,
+            )
+            for chunk_dict in [{}, {"total_chunks": 4}]
+        ]
+
+        assert "total_chunks" not in kwargs_list[0]
+        assert kwargs_list[1]["total_chunks"] == 4
+
+        assert curvature_matrix_list[1] == pytest.approx(
+            curvature_matrix_list[0], 1.0e-8
+        )
+
 
 class TestMappedReconstructedDataFrom:
     def test__mapped_reconstructed_data_via_mapping_matrix_from(self):
@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+
 import autoarray as aa
 
 
@@ -56,3 +58,33 @@ def test__pix_indexes_for_sub_slim_index__matches_util(grid_2d_7x7):
     assert (
         mapper.pix_sizes_for_sub_slim_index == np.array([1, 1, 3, 1, 1, 1, 1, 1, 1])
     ).all()
+
+
+def test__pix_sub_weights__walk_matches_find_simplex_util():
+
+    grid = aa.Grid2D.uniform(shape_native=(30, 30), pixel_scales=0.1, sub_size=2)
+
+    pixelization_grid = aa.Grid2DDelaunay(
+        grid=np.random.RandomState(seed=1).uniform(-1.2, 1.2, size=(200, 2))
+    )
+
+    mapper = aa.Mapper(source_grid_slim=grid, source_pixelization_grid=pixelization_grid)
+
+    mappings, sizes = aa.util.mapper.pix_indexes_for_sub_slim_index_delaunay_from(
+        source_grid_slim=grid,
+        simplex_index_for_sub_slim_index=mapper.delaunay.find_simplex(grid),
+        pix_indexes_for_simplex_index=mapper.delaunay.simplices,
+        delaunay_points=mapper.delaunay.points,
+    )
+
+    weights = aa.util.mapper.pixel_weights_delaunay_from(
+        source_grid_slim=grid,
+        source_pixelization_grid=pixelization_grid,
+        slim_index_for_sub_slim_index=mapper.slim_index_for_sub_slim_index,
+        pix_indexes_for_sub_slim_index=mappings.astype("int"),
+    )
+
+    assert (sizes == 1).any()
+    assert (mapper.pix_indexes_for_sub_slim_index == mappings.astype("int")).all()
+    assert (mapper.pix_sizes_for_sub_slim_index == sizes.astype("int")).all()
+    assert mapper.pix_weights_for_sub_slim_index == pytest.approx(weights, 1.0e-8)
@@ -291,6 +291,90 @@ class TestMappingMatrix:
             )
         ).all()
 
+    def test__sparse_mapping_matrix_from__same_as_mapping_matrix(self):
+
+        pix_indexes_for_sub_slim_index = np.array(
+            [[0, 2, -1], [1, -1, -1], [1, 2, 3], [3, 0, -1], [4, 4, 2], [0, -1, -1]]
+        )
+        pix_size_for_sub_slim_index = np.array([2, 1, 3, 2, 3, 1])
+        pix_weights_for_sub_slim_index = np.array(
+            [
+                [0.5, 0.5, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.2, 0.3, 0.5],
+                [0.6, 0.4, 0.0],
+                [0.1, 0.1, 0.8],
+                [1.0, 0.0, 0.0],
+            ]
+        )
+        slim_index_for_sub_slim_index = np.array([0, 0, 1, 1, 2, 2])
+
+        mapping_matrix = aa.util.mapper.mapping_matrix_from(
+            pix_indexes_for_sub_slim_index=pix_indexes_for_sub_slim_index,
+            pix_size_for_sub_slim_index=pix_size_for_sub_slim_index,
+            pix_weights_for_sub_slim_index=pix_weights_for_sub_slim_index,
+            pixels=5,
+            total_mask_sub_pixels=3,
+            slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+            sub_fraction=0.5,
+        )
+
+        sparse_mapping_matrix = aa.util.mapper.sparse_mapping_matrix_from(
+            pix_indexes_for_sub_slim_index=pix_indexes_for_sub_slim_index,
+            pix_size_for_sub_slim_index=pix_size_for_sub_slim_index,
+            pix_weights_for_sub_slim_index=pix_weights_for_sub_slim_index,
+            pixels=5,
+            total_mask_sub_pixels=3,
+            slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+            sub_fraction=0.5,
+        )
+
+        assert sparse_mapping_matrix.format == "csr"
+        assert sparse_mapping_matrix.toarray() == pytest.approx(mapping_matrix, 1.0e-8)
+
+    def test__mapping_matrix_from__chunks_give_same_answer(self):
+
+        pix_indexes_for_sub_slim_index = np.array(
+            [[0, 2, -1], [1, -1, -1], [1, 2, 3], [3, 0, -1], [4, 4, 2], [0, -1, -1]]
+        )
+        pix_size_for_sub_slim_index = np.array([2, 1, 3, 2, 3, 1])
+        pix_weights_for_sub_slim_index = np.array(
+            [
+                [0.5, 0.5, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.2, 0.3, 0.5],
+                [0.6, 0.4, 0.0],
+                [0.1, 0.1, 0.8],
+                [1.0, 0.0, 0.0],
+            ]
+        )
+        slim_index_for_sub_slim_index = np.array([0, 0, 1, 1, 2, 2])
+
+        mapping_matrix = aa.util.mapper.mapping_matrix_from(
+            pix_indexes_for_sub_slim_index=pix_indexes_for_sub_slim_index,
+            pix_size_for_sub_slim_index=pix_size_for_sub_slim_index,
+            pix_weights_for_sub_slim_index=pix_weights_for_sub_slim_index,
+            pixels=5,
+            total_mask_sub_pixels=3,
+            slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+            sub_fraction=0.5,
+        )
+
+        for total_chunks in [2, 3, 5]:
+
+            mapping_matrix_chunks = aa.util.mapper.mapping_matrix_from(
+                pix_indexes_for_sub_slim_index=pix_indexes_for_sub_slim_index,
+                pix_size_for_sub_slim_index=pix_size_for_sub_slim_index,
+                pix_weights_for_sub_slim_index=pix_weights_for_sub_slim_index,
+                pixels=5,
+                total_mask_sub_pixels=3,
+                slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+                sub_fraction=0.5,
+                total_chunks=total_chunks,
+            )
+
+            assert (mapping_matrix_chunks == mapping_matrix).all()
+
 
 class TestDataToPixUnique:
     def test__data_to_pix_unique_from(self):
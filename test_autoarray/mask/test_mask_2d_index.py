@@ -0,0 +1,102 @@
+import numpy as np
+import pickle
+
+import autoarray as aa
+from autoarray.mask import mask_2d_util
+from autoarray.mask.mask_2d_index import mask_2d_index_from
+
+
+def test__indexes_match_mask_2d_util():
+
+    mask = aa.Mask2D.circular_annular(
+        shape_native=(15, 15),
+        inner_radius=2.0,
+        outer_radius=6.0,
+        pixel_scales=1.0,
+        sub_size=2,
+    )
+
+    native_index_for_slim_index = mask_2d_util.native_index_for_slim_index_2d_from(
+        mask_2d=mask, sub_size=1
+    )
+    border_1d_indexes = mask_2d_util.border_slim_indexes_from(mask_2d=mask)
+    edge_1d_indexes = mask_2d_util.edge_1d_indexes_from(mask_2d=mask)
+
+    assert (mask.native_index_for_slim_index == native_index_for_slim_index).all()
+    assert (mask.border_1d_indexes == border_1d_indexes).all()
+    assert (mask.edge_1d_indexes == edge_1d_indexes).all()
+    assert (
+        mask.border_2d_indexes
+        == native_index_for_slim_index[border_1d_indexes.astype("int")]
+    ).all()
+    assert (
+        mask.edge_2d_indexes
+        == native_index_for_slim_index[edge_1d_indexes.astype("int")]
+    ).all()
+    assert (
+        mask.sub_border_flat_indexes
+        == mask_2d_util.sub_border_pixel_slim_indexes_from(mask_2d=mask, sub_size=2)
+    ).all()
+    assert (
+        mask.sub_mask_index_for_sub_mask_1d_index
+        == mask_2d_util.native_index_for_slim_index_2d_from(mask_2d=mask, sub_size=2)
+    ).all()
+    assert (
+        mask.slim_index_for_sub_slim_index
+        == mask_2d_util.slim_index_for_sub_slim_index_via_mask_2d_from(
+            mask_2d=mask, sub_size=2
+        )
+    ).all()
+
+    assert mask.native_index_for_slim_index.dtype == np.int32
+    assert not mask.native_index_for_slim_index.flags.writeable
+
+
+def test__index_shared_between_masks_with_identical_values():
+
+    mask_0 = aa.Mask2D.circular(
+        shape_native=(15, 15), radius=5.0, pixel_scales=1.0, sub_size=2
+    )
+    mask_1 = aa.Mask2D.circular(
+        shape_native=(15, 15), radius=5.0, pixel_scales=1.0, sub_size=2
+    )
+
+    assert mask_0.mask_index is mask_1.mask_index
+    assert mask_0.mask_index is mask_2d_index_from(
+        mask_2d=np.asarray(mask_0), sub_size=2
+    )
+    assert mask_0.mask_index is not mask_0.mask_sub_1.mask_index
+
+
+def test__mask_changed_in_place__index_recomputed():
+
+    mask = aa.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=1.0)
+
+    assert mask.native_index_for_slim_index.shape == (9, 2)
+
+    mask[0, 0] = True
+
+    assert mask.native_index_for_slim_index.shape == (8, 2)
+    assert (mask.native_index_for_slim_index[0] == np.array([0, 1])).all()
+
+
+def test__mask_pickled__index_not_pickled_but_same_after_unpickling():
+
+    mask = aa.Mask2D.circular(
+        shape_native=(15, 15), radius=5.0, pixel_scales=1.0, sub_size=2
+    )
+
+    sub_border_flat_indexes = mask.sub_border_flat_indexes
+    slim_index_for_sub_slim_index = mask.slim_index_for_sub_slim_index
+
+    assert "_mask_index" in mask.__dict__
+    assert "slim_index_for_sub_slim_index" in mask.__dict__
+
+    mask_unpickled = pickle.loads(pickle.dumps(mask))
+
+    assert "_mask_index" not in mask_unpickled.__dict__
+    assert mask_unpickled.mask_index is mask.mask_index
+    assert (mask_unpickled.sub_border_flat_indexes == sub_border_flat_indexes).all()
+    assert (
+        mask_unpickled.slim_index_for_sub_slim_index == slim_index_for_sub_slim_index
+    ).all()
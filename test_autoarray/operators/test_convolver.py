@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from scipy.sparse import csr_matrix
 
 import autoarray as aa
 from autoarray import exc
@@ -1043,6 +1044,32 @@ def test__convolve_mapping_matrix__asymetric_convolver__matrix_blurred_correctly
     )
 
 
+def test__convolve_mapping_matrix_sparse__same_as_convolve_mapping_matrix():
+
+    mask = aa.Mask2D.circular(shape_native=(15, 15), pixel_scales=1.0, radius=5.5)
+
+    kernel = aa.Kernel2D.manual_native(
+        array=np.arange(25, dtype="float").reshape(5, 5), pixel_scales=1.0
+    )
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel)
+
+    mapping_matrix = np.random.uniform(size=(mask.pixels_in_mask, 10))
+    mapping_matrix[mapping_matrix < 0.8] = 0.0
+
+    blurred_mapping_matrix = convolver.convolve_mapping_matrix(
+        mapping_matrix=mapping_matrix
+    )
+
+    blurred_sparse_mapping_matrix = convolver.convolve_mapping_matrix_sparse(
+        mapping_matrix=csr_matrix(mapping_matrix)
+    )
+
+    assert blurred_sparse_mapping_matrix.toarray() == pytest.approx(
+        blurred_mapping_matrix, 1.0e-8
+    )
+
+
 def test__convolution__cross_mask_with_blurring_entries__returns_array():
 
     cross_mask = aa.Mask2D.manual(
@@ -1155,3 +1182,77 @@ def test__compare_to_full_2d_convolution__no_blurring_image():
     blurred_masked_im_1 = convolver.convolve_image_no_blurring(image=masked_image)
 
     assert blurred_masked_image_via_scipy == pytest.approx(blurred_masked_im_1, 1e-4)
+
+
+class TestConvolverFFT:
+    def test__convolve_image__same_as_convolver(self):
+
+        mask = aa.Mask2D.circular_annular(
+            shape_native=(30, 30),
+            pixel_scales=1.0,
+            sub_size=1,
+            inner_radius=3.0,
+            outer_radius=10.0,
+        )
+
+        kernel = aa.Kernel2D.manual_native(
+            array=np.random.uniform(size=(9, 7)), pixel_scales=1.0
+        )
+
+        image = aa.Array2D.manual_native(
+            array=np.random.uniform(size=(30, 30)), pixel_scales=1.0
+        )
+
+        blurring_mask = mask.blurring_mask_from(kernel_shape_native=kernel.shape_native)
+
+        masked_image = aa.Array2D.manual_mask(array=image.native, mask=mask)
+        blurring_image = aa.Array2D.manual_mask(array=image.native, mask=blurring_mask)
+
+        convolver = aa.Convolver(mask=mask, kernel=kernel)
+        convolver_fft = aa.ConvolverFFT(mask=mask, kernel=kernel)
+
+        assert convolver_fft.convolve_image(
+            image=masked_image, blurring_image=blurring_image
+        ) == pytest.approx(
+            convolver.convolve_image(image=masked_image, blurring_image=blurring_image),
+            1.0e-8,
+        )
+        assert convolver_fft.convolve_image_no_blurring(
+            image=masked_image
+        ) == pytest.approx(
+            convolver.convolve_image_no_blurring(image=masked_image), 1.0e-8
+        )
+
+    def test__convolve_mapping_matrix__same_as_convolver(self, monkeypatch):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(20, 20), pixel_scales=1.0, sub_size=1, radius=6.0
+        )
+
+        kernel = aa.Kernel2D.manual_native(
+            array=np.random.uniform(size=(7, 7)), pixel_scales=1.0
+        )
+
+        mapping_matrix = np.random.uniform(size=(mask.pixels_in_mask, 10))
+        mapping_matrix[mapping_matrix < 0.7] = 0.0
+
+        convolver = aa.Convolver(mask=mask, kernel=kernel)
+        convolver_fft = aa.ConvolverFFT(mask=mask, kernel=kernel)
+
+        blurred_mapping_matrix = convolver.convolve_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )
+
+        assert convolver_fft.convolve_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        ) == pytest.approx(blurred_mapping_matrix, 1.0e-8)
+
+        monkeypatch.setattr(aa.operators.convolver, "fft_batch_size", 1)
+
+        assert convolver_fft.convolve_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        ) == pytest.approx(blurred_mapping_matrix, 1.0e-8)
+
+        assert (
+            convolver_fft.image_frame_1d_indexes == convolver.image_frame_1d_indexes
+        ).all()
@@ -1,7 +1,10 @@
 import autoarray as aa
+from autoarray import numba_util
 
+import numba
 import numpy as np
 import pytest
+import tracemalloc
 
 
 class MockRealSpaceMask:
@@ -166,6 +169,97 @@ class TestVisiblities:
 
         assert (visibilities_via_preload == visibilities).all()
 
+    def test__visibilities__complex_transforms_give_same_answer(self):
+
+        uv_wavelengths = np.array([[0.2, 1.0], [0.5, 1.1], [0.8, 1.2]])
+        grid_radians = aa.Grid2D.manual_native(
+            grid=[[[0.1, 0.2], [0.3, 0.4]]], pixel_scales=1.0
+        )
+        real_space_mask = MockRealSpaceMask(grid=grid_radians)
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_transform=False,
+        )
+
+        image = aa.Array2D.manual_native([[2.0, 6.0]], pixel_scales=1.0)
+
+        visibilities = transformer.visibilities_from(image=image)
+
+        transformer_complex = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_transform=True,
+            use_complex_transforms=True,
+        )
+
+        visibilities_complex = transformer_complex.visibilities_from(image=image)
+
+        assert visibilities_complex == pytest.approx(visibilities, 1.0e-8)
+
+        transformer_complex = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_transform=False,
+            use_complex_transforms=True,
+            max_block_gb=1.0e-9,
+        )
+
+        visibilities_complex = transformer_complex.visibilities_from(image=image)
+
+        assert visibilities_complex == pytest.approx(visibilities, 1.0e-8)
+
+        transformer_complex = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            use_complex_transforms=True,
+            complex_dtype="complex64",
+        )
+
+        visibilities_complex = transformer_complex.visibilities_from(image=image)
+
+        assert visibilities_complex == pytest.approx(visibilities, 1.0e-4)
+
+    def test__complex_transform_blocks_from__peak_memory_below_max_block_gb(self):
+
+        np.random.seed(1)
+
+        grid_radians = np.random.uniform(size=(1000, 2)).round(2) * 1.0e-5
+        uv_wavelengths = np.random.uniform(-1.0e5, 1.0e5, size=(2000, 2))
+
+        tracemalloc.start()
+
+        for block, complex_transforms in aa.util.transformer.complex_transform_blocks_from(
+            grid_radians=grid_radians, uv_wavelengths=uv_wavelengths, max_block_gb=0.004
+        ):
+            pass
+
+        peak_memory = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.stop()
+
+        assert peak_memory < 1.1 * 0.004 * 1.0e9
+
+
+class TestImage:
+    def test__image_from__complex_transforms_give_same_answer(
+        self, uv_wavelengths_7x2, mask_2d_7x7, visibilities_7, transformer_7x7_7
+    ):
+
+        image = transformer_7x7_7.image_from(visibilities=visibilities_7)
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths_7x2,
+            real_space_mask=mask_2d_7x7,
+            use_complex_transforms=True,
+            max_block_gb=1.0e-9,
+        )
+
+        image_complex = transformer.image_from(visibilities=visibilities_7)
+
+        assert image_complex.native == pytest.approx(image.native, 1.0e-8)
+
 
 class TestVisiblitiesMappingMatrix:
     def test__visibilities__mapping_matrix_all_ones__simple_cases(self):
@@ -322,6 +416,44 @@ class TestVisiblitiesMappingMatrix:
 
         assert (transformed_mapping_matrix_preload == transformed_mapping_matrix).all()
 
+    def test__transformed_mapping_matrix__complex_transforms_give_same_answer(self):
+
+        uv_wavelengths = np.array([[0.2, 1.0], [0.5, 1.1], [0.8, 1.2]])
+        grid_radians = aa.Grid2D.manual_native(
+            grid=[[[0.1, 0.2], [0.3, 0.4]]], pixel_scales=1.0
+        )
+        real_space_mask = MockRealSpaceMask(grid=grid_radians)
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_transform=False,
+        )
+
+        mapping_matrix = np.array([[3.0, 5.0], [1.0, 2.0]])
+
+        transformed_mapping_matrix = transformer.transform_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )
+
+        for preload_transform in [True, False]:
+
+            transformer_complex = aa.TransformerDFT(
+                uv_wavelengths=uv_wavelengths,
+                real_space_mask=real_space_mask,
+                preload_transform=preload_transform,
+                use_complex_transforms=True,
+                max_block_gb=1.0e-9,
+            )
+
+            transformed_mapping_matrix_complex = transformer_complex.transform_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            )
+
+            assert transformed_mapping_matrix_complex == pytest.approx(
+                transformed_mapping_matrix, 1.0e-8
+            )
+
 
 class TestTransformerNUFFT:
     def test__visibilities_from__same_as_direct__include_numerics(self):
@@ -396,3 +528,214 @@ class TestTransformerNUFFT:
         assert transformed_mapping_matrix_nufft[0, 0] == pytest.approx(
             25.02317 + 0.0j, 1.0e-4
         )
+
+
+class TestNUFFTBatch:
+    def test__native_stack_from(self):
+
+        mask = aa.Mask2D.manual(
+            mask=[[True, False, True], [False, False, True]], pixel_scales=1.0
+        )
+
+        native_stack = aa.util.transformer.native_stack_from(
+            array_2d_slim=np.array([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]),
+            native_index_for_slim_index=mask.native_index_for_slim_index.astype("int"),
+            shape_native=mask.shape_native,
+        )
+
+        assert native_stack.shape == (2, 3, 2)
+        assert (
+            native_stack[:, :, 0] == np.array([[0.0, 1.0, 0.0], [2.0, 3.0, 0.0]])
+        ).all()
+        assert (
+            native_stack[:, :, 1] == np.array([[0.0, 4.0, 0.0], [5.0, 6.0, 0.0]])
+        ).all()
+
+    def test__forward_batch_same_as_every_image_separately__adjoint_passes_dot_test(
+        self,
+    ):
+
+        from scipy.sparse import random
+
+        np.random.seed(1)
+
+        native_stack = np.random.normal(size=(4, 5, 3))
+        scaling_factors = np.random.uniform(0.5, 1.5, size=(4, 5))
+        oversampled_shape = (8, 10)
+
+        interpolation_matrix = random(6, 80, density=0.2, format="csr", random_state=1)
+        interpolation_matrix = interpolation_matrix + 1j * interpolation_matrix
+
+        visibilities = aa.util.transformer.nufft_forward_batch_from(
+            native_stack=native_stack,
+            scaling_factors=scaling_factors,
+            interpolation_matrix=interpolation_matrix,
+            oversampled_shape=oversampled_shape,
+        )
+
+        assert visibilities.shape == (6, 3)
+
+        for index in range(3):
+
+            oversampled_image = np.zeros(oversampled_shape)
+            oversampled_image[:4, :5] = native_stack[:, :, index] * scaling_factors
+
+            visibilities_image = interpolation_matrix.dot(
+                np.fft.fft2(oversampled_image).ravel()
+            )
+
+            assert visibilities[:, index] == pytest.approx(visibilities_image, 1.0e-8)
+
+        visibilities_adjoint = np.random.normal(size=(6, 3)) + 1j * np.random.normal(
+            size=(6, 3)
+        )
+
+        native_stack_adjoint = aa.util.transformer.nufft_adjoint_batch_from(
+            visibilities=visibilities_adjoint,
+            scaling_factors=scaling_factors,
+            interpolation_matrix_adjoint=interpolation_matrix.getH(),
+            oversampled_shape=oversampled_shape,
+        )
+
+        assert native_stack_adjoint.shape == (4, 5, 3)
+        assert np.vdot(visibilities_adjoint, visibilities) == pytest.approx(
+            80.0 * np.vdot(native_stack_adjoint, native_stack), 1.0e-8
+        )
+
+
+class TestTransformerKaiserBessel:
+    def test__transforms_same_as_direct(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(12, 12), radius=0.25, pixel_scales=0.05, centre=(0.1, -0.05)
+        )
+
+        np.random.seed(1)
+
+        uv_wavelengths = np.random.uniform(-2.0e6, 2.0e6, size=(50, 2))
+
+        transformer_dft = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask
+        )
+
+        transformer = aa.TransformerKaiserBessel(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask, eps=1.0e-8
+        )
+
+        mapping_matrix = np.random.uniform(size=(mask.pixels_in_mask, 3))
+
+        transformed_mapping_matrix = transformer.transform_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )
+
+        assert transformed_mapping_matrix == pytest.approx(
+            transformer_dft.transform_mapping_matrix(mapping_matrix=mapping_matrix),
+            1.0e-6,
+        )
+
+        image = aa.Array2D.manual_mask(array=mapping_matrix[:, 0], mask=mask)
+
+        assert transformer.visibilities_from(image=image) == pytest.approx(
+            transformed_mapping_matrix[:, 0], 1.0e-8
+        )
+
+        visibilities = aa.Visibilities.manual_slim(
+            visibilities=np.random.normal(size=(50, 2))
+        )
+
+        assert transformer.image_from(visibilities=visibilities) == pytest.approx(
+            transformer_dft.image_from(visibilities=visibilities), 1.0e-6
+        )
+
+    def test__float32_precision__adjoint_passes_dot_test(self):
+
+        mask = aa.Mask2D.circular(shape_native=(12, 12), radius=0.25, pixel_scales=0.05)
+
+        np.random.seed(2)
+
+        uv_wavelengths = np.random.uniform(-2.0e6, 2.0e6, size=(40, 2))
+
+        transformer = aa.TransformerKaiserBessel(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask
+        )
+
+        transformer_float32 = aa.TransformerKaiserBessel(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask, precision="float32"
+        )
+
+        assert transformer_float32.weights_y.dtype == np.float32
+
+        image = np.random.uniform(size=(mask.pixels_in_mask, 2))
+        visibilities = np.random.normal(size=(80, 2))
+
+        assert transformer_float32.forward_lop(image) == pytest.approx(
+            transformer.forward_lop(image), abs=1.0e-4
+        )
+        assert np.sum(transformer.forward_lop(image) * visibilities) == pytest.approx(
+            np.sum(image * transformer.adjoint_lop(visibilities)), 1.0e-10
+        )
+
+    def test__image_batch_from__gridding_chunks_within_max_batch_gb(
+        self, monkeypatch
+    ):
+
+        mask = aa.Mask2D.circular(shape_native=(12, 12), radius=0.25, pixel_scales=0.05)
+
+        np.random.seed(3)
+
+        uv_wavelengths = np.random.uniform(-2.0e6, 2.0e6, size=(30, 2))
+
+        transformer = aa.TransformerKaiserBessel(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask
+        )
+
+        transformer.max_batch_gb = (
+            6.5 * np.prod(transformer.oversampled_shape) * 16.0 / 1.0e9
+        )
+
+        assert transformer.batch_size == 6
+
+        visibilities = np.random.normal(size=(30, 10))
+
+        image_batch = transformer.image_batch_from(visibilities=visibilities)
+
+        grid_func = aa.util.transformer.nufft_grid_from
+
+        shape_list = []
+
+        def grid_recorded_from(**kwargs):
+            shape_list.append((kwargs["visibilities"].shape[1], kwargs["total_chunks"]))
+            return grid_func(**kwargs)
+
+        monkeypatch.setattr(aa.util.transformer, "nufft_grid_from", grid_recorded_from)
+        monkeypatch.setattr(numba_util, "_num_threads", 4)
+        monkeypatch.setattr(numba, "get_num_threads", lambda: 4)
+
+        assert transformer.image_batch_from(visibilities=visibilities) == pytest.approx(
+            image_batch, 1.0e-10
+        )
+
+        assert shape_list[0] == (1, 4)
+        assert all(batch * chunks <= 6 for batch, chunks in shape_list)
+
+    def test__interpolation_arrays_loaded_from_cache(self, tmp_path):
+
+        mask = aa.Mask2D.circular(shape_native=(12, 12), radius=0.25, pixel_scales=0.05)
+
+        uv_wavelengths = np.random.uniform(-2.0e6, 2.0e6, size=(20, 2))
+
+        cache = aa.WTildeCache(cache_path=str(tmp_path))
+
+        transformer = aa.TransformerKaiserBessel(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask, cache=cache
+        )
+
+        assert len(cache.entry_size_dict) == 1
+
+        transformer_cached = aa.TransformerKaiserBessel(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask, cache=cache
+        )
+
+        assert isinstance(transformer_cached.weights_y, np.memmap)
+        assert (transformer_cached.weights_y == transformer.weights_y).all()
+        assert (transformer_cached.indexes_x == transformer.indexes_x).all()
@@ -1206,3 +1206,114 @@ class TestGrid2DSparse:
         )
 
         assert (sparse_grid_weight_0 != sparse_grid_weight_1).any()
+
+    def test__kmeans_cache_warm_start_and_mini_batch(self):
+
+        from autoarray.structures.grids.two_d import sparse_kmeans
+
+        mask = aa.Mask2D.unmasked(shape_native=(8, 8), pixel_scales=0.5, sub_size=1)
+
+        grid = aa.Grid2D.from_mask(mask=mask)
+
+        weight_map = np.ones(mask.pixels_in_mask)
+        weight_map[0:10] = 5.0
+
+        cluster_centers, labels = sparse_kmeans.cluster_centers_and_labels_from(
+            grid=grid, weight_map=weight_map, total_pixels=8, seed=1, use_cache=False
+        )
+
+        sparse_grid = aa.Grid2DSparse.from_total_pixels_grid_and_weight_map(
+            total_pixels=8, grid=grid, weight_map=weight_map, seed=1
+        )
+
+        assert (sparse_grid == cluster_centers).all()
+        assert (sparse_grid.sparse_index_for_slim_index == labels).all()
+
+        sparse_grid[0, 0] = 100.0
+
+        sparse_grid = aa.Grid2DSparse.from_total_pixels_grid_and_weight_map(
+            total_pixels=8, grid=grid, weight_map=weight_map, seed=1
+        )
+
+        assert (sparse_grid == cluster_centers).all()
+
+        sparse_kmeans._warm_start_dict.clear()
+
+        sparse_grid_list = []
+
+        for total_calls in range(2):
+
+            sparse_grid_list.append(
+                [
+                    aa.Grid2DSparse.from_total_pixels_grid_and_weight_map(
+                        total_pixels=8,
+                        grid=grid,
+                        weight_map=weight_map + 0.01 * index,
+                        seed=1,
+                        warm_start=True,
+                        mini_batch_size=16,
+                    )
+                    for index in range(3)
+                ]
+            )
+
+            sparse_kmeans._warm_start_dict.clear()
+            sparse_kmeans._kmeans_cache.clear()
+
+        for sparse_grid_0, sparse_grid_1 in zip(*sparse_grid_list):
+
+            assert sparse_grid_0.shape == (8, 2)
+            assert (sparse_grid_0 == sparse_grid_1).all()
+            assert (
+                sparse_grid_0.sparse_index_for_slim_index
+                == sparse_grid_1.sparse_index_for_slim_index
+            ).all()
+
+    def test__kmeans_cache__warm_start_matches_uncached_and_no_seed_not_cached(self):
+
+        from autoarray.structures.grids.two_d import sparse_kmeans
+
+        mask = aa.Mask2D.unmasked(shape_native=(8, 8), pixel_scales=0.5, sub_size=1)
+
+        grid = aa.Grid2D.from_mask(mask=mask)
+
+        weight_map_0 = np.ones(mask.pixels_in_mask)
+        weight_map_0[0:10] = 5.0
+
+        weight_map_1 = np.ones(mask.pixels_in_mask)
+        weight_map_1[-10:] = 5.0
+
+        weight_map_list = [weight_map_0, weight_map_1, weight_map_0, weight_map_1]
+
+        cluster_centers_list = []
+
+        for use_cache in [False, True]:
+
+            sparse_kmeans._warm_start_dict.clear()
+            sparse_kmeans._kmeans_cache.clear()
+
+            cluster_centers_list.append(
+                [
+                    sparse_kmeans.cluster_centers_and_labels_from(
+                        grid=grid,
+                        weight_map=weight_map,
+                        total_pixels=8,
+                        seed=1,
+                        use_cache=use_cache,
+                        warm_start=True,
+                    )[0]
+                    for weight_map in weight_map_list
+                ]
+            )
+
+        for cluster_centers_0, cluster_centers_1 in zip(*cluster_centers_list):
+            assert (cluster_centers_0 == cluster_centers_1).all()
+
+        sparse_kmeans._warm_start_dict.clear()
+        sparse_kmeans._kmeans_cache.clear()
+
+        aa.Grid2DSparse.from_total_pixels_grid_and_weight_map(
+            total_pixels=8, grid=grid, weight_map=weight_map_0, seed=None
+        )
+
+        assert len(sparse_kmeans._kmeans_cache) == 0
@@ -165,6 +165,65 @@ class TestGrid2DIrregular:
             == np.array([[0.0, 0.0], [0.0, 0.0], [0.0, 1.0], [0.0, 0.0]])
         ).all()
 
+    def test__k_nearest_from__indexes_within_radius_from(self):
+
+        grid = aa.Grid2DIrregular(grid=[(0.0, 0.0), (0.0, 1.0), (0.0, 3.0)])
+
+        distances, indexes = grid.k_nearest_from(grid=np.array([[0.0, 0.9]]), k=2)
+
+        assert distances == pytest.approx(np.array([[0.1, 0.9]]), 1.0e-4)
+        assert (indexes == np.array([[1, 0]])).all()
+
+        indexes = grid.indexes_within_radius_from(
+            grid=np.array([[0.0, 0.9], [0.0, 5.0]]), radius=1.0
+        )
+
+        assert indexes == [[0, 1], []]
+
+        indexes = grid.indexes_within_radius_from(grid=(0.0, 0.9), radius=1.0)
+
+        assert indexes == [[0, 1]]
+
+    def test__convex_hull_grid__hull_vertices_or_end_points_of_collinear_grid(self):
+
+        grid = aa.Grid2DIrregular(
+            grid=[(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.5, 0.5)]
+        )
+
+        assert sorted(map(tuple, grid.convex_hull_grid)) == [
+            (0.0, 0.0),
+            (0.0, 1.0),
+            (1.0, 0.0),
+            (1.0, 1.0),
+        ]
+
+        grid = aa.Grid2DIrregular(grid=[(0.0, 1.0), (0.0, 0.0), (0.0, 3.0)])
+
+        assert (grid.convex_hull_grid == np.array([[0.0, 0.0], [0.0, 3.0]])).all()
+
+    def test__large_grids__use_kd_tree_and_convex_hull__same_as_brute_force(self):
+
+        np.random.seed(1)
+
+        grid = aa.Grid2DIrregular(grid=np.random.normal(size=(300, 2)))
+        grid_pair = np.random.normal(size=(200, 2))
+
+        squared_distances = np.sum(
+            np.square(np.asarray(grid)[None, :, :] - grid_pair[:, None, :]), axis=2
+        )
+
+        grid_of_closest = grid.grid_of_closest_from(grid_pair=grid_pair)
+
+        assert (
+            grid_of_closest == np.asarray(grid)[np.argmin(squared_distances, axis=1)]
+        ).all()
+
+        furthest_distances = grid.furthest_distances_from(grid=grid_pair)
+
+        assert furthest_distances == pytest.approx(
+            np.sqrt(np.max(squared_distances, axis=1)), 1.0e-8
+        )
+
     def test__structure_2d_from__maps_numpy_array_to__auto_array_or_grid(self):
 
         grid = aa.Grid2DIrregular(grid=[(1.0, -1.0), (1.0, 1.0)])
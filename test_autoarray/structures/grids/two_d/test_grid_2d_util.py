@@ -2150,3 +2150,46 @@ class TestGridUpscaled2d:
         assert grid_upscaled_2d[6] == pytest.approx(np.array([0.333, 0.333]), 1.0e-2)
         assert grid_upscaled_2d[7] == pytest.approx(np.array([0.333, 1.0]), 1.0e-2)
         assert grid_upscaled_2d[8] == pytest.approx(np.array([0.333, 1.666]), 1.0e-2)
+
+
+class TestRelocatedGrid:
+    def test__via_kd_tree__identical_to_brute_force_search(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(30, 30), radius=1.0, pixel_scales=(0.1, 0.1), sub_size=2
+        )
+
+        grid = aa.Grid2D.from_mask(mask=mask)
+
+        border_grid = np.asarray(grid.sub_border_grid)
+
+        grid_to_relocate = np.asarray(grid) * np.linspace(0.5, 3.0, grid.shape[0])[
+            :, None
+        ]
+
+        relocated_grid_via_jit = aa.util.grid_2d.relocated_grid_via_jit_from(
+            grid=grid_to_relocate, border_grid=border_grid
+        )
+
+        relocated_grid_via_kd_tree = aa.util.grid_2d.relocated_grid_via_kd_tree_from(
+            grid=grid_to_relocate,
+            border_grid=border_grid,
+            border_grid_tree=grid.sub_border_grid_tree,
+        )
+
+        assert (relocated_grid_via_kd_tree == relocated_grid_via_jit).all()
+
+        grid_equidistant_to_border = 2.0 * (border_grid[:-1] + border_grid[1:]) / 2.0
+
+        relocated_grid_via_jit = aa.util.grid_2d.relocated_grid_via_jit_from(
+            grid=grid_equidistant_to_border, border_grid=border_grid
+        )
+
+        relocated_grid_via_kd_tree = aa.util.grid_2d.relocated_grid_via_kd_tree_from(
+            grid=grid_equidistant_to_border,
+            border_grid=border_grid,
+            border_grid_tree=grid.sub_border_grid_tree,
+            total_neighbors=2,
+        )
+
+        assert (relocated_grid_via_kd_tree == relocated_grid_via_jit).all()
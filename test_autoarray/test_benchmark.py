@@ -0,0 +1,68 @@
+import copy
+from os import path
+import pytest
+
+from autoarray import benchmark
+from autoarray.benchmark.__main__ import main
+
+parameter_dict = {
+    "mask_radius": [0.5],
+    "sub_size": [1],
+    "kernel_size": [3],
+    "source_pixels": [9],
+    "total_visibilities": [10],
+}
+
+key = "convolve_image[mask_radius=0.5,kernel_size=3]"
+
+
+def test__run__results_output_and_compared_to_baseline(tmp_path):
+
+    results = benchmark.run(
+        name_list=["convolve_image", "transformer_visibilities"],
+        parameter_dict=parameter_dict,
+        repeats=2,
+        min_time=0.0,
+    )
+
+    assert results["results"][key]["repeats"] == 2
+    assert 0.0 < results["results"][key]["min"] <= results["results"][key]["median"]
+    assert (
+        "transformer_visibilities[mask_radius=0.5,total_visibilities=10,transformer=dft]"
+        in results["results"]
+    )
+
+    file_path = path.join(tmp_path, "benchmark.json")
+
+    benchmark.output_to_json(results=results, file_path=file_path)
+
+    baseline = benchmark.results_from_json(file_path=file_path)
+
+    assert baseline["results"].keys() == results["results"].keys()
+    assert benchmark.regression_dict_from(results=results, baseline=baseline) == {}
+
+    baseline = copy.deepcopy(baseline)
+    baseline["results"][key]["min"] /= 4.0
+
+    regression_dict = benchmark.regression_dict_from(
+        results=results, baseline=baseline, tolerance=0.5
+    )
+
+    assert list(regression_dict) == [key]
+    assert regression_dict[key] == pytest.approx(4.0)
+
+
+def test__main__exit_status_1_for_regression(tmp_path):
+
+    file_path = path.join(tmp_path, "benchmark.json")
+
+    args = ["--name", "convolve_image", "--repeats", "1", "--min-time", "0.0"]
+    args += ["--param", "mask_radius=0.5", "kernel_size=3"]
+
+    assert main(args=args + ["--output", file_path]) == 0
+
+    results = benchmark.results_from_json(file_path=file_path)
+    results["results"][key]["min"] /= 1.0e4
+    benchmark.output_to_json(results=results, file_path=file_path)
+
+    assert main(args=args + ["--baseline", file_path]) == 1
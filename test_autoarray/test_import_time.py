@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+import autoarray as aa
+
+"""
+Heavy dependencies which must not be imported by `import autoarray`, as they are only imported by the functions
+that use them.
+"""
+lazy_module_list = [
+    "astropy",
+    "matplotlib",
+    "pylops",
+    "scipy.signal",
+    "scipy.spatial",
+    "scipy.stats",
+    "skimage",
+    "sklearn",
+]
+
+"""
+The upper limit on the time it takes to import autoarray in a new interpreter, in seconds, which is generous such
+that it only fails for a large import time regression.
+"""
+import_time_limit = 10.0
+
+
+def run_in_new_interpreter(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+
+def test__import__heavy_dependencies_not_imported():
+
+    stdout = run_in_new_interpreter(
+        "import sys; import autoarray; "
+        f"print([module for module in {lazy_module_list} if module in sys.modules])"
+    )
+
+    assert stdout.strip().splitlines()[-1] == "[]"
+
+
+def test__import__time_below_limit():
+
+    stdout = run_in_new_interpreter(
+        "import time; start = time.perf_counter(); import autoarray; "
+        "print(time.perf_counter() - start)"
+    )
+
+    assert float(stdout.strip().splitlines()[-1]) < import_time_limit
+
+
+def test__lazy_attributes__resolved_on_access():
+
+    assert aa.TransformerDFT.__name__ == "TransformerDFT"
+    assert aa.TransformerNUFFT.__name__ == "TransformerNUFFT"
+    assert aa.fixtures.make_mask_2d_7x7 is not None
+    assert "TransformerNUFFT" in dir(aa)
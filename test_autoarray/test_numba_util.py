@@ -0,0 +1,63 @@
+import numba
+import numpy as np
+import pytest
+
+import autoarray as aa
+from autoarray import numba_util
+
+
+@numba_util.jit_prange(cache=False)
+def chunk_sums_from(values: np.ndarray, total_chunks: int = 1) -> np.ndarray:
+
+    chunk_sums = np.zeros(total_chunks)
+
+    for chunk in numba.prange(total_chunks):
+        for i in range(chunk, values.shape[0], total_chunks):
+            chunk_sums[chunk] += values[i]
+
+    return chunk_sums
+
+
+def test__num_threads__context_manager_sets_and_restores_value():
+
+    num_threads = aa.get_num_threads()
+
+    with aa.num_threads(1):
+        assert aa.get_num_threads() == 1
+
+    assert aa.get_num_threads() == num_threads
+
+    aa.set_num_threads(0)
+
+    assert aa.get_num_threads() == 1
+
+    aa.set_num_threads(num_threads)
+
+
+def test__jit_prange__total_chunks_set_to_num_threads_unless_input(monkeypatch):
+
+    monkeypatch.setattr(numba_util, "_num_threads", 2)
+    monkeypatch.setattr(numba, "get_num_threads", lambda: 2)
+
+    values = np.arange(10.0)
+
+    assert chunk_sums_from(values) == pytest.approx(np.array([20.0, 25.0]))
+    assert chunk_sums_from(values, 3).shape == (3,)
+    assert chunk_sums_from(values, total_chunks=1) == pytest.approx(np.array([45.0]))
+
+
+def test__chunk_bounds_from():
+
+    group_index = np.array([0, 0, 1, 1, 2, 2, 2, 3])
+
+    chunk_bounds = numba_util.chunk_bounds_from(group_index=group_index, total_chunks=1)
+
+    assert (chunk_bounds == np.array([0, 8])).all()
+
+    chunk_bounds = numba_util.chunk_bounds_from(group_index=group_index, total_chunks=2)
+
+    assert (chunk_bounds == np.array([0, 4, 8])).all()
+
+    chunk_bounds = numba_util.chunk_bounds_from(group_index=group_index, total_chunks=3)
+
+    assert (chunk_bounds == np.array([0, 2, 7, 8])).all()
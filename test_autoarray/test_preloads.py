@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import autoarray as aa
 
@@ -10,6 +11,7 @@ from autoarray.mock.mock import MockRegularization
 from autoarray.mock.mock import MockLEq
 from autoarray.mock.mock import MockLEqImaging
 from autoarray.mock.mock import MockInversion
+from autoarray.inversion.inversion.solver import solver_from
 
 # def test__set_w_tilde():
 #
@@ -250,6 +252,109 @@ def test__set_operated_mapping_matrix_with_preloads():
     ).all()
 
 
+def test__set_curvature_matrix():
+
+    # Inversion is None thus preload curvature_matrix to None.
+
+    fit_0 = MockFit(inversion=None)
+    fit_1 = MockFit(inversion=None)
+
+    preloads = aa.Preloads(curvature_matrix=1)
+    preloads.set_curvature_matrix(fit_0=fit_0, fit_1=fit_1)
+
+    assert preloads.curvature_matrix is None
+
+    # Inversion's curvature matrices are different thus no preloading.
+
+    fit_0 = MockFit(inversion=MockInversion(leq=MockLEq(curvature_matrix=np.eye(2))))
+    fit_1 = MockFit(
+        inversion=MockInversion(leq=MockLEq(curvature_matrix=2.0 * np.eye(2)))
+    )
+
+    preloads = aa.Preloads(curvature_matrix=1)
+    preloads.set_curvature_matrix(fit_0=fit_0, fit_1=fit_1)
+
+    assert preloads.curvature_matrix is None
+
+    # Inversion's curvature matrices are the same therefore preload it.
+
+    fit_0 = MockFit(inversion=MockInversion(leq=MockLEq(curvature_matrix=np.eye(2))))
+    fit_1 = MockFit(inversion=MockInversion(leq=MockLEq(curvature_matrix=np.eye(2))))
+
+    preloads = aa.Preloads(curvature_matrix=1)
+    preloads.set_curvature_matrix(fit_0=fit_0, fit_1=fit_1)
+
+    assert (preloads.curvature_matrix == np.eye(2)).all()
+
+
+def test__set_data_vector():
+
+    # Inversion is None thus preload data_vector to None.
+
+    fit_0 = MockFit(inversion=None)
+    fit_1 = MockFit(inversion=None)
+
+    preloads = aa.Preloads(data_vector=1)
+    preloads.set_data_vector(fit_0=fit_0, fit_1=fit_1)
+
+    assert preloads.data_vector is None
+
+    # Inversion's data vectors are different thus no preloading.
+
+    fit_0 = MockFit(inversion=MockInversion(data_vector=np.ones(2)))
+    fit_1 = MockFit(inversion=MockInversion(data_vector=2.0 * np.ones(2)))
+
+    preloads = aa.Preloads(data_vector=1)
+    preloads.set_data_vector(fit_0=fit_0, fit_1=fit_1)
+
+    assert preloads.data_vector is None
+
+    # Inversion's data vectors are the same therefore preload it.
+
+    fit_0 = MockFit(inversion=MockInversion(data_vector=np.ones(2)))
+    fit_1 = MockFit(inversion=MockInversion(data_vector=np.ones(2)))
+
+    preloads = aa.Preloads(data_vector=1)
+    preloads.set_data_vector(fit_0=fit_0, fit_1=fit_1)
+
+    assert (preloads.data_vector == np.ones(2)).all()
+
+
+def test__set_curvature_reg_eigen():
+
+    # Curvature matrix is not preloaded thus no preloading.
+
+    fit_0 = MockFit(inversion=MockInversion(regularization_matrix=np.eye(2)))
+    fit_1 = MockFit(inversion=MockInversion(regularization_matrix=2.0 * np.eye(2)))
+
+    preloads = aa.Preloads(curvature_reg_eigen=1)
+    preloads.set_curvature_reg_eigen(fit_0=fit_0, fit_1=fit_1)
+
+    assert preloads.curvature_reg_eigen is None
+
+    # Inversion's regularization matrices are the same thus no preloading.
+
+    fit_0 = MockFit(inversion=MockInversion(regularization_matrix=np.eye(2)))
+    fit_1 = MockFit(inversion=MockInversion(regularization_matrix=np.eye(2)))
+
+    preloads = aa.Preloads(curvature_matrix=np.eye(2), curvature_reg_eigen=1)
+    preloads.set_curvature_reg_eigen(fit_0=fit_0, fit_1=fit_1)
+
+    assert preloads.curvature_reg_eigen is None
+
+    # Inversion's regularization matrices are different therefore preload the eigendecomposition.
+
+    fit_0 = MockFit(inversion=MockInversion(regularization_matrix=np.eye(2)))
+    fit_1 = MockFit(inversion=MockInversion(regularization_matrix=3.0 * np.eye(2)))
+
+    preloads = aa.Preloads(curvature_matrix=np.eye(2), curvature_reg_eigen=1)
+    preloads.set_curvature_reg_eigen(fit_0=fit_0, fit_1=fit_1)
+
+    assert preloads.curvature_reg_eigen.step_from(
+        regularization_matrix=5.0 * np.eye(2)
+    ) == pytest.approx(2.0, 1.0e-8)
+
+
 def test__set_regularization_matrix_and_term():
 
     regularization = MockRegularization(regularization_matrix=np.eye(2))
@@ -309,3 +414,106 @@ def test__set_regularization_matrix_and_term():
 
     assert (preloads.regularization_matrix == np.eye(2)).all()
     assert preloads.log_det_regularization_matrix_term == 1
+
+
+def test__preload_cache__quantities_reused_when_fingerprints_recur(masked_imaging_7x7):
+
+    preloads = aa.Preloads(cache=aa.PreloadCache())
+
+    pixelization = aa.pix.Rectangular(shape=(3, 3))
+
+    def inversion_from(coefficient):
+
+        mapper = pixelization.mapper_from(
+            source_grid_slim=masked_imaging_7x7.grid_inversion,
+            settings=aa.SettingsPixelization(use_border=True),
+            preloads=preloads,
+        )
+
+        return aa.Inversion(
+            dataset=masked_imaging_7x7,
+            linear_obj_list=[mapper],
+            regularization_list=[aa.reg.Constant(coefficient=coefficient)],
+            preloads=preloads,
+        )
+
+    inversion_0 = inversion_from(coefficient=1.0)
+
+    log_evidence_0 = inversion_0.log_det_curvature_reg_matrix_term
+
+    inversion_1 = inversion_from(coefficient=1.0)
+
+    assert inversion_1.log_det_curvature_reg_matrix_term == log_evidence_0
+    assert inversion_1.log_det_regularization_matrix_term == pytest.approx(
+        inversion_0.log_det_regularization_matrix_term, 1.0e-4
+    )
+
+    stats = preloads.cache.stats
+
+    assert stats["relocated_grid"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+    assert stats["curvature_matrix"] == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+    assert stats["curvature_reg_matrix_solver"]["hits"] == 1
+
+    inversion_2 = inversion_from(coefficient=2.0)
+
+    no_cache = aa.Inversion(
+        dataset=masked_imaging_7x7,
+        linear_obj_list=inversion_2.linear_obj_list,
+        regularization_list=[aa.reg.Constant(coefficient=2.0)],
+    )
+
+    assert inversion_2.reconstruction == pytest.approx(no_cache.reconstruction, 1.0e-4)
+    assert inversion_2.log_det_curvature_reg_matrix_term == pytest.approx(
+        no_cache.log_det_curvature_reg_matrix_term, 1.0e-4
+    )
+
+    stats = preloads.cache.stats
+
+    assert stats["curvature_matrix"]["hits"] == 1
+    assert stats["regularization_matrix"]["misses"] == 2
+    assert stats["curvature_reg_matrix_solver"]["misses"] == 2
+
+    assert "Cache curvature_matrix = 1 hits, 1 misses\n" in preloads.info
+
+    preloads.reset_all()
+
+    assert len(preloads.cache) == 0
+
+
+def test__preload_cache__least_recently_used_removed_above_max_size():
+
+    cache = aa.PreloadCache(max_size_gb=2.0e-7)
+
+    cache.cached_from(name="array", key="0", func=lambda: np.zeros(10))
+    cache.cached_from(name="array", key="1", func=lambda: np.ones(10))
+    cache.cached_from(name="array", key="0", func=lambda: np.ones(10))
+    cache.cached_from(name="array", key="2", func=lambda: np.ones(10))
+
+    assert len(cache) == 2
+    assert cache.size_gb == pytest.approx(1.6e-7)
+    assert cache.stats["array"] == {"hits": 1, "misses": 3, "hit_rate": 0.25}
+
+    assert (cache.cached_from(name="array", key="0", func=None) == np.zeros(10)).all()
+
+    cache.cached_from(name="array", key="1", func=lambda: np.ones(10))
+
+    assert cache.stats["array"]["misses"] == 4
+
+
+def test__preload_cache__sparse_solver_size_includes_lu_factors():
+
+    matrix = (
+        np.diag(np.full(500, 4.0))
+        + np.diag(np.full(499, -1.0), k=1)
+        + np.diag(np.full(499, -1.0), k=-1)
+    )
+
+    solver = solver_from(matrix=matrix, solver="sparse")
+
+    cache = aa.PreloadCache()
+
+    cache.cached_from(name="solver", key="0", func=lambda: solver)
+
+    assert cache.size_gb * 1.0e9 > (
+        solver.diag.nbytes + solver.lu.L.data.nbytes + solver.lu.U.data.nbytes
+    )
@@ -0,0 +1,88 @@
+import json
+from os import path
+import pickle
+
+import autoarray as aa
+
+
+class MockClass:
+    def __init__(self, value, profiling_dict=None):
+
+        self._value = value
+        self.profiling_dict = profiling_dict
+
+    @property
+    @aa.profile_func
+    def value(self):
+        return self._value
+
+    @property
+    @aa.profile_func
+    def value_sum(self):
+        return sum(self.value for i in range(10))
+
+
+def test__profiler__spans_nested_with_no_limit_on_calls(tmp_path):
+
+    profiler = aa.Profiler(trace_allocations=True)
+
+    cls = MockClass(value=1.0, profiling_dict=profiler)
+
+    assert cls.value_sum == 10.0
+
+    assert len(profiler.spans) == 1
+
+    span = profiler.spans[0]
+
+    assert span.name == "value_sum"
+    assert len(span.children) == 10
+    assert span.children[0].name == "value"
+    assert span.children[0].parent is span
+    assert span.wall_time >= sum(child.wall_time for child in span.children)
+    assert span.allocated_bytes is not None
+
+    assert "value_sum_0" in profiler
+    assert "value_9" in profiler
+    assert profiler.call_counts == {"value": 10, "value_sum": 1}
+
+    file_path = path.join(tmp_path, "profile.json")
+
+    profiler.output_to_json(file_path=file_path)
+
+    with open(file_path) as f:
+        assert json.load(f)["spans"][0]["children"][0]["name"] == "value"
+
+    profiler.output_to_chrome_trace(file_path=file_path)
+
+    with open(file_path) as f:
+        events = json.load(f)["traceEvents"]
+
+    assert len(events) == 11
+    assert events[0]["ph"] == "X"
+
+    profiler = pickle.loads(pickle.dumps(profiler))
+
+    with profiler.span(name="span"):
+        pass
+
+    assert profiler.call_counts["span"] == 1
+
+
+def test__fit_imaging__profiled_under_root_span(masked_imaging_7x7):
+
+    profiler = aa.Profiler()
+
+    model_image = masked_imaging_7x7.image
+
+    fit = aa.FitData(
+        data=masked_imaging_7x7.image,
+        noise_map=masked_imaging_7x7.noise_map,
+        model_data=model_image,
+        mask=masked_imaging_7x7.mask,
+        profiling_dict=profiler,
+    )
+
+    aa.FitImaging(dataset=masked_imaging_7x7, fit=fit, profiling_dict=profiler)
+
+    assert profiler.spans[0].name == "FitImaging"
+    assert profiler.spans[0].children[0].name == "figure_of_merit"
@@ -0,0 +1,54 @@
+import copyreg
+import numpy as np
+from os import path
+import pickle
+
+import autoarray as aa
+from autoarray import shared_buffer
+
+
+def test__structures_pickled_as_memory_mapped_files(masked_imaging_7x7, tmp_path):
+
+    with aa.shared_buffers(shared_buffer_path=str(tmp_path), min_size_bytes=0) as sb:
+
+        image = pickle.loads(pickle.dumps(masked_imaging_7x7.image))
+
+        assert isinstance(image.base, np.memmap)
+        assert isinstance(image, aa.Array2D)
+        assert isinstance(image.mask, aa.Mask2D)
+        assert not image.flags.writeable
+        assert (image == masked_imaging_7x7.image).all()
+        assert (image.native == masked_imaging_7x7.image.native).all()
+        assert (image.mask == masked_imaging_7x7.mask).all()
+        assert image.mask.pixel_scales == masked_imaging_7x7.mask.pixel_scales
+
+        masked_imaging = pickle.loads(pickle.dumps(masked_imaging_7x7))
+
+        assert (masked_imaging.grid == masked_imaging_7x7.grid).all()
+        assert (masked_imaging.psf == masked_imaging_7x7.psf).all()
+
+        array = np.arange(10.0)
+
+        assert (pickle.loads(pickle.dumps(array)) == array).all()
+
+        total_files = len(sb.file_path_dict)
+
+        pickle.dumps(masked_imaging_7x7.image)
+
+        assert len(sb.file_path_dict) == total_files
+
+        shared_buffer_path = sb.path
+
+    assert not path.exists(shared_buffer_path)
+    assert shared_buffer._shared_buffers is None
+    assert np.ndarray not in copyreg.dispatch_table
+
+
+def test__arrays_below_min_size__pickled_as_normal(masked_imaging_7x7):
+
+    with aa.shared_buffers(min_size_bytes=1.0e8) as sb:
+
+        image = pickle.loads(pickle.dumps(masked_imaging_7x7.image))
+
+        assert image.flags.writeable
+        assert len(sb.file_path_dict) == 0
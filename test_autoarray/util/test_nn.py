@@ -1,5 +1,6 @@
 import autoarray as aa
 import numpy as np
+import pytest
 from autoarray.util.nn import nn_py
 
 
@@ -90,3 +91,61 @@ def test__nn_interpolation_correct():
     answer = np.array([5.0, 4.5, 1.0])
 
     assert (interpolated_values == answer).all()
+
+
+@pytest.mark.skipif(
+    not hasattr(nn_py, "_mod"), reason="nn library is not compiled"
+)
+def test__nn_triangulation__matches_functions_and_reused_across_queries():
+
+    pixelization_grid = aa.Grid2D.manual_slim(
+        [
+            [1.0, 1.0],
+            [0.0, 1.0],
+            [-1.0, 1.0],
+            [-1.0, 0.0],
+            [-1.0, -1.0],
+            [0.0, -1.0],
+            [1.0, -1.0],
+            [1.0, 0.0],
+            [0.0, 0.0],
+        ],
+        shape_native=(3, 3),
+        pixel_scales=1.0,
+    )
+
+    interpolate_grid = aa.Grid2D.manual_slim(
+        [[0.5, 0.5], [-0.5, 0.5], [2.0, 2.0], [0.1, -0.3]],
+        shape_native=(4, 1),
+        pixel_scales=1.0,
+    )
+
+    nn_triangulation = nn_py.NNTriangulation(yx_in=pixelization_grid)
+
+    weights, neighbour_indexes = nn_py.natural_interpolation_weights(
+        pixelization_grid[:, 1],
+        pixelization_grid[:, 0],
+        interpolate_grid[:, 1],
+        interpolate_grid[:, 0],
+        30,
+    )
+
+    for total_threads in [1, 2]:
+
+        (
+            weights_triangulation,
+            neighbour_indexes_triangulation,
+        ) = nn_triangulation.weights_from(
+            yx_target=interpolate_grid, max_nneighbours=30, total_threads=total_threads
+        )
+
+        assert (weights_triangulation == weights).all()
+        assert (neighbour_indexes_triangulation == neighbour_indexes).all()
+
+    input_values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+
+    interpolated_values = nn_triangulation.interpolate_from(
+        z_in=input_values, yx_target=interpolate_grid
+    )
+
+    assert interpolated_values[0:3] == pytest.approx(np.array([5.0, 4.5, 1.0]), 1.0e-8)